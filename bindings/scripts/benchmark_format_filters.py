@@ -0,0 +1,206 @@
+#!/usr/bin/python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=relative-import
+
+"""Benchmarks the Jinja filters formatting generated code.
+
+Runs the format filters of utilities.py over generated files, e.g. the
+largest .cpp files of the bindings in a build's gen/ directory, and compares
+them with straightforward reference implementations of the filters: the
+outputs must be identical, and the speedup is reported.  Each filter is run
+--repeat times over each file and the fastest run is reported.
+format_blink_cpp_source_code is also run on the files split into chunks, as
+when formatting the output of Template.generate() while writing it.
+
+Usage:
+  benchmark_format_filters.py [--largest N] [--pattern PATTERN...] PATH...
+
+PATHs are generated files or directories searched for .h, .cc and .cpp
+files.
+"""
+
+import optparse
+import os
+import re
+import sys
+import time
+
+from utilities import format_blink_cpp_source_code
+from utilities import format_blink_cpp_source_code_chunks
+from utilities import format_remove_duplicates
+
+SOURCE_EXTENSIONS = ('.h', '.cc', '.cpp')
+# Patterns which the templates remove duplicates of.
+DEFAULT_PATTERNS = [
+    'ExceptionState exceptionState',
+    'ScriptState* scriptState = ',
+    'ExecutionContext* executionContext = ',
+    'LocalDOMWindow* currentDOMWindow = ',
+    'LocalDOMWindow* enteredDOMWindow = ',
+    'V8PerContextData* perContextData = ',
+]
+# Size of the chunks the formatter is given in the streaming runs, about that
+# of the chunks of Template.generate().
+CHUNK_SIZE = 32
+
+
+def parse_options():
+    usage = 'Usage: %prog [options] PATH...'
+    parser = optparse.OptionParser(usage=usage)
+    parser.add_option('--largest', type='int', default=10,
+                      help='number of the largest files to run the filters on '
+                      '[default: %default]')
+    parser.add_option('--pattern', action='append', dest='patterns',
+                      help='pattern of format_remove_duplicates; may be '
+                      'repeated [default: patterns of the templates]')
+    parser.add_option('--repeat', type='int', default=5,
+                      help='number of runs; the fastest is reported')
+    options, paths = parser.parse_args()
+    if not paths:
+        parser.error('Must specify generated files or directories.')
+    if options.repeat < 1:
+        parser.error('--repeat must be at least 1.')
+    return options, paths
+
+
+def reference_format_remove_duplicates(text, patterns):
+    """Checks each pattern against each line."""
+    pattern_founds = [False] * len(patterns)
+    output = []
+    for line in text.split('\n'):
+        to_be_removed = False
+        for i, pattern in enumerate(patterns):
+            if pattern not in line:
+                continue
+            if pattern_founds[i]:
+                to_be_removed = True
+            else:
+                pattern_founds[i] = True
+        if to_be_removed:
+            continue
+        output.append(line)
+    if output:
+        output.append('')
+    return '\n'.join(output)
+
+
+def reference_format_blink_cpp_source_code(text):
+    """Checks each line with regexes."""
+    re_empty_line = re.compile(r'^\s*$')
+    re_first_brace = re.compile(r'(?P<first>[{}])')
+    re_last_brace = re.compile(r'.*(?P<last>[{}]).*?$')
+    was_open_brace = True
+    was_empty_line = False
+    output = []
+    for line in text.split('\n'):
+        if re_empty_line.match(line):
+            was_empty_line = True
+            continue
+        if was_empty_line:
+            was_empty_line = False
+            match = re_first_brace.search(line)
+            if was_open_brace:
+                pass
+            elif match and match.group('first') == '}' and 'namespace' not in line:
+                pass
+            else:
+                output.append('')
+        output.append(line)
+        match = re_last_brace.search(line)
+        was_open_brace = (match and match.group('last') == '{' and 'namespace' not in line)
+    if output:
+        output.append('')
+    return '\n'.join(output)
+
+
+def format_blink_cpp_source_code_streamed(text):
+    chunks = [text[index:index + CHUNK_SIZE]
+              for index in range(0, len(text), CHUNK_SIZE)]
+    return ''.join(format_blink_cpp_source_code_chunks(chunks))
+
+
+def largest_files(paths, count):
+    filenames = []
+    for path in paths:
+        if not os.path.isdir(path):
+            filenames.append(path)
+            continue
+        for dirpath, _, basenames in os.walk(path):
+            filenames.extend(os.path.join(dirpath, basename)
+                             for basename in basenames
+                             if basename.endswith(SOURCE_EXTENSIONS))
+    filenames.sort(key=lambda filename: (-os.path.getsize(filename), filename))
+    return filenames[:count]
+
+
+def best_time(function, args, repeat):
+    best = None
+    for _ in range(repeat):
+        start_time = time.time()
+        result = function(*args)
+        elapsed_time = time.time() - start_time
+        if best is None or elapsed_time < best:
+            best = elapsed_time
+    return best, result
+
+
+def run_benchmark(filenames, patterns, repeat=5):
+    """Returns a list of (filter name, filename, reference seconds, seconds,
+    identical)."""
+    filters = [
+        ('format_remove_duplicates',
+         lambda text: reference_format_remove_duplicates(text, patterns),
+         lambda text: format_remove_duplicates(text, patterns)),
+        ('format_blink_cpp_source_code',
+         reference_format_blink_cpp_source_code, format_blink_cpp_source_code),
+        ('  in %d-char chunks' % CHUNK_SIZE,
+         reference_format_blink_cpp_source_code,
+         format_blink_cpp_source_code_streamed),
+    ]
+    results = []
+    for filter_name, reference_function, function in filters:
+        for filename in filenames:
+            with open(filename) as source_file:
+                text = source_file.read()
+            reference_time, expected = best_time(
+                reference_function, (text,), repeat)
+            filter_time, actual = best_time(function, (text,), repeat)
+            results.append((filter_name, filename, reference_time, filter_time,
+                            actual == expected))
+    return results
+
+
+def main():
+    options, paths = parse_options()
+    filenames = largest_files(paths, options.largest)
+    results = run_benchmark(filenames, options.patterns or DEFAULT_PATTERNS,
+                            options.repeat)
+    filter_names = []
+    for result in results:
+        if result[0] not in filter_names:
+            filter_names.append(result[0])
+    for filter_name in filter_names:
+        filter_results = [result for result in results
+                          if result[0] == filter_name]
+        print('%-30s %9s %9s %8s' % (filter_name, 'reference', 'filter',
+                                     'speedup'))
+        for _, filename, reference_time, filter_time, identical in filter_results:
+            print('%-30s %7.2fms %7.2fms %7.1fx%s' % (
+                os.path.basename(filename)[:30], reference_time * 1000,
+                filter_time * 1000, reference_time / max(filter_time, 1e-9),
+                '' if identical else '  OUTPUT DIFFERS'))
+        reference_total = sum(result[2] for result in filter_results)
+        filter_total = sum(result[3] for result in filter_results)
+        print('%-30s %7.2fms %7.2fms %7.1fx' % (
+            'total', reference_total * 1000, filter_total * 1000,
+            reference_total / max(filter_total, 1e-9)))
+    if not all(result[4] for result in results):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
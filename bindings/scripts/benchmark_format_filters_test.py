@@ -0,0 +1,51 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for benchmark_format_filters.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmark_format_filters import DEFAULT_PATTERNS
+from benchmark_format_filters import largest_files
+from benchmark_format_filters import run_benchmark
+
+
+class BenchmarkFormatFiltersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, basename, text):
+        filename = os.path.join(self.temp_dir, basename)
+        with open(filename, 'w') as output_file:
+            output_file.write(text)
+        return filename
+
+    def test_largest_files(self):
+        small = self.write('V8Node.h', 'a\n')
+        large = self.write('V8Node.cpp', 'a\n' * 10)
+        self.write('V8Node.idl', 'a\n' * 100)
+        self.assertEqual(largest_files([self.temp_dir], 10), [large, small])
+        self.assertEqual(largest_files([self.temp_dir, small], 1), [large])
+
+    def test_run_benchmark(self):
+        line = '  %s(info.GetIsolate());\n' % DEFAULT_PATTERNS[0]
+        filename = self.write('V8Node.cpp', ('  foo() {\n\n' + line + '\n}\n') * 20)
+        results = run_benchmark([filename], DEFAULT_PATTERNS, repeat=1)
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertEqual(result[1], filename)
+            self.assertTrue(result[4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+#!/usr/bin/python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=relative-import
+
+"""Benchmarks the IDL front end over the IDL files of the source tree.
+
+Reads every IDL file under core/, modules/ and bindings/tests/idls (or the
+given directories) and, for each file, times the phases of reading it as
+IdlReader does:
+
+  lex          tokenizing the file (BlinkIDLLexer)
+  yacc         parsing the tokens into an AST (BlinkIDLParser); measured as
+               the time of a full parse minus the time of the lex phase
+  definitions  building IdlDefinitions from the AST
+  validation   validating the extended attributes
+
+The phases are run --repeat times, and the fastest run of each phase is
+reported, together with files/s and tokens/s.  Then all files are parsed
+again keeping the ASTs alive, as a batch build does, to report the number of
+IDLNodes and the peak RSS of the process before and after; with
+--tracemalloc, the peak size of the Python allocations of the ASTs is
+reported too (tracing slows parsing down considerably).  The results are written as JSON, so that runs can be compared: with
+--baseline, the script exits with an error if the total time regressed by
+more than --max-regression percent (ignoring differences below 10ms).
+
+Usage:
+  benchmark_idl_parser.py [--output FILE] [--baseline FILE] [--tracemalloc]
+      [DIRECTORY...]
+"""
+
+import json
+import optparse
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+
+from blink_idl_lexer import BlinkIDLLexer
+from blink_idl_parser import BlinkIDLParser
+from idl_definitions import IdlDefinitions
+from idl_validator import IDLExtendedAttributeValidator
+
+SOURCE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DEFAULT_DIRECTORIES = [os.path.join(SOURCE_DIR, 'core'),
+                       os.path.join(SOURCE_DIR, 'modules'),
+                       os.path.join(SOURCE_DIR, 'bindings', 'tests', 'idls')]
+PHASES = ['lex', 'yacc', 'definitions', 'validation']
+# Slowdowns smaller than this are noise, whatever their percentage.
+MIN_REGRESSION_SECONDS = 0.01
+
+
+def parse_options():
+    usage = 'Usage: %prog [options] [DIRECTORY...]'
+    parser = optparse.OptionParser(usage=usage)
+    parser.add_option('--output', help='write the results to a JSON file '
+                      'rather than to stdout')
+    parser.add_option('--repeat', type='int', default=3,
+                      help='number of runs; the fastest is reported')
+    parser.add_option('--lexer-engine', choices=['fast', 'ply'],
+                      default='fast')
+    parser.add_option('--baseline', help='JSON results of an earlier run to '
+                      'compare with')
+    parser.add_option('--max-regression', type='float', default=10.0,
+                      help='percentage by which the total time may exceed '
+                      'the baseline [default: %default]')
+    parser.add_option('--tracemalloc', action='store_true', default=False,
+                      help='also report the peak size of the Python '
+                      'allocations of the ASTs')
+    options, directories = parser.parse_args()
+    if options.repeat < 1:
+        parser.error('--repeat must be at least 1.')
+    return options, directories
+
+
+def idl_filenames(directories):
+    filenames = []
+    for directory in directories:
+        for dirpath, _, basenames in os.walk(directory):
+            filenames.extend(os.path.join(dirpath, basename)
+                             for basename in basenames
+                             if basename.endswith('.idl'))
+    return sorted(filenames)
+
+
+def count_nodes(node):
+    count = 0
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        count += 1
+        pending.extend(node.GetChildren())
+    return count
+
+
+def peak_rss_kilobytes():
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on Mac, kilobytes elsewhere.
+    if sys.platform == 'darwin':
+        return peak_rss // 1024
+    return peak_rss
+
+
+class FileBenchmark(object):
+    """Times the front end phases for one file at a time."""
+
+    def __init__(self, lexer_engine):
+        self.parser = BlinkIDLParser(lexer=BlinkIDLLexer(engine=lexer_engine))
+        self.validator = IDLExtendedAttributeValidator()
+
+    def run(self, filename, text, times):
+        """Adds the time of each phase to |times| and returns the number of
+        tokens of the file."""
+        lexer = self.parser.lexer
+        start_time = time.time()
+        lexer.Tokenize(text, filename)
+        token_count = len(lexer.GetTokens())
+        lex_time = time.time() - start_time
+
+        start_time = time.time()
+        ast = self.parser.ParseText(filename, text)
+        parse_time = time.time() - start_time
+        if not ast or self.parser.GetErrors():
+            raise Exception('Failed to parse %s' % filename)
+
+        start_time = time.time()
+        definitions = IdlDefinitions(ast)
+        definitions_time = time.time() - start_time
+
+        start_time = time.time()
+        self.validator.validate_extended_attributes(definitions)
+        validation_time = time.time() - start_time
+
+        times['lex'] += lex_time
+        times['yacc'] += max(parse_time - lex_time, 0.0)
+        times['definitions'] += definitions_time
+        times['validation'] += validation_time
+        return token_count
+
+    def measure_asts(self, sources, trace=False):
+        """Parses all |sources| keeping the ASTs alive, and returns the number
+        of IDLNodes, the peak RSS before and after, and with |trace| the peak
+        size of the traced allocations in KiB."""
+        rss_before = peak_rss_kilobytes()
+        if trace:
+            tracemalloc.start()
+        asts = [self.parser.ParseText(filename, text)
+                for filename, text in sources]
+        traced_peak = None
+        if trace:
+            traced_peak = tracemalloc.get_traced_memory()[1] // 1024
+            tracemalloc.stop()
+        return {
+            'idl_nodes': sum(count_nodes(ast) for ast in asts if ast),
+            'rss_before_asts_kib': rss_before,
+            'peak_rss_kib': peak_rss_kilobytes(),
+            'asts_traced_peak_kib': traced_peak,
+        }
+
+
+def run_benchmark(filenames, repeat=3, lexer_engine='fast', trace=False):
+    """Returns the results of the benchmark as a dict."""
+    sources = []
+    for filename in filenames:
+        with open(filename) as idl_file:
+            sources.append((filename, idl_file.read()))
+    benchmark = FileBenchmark(lexer_engine)
+
+    best_times = dict((phase, None) for phase in PHASES)
+    token_count = 0
+    for _ in range(repeat):
+        times = dict((phase, 0.0) for phase in PHASES)
+        token_count = sum(benchmark.run(filename, text, times)
+                          for filename, text in sources)
+        for phase in PHASES:
+            if best_times[phase] is None or times[phase] < best_times[phase]:
+                best_times[phase] = times[phase]
+
+    total_time = sum(best_times.values())
+    results = {
+        'python': platform.python_version(),
+        'lexer_engine': lexer_engine,
+        'repeat': repeat,
+        'files': len(sources),
+        'bytes': sum(len(text) for _, text in sources),
+        'tokens': token_count,
+        'phase_seconds': best_times,
+        'total_seconds': total_time,
+        'files_per_second': len(sources) / total_time if total_time else None,
+        'tokens_per_second': token_count / total_time if total_time else None,
+    }
+    results.update(benchmark.measure_asts(sources, trace))
+    return results
+
+
+def compare_results(baseline, results, max_regression):
+    """Returns a list of messages describing regressions of |results| over
+    |baseline| by more than |max_regression| percent."""
+    regressions = []
+    if baseline['files'] != results['files']:
+        regressions.append('The number of files changed from %d to %d; the '
+                           'results are not comparable.' %
+                           (baseline['files'], results['files']))
+        return regressions
+
+    def check(name, old, new):
+        if (old and new > old * (1 + max_regression / 100.0) and
+                new - old >= MIN_REGRESSION_SECONDS):
+            regressions.append('%s: %.3f -> %.3f (+%.1f%%)' % (
+                name, old, new, (new - old) * 100.0 / old))
+
+    check('total_seconds', baseline['total_seconds'], results['total_seconds'])
+    for phase in PHASES:
+        check('phase_seconds.%s' % phase, baseline['phase_seconds'][phase],
+              results['phase_seconds'][phase])
+    return regressions
+
+
+def main():
+    options, directories = parse_options()
+    filenames = idl_filenames(directories or DEFAULT_DIRECTORIES)
+    results = run_benchmark(filenames, options.repeat, options.lexer_engine,
+                            options.tracemalloc)
+
+    results_text = json.dumps(results, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            output_file.write(results_text + '\n')
+    else:
+        print(results_text)
+
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(baseline, results, options.max_regression)
+        for regression in regressions:
+            sys.stderr.write('Regression: %s\n' % regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
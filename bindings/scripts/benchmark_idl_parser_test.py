@@ -0,0 +1,57 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for benchmark_idl_parser.py."""
+
+import os
+import unittest
+
+from benchmark_idl_parser import PHASES
+from benchmark_idl_parser import SOURCE_DIR
+from benchmark_idl_parser import compare_results
+from benchmark_idl_parser import run_benchmark
+
+
+def results(total_seconds, files=10, **phase_seconds):
+    times = dict((phase, 0.0) for phase in PHASES)
+    times.update(phase_seconds)
+    return {'files': files, 'total_seconds': total_seconds,
+            'phase_seconds': times}
+
+
+class BenchmarkIdlParserTest(unittest.TestCase):
+
+    def test_run_benchmark(self):
+        filename = os.path.join(SOURCE_DIR, 'bindings', 'tests', 'idls',
+                                'core', 'TestInterface2.idl')
+        benchmark_results = run_benchmark([filename], repeat=1)
+        self.assertEqual(benchmark_results['files'], 1)
+        self.assertGreater(benchmark_results['tokens'], 0)
+        self.assertEqual(sorted(benchmark_results['phase_seconds']),
+                         sorted(PHASES))
+        self.assertGreater(benchmark_results['idl_nodes'], 1)
+        self.assertGreaterEqual(benchmark_results['peak_rss_kib'],
+                                benchmark_results['rss_before_asts_kib'])
+        self.assertIsNone(benchmark_results['asts_traced_peak_kib'])
+        benchmark_results = run_benchmark([filename], repeat=1, trace=True)
+        self.assertGreater(benchmark_results['asts_traced_peak_kib'], 0)
+
+    def test_compare_results(self):
+        baseline = results(1.0, lex=0.4, yacc=0.6)
+        self.assertEqual(compare_results(baseline, results(1.05, lex=0.43, yacc=0.62), 10), [])
+        self.assertEqual(
+            compare_results(baseline, results(1.2, lex=0.6, yacc=0.6), 10),
+            ['total_seconds: 1.000 -> 1.200 (+20.0%)',
+             'phase_seconds.lex: 0.400 -> 0.600 (+50.0%)'])
+        # Small absolute differences are noise.
+        self.assertEqual(
+            compare_results(baseline, results(1.0, lex=0.4, yacc=0.6,
+                                              validation=0.005), 10), [])
+        self.assertEqual(len(compare_results(baseline, results(1.0, files=9), 10)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
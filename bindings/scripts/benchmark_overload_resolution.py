@@ -0,0 +1,176 @@
+#!/usr/bin/python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=relative-import
+
+"""Benchmarks the overload resolution of the V8 bindings generator.
+
+Builds the template contexts of the given interfaces, by default the
+overload-heavy canvas and WebGL rendering contexts, collects their
+overloaded methods and constructors, and times computing the effective
+overload sets and resolution tests of all of them:
+
+  uncached  effective_overload_set_by_length() and length_tests_methods()
+  cold      overload_resolution_cache.resolve() with an empty cache, as in a
+            run of the compiler
+  warm      overload_resolution_cache.resolve() again
+
+The overloads are resolved --repeat times with the garbage collector
+disabled, as timeit does, so that collections of the large interfaces info
+do not add noise.  The fastest run of each is reported, and the cold runs
+must return the same overload sets and tests as the uncached ones.
+
+Usage:
+  benchmark_overload_resolution.py --info-dir DIR [INTERFACE...]
+"""
+
+import gc
+import optparse
+import sys
+import time
+
+from code_generator_v8 import CodeGeneratorV8
+from idl_reader import IdlReader
+from idl_types import use_type_registry
+from overload_set_algorithm import effective_overload_set_by_length
+from overload_set_algorithm import method_overloads_by_name
+from utilities import create_component_info_provider
+from v8_interface import interface_context
+from v8_interface import length_tests_methods
+from v8_interface import overload_resolution_cache
+
+DEFAULT_INTERFACES = [
+    'CanvasRenderingContext2D',
+    'OffscreenCanvasRenderingContext2D',
+    'WebGLRenderingContext',
+    'WebGL2RenderingContext',
+]
+
+
+def parse_options():
+    usage = 'Usage: %prog --info-dir DIR [options] [INTERFACE...]'
+    parser = optparse.OptionParser(usage=usage)
+    parser.add_option('--info-dir', help='directory of the interfaces info '
+                      'pickles, as given to idl_compiler.py')
+    parser.add_option('--target-component', default='modules',
+                      help='component of the info provider [default: %default]')
+    parser.add_option('--repeat', type='int', default=5,
+                      help='number of runs; the fastest is reported')
+    options, interface_names = parser.parse_args()
+    if not options.info_dir:
+        parser.error('Must specify the info directory with --info-dir.')
+    if options.repeat < 1:
+        parser.error('--repeat must be at least 1.')
+    return options, interface_names or DEFAULT_INTERFACES
+
+
+def overloaded_methods(context):
+    """Returns the lists of overloads of the methods and constructors of an
+    interface context."""
+    methods = context['methods']
+    overloads = [method_overloads
+                 for is_static in (False, True)
+                 for _, method_overloads in method_overloads_by_name(
+                     [method for method in methods
+                      if method['is_static'] == is_static])]
+    if len(context['constructors']) > 1:
+        overloads.append(context['constructors'])
+    return overloads
+
+
+def collect_overloads(info_dir, interface_names, target_component='modules'):
+    """Returns the type registry of a V8 code generator and a list of
+    (interface name, overloads) of |interface_names|."""
+    info_provider = create_component_info_provider(info_dir, target_component)
+    generator = CodeGeneratorV8(info_provider, cache_dir=None, output_dir='',
+                                snake_case=False)
+    reader = IdlReader(info_provider.interfaces_info)
+    interface_overloads = []
+    with use_type_registry(generator.type_registry):
+        for interface_name in interface_names:
+            full_path = info_provider.interfaces_info[interface_name]['full_path']
+            for definitions in reader.read_idl_definitions(full_path).values():
+                if interface_name not in definitions.interfaces:
+                    continue
+                generator.typedef_resolver.resolve(definitions, interface_name)
+                context = interface_context(
+                    definitions.interfaces[interface_name],
+                    definitions.interfaces)
+                interface_overloads.extend(
+                    (interface_name, overloads)
+                    for overloads in overloaded_methods(context))
+    return generator.type_registry, interface_overloads
+
+
+def resolve_uncached(overloads):
+    effective_overloads_by_length = effective_overload_set_by_length(overloads)
+    return (effective_overloads_by_length,
+            length_tests_methods(effective_overloads_by_length))
+
+
+def run_benchmark(type_registry, interface_overloads, repeat=5):
+    """Returns a dict of the fastest times of the runs, the hits and misses
+    of a cold run, and whether the resolutions are identical."""
+    all_overloads = [overloads for _, overloads in interface_overloads]
+    best_times = {'uncached': None, 'cold': None, 'warm': None}
+
+    def record(run, start_time):
+        elapsed_time = time.time() - start_time
+        if best_times[run] is None or elapsed_time < best_times[run]:
+            best_times[run] = elapsed_time
+
+    with use_type_registry(type_registry):
+        expected = [resolve_uncached(overloads) for overloads in all_overloads]
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start_time = time.time()
+                for overloads in all_overloads:
+                    resolve_uncached(overloads)
+                record('uncached', start_time)
+
+                type_registry.cache('overload_resolution').clear()
+                overload_resolution_cache.reset_statistics()
+                start_time = time.time()
+                actual = [overload_resolution_cache.resolve(overloads)
+                          for overloads in all_overloads]
+                record('cold', start_time)
+                statistics = overload_resolution_cache.statistics()
+
+                start_time = time.time()
+                for overloads in all_overloads:
+                    overload_resolution_cache.resolve(overloads)
+                record('warm', start_time)
+        finally:
+            gc.enable()
+    results = dict(statistics)
+    results.update(best_times)
+    results['identical'] = actual == expected
+    return results
+
+
+def main():
+    options, interface_names = parse_options()
+    type_registry, interface_overloads = collect_overloads(
+        options.info_dir, interface_names, options.target_component)
+    for interface_name in interface_names:
+        print('%-36s %3d overloaded methods' % (interface_name, sum(
+            1 for name, _ in interface_overloads if name == interface_name)))
+    results = run_benchmark(type_registry, interface_overloads, options.repeat)
+    hits, misses = results['hits'], results['misses']
+    print('cold run: %d hits, %d misses (%.1f%% hit rate)' % (
+        hits, misses, 100.0 * hits / max(hits + misses, 1)))
+    for run in ('uncached', 'cold', 'warm'):
+        print('%-8s %8.2fms %7.1fx' % (
+            run, results[run] * 1000,
+            results['uncached'] / max(results[run], 1e-9)))
+    if not results['identical']:
+        print('OVERLOAD RESOLUTION DIFFERS')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
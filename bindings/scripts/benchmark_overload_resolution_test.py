@@ -0,0 +1,56 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for benchmark_overload_resolution.py."""
+
+import unittest
+
+from benchmark_overload_resolution import overloaded_methods
+from benchmark_overload_resolution import run_benchmark
+from idl_types import IdlType
+from idl_types import TypeRegistry
+
+
+def method(name, type_names, is_static=False):
+    return {
+        'name': name,
+        'is_static': is_static,
+        'arguments': [{'idl_type_object': IdlType(type_name),
+                       'is_optional': False, 'is_variadic': False}
+                      for type_name in type_names],
+    }
+
+
+class BenchmarkOverloadResolutionTest(unittest.TestCase):
+
+    def test_overloaded_methods(self):
+        context = {
+            'methods': [method('uniform1f', ['float']),
+                        method('uniform1f', ['long']),
+                        method('clear', []),
+                        method('create', ['long'], is_static=True),
+                        method('create', ['DOMString'], is_static=True)],
+            'constructors': [method('', [])],
+        }
+        self.assertEqual(
+            [[overload['name'] for overload in overloads]
+             for overloads in overloaded_methods(context)],
+            [['uniform1f', 'uniform1f'], ['create', 'create']])
+
+    def test_run_benchmark(self):
+        interface_overloads = [
+            ('WebGLRenderingContext',
+             [method('uniform1f', ['float']), method('uniform1f', ['DOMString'])]),
+            ('WebGL2RenderingContext',
+             [method('uniform1f', ['float']), method('uniform1f', ['DOMString'])]),
+        ]
+        results = run_benchmark(TypeRegistry(), interface_overloads, repeat=2)
+        self.assertEqual((results['hits'], results['misses']), (1, 1))
+        self.assertTrue(results['identical'])
+
+
+if __name__ == '__main__':
+    unittest.main()
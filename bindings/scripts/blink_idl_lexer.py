@@ -54,8 +54,10 @@ http://www.chromium.org/developers/design-documents/idl-compiler#TOC-Front-end
 # Disable attribute validation, as lint can't import parent class to check
 # pylint: disable=E1101
 
+import hashlib
 import os.path
 import sys
+import types
 
 # PLY is in Chromium src/third_party/ply
 module_path, module_name = os.path.split(__file__)
@@ -69,36 +71,72 @@ tools_dir = os.path.join(third_party, os.pardir, 'tools')
 sys.path.append(tools_dir)
 from idl_parser.idl_lexer import IDLLexer
 
-LEXTAB = 'lextab'
+# Lex and parse tables generated by blink_idl_parser.py; see
+# write_tables_module() there.
+try:
+    import blink_idl_parser_tables
+except ImportError:
+    blink_idl_parser_tables = None
+
+
+def lexer_signature(lexer):
+    """Returns a hash of everything the lex tables are built from."""
+    rules = []
+    function_rules = []
+    for name in sorted(dir(lexer)):
+        if not name.startswith('t_'):
+            continue
+        rule = getattr(lexer, name)
+        if callable(rule):
+            code = rule.__code__
+            # Function rules are tried in the order they are defined.
+            function_rules.append(((code.co_filename, code.co_firstlineno),
+                                   name, rule.__doc__))
+        else:
+            rules.append((name, rule))
+    signature = repr((sorted(lexer.tokens), lexer.literals, rules,
+                      [rule[1:] for rule in sorted(function_rules)]))
+    return hashlib.sha1(signature.encode('utf-8')).hexdigest()
+
+
+def tables_module(name, tables):
+    """Returns |tables|, a dict of generated PLY tables, as a module."""
+    module = types.ModuleType(name)
+    module.__dict__.update(tables)
+    # PLY derives its default output directory from the module.
+    module.__file__ = blink_idl_parser_tables.__file__
+    return module
+
+
+def shipped_lextab(lexer):
+    """Returns the generated lex tables as a module, or None if they are
+    missing or were generated from other rules or by another PLY version."""
+    if (not blink_idl_parser_tables or
+            blink_idl_parser_tables.LEX_TABLES['_tabversion'] != lex.__tabversion__ or
+            blink_idl_parser_tables.LEXER_SIGNATURE != lexer_signature(lexer)):
+        return None
+    return tables_module('blink_idl_lextab', blink_idl_parser_tables.LEX_TABLES)
 
 
 class BlinkIDLLexer(IDLLexer):
     def __init__(self, debug=False, optimize=True, outputdir=None,
-                 rewrite_tables=False):
+                 engine='fast'):
+        # |outputdir| is no longer used: the lex tables are read from
+        # blink_idl_parser_tables.py rather than cached in a directory.
+        # |engine| is 'fast' (FastLexer; see idl_lexer.py) or 'ply'.  Both
+        # produce the same tokens; PLY is needed to debug or to generate the
+        # lex tables.
         if debug:
-            # Turn off optimization and caching to help debugging
+            engine = 'ply'
+        IDLLexer.__init__(self, engine=engine)
+        if engine != 'ply':
+            return
+        lextab = None
+        if optimize and not debug:
+            lextab = shipped_lextab(self)
+        if not lextab:
+            # Missing or stale tables; build them in memory.
             optimize = False
-            outputdir = None
-        if outputdir:
-            # Need outputdir in path because lex imports the cached lex table
-            # as a Python module
-            sys.path.append(outputdir)
-
-            if rewrite_tables:
-                tablefile_root = os.path.join(outputdir, LEXTAB)
-                # Also remove the .pyc/.pyo files, or they'll be used even if
-                # the .py file doesn't exist.
-                for ext in ('.py', '.pyc', '.pyo'):
-                    try:
-                        os.unlink(tablefile_root + ext)
-                    except OSError:
-                        pass
-
-            lextab = LEXTAB
-        else:
-            lextab = None
-
-        IDLLexer.__init__(self)
         # Optimized mode substantially decreases startup time (by disabling
         # error checking), and also allows use of Python's optimized mode.
         # See: Optimized Mode
@@ -106,24 +144,4 @@ class BlinkIDLLexer(IDLLexer):
         self._lexobj = lex.lex(object=self,
                                debug=debug,
                                optimize=optimize,
-                               lextab=lextab,
-                               outputdir=outputdir)
-
-
-################################################################################
-
-def main(argv):
-    # If file itself executed, build and cache lex table
-    try:
-        outputdir = argv[1]
-    except IndexError as err:
-        print('Usage: %s OUTPUT_DIR' % argv[0])
-        return 1
-    # Important: rewrite_tables=True causes the cache file to be deleted if it
-    # exists, thus making sure that PLY doesn't load it instead of regenerating
-    # the parse table.
-    lexer = BlinkIDLLexer(outputdir=outputdir, rewrite_tables=True)
-
-
-if __name__ == '__main__':
-    sys.exit(main(sys.argv))
+                               lextab=lextab)
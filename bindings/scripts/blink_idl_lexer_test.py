@@ -0,0 +1,82 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for blink_idl_lexer.py."""
+
+import io
+import os
+import unittest
+from unittest import mock
+
+from blink_idl_lexer import BlinkIDLLexer
+from ply import lex
+
+SOURCE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def idl_filenames():
+    filenames = []
+    for component in ('core', 'modules'):
+        for dirpath, _, basenames in os.walk(os.path.join(SOURCE_DIR, component)):
+            filenames.extend(os.path.join(dirpath, basename)
+                             for basename in basenames
+                             if basename.endswith('.idl'))
+    return sorted(filenames)
+
+
+def tokenize(engine, text, filename='test.idl'):
+    """Returns the tokens of |text|, and the lexer's final line state."""
+    lexer = BlinkIDLLexer(engine=engine)
+    lexer.Tokenize(text, filename)
+    tokens = [(token.type, token.value, token.lineno, token.lexpos)
+              for token in lexer.GetTokens()]
+    return tokens, lexer.Lexer().lineno, lexer.index
+
+
+class FastLexerTest(unittest.TestCase):
+
+    def assert_same_tokens(self, text, filename='test.idl'):
+        self.assertEqual(tokenize('fast', text, filename),
+                         tokenize('ply', text, filename),
+                         filename)
+
+    def test_conforms_to_ply_on_all_idl_files(self):
+        filenames = idl_filenames()
+        self.assertTrue(filenames)
+        for filename in filenames:
+            with open(filename) as idl_file:
+                self.assert_same_tokens(idl_file.read(), filename)
+
+    def test_conforms_to_ply_on_edge_cases(self):
+        self.assert_same_tokens(
+            '/** doc\n * comment */ interface _interface : A {\n'
+            '  // line\n  // comments\n\n'
+            '  const double x = -1.5e+3; const long y = 0x1F;\n'
+            '  attribute DOMString s = "multi\nline"; void f(long... args);\n'
+            '  /* block\n\n comment */ any? _or;\n};')
+
+    def test_illegal_character(self):
+        for engine in ('fast', 'ply'):
+            lexer = BlinkIDLLexer(engine=engine)
+            lexer.Tokenize('interface A {\n  @\n};', 'test.idl')
+            values = []
+            with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+                with self.assertRaises(lex.LexError):
+                    while True:
+                        token = lexer.token()
+                        if not token:
+                            break
+                        values.append(token.value)
+            # The tokens before the error are returned, and the error is
+            # reported once.
+            self.assertEqual(values, ['interface', 'A', '{'])
+            self.assertEqual(lexer.Lexer().lexpos, 16)
+            self.assertEqual(stderr.getvalue(),
+                             '\ntest.idl(3) : Unrecognized input\n'
+                             '  @\n  ^\n')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -56,13 +56,16 @@ http://www.chromium.org/developers/design-documents/idl-compiler#TOC-Front-end
 #
 
 import os.path
+import shutil
 import sys
+import tempfile
 
 # PLY is in Chromium src/third_party/ply
 module_path, module_name = os.path.split(__file__)
 third_party = os.path.join(module_path, os.pardir, os.pardir, os.pardir, os.pardir)
 # Insert at front to override system libraries, and after path[0] == script dir
 sys.path.insert(1, third_party)
+from ply import lex
 from ply import yacc
 
 # Base parser is in Chromium src/tools/idl_parser
@@ -72,52 +75,70 @@ from idl_parser.idl_parser import IDLParser  # pylint: disable=import-error
 from idl_parser.idl_parser import ParseFile as parse_file
 
 from blink_idl_lexer import BlinkIDLLexer
+from blink_idl_lexer import blink_idl_parser_tables
+from blink_idl_lexer import lexer_signature
+from blink_idl_lexer import tables_module
+
+TABLES_MODULE_PATH = os.path.join(module_path, 'blink_idl_parser_tables.py')
+# Module name under which PLY would look for tables it cannot find.
+MISSING_TABMODULE = 'blink_idl_parsetab_missing'
+
+
+def parser_signature(parser):
+    """Returns the signature PLY computes for the grammar of |parser|."""
+    pdict = dict((name, getattr(parser, name)) for name in dir(parser))
+    pdict['__file__'] = sys.modules[pdict['__module__']].__file__
+    parser_info = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    parser_info.get_all()
+    return parser_info.signature()
+
+
+def shipped_parsetab(parser):
+    """Returns the generated parse tables as a module, or None if they are
+    missing or were generated from another grammar or by another PLY
+    version."""
+    if (not blink_idl_parser_tables or
+            blink_idl_parser_tables.PARSE_TABLES['_tabversion'] != yacc.__tabversion__ or
+            blink_idl_parser_tables.PARSE_TABLES['_lr_signature'] != parser_signature(parser)):
+        return None
+    return tables_module('blink_idl_parsetab', blink_idl_parser_tables.PARSE_TABLES)
+
 
 class BlinkIDLParser(IDLParser):
     def __init__(self,
                  # common parameters
                  debug=False,
-                 # local parameters
-                 rewrite_tables=False,
                  # idl_parser parameters
                  lexer=None, verbose=False, mute_error=False,
                  # yacc parameters
-                 outputdir='', optimize=True, write_tables=False,
-                 picklefile=None):
+                 outputdir='', optimize=True):
+        # |outputdir| is no longer used: the lex and parse tables are
+        # generated into blink_idl_parser_tables.py (see main()) and imported,
+        # so no cache directory is needed.
+        write_tables = False
         if debug:
-            # Turn off optimization and caching, and write out tables,
-            # to help debugging
+            # Turn off optimization, and write out tables, to help debugging
             optimize = False
-            outputdir = None
-            picklefile = None
             write_tables = True
-        if outputdir:
-            picklefile = picklefile or os.path.join(outputdir, 'parsetab.pickle')
-            if rewrite_tables:
-                try:
-                    os.unlink(picklefile)
-                except OSError:
-                    pass
-
-        lexer = lexer or BlinkIDLLexer(debug=debug,
-                                       outputdir=outputdir,
-                                       optimize=optimize)
+
+        lexer = lexer or BlinkIDLLexer(debug=debug, optimize=optimize)
         self.lexer = lexer
         self.tokens = lexer.KnownTokens()
+        tabmodule = None
+        if optimize:
+            tabmodule = shipped_parsetab(self)
+        if not tabmodule:
+            # Missing or stale tables; build them in memory.
+            optimize = False
         # Optimized mode substantially decreases startup time (by disabling
         # error checking), and also allows use of Python's optimized mode.
         # See: Using Python's Optimized Mode
         # http://www.dabeaz.com/ply/ply.html#ply_nn38
-        #
-        # |picklefile| allows simpler importing than |tabmodule| (parsetab.py),
-        # as we don't need to modify sys.path; virtually identical speed.
-        # See: CHANGES, Version 3.2
-        # http://ply.googlecode.com/svn/trunk/CHANGES
         self.yaccobj = yacc.yacc(module=self,
                                  debug=debug,
                                  optimize=optimize,
-                                 write_tables=write_tables,
-                                 picklefile=picklefile)
+                                 tabmodule=tabmodule or MISSING_TABMODULE,
+                                 write_tables=write_tables)
         self.parse_debug = debug
         self.verbose = verbose
         self.mute_error = mute_error
@@ -130,18 +151,75 @@ class BlinkIDLParser(IDLParser):
 
 ################################################################################
 
-def main(argv):
-    # If file itself executed, cache lex/parse tables
+def generate_tables(generator, directory):
+    """Runs |generator| to write a PLY table module into |directory|, and
+    returns the tables defined by the module."""
+    tables = {}
+    filename = generator(directory)
+    with open(filename) as table_file:
+        exec(compile(table_file.read(), filename, 'exec'), tables)  # pylint: disable=exec-used
+    del tables['__builtins__']
+    return tables
+
+
+def format_tables(tables):
+    lines = ['{']
+    for key, value in sorted(tables.items()):
+        # Sets are written sorted, so that regenerating is deterministic.
+        if isinstance(value, (set, frozenset)):
+            value_text = 'set(%r)' % sorted(value)
+        else:
+            value_text = repr(value)
+        lines.append('    %r: %s,' % (key, value_text))
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def write_tables_module(filename=TABLES_MODULE_PATH):
+    """Builds the lex and parse tables and writes them as a Python module."""
+    lexer = BlinkIDLLexer(optimize=False, engine='ply')
+    parser = BlinkIDLParser(lexer=lexer, optimize=False)
+
+    def write_lextab(directory):
+        lexer.Lexer().writetab('lextab', directory)
+        return os.path.join(directory, 'lextab.py')
+
+    def write_parsetab(directory):
+        yacc.yacc(module=parser, tabmodule='parsetab', outputdir=directory,
+                  write_tables=True, debug=False)
+        return os.path.join(directory, 'parsetab.py')
+
+    temp_dir = tempfile.mkdtemp()
     try:
-        outputdir = argv[1]
-    except IndexError as err:
-        print('Usage: %s OUTPUT_DIR' % argv[0])
+        lex_tables = generate_tables(write_lextab, temp_dir)
+        parse_tables = generate_tables(write_parsetab, temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    with open(filename, 'w') as tables_file:
+        tables_file.write(
+            '# Lex and parse tables for Blink IDL, generated by\n'
+            '# blink_idl_parser.py with PLY %s. Do not edit; rerun\n'
+            '# blink_idl_parser.py after changing the lexer or the grammar.\n'
+            '\n'
+            '# pylint: skip-file\n'
+            '\n'
+            'LEXER_SIGNATURE = %r\n'
+            '\n'
+            'LEX_TABLES = %s\n'
+            '\n'
+            'PARSE_TABLES = %s\n' % (
+                lex.__version__, lexer_signature(lexer),
+                format_tables(lex_tables), format_tables(parse_tables)))
+
+
+def main(argv):
+    # If file itself executed, regenerate the lex/parse tables module
+    if len(argv) > 2:
+        print('Usage: %s [OUTPUT_FILE]' % argv[0])
         return 1
-    blink_idl_lexer.main(argv)
-    # Important: rewrite_tables=True causes the cache file to be deleted if it
-    # exists, thus making sure that PLY doesn't load it instead of regenerating
-    # the parse table.
-    parser = BlinkIDLParser(outputdir=outputdir, rewrite_tables=True)
+    write_tables_module(*argv[1:])
+    return 0
 
 
 if __name__ == '__main__':
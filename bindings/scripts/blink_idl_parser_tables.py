@@ -0,0 +1,32 @@
+# Lex and parse tables for Blink IDL, generated by
+# blink_idl_parser.py with PLY 3.11. Do not edit; rerun
+# blink_idl_parser.py after changing the lexer or the grammar.
+
+# pylint: skip-file
+
+LEXER_SIGNATURE = '0ef9a9db3cddf796dc9a259870444ca0e09aa9f6'
+
+LEX_TABLES = {
+    '_lexliterals': '"*.(){}[],;:=+-/~|&^?<>',
+    '_lexreflags': 64,
+    '_lexstateeoff': {},
+    '_lexstateerrorf': {'INITIAL': 't_ANY_error'},
+    '_lexstateignore': {'INITIAL': ' \t'},
+    '_lexstateinfo': {'INITIAL': 'inclusive'},
+    '_lexstatere': {'INITIAL': [('(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_float>-?(([0-9]+\\.[0-9]*|[0-9]*\\.[0-9]+)([Ee][+-]?[0-9]+)?|[0-9]+[Ee][+-]?[0-9]+))|(?P<t_integer>-?([1-9][0-9]*|0[Xx][0-9A-Fa-f]+|0[0-7]*))|(?P<t_LINE_END>\\n+)|(?P<t_string>"[^"]*")|(?P<t_SPECIAL_COMMENT>/\\*\\*(.|\\n)+?\\*/)|(?P<t_COMMENT>(/\\*(.|\\n)*?\\*/)|(//.*(\\n[ \\t]*//.*)*))|(?P<t_KEYWORD_OR_SYMBOL>_?[A-Za-z][A-Za-z_0-9]*)', [None, ('t_ELLIPSIS', 'ELLIPSIS'), ('t_float', 'float'), None, None, None, ('t_integer', 'integer'), None, ('t_LINE_END', 'LINE_END'), ('t_string', 'string'), ('t_SPECIAL_COMMENT', 'SPECIAL_COMMENT'), None, ('t_COMMENT', 'COMMENT'), None, None, None, None, ('t_KEYWORD_OR_SYMBOL', 'KEYWORD_OR_SYMBOL')])]},
+    '_lextokens': set(['ANY', 'ATTRIBUTE', 'BOOLEAN', 'BYTE', 'BYTESTRING', 'CALLBACK', 'CONST', 'CREATOR', 'DATE', 'DELETER', 'DICTIONARY', 'DOMSTRING', 'DOUBLE', 'ELLIPSIS', 'ENUM', 'FALSE', 'FLOAT', 'FROZENARRAY', 'GETTER', 'IMPLEMENTS', 'INFINITY', 'INHERIT', 'INTERFACE', 'ITERABLE', 'LEGACYCALLER', 'LONG', 'MAPLIKE', 'NAMESPACE', 'NAN', 'NULL', 'OBJECT', 'OCTET', 'OPTIONAL', 'OR', 'PARTIAL', 'PROMISE', 'READONLY', 'RECORD', 'REGEXP', 'REQUIRED', 'SEQUENCE', 'SERIALIZER', 'SETLIKE', 'SETTER', 'SHORT', 'SPECIAL_COMMENT', 'STATIC', 'STRINGIFIER', 'TRUE', 'TYPEDEF', 'UNRESTRICTED', 'UNSIGNED', 'USVSTRING', 'VOID', 'float', 'identifier', 'integer', 'string']),
+    '_tabversion': '3.10',
+}
+
+PARSE_TABLES = {
+    '_k': 'OptionalType',
+    '_lr_action': {0: {'$end': -3, 'SPECIAL_COMMENT': 4, '[': 5, 'error': -152, 'CALLBACK': -152, 'NAMESPACE': -152, 'PARTIAL': -152, 'DICTIONARY': -152, 'ENUM': -152, 'TYPEDEF': -152, 'identifier': -152, 'INTERFACE': -152}, 1: {'$end': 0}, 7: {'$end': -3, 'SPECIAL_COMMENT': 4, '[': 5, 'error': -152, 'CALLBACK': -152, 'NAMESPACE': -152, 'PARTIAL': -152, 'DICTIONARY': -152, 'ENUM': -152, 'TYPEDEF': -152, 'identifier': -152, 'INTERFACE': -152}, 8: {'$end': -4, 'SPECIAL_COMMENT': -4, '[': -4, 'error': -4, 'CALLBACK': -4, 'NAMESPACE': -4, 'PARTIAL': -4, 'DICTIONARY': -4, 'ENUM': -4, 'TYPEDEF': -4, 'identifier': -4, 'INTERFACE': -4}, 9: {'$end': -5, 'SPECIAL_COMMENT': -5, '[': -5, 'error': -5, 'CALLBACK': -5, 'NAMESPACE': -5, 'PARTIAL': -5, 'DICTIONARY': -5, 'ENUM': -5, 'TYPEDEF': -5, 'identifier': -5, 'INTERFACE': -5}, 10: {'$end': -6, 'SPECIAL_COMMENT': -6, '[': -6, 'error': -6, 'CALLBACK': -6, 'NAMESPACE': -6, 'PARTIAL': -6, 'DICTIONARY': -6, 'ENUM': -6, 'TYPEDEF': -6, 'identifier': -6, 'INTERFACE': -6}, 11: {'$end': -7, 'SPECIAL_COMMENT': -7, '[': -7, 'error': -7, 'CALLBACK': -7, 'NAMESPACE': -7, 'PARTIAL': -7, 'DICTIONARY': -7, 'ENUM': -7, 'TYPEDEF': -7, 'identifier': -7, 'INTERFACE': -7}, 12: {'$end': -8, 'SPECIAL_COMMENT': -8, '[': -8, 'error': -8, 'CALLBACK': -8, 'NAMESPACE': -8, 'PARTIAL': -8, 'DICTIONARY': -8, 'ENUM': -8, 'TYPEDEF': -8, 'identifier': -8, 'INTERFACE': -8}, 13: {'$end': -9, 'SPECIAL_COMMENT': -9, '[': -9, 'error': -9, 'CALLBACK': -9, 'NAMESPACE': -9, 'PARTIAL': -9, 'DICTIONARY': -9, 'ENUM': -9, 'TYPEDEF': -9, 'identifier': -9, 'INTERFACE': -9}, 14: {'$end': -10, 'SPECIAL_COMMENT': -10, '[': -10, 'error': -10, 'CALLBACK': -10, 'NAMESPACE': -10, 'PARTIAL': -10, 'DICTIONARY': -10, 'ENUM': -10, 'TYPEDEF': -10, 'identifier': -10, 'INTERFACE': -10}, 17: {'$end': -13, 'SPECIAL_COMMENT': -13, '[': -13, 'error': -13, 'CALLBACK': -13, 'NAMESPACE': -13, 'PARTIAL': -13, 'DICTIONARY': -13, 'ENUM': -13, 'TYPEDEF': -13, 'identifier': -13, 'INTERFACE': -13}, 35: {'$end': -3, 'SPECIAL_COMMENT': 4, '[': 5, 'error': -152, 'CALLBACK': -152, 'NAMESPACE': -152, 'PARTIAL': -152, 'DICTIONARY': -152, 'ENUM': -152, 'TYPEDEF': -152, 'identifier': -152, 'INTERFACE': -152}, 36: {'$end': -2}, 37: {'$end': -11, 'SPECIAL_COMMENT': -11, '[': -11, 'error': -11, 'CALLBACK': -11, 'NAMESPACE': -11, 'PARTIAL': -11, 'DICTIONARY': -11, 'ENUM': -11, 'TYPEDEF': -11, 'identifier': -11, 'INTERFACE': -11}, 38: {'$end': -12, 'SPECIAL_COMMENT': -12, '[': -12, 'error': -12, 'CALLBACK': -12, 'NAMESPACE': -12, 'PARTIAL': -12, 'DICTIONARY': -12, 'ENUM': -12, 'TYPEDEF': -12, 'identifier': -12, 'INTERFACE': -12}, 39: {'$end': -14, 'SPECIAL_COMMENT': -14, '[': -14, 'error': -14, 'CALLBACK': -14, 'NAMESPACE': -14, 'PARTIAL': -14, 'DICTIONARY': -14, 'ENUM': -14, 'TYPEDEF': -14, 'identifier': -14, 'INTERFACE': -14}, 40: {'$end': -15, 'SPECIAL_COMMENT': -15, '[': -15, 'error': -15, 'CALLBACK': -15, 'NAMESPACE': -15, 'PARTIAL': -15, 'DICTIONARY': -15, 'ENUM': -15, 'TYPEDEF': -15, 'identifier': -15, 'INTERFACE': -15}, 44: {'$end': -18, 'SPECIAL_COMMENT': -18, '[': -18, 'error': -18, 'CALLBACK': -18, 'NAMESPACE': -18, 'PARTIAL': -18, 'DICTIONARY': -18, 'ENUM': -18, 'TYPEDEF': -18, 'identifier': -18, 'INTERFACE': -18}, 45: {'$end': -19, 'SPECIAL_COMMENT': -19, '[': -19, 'error': -19, 'CALLBACK': -19, 'NAMESPACE': -19, 'PARTIAL': -19, 'DICTIONARY': -19, 'ENUM': -19, 'TYPEDEF': -19, 'identifier': -19, 'INTERFACE': -19}, 46: {'$end': -20, 'SPECIAL_COMMENT': -20, '[': -20, 'error': -20, 'CALLBACK': -20, 'NAMESPACE': -20, 'PARTIAL': -20, 'DICTIONARY': -20, 'ENUM': -20, 'TYPEDEF': -20, 'identifier': -20, 'INTERFACE': -20}, 47: {'$end': -21, 'SPECIAL_COMMENT': -21, '[': -21, 'error': -21, 'CALLBACK': -21, 'NAMESPACE': -21, 'PARTIAL': -21, 'DICTIONARY': -21, 'ENUM': -21, 'TYPEDEF': -21, 'identifier': -21, 'INTERFACE': -21}, 48: {'$end': -22, 'SPECIAL_COMMENT': -22, '[': -22, 'error': -22, 'CALLBACK': -22, 'NAMESPACE': -22, 'PARTIAL': -22, 'DICTIONARY': -22, 'ENUM': -22, 'TYPEDEF': -22, 'identifier': -22, 'INTERFACE': -22}, 63: {'$end': -1}, 72: {'$end': -38, 'SPECIAL_COMMENT': -38, '[': -38, 'error': -38, 'CALLBACK': -38, 'NAMESPACE': -38, 'PARTIAL': -38, 'DICTIONARY': -38, 'ENUM': -38, 'TYPEDEF': -38, 'identifier': -38, 'INTERFACE': -38}, 74: {'$end': -55, 'SPECIAL_COMMENT': -55, '[': -55, 'error': -55, 'CALLBACK': -55, 'NAMESPACE': -55, 'PARTIAL': -55, 'DICTIONARY': -55, 'ENUM': -55, 'TYPEDEF': -55, 'identifier': -55, 'INTERFACE': -55}, 76: {'$end': -63, 'SPECIAL_COMMENT': -63, '[': -63, 'error': -63, 'CALLBACK': -63, 'NAMESPACE': -63, 'PARTIAL': -63, 'DICTIONARY': -63, 'ENUM': -63, 'TYPEDEF': -63, 'identifier': -63, 'INTERFACE': -63}, 128: {'$end': -145, 'SPECIAL_COMMENT': -145, '[': -145, 'error': -145, 'CALLBACK': -145, 'NAMESPACE': -145, 'PARTIAL': -145, 'DICTIONARY': -145, 'ENUM': -145, 'TYPEDEF': -145, 'identifier': -145, 'INTERFACE': -145}, 131: {'$end': -64, 'SPECIAL_COMMENT': -64, '[': -64, 'error': -64, 'CALLBACK': -64, 'NAMESPACE': -64, 'PARTIAL': -64, 'DICTIONARY': -64, 'ENUM': -64, 'TYPEDEF': -64, 'identifier': -64, 'INTERFACE': -64}, 133: {'$end': -46, 'SPECIAL_COMMENT': -46, '[': -46, 'error': -46, 'CALLBACK': -46, 'NAMESPACE': -46, 'PARTIAL': -46, 'DICTIONARY': -46, 'ENUM': -46, 'TYPEDEF': -46, 'identifier': -46, 'INTERFACE': -46}, 139: {'$end': -62, 'SPECIAL_COMMENT': -62, '[': -62, 'error': -62, 'CALLBACK': -62, 'NAMESPACE': -62, 'PARTIAL': -62, 'DICTIONARY': -62, 'ENUM': -62, 'TYPEDEF': -62, 'identifier': -62, 'INTERFACE': -62}, 184: {'$end': -39, 'SPECIAL_COMMENT': -39, '[': -39, 'error': -39, 'CALLBACK': -39, 'NAMESPACE': -39, 'PARTIAL': -39, 'DICTIONARY': -39, 'ENUM': -39, 'TYPEDEF': -39, 'identifier': -39, 'INTERFACE': -39}, 195: {'$end': -17, 'SPECIAL_COMMENT': -17, '[': -17, 'error': -17, 'CALLBACK': -17, 'NAMESPACE': -17, 'PARTIAL': -17, 'DICTIONARY': -17, 'ENUM': -17, 'TYPEDEF': -17, 'identifier': -17, 'INTERFACE': -17, '}': -26}, 208: {'$end': -144, 'SPECIAL_COMMENT': -144, '[': -144, 'error': -144, 'CALLBACK': -144, 'NAMESPACE': -144, 'PARTIAL': -144, 'DICTIONARY': -144, 'ENUM': -144, 'TYPEDEF': -144, 'identifier': -144, 'INTERFACE': -144}, 252: {'$end': -54, 'SPECIAL_COMMENT': -54, '[': -54, 'error': -54, 'CALLBACK': -54, 'NAMESPACE': -54, 'PARTIAL': -54, 'DICTIONARY': -54, 'ENUM': -54, 'TYPEDEF': -54, 'identifier': -54, 'INTERFACE': -54}, 292: {'$end': -45, 'SPECIAL_COMMENT': -45, '[': -45, 'error': -45, 'CALLBACK': -45, 'NAMESPACE': -45, 'PARTIAL': -45, 'DICTIONARY': -45, 'ENUM': -45, 'TYPEDEF': -45, 'identifier': -45, 'INTERFACE': -45}, 295: {'$end': -23, 'SPECIAL_COMMENT': -23, '[': -23, 'error': -23, 'CALLBACK': -23, 'NAMESPACE': -23, 'PARTIAL': -23, 'DICTIONARY': -23, 'ENUM': -23, 'TYPEDEF': -23, 'identifier': -23, 'INTERFACE': -23}, 323: {'$end': -37, 'SPECIAL_COMMENT': -37, '[': -37, 'error': -37, 'CALLBACK': -37, 'NAMESPACE': -37, 'PARTIAL': -37, 'DICTIONARY': -37, 'ENUM': -37, 'TYPEDEF': -37, 'identifier': -37, 'INTERFACE': -37}, 332: {'$end': -16, 'SPECIAL_COMMENT': -16, '[': -16, 'error': -16, 'CALLBACK': -16, 'NAMESPACE': -16, 'PARTIAL': -16, 'DICTIONARY': -16, 'ENUM': -16, 'TYPEDEF': -16, 'identifier': -16, 'INTERFACE': -16}, 336: {'$end': -61, 'SPECIAL_COMMENT': -61, '[': -61, 'error': -61, 'CALLBACK': -61, 'NAMESPACE': -61, 'PARTIAL': -61, 'DICTIONARY': -61, 'ENUM': -61, 'TYPEDEF': -61, 'identifier': -61, 'INTERFACE': -61}, 4: {'SPECIAL_COMMENT': 4, '[': -245, 'error': -245, 'CALLBACK': -245, 'NAMESPACE': -245, 'PARTIAL': -245, 'DICTIONARY': -245, 'ENUM': -245, 'TYPEDEF': -245, 'identifier': -245, 'INTERFACE': -245}, 2: {'[': 5, 'error': -152, 'CALLBACK': -152, 'NAMESPACE': -152, 'PARTIAL': -152, 'DICTIONARY': -152, 'ENUM': -152, 'TYPEDEF': -152, 'identifier': -152, 'INTERFACE': -152}, 23: {'[': 5, 'error': 56, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 25: {'[': -244, 'error': -244, 'CALLBACK': -244, 'NAMESPACE': -244, 'PARTIAL': -244, 'DICTIONARY': -244, 'ENUM': -244, 'TYPEDEF': -244, 'identifier': -244, 'INTERFACE': -244}, 61: {'[': 5, 'error': 116, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, ')': -126, 'OPTIONAL': -152}, 65: {'[': 5, 'error': 128, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, 'VOID': -152, '}': -147, 'READONLY': -152}, 73: {'[': 5, 'string': -152}, 129: {'[': 5, 'error': -152, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, 'VOID': -152, '}': -147, 'READONLY': -152}, 132: {'[': 5, 'error': -152, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, '}': -41, 'REQUIRED': -152}, 134: {'[': 5, 'error': 182, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, 'VOID': -152, '}': -25, 'READONLY': -152, 'ATTRIBUTE': -152, 'CONST': -152, 'CREATOR': -152, 'DELETER': -152, 'GETTER': -152, 'INHERIT': -152, 'LEGACYCALLER': -152, 'SERIALIZER': -152, 'SETTER': -152, 'STATIC': -152, 'STRINGIFIER': -152, 'ITERABLE': -152, 'MAPLIKE': -152, 'SETLIKE': -152}, 135: {'[': 5, 'error': 184, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, '}': -41, 'REQUIRED': -152}, 148: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 149: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 157: {'[': 5, 'error': 195, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, 'VOID': -152, '}': -25, 'READONLY': -152, 'ATTRIBUTE': -152, 'CONST': -152, 'CREATOR': -152, 'DELETER': -152, 'GETTER': -152, 'INHERIT': -152, 'LEGACYCALLER': -152, 'SERIALIZER': -152, 'SETTER': -152, 'STATIC': -152, 'STRINGIFIER': -152, 'ITERABLE': -152, 'MAPLIKE': -152, 'SETLIKE': -152}, 162: {'[': 5, 'error': 197, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, 'OPTIONAL': -152}, 163: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 165: {'[': 5, 'error': 116, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, ')': -126, 'OPTIONAL': -152}, 170: {'[': 5, 'error': 116, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, ')': -126, 'OPTIONAL': -152}, 178: {'[': 5, 'error': -152, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, '}': -41, 'REQUIRED': -152}, 209: {'[': -149, 'error': -149, 'identifier': -149, 'ANY': -149, '(': -149, 'SEQUENCE': -149, 'FROZENARRAY': -149, 'BOOLEAN': -149, 'BYTE': -149, 'OCTET': -149, 'OBJECT': -149, 'DATE': -149, 'REGEXP': -149, 'PROMISE': -149, 'RECORD': -149, 'UNSIGNED': -149, 'UNRESTRICTED': -149, 'BYTESTRING': -149, 'DOMSTRING': -149, 'USVSTRING': -149, 'SHORT': -149, 'LONG': -149, 'FLOAT': -149, 'DOUBLE': -149, 'VOID': -149, '}': -149, 'READONLY': -149}, 212: {'[': -150, 'error': -150, 'identifier': -150, 'ANY': -150, '(': -150, 'SEQUENCE': -150, 'FROZENARRAY': -150, 'BOOLEAN': -150, 'BYTE': -150, 'OCTET': -150, 'OBJECT': -150, 'DATE': -150, 'REGEXP': -150, 'PROMISE': -150, 'RECORD': -150, 'UNSIGNED': -150, 'UNRESTRICTED': -150, 'BYTESTRING': -150, 'DOMSTRING': -150, 'USVSTRING': -150, 'SHORT': -150, 'LONG': -150, 'FLOAT': -150, 'DOUBLE': -150, 'VOID': -150, '}': -150, 'READONLY': -150}, 213: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 217: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 220: {'[': 5, 'error': 182, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, 'VOID': -152, '}': -25, 'READONLY': -152, 'ATTRIBUTE': -152, 'CONST': -152, 'CREATOR': -152, 'DELETER': -152, 'GETTER': -152, 'INHERIT': -152, 'LEGACYCALLER': -152, 'SERIALIZER': -152, 'SETTER': -152, 'STATIC': -152, 'STRINGIFIER': -152, 'ITERABLE': -152, 'MAPLIKE': -152, 'SETLIKE': -152}, 221: {'[': -27, 'error': -27, 'identifier': -27, 'ANY': -27, '(': -27, 'SEQUENCE': -27, 'FROZENARRAY': -27, 'BOOLEAN': -27, 'BYTE': -27, 'OCTET': -27, 'OBJECT': -27, 'DATE': -27, 'REGEXP': -27, 'PROMISE': -27, 'RECORD': -27, 'UNSIGNED': -27, 'UNRESTRICTED': -27, 'BYTESTRING': -27, 'DOMSTRING': -27, 'USVSTRING': -27, 'SHORT': -27, 'LONG': -27, 'FLOAT': -27, 'DOUBLE': -27, 'VOID': -27, '}': -27, 'READONLY': -27, 'ATTRIBUTE': -27, 'CONST': -27, 'CREATOR': -27, 'DELETER': -27, 'GETTER': -27, 'INHERIT': -27, 'LEGACYCALLER': -27, 'SERIALIZER': -27, 'SETTER': -27, 'STATIC': -27, 'STRINGIFIER': -27, 'ITERABLE': -27, 'MAPLIKE': -27, 'SETLIKE': -27}, 222: {'[': -28, 'error': -28, 'identifier': -28, 'ANY': -28, '(': -28, 'SEQUENCE': -28, 'FROZENARRAY': -28, 'BOOLEAN': -28, 'BYTE': -28, 'OCTET': -28, 'OBJECT': -28, 'DATE': -28, 'REGEXP': -28, 'PROMISE': -28, 'RECORD': -28, 'UNSIGNED': -28, 'UNRESTRICTED': -28, 'BYTESTRING': -28, 'DOMSTRING': -28, 'USVSTRING': -28, 'SHORT': -28, 'LONG': -28, 'FLOAT': -28, 'DOUBLE': -28, 'VOID': -28, '}': -28, 'READONLY': -28, 'ATTRIBUTE': -28, 'CONST': -28, 'CREATOR': -28, 'DELETER': -28, 'GETTER': -28, 'INHERIT': -28, 'LEGACYCALLER': -28, 'SERIALIZER': -28, 'SETTER': -28, 'STATIC': -28, 'STRINGIFIER': -28, 'ITERABLE': -28, 'MAPLIKE': -28, 'SETLIKE': -28}, 223: {'[': -29, 'error': -29, 'identifier': -29, 'ANY': -29, '(': -29, 'SEQUENCE': -29, 'FROZENARRAY': -29, 'BOOLEAN': -29, 'BYTE': -29, 'OCTET': -29, 'OBJECT': -29, 'DATE': -29, 'REGEXP': -29, 'PROMISE': -29, 'RECORD': -29, 'UNSIGNED': -29, 'UNRESTRICTED': -29, 'BYTESTRING': -29, 'DOMSTRING': -29, 'USVSTRING': -29, 'SHORT': -29, 'LONG': -29, 'FLOAT': -29, 'DOUBLE': -29, 'VOID': -29, '}': -29, 'READONLY': -29, 'ATTRIBUTE': -29, 'CONST': -29, 'CREATOR': -29, 'DELETER': -29, 'GETTER': -29, 'INHERIT': -29, 'LEGACYCALLER': -29, 'SERIALIZER': -29, 'SETTER': -29, 'STATIC': -29, 'STRINGIFIER': -29, 'ITERABLE': -29, 'MAPLIKE': -29, 'SETLIKE': -29}, 224: {'[': -30, 'error': -30, 'identifier': -30, 'ANY': -30, '(': -30, 'SEQUENCE': -30, 'FROZENARRAY': -30, 'BOOLEAN': -30, 'BYTE': -30, 'OCTET': -30, 'OBJECT': -30, 'DATE': -30, 'REGEXP': -30, 'PROMISE': -30, 'RECORD': -30, 'UNSIGNED': -30, 'UNRESTRICTED': -30, 'BYTESTRING': -30, 'DOMSTRING': -30, 'USVSTRING': -30, 'SHORT': -30, 'LONG': -30, 'FLOAT': -30, 'DOUBLE': -30, 'VOID': -30, '}': -30, 'READONLY': -30, 'ATTRIBUTE': -30, 'CONST': -30, 'CREATOR': -30, 'DELETER': -30, 'GETTER': -30, 'INHERIT': -30, 'LEGACYCALLER': -30, 'SERIALIZER': -30, 'SETTER': -30, 'STATIC': -30, 'STRINGIFIER': -30, 'ITERABLE': -30, 'MAPLIKE': -30, 'SETLIKE': -30}, 225: {'[': -31, 'error': -31, 'identifier': -31, 'ANY': -31, '(': -31, 'SEQUENCE': -31, 'FROZENARRAY': -31, 'BOOLEAN': -31, 'BYTE': -31, 'OCTET': -31, 'OBJECT': -31, 'DATE': -31, 'REGEXP': -31, 'PROMISE': -31, 'RECORD': -31, 'UNSIGNED': -31, 'UNRESTRICTED': -31, 'BYTESTRING': -31, 'DOMSTRING': -31, 'USVSTRING': -31, 'SHORT': -31, 'LONG': -31, 'FLOAT': -31, 'DOUBLE': -31, 'VOID': -31, '}': -31, 'READONLY': -31, 'ATTRIBUTE': -31, 'CONST': -31, 'CREATOR': -31, 'DELETER': -31, 'GETTER': -31, 'INHERIT': -31, 'LEGACYCALLER': -31, 'SERIALIZER': -31, 'SETTER': -31, 'STATIC': -31, 'STRINGIFIER': -31, 'ITERABLE': -31, 'MAPLIKE': -31, 'SETLIKE': -31}, 226: {'[': -32, 'error': -32, 'identifier': -32, 'ANY': -32, '(': -32, 'SEQUENCE': -32, 'FROZENARRAY': -32, 'BOOLEAN': -32, 'BYTE': -32, 'OCTET': -32, 'OBJECT': -32, 'DATE': -32, 'REGEXP': -32, 'PROMISE': -32, 'RECORD': -32, 'UNSIGNED': -32, 'UNRESTRICTED': -32, 'BYTESTRING': -32, 'DOMSTRING': -32, 'USVSTRING': -32, 'SHORT': -32, 'LONG': -32, 'FLOAT': -32, 'DOUBLE': -32, 'VOID': -32, '}': -32, 'READONLY': -32, 'ATTRIBUTE': -32, 'CONST': -32, 'CREATOR': -32, 'DELETER': -32, 'GETTER': -32, 'INHERIT': -32, 'LEGACYCALLER': -32, 'SERIALIZER': -32, 'SETTER': -32, 'STATIC': -32, 'STRINGIFIER': -32, 'ITERABLE': -32, 'MAPLIKE': -32, 'SETLIKE': -32}, 227: {'[': -33, 'error': -33, 'identifier': -33, 'ANY': -33, '(': -33, 'SEQUENCE': -33, 'FROZENARRAY': -33, 'BOOLEAN': -33, 'BYTE': -33, 'OCTET': -33, 'OBJECT': -33, 'DATE': -33, 'REGEXP': -33, 'PROMISE': -33, 'RECORD': -33, 'UNSIGNED': -33, 'UNRESTRICTED': -33, 'BYTESTRING': -33, 'DOMSTRING': -33, 'USVSTRING': -33, 'SHORT': -33, 'LONG': -33, 'FLOAT': -33, 'DOUBLE': -33, 'VOID': -33, '}': -33, 'READONLY': -33, 'ATTRIBUTE': -33, 'CONST': -33, 'CREATOR': -33, 'DELETER': -33, 'GETTER': -33, 'INHERIT': -33, 'LEGACYCALLER': -33, 'SERIALIZER': -33, 'SETTER': -33, 'STATIC': -33, 'STRINGIFIER': -33, 'ITERABLE': -33, 'MAPLIKE': -33, 'SETLIKE': -33}, 228: {'[': -34, 'error': -34, 'identifier': -34, 'ANY': -34, '(': -34, 'SEQUENCE': -34, 'FROZENARRAY': -34, 'BOOLEAN': -34, 'BYTE': -34, 'OCTET': -34, 'OBJECT': -34, 'DATE': -34, 'REGEXP': -34, 'PROMISE': -34, 'RECORD': -34, 'UNSIGNED': -34, 'UNRESTRICTED': -34, 'BYTESTRING': -34, 'DOMSTRING': -34, 'USVSTRING': -34, 'SHORT': -34, 'LONG': -34, 'FLOAT': -34, 'DOUBLE': -34, 'VOID': -34, '}': -34, 'READONLY': -34, 'ATTRIBUTE': -34, 'CONST': -34, 'CREATOR': -34, 'DELETER': -34, 'GETTER': -34, 'INHERIT': -34, 'LEGACYCALLER': -34, 'SERIALIZER': -34, 'SETTER': -34, 'STATIC': -34, 'STRINGIFIER': -34, 'ITERABLE': -34, 'MAPLIKE': -34, 'SETLIKE': -34}, 229: {'[': -35, 'error': -35, 'identifier': -35, 'ANY': -35, '(': -35, 'SEQUENCE': -35, 'FROZENARRAY': -35, 'BOOLEAN': -35, 'BYTE': -35, 'OCTET': -35, 'OBJECT': -35, 'DATE': -35, 'REGEXP': -35, 'PROMISE': -35, 'RECORD': -35, 'UNSIGNED': -35, 'UNRESTRICTED': -35, 'BYTESTRING': -35, 'DOMSTRING': -35, 'USVSTRING': -35, 'SHORT': -35, 'LONG': -35, 'FLOAT': -35, 'DOUBLE': -35, 'VOID': -35, '}': -35, 'READONLY': -35, 'ATTRIBUTE': -35, 'CONST': -35, 'CREATOR': -35, 'DELETER': -35, 'GETTER': -35, 'INHERIT': -35, 'LEGACYCALLER': -35, 'SERIALIZER': -35, 'SETTER': -35, 'STATIC': -35, 'STRINGIFIER': -35, 'ITERABLE': -35, 'MAPLIKE': -35, 'SETLIKE': -35}, 230: {'[': -36, 'error': -36, 'identifier': -36, 'ANY': -36, '(': -36, 'SEQUENCE': -36, 'FROZENARRAY': -36, 'BOOLEAN': -36, 'BYTE': -36, 'OCTET': -36, 'OBJECT': -36, 'DATE': -36, 'REGEXP': -36, 'PROMISE': -36, 'RECORD': -36, 'UNSIGNED': -36, 'UNRESTRICTED': -36, 'BYTESTRING': -36, 'DOMSTRING': -36, 'USVSTRING': -36, 'SHORT': -36, 'LONG': -36, 'FLOAT': -36, 'DOUBLE': -36, 'VOID': -36, '}': -36, 'READONLY': -36, 'ATTRIBUTE': -36, 'CONST': -36, 'CREATOR': -36, 'DELETER': -36, 'GETTER': -36, 'INHERIT': -36, 'LEGACYCALLER': -36, 'SERIALIZER': -36, 'SETTER': -36, 'STATIC': -36, 'STRINGIFIER': -36, 'ITERABLE': -36, 'MAPLIKE': -36, 'SETLIKE': -36}, 233: {'[': -113, 'error': -113, 'identifier': -113, 'ANY': -113, '(': -113, 'SEQUENCE': -113, 'FROZENARRAY': -113, 'BOOLEAN': -113, 'BYTE': -113, 'OCTET': -113, 'OBJECT': -113, 'DATE': -113, 'REGEXP': -113, 'PROMISE': -113, 'RECORD': -113, 'UNSIGNED': -113, 'UNRESTRICTED': -113, 'BYTESTRING': -113, 'DOMSTRING': -113, 'USVSTRING': -113, 'SHORT': -113, 'LONG': -113, 'FLOAT': -113, 'DOUBLE': -113, 'VOID': -113, '}': -113, 'READONLY': -113, 'ATTRIBUTE': -113, 'CONST': -113, 'CREATOR': -113, 'DELETER': -113, 'GETTER': -113, 'INHERIT': -113, 'LEGACYCALLER': -113, 'SERIALIZER': -113, 'SETTER': -113, 'STATIC': -113, 'STRINGIFIER': -113, 'ITERABLE': -113, 'MAPLIKE': -113, 'SETLIKE': -113}, 240: {'[': -105, 'error': -105, 'identifier': -105, 'ANY': -105, '(': -105, 'SEQUENCE': -105, 'FROZENARRAY': -105, 'BOOLEAN': -105, 'BYTE': -105, 'OCTET': -105, 'OBJECT': -105, 'DATE': -105, 'REGEXP': -105, 'PROMISE': -105, 'RECORD': -105, 'UNSIGNED': -105, 'UNRESTRICTED': -105, 'BYTESTRING': -105, 'DOMSTRING': -105, 'USVSTRING': -105, 'SHORT': -105, 'LONG': -105, 'FLOAT': -105, 'DOUBLE': -105, 'VOID': -105, '}': -105, 'READONLY': -105, 'ATTRIBUTE': -105, 'CONST': -105, 'CREATOR': -105, 'DELETER': -105, 'GETTER': -105, 'INHERIT': -105, 'LEGACYCALLER': -105, 'SERIALIZER': -105, 'SETTER': -105, 'STATIC': -105, 'STRINGIFIER': -105, 'ITERABLE': -105, 'MAPLIKE': -105, 'SETLIKE': -105}, 241: {'[': -140, 'error': -140, 'identifier': -140, 'ANY': -140, '(': -140, 'SEQUENCE': -140, 'FROZENARRAY': -140, 'BOOLEAN': -140, 'BYTE': -140, 'OCTET': -140, 'OBJECT': -140, 'DATE': -140, 'REGEXP': -140, 'PROMISE': -140, 'RECORD': -140, 'UNSIGNED': -140, 'UNRESTRICTED': -140, 'BYTESTRING': -140, 'DOMSTRING': -140, 'USVSTRING': -140, 'SHORT': -140, 'LONG': -140, 'FLOAT': -140, 'DOUBLE': -140, 'VOID': -140, '}': -140, 'READONLY': -140, 'ATTRIBUTE': -140, 'CONST': -140, 'CREATOR': -140, 'DELETER': -140, 'GETTER': -140, 'INHERIT': -140, 'LEGACYCALLER': -140, 'SERIALIZER': -140, 'SETTER': -140, 'STATIC': -140, 'STRINGIFIER': -140, 'ITERABLE': -140, 'MAPLIKE': -140, 'SETLIKE': -140}, 242: {'[': -141, 'error': -141, 'identifier': -141, 'ANY': -141, '(': -141, 'SEQUENCE': -141, 'FROZENARRAY': -141, 'BOOLEAN': -141, 'BYTE': -141, 'OCTET': -141, 'OBJECT': -141, 'DATE': -141, 'REGEXP': -141, 'PROMISE': -141, 'RECORD': -141, 'UNSIGNED': -141, 'UNRESTRICTED': -141, 'BYTESTRING': -141, 'DOMSTRING': -141, 'USVSTRING': -141, 'SHORT': -141, 'LONG': -141, 'FLOAT': -141, 'DOUBLE': -141, 'VOID': -141, '}': -141, 'READONLY': -141, 'ATTRIBUTE': -141, 'CONST': -141, 'CREATOR': -141, 'DELETER': -141, 'GETTER': -141, 'INHERIT': -141, 'LEGACYCALLER': -141, 'SERIALIZER': -141, 'SETTER': -141, 'STATIC': -141, 'STRINGIFIER': -141, 'ITERABLE': -141, 'MAPLIKE': -141, 'SETLIKE': -141}, 254: {'[': 5, 'string': -152, '}': -60}, 259: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 290: {'[': 5, 'error': 116, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152, ')': -126, 'OPTIONAL': -152}, 300: {'[': -112, 'error': -112, 'identifier': -112, 'ANY': -112, '(': -112, 'SEQUENCE': -112, 'FROZENARRAY': -112, 'BOOLEAN': -112, 'BYTE': -112, 'OCTET': -112, 'OBJECT': -112, 'DATE': -112, 'REGEXP': -112, 'PROMISE': -112, 'RECORD': -112, 'UNSIGNED': -112, 'UNRESTRICTED': -112, 'BYTESTRING': -112, 'DOMSTRING': -112, 'USVSTRING': -112, 'SHORT': -112, 'LONG': -112, 'FLOAT': -112, 'DOUBLE': -112, 'VOID': -112, '}': -112, 'READONLY': -112, 'ATTRIBUTE': -112, 'CONST': -112, 'CREATOR': -112, 'DELETER': -112, 'GETTER': -112, 'INHERIT': -112, 'LEGACYCALLER': -112, 'SERIALIZER': -112, 'SETTER': -112, 'STATIC': -112, 'STRINGIFIER': -112, 'ITERABLE': -112, 'MAPLIKE': -112, 'SETLIKE': -112}, 301: {'[': -77, 'error': -77, 'identifier': -77, 'ANY': -77, '(': -77, 'SEQUENCE': -77, 'FROZENARRAY': -77, 'BOOLEAN': -77, 'BYTE': -77, 'OCTET': -77, 'OBJECT': -77, 'DATE': -77, 'REGEXP': -77, 'PROMISE': -77, 'RECORD': -77, 'UNSIGNED': -77, 'UNRESTRICTED': -77, 'BYTESTRING': -77, 'DOMSTRING': -77, 'USVSTRING': -77, 'SHORT': -77, 'LONG': -77, 'FLOAT': -77, 'DOUBLE': -77, 'VOID': -77, '}': -77, 'READONLY': -77, 'ATTRIBUTE': -77, 'CONST': -77, 'CREATOR': -77, 'DELETER': -77, 'GETTER': -77, 'INHERIT': -77, 'LEGACYCALLER': -77, 'SERIALIZER': -77, 'SETTER': -77, 'STATIC': -77, 'STRINGIFIER': -77, 'ITERABLE': -77, 'MAPLIKE': -77, 'SETLIKE': -77}, 303: {'[': 350, 'identifier': 351, '{': 349}, 304: {'[': -80, 'error': -80, 'identifier': -80, 'ANY': -80, '(': -80, 'SEQUENCE': -80, 'FROZENARRAY': -80, 'BOOLEAN': -80, 'BYTE': -80, 'OCTET': -80, 'OBJECT': -80, 'DATE': -80, 'REGEXP': -80, 'PROMISE': -80, 'RECORD': -80, 'UNSIGNED': -80, 'UNRESTRICTED': -80, 'BYTESTRING': -80, 'DOMSTRING': -80, 'USVSTRING': -80, 'SHORT': -80, 'LONG': -80, 'FLOAT': -80, 'DOUBLE': -80, 'VOID': -80, '}': -80, 'READONLY': -80, 'ATTRIBUTE': -80, 'CONST': -80, 'CREATOR': -80, 'DELETER': -80, 'GETTER': -80, 'INHERIT': -80, 'LEGACYCALLER': -80, 'SERIALIZER': -80, 'SETTER': -80, 'STATIC': -80, 'STRINGIFIER': -80, 'ITERABLE': -80, 'MAPLIKE': -80, 'SETLIKE': -80}, 305: {'[': -93, 'error': -93, 'identifier': -93, 'ANY': -93, '(': -93, 'SEQUENCE': -93, 'FROZENARRAY': -93, 'BOOLEAN': -93, 'BYTE': -93, 'OCTET': -93, 'OBJECT': -93, 'DATE': -93, 'REGEXP': -93, 'PROMISE': -93, 'RECORD': -93, 'UNSIGNED': -93, 'UNRESTRICTED': -93, 'BYTESTRING': -93, 'DOMSTRING': -93, 'USVSTRING': -93, 'SHORT': -93, 'LONG': -93, 'FLOAT': -93, 'DOUBLE': -93, 'VOID': -93, '}': -93, 'READONLY': -93, 'ATTRIBUTE': -93, 'CONST': -93, 'CREATOR': -93, 'DELETER': -93, 'GETTER': -93, 'INHERIT': -93, 'LEGACYCALLER': -93, 'SERIALIZER': -93, 'SETTER': -93, 'STATIC': -93, 'STRINGIFIER': -93, 'ITERABLE': -93, 'MAPLIKE': -93, 'SETLIKE': -93}, 308: {'[': -96, 'error': -96, 'identifier': -96, 'ANY': -96, '(': -96, 'SEQUENCE': -96, 'FROZENARRAY': -96, 'BOOLEAN': -96, 'BYTE': -96, 'OCTET': -96, 'OBJECT': -96, 'DATE': -96, 'REGEXP': -96, 'PROMISE': -96, 'RECORD': -96, 'UNSIGNED': -96, 'UNRESTRICTED': -96, 'BYTESTRING': -96, 'DOMSTRING': -96, 'USVSTRING': -96, 'SHORT': -96, 'LONG': -96, 'FLOAT': -96, 'DOUBLE': -96, 'VOID': -96, '}': -96, 'READONLY': -96, 'ATTRIBUTE': -96, 'CONST': -96, 'CREATOR': -96, 'DELETER': -96, 'GETTER': -96, 'INHERIT': -96, 'LEGACYCALLER': -96, 'SERIALIZER': -96, 'SETTER': -96, 'STATIC': -96, 'STRINGIFIER': -96, 'ITERABLE': -96, 'MAPLIKE': -96, 'SETLIKE': -96}, 310: {'[': -97, 'error': -97, 'identifier': -97, 'ANY': -97, '(': -97, 'SEQUENCE': -97, 'FROZENARRAY': -97, 'BOOLEAN': -97, 'BYTE': -97, 'OCTET': -97, 'OBJECT': -97, 'DATE': -97, 'REGEXP': -97, 'PROMISE': -97, 'RECORD': -97, 'UNSIGNED': -97, 'UNRESTRICTED': -97, 'BYTESTRING': -97, 'DOMSTRING': -97, 'USVSTRING': -97, 'SHORT': -97, 'LONG': -97, 'FLOAT': -97, 'DOUBLE': -97, 'VOID': -97, '}': -97, 'READONLY': -97, 'ATTRIBUTE': -97, 'CONST': -97, 'CREATOR': -97, 'DELETER': -97, 'GETTER': -97, 'INHERIT': -97, 'LEGACYCALLER': -97, 'SERIALIZER': -97, 'SETTER': -97, 'STATIC': -97, 'STRINGIFIER': -97, 'ITERABLE': -97, 'MAPLIKE': -97, 'SETLIKE': -97}, 313: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 314: {'[': -100, 'error': -100, 'identifier': -100, 'ANY': -100, '(': -100, 'SEQUENCE': -100, 'FROZENARRAY': -100, 'BOOLEAN': -100, 'BYTE': -100, 'OCTET': -100, 'OBJECT': -100, 'DATE': -100, 'REGEXP': -100, 'PROMISE': -100, 'RECORD': -100, 'UNSIGNED': -100, 'UNRESTRICTED': -100, 'BYTESTRING': -100, 'DOMSTRING': -100, 'USVSTRING': -100, 'SHORT': -100, 'LONG': -100, 'FLOAT': -100, 'DOUBLE': -100, 'VOID': -100, '}': -100, 'READONLY': -100, 'ATTRIBUTE': -100, 'CONST': -100, 'CREATOR': -100, 'DELETER': -100, 'GETTER': -100, 'INHERIT': -100, 'LEGACYCALLER': -100, 'SERIALIZER': -100, 'SETTER': -100, 'STATIC': -100, 'STRINGIFIER': -100, 'ITERABLE': -100, 'MAPLIKE': -100, 'SETLIKE': -100}, 315: {'[': -101, 'error': -101, 'identifier': -101, 'ANY': -101, '(': -101, 'SEQUENCE': -101, 'FROZENARRAY': -101, 'BOOLEAN': -101, 'BYTE': -101, 'OCTET': -101, 'OBJECT': -101, 'DATE': -101, 'REGEXP': -101, 'PROMISE': -101, 'RECORD': -101, 'UNSIGNED': -101, 'UNRESTRICTED': -101, 'BYTESTRING': -101, 'DOMSTRING': -101, 'USVSTRING': -101, 'SHORT': -101, 'LONG': -101, 'FLOAT': -101, 'DOUBLE': -101, 'VOID': -101, '}': -101, 'READONLY': -101, 'ATTRIBUTE': -101, 'CONST': -101, 'CREATOR': -101, 'DELETER': -101, 'GETTER': -101, 'INHERIT': -101, 'LEGACYCALLER': -101, 'SERIALIZER': -101, 'SETTER': -101, 'STATIC': -101, 'STRINGIFIER': -101, 'ITERABLE': -101, 'MAPLIKE': -101, 'SETLIKE': -101}, 316: {'[': -102, 'error': -102, 'identifier': -102, 'ANY': -102, '(': -102, 'SEQUENCE': -102, 'FROZENARRAY': -102, 'BOOLEAN': -102, 'BYTE': -102, 'OCTET': -102, 'OBJECT': -102, 'DATE': -102, 'REGEXP': -102, 'PROMISE': -102, 'RECORD': -102, 'UNSIGNED': -102, 'UNRESTRICTED': -102, 'BYTESTRING': -102, 'DOMSTRING': -102, 'USVSTRING': -102, 'SHORT': -102, 'LONG': -102, 'FLOAT': -102, 'DOUBLE': -102, 'VOID': -102, '}': -102, 'READONLY': -102, 'ATTRIBUTE': -102, 'CONST': -102, 'CREATOR': -102, 'DELETER': -102, 'GETTER': -102, 'INHERIT': -102, 'LEGACYCALLER': -102, 'SERIALIZER': -102, 'SETTER': -102, 'STATIC': -102, 'STRINGIFIER': -102, 'ITERABLE': -102, 'MAPLIKE': -102, 'SETLIKE': -102}, 317: {'[': -103, 'error': -103, 'identifier': -103, 'ANY': -103, '(': -103, 'SEQUENCE': -103, 'FROZENARRAY': -103, 'BOOLEAN': -103, 'BYTE': -103, 'OCTET': -103, 'OBJECT': -103, 'DATE': -103, 'REGEXP': -103, 'PROMISE': -103, 'RECORD': -103, 'UNSIGNED': -103, 'UNRESTRICTED': -103, 'BYTESTRING': -103, 'DOMSTRING': -103, 'USVSTRING': -103, 'SHORT': -103, 'LONG': -103, 'FLOAT': -103, 'DOUBLE': -103, 'VOID': -103, '}': -103, 'READONLY': -103, 'ATTRIBUTE': -103, 'CONST': -103, 'CREATOR': -103, 'DELETER': -103, 'GETTER': -103, 'INHERIT': -103, 'LEGACYCALLER': -103, 'SERIALIZER': -103, 'SETTER': -103, 'STATIC': -103, 'STRINGIFIER': -103, 'ITERABLE': -103, 'MAPLIKE': -103, 'SETLIKE': -103}, 321: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 322: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 334: {'[': 370, 'string': 369, 'integer': 373, 'TRUE': 375, 'FALSE': 376, 'float': 377, '-': 378, 'INFINITY': 379, 'NAN': 380, 'NULL': 381}, 347: {'[': -78, 'error': -78, 'identifier': -78, 'ANY': -78, '(': -78, 'SEQUENCE': -78, 'FROZENARRAY': -78, 'BOOLEAN': -78, 'BYTE': -78, 'OCTET': -78, 'OBJECT': -78, 'DATE': -78, 'REGEXP': -78, 'PROMISE': -78, 'RECORD': -78, 'UNSIGNED': -78, 'UNRESTRICTED': -78, 'BYTESTRING': -78, 'DOMSTRING': -78, 'USVSTRING': -78, 'SHORT': -78, 'LONG': -78, 'FLOAT': -78, 'DOUBLE': -78, 'VOID': -78, '}': -78, 'READONLY': -78, 'ATTRIBUTE': -78, 'CONST': -78, 'CREATOR': -78, 'DELETER': -78, 'GETTER': -78, 'INHERIT': -78, 'LEGACYCALLER': -78, 'SERIALIZER': -78, 'SETTER': -78, 'STATIC': -78, 'STRINGIFIER': -78, 'ITERABLE': -78, 'MAPLIKE': -78, 'SETLIKE': -78}, 352: {'[': -94, 'error': -94, 'identifier': -94, 'ANY': -94, '(': -94, 'SEQUENCE': -94, 'FROZENARRAY': -94, 'BOOLEAN': -94, 'BYTE': -94, 'OCTET': -94, 'OBJECT': -94, 'DATE': -94, 'REGEXP': -94, 'PROMISE': -94, 'RECORD': -94, 'UNSIGNED': -94, 'UNRESTRICTED': -94, 'BYTESTRING': -94, 'DOMSTRING': -94, 'USVSTRING': -94, 'SHORT': -94, 'LONG': -94, 'FLOAT': -94, 'DOUBLE': -94, 'VOID': -94, '}': -94, 'READONLY': -94, 'ATTRIBUTE': -94, 'CONST': -94, 'CREATOR': -94, 'DELETER': -94, 'GETTER': -94, 'INHERIT': -94, 'LEGACYCALLER': -94, 'SERIALIZER': -94, 'SETTER': -94, 'STATIC': -94, 'STRINGIFIER': -94, 'ITERABLE': -94, 'MAPLIKE': -94, 'SETLIKE': -94}, 353: {'[': -95, 'error': -95, 'identifier': -95, 'ANY': -95, '(': -95, 'SEQUENCE': -95, 'FROZENARRAY': -95, 'BOOLEAN': -95, 'BYTE': -95, 'OCTET': -95, 'OBJECT': -95, 'DATE': -95, 'REGEXP': -95, 'PROMISE': -95, 'RECORD': -95, 'UNSIGNED': -95, 'UNRESTRICTED': -95, 'BYTESTRING': -95, 'DOMSTRING': -95, 'USVSTRING': -95, 'SHORT': -95, 'LONG': -95, 'FLOAT': -95, 'DOUBLE': -95, 'VOID': -95, '}': -95, 'READONLY': -95, 'ATTRIBUTE': -95, 'CONST': -95, 'CREATOR': -95, 'DELETER': -95, 'GETTER': -95, 'INHERIT': -95, 'LEGACYCALLER': -95, 'SERIALIZER': -95, 'SETTER': -95, 'STATIC': -95, 'STRINGIFIER': -95, 'ITERABLE': -95, 'MAPLIKE': -95, 'SETLIKE': -95}, 354: {'[': -98, 'error': -98, 'identifier': -98, 'ANY': -98, '(': -98, 'SEQUENCE': -98, 'FROZENARRAY': -98, 'BOOLEAN': -98, 'BYTE': -98, 'OCTET': -98, 'OBJECT': -98, 'DATE': -98, 'REGEXP': -98, 'PROMISE': -98, 'RECORD': -98, 'UNSIGNED': -98, 'UNRESTRICTED': -98, 'BYTESTRING': -98, 'DOMSTRING': -98, 'USVSTRING': -98, 'SHORT': -98, 'LONG': -98, 'FLOAT': -98, 'DOUBLE': -98, 'VOID': -98, '}': -98, 'READONLY': -98, 'ATTRIBUTE': -98, 'CONST': -98, 'CREATOR': -98, 'DELETER': -98, 'GETTER': -98, 'INHERIT': -98, 'LEGACYCALLER': -98, 'SERIALIZER': -98, 'SETTER': -98, 'STATIC': -98, 'STRINGIFIER': -98, 'ITERABLE': -98, 'MAPLIKE': -98, 'SETLIKE': -98}, 355: {'[': -99, 'error': -99, 'identifier': -99, 'ANY': -99, '(': -99, 'SEQUENCE': -99, 'FROZENARRAY': -99, 'BOOLEAN': -99, 'BYTE': -99, 'OCTET': -99, 'OBJECT': -99, 'DATE': -99, 'REGEXP': -99, 'PROMISE': -99, 'RECORD': -99, 'UNSIGNED': -99, 'UNRESTRICTED': -99, 'BYTESTRING': -99, 'DOMSTRING': -99, 'USVSTRING': -99, 'SHORT': -99, 'LONG': -99, 'FLOAT': -99, 'DOUBLE': -99, 'VOID': -99, '}': -99, 'READONLY': -99, 'ATTRIBUTE': -99, 'CONST': -99, 'CREATOR': -99, 'DELETER': -99, 'GETTER': -99, 'INHERIT': -99, 'LEGACYCALLER': -99, 'SERIALIZER': -99, 'SETTER': -99, 'STATIC': -99, 'STRINGIFIER': -99, 'ITERABLE': -99, 'MAPLIKE': -99, 'SETLIKE': -99}, 357: {'[': -104, 'error': -104, 'identifier': -104, 'ANY': -104, '(': -104, 'SEQUENCE': -104, 'FROZENARRAY': -104, 'BOOLEAN': -104, 'BYTE': -104, 'OCTET': -104, 'OBJECT': -104, 'DATE': -104, 'REGEXP': -104, 'PROMISE': -104, 'RECORD': -104, 'UNSIGNED': -104, 'UNRESTRICTED': -104, 'BYTESTRING': -104, 'DOMSTRING': -104, 'USVSTRING': -104, 'SHORT': -104, 'LONG': -104, 'FLOAT': -104, 'DOUBLE': -104, 'VOID': -104, '}': -104, 'READONLY': -104, 'ATTRIBUTE': -104, 'CONST': -104, 'CREATOR': -104, 'DELETER': -104, 'GETTER': -104, 'INHERIT': -104, 'LEGACYCALLER': -104, 'SERIALIZER': -104, 'SETTER': -104, 'STATIC': -104, 'STRINGIFIER': -104, 'ITERABLE': -104, 'MAPLIKE': -104, 'SETLIKE': -104}, 383: {'[': -106, 'error': -106, 'identifier': -106, 'ANY': -106, '(': -106, 'SEQUENCE': -106, 'FROZENARRAY': -106, 'BOOLEAN': -106, 'BYTE': -106, 'OCTET': -106, 'OBJECT': -106, 'DATE': -106, 'REGEXP': -106, 'PROMISE': -106, 'RECORD': -106, 'UNSIGNED': -106, 'UNRESTRICTED': -106, 'BYTESTRING': -106, 'DOMSTRING': -106, 'USVSTRING': -106, 'SHORT': -106, 'LONG': -106, 'FLOAT': -106, 'DOUBLE': -106, 'VOID': -106, '}': -106, 'READONLY': -106, 'ATTRIBUTE': -106, 'CONST': -106, 'CREATOR': -106, 'DELETER': -106, 'GETTER': -106, 'INHERIT': -106, 'LEGACYCALLER': -106, 'SERIALIZER': -106, 'SETTER': -106, 'STATIC': -106, 'STRINGIFIER': -106, 'ITERABLE': -106, 'MAPLIKE': -106, 'SETLIKE': -106}, 385: {'[': -44, 'error': -44, 'identifier': -44, 'ANY': -44, '(': -44, 'SEQUENCE': -44, 'FROZENARRAY': -44, 'BOOLEAN': -44, 'BYTE': -44, 'OCTET': -44, 'OBJECT': -44, 'DATE': -44, 'REGEXP': -44, 'PROMISE': -44, 'RECORD': -44, 'UNSIGNED': -44, 'UNRESTRICTED': -44, 'BYTESTRING': -44, 'DOMSTRING': -44, 'USVSTRING': -44, 'SHORT': -44, 'LONG': -44, 'FLOAT': -44, 'DOUBLE': -44, '}': -44, 'REQUIRED': -44}, 387: {'[': -79, 'error': -79, 'identifier': -79, 'ANY': -79, '(': -79, 'SEQUENCE': -79, 'FROZENARRAY': -79, 'BOOLEAN': -79, 'BYTE': -79, 'OCTET': -79, 'OBJECT': -79, 'DATE': -79, 'REGEXP': -79, 'PROMISE': -79, 'RECORD': -79, 'UNSIGNED': -79, 'UNRESTRICTED': -79, 'BYTESTRING': -79, 'DOMSTRING': -79, 'USVSTRING': -79, 'SHORT': -79, 'LONG': -79, 'FLOAT': -79, 'DOUBLE': -79, 'VOID': -79, '}': -79, 'READONLY': -79, 'ATTRIBUTE': -79, 'CONST': -79, 'CREATOR': -79, 'DELETER': -79, 'GETTER': -79, 'INHERIT': -79, 'LEGACYCALLER': -79, 'SERIALIZER': -79, 'SETTER': -79, 'STATIC': -79, 'STRINGIFIER': -79, 'ITERABLE': -79, 'MAPLIKE': -79, 'SETLIKE': -79}, 397: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 398: {'[': -114, 'error': -114, 'identifier': -114, 'ANY': -114, '(': -114, 'SEQUENCE': -114, 'FROZENARRAY': -114, 'BOOLEAN': -114, 'BYTE': -114, 'OCTET': -114, 'OBJECT': -114, 'DATE': -114, 'REGEXP': -114, 'PROMISE': -114, 'RECORD': -114, 'UNSIGNED': -114, 'UNRESTRICTED': -114, 'BYTESTRING': -114, 'DOMSTRING': -114, 'USVSTRING': -114, 'SHORT': -114, 'LONG': -114, 'FLOAT': -114, 'DOUBLE': -114, 'VOID': -114, '}': -114, 'READONLY': -114, 'ATTRIBUTE': -114, 'CONST': -114, 'CREATOR': -114, 'DELETER': -114, 'GETTER': -114, 'INHERIT': -114, 'LEGACYCALLER': -114, 'SERIALIZER': -114, 'SETTER': -114, 'STATIC': -114, 'STRINGIFIER': -114, 'ITERABLE': -114, 'MAPLIKE': -114, 'SETLIKE': -114}, 399: {'[': 5, 'identifier': -152, 'ANY': -152, '(': -152, 'SEQUENCE': -152, 'FROZENARRAY': -152, 'BOOLEAN': -152, 'BYTE': -152, 'OCTET': -152, 'OBJECT': -152, 'DATE': -152, 'REGEXP': -152, 'PROMISE': -152, 'RECORD': -152, 'UNSIGNED': -152, 'UNRESTRICTED': -152, 'BYTESTRING': -152, 'DOMSTRING': -152, 'USVSTRING': -152, 'SHORT': -152, 'LONG': -152, 'FLOAT': -152, 'DOUBLE': -152}, 405: {'[': -122, 'error': -122, 'identifier': -122, 'ANY': -122, '(': -122, 'SEQUENCE': -122, 'FROZENARRAY': -122, 'BOOLEAN': -122, 'BYTE': -122, 'OCTET': -122, 'OBJECT': -122, 'DATE': -122, 'REGEXP': -122, 'PROMISE': -122, 'RECORD': -122, 'UNSIGNED': -122, 'UNRESTRICTED': -122, 'BYTESTRING': -122, 'DOMSTRING': -122, 'USVSTRING': -122, 'SHORT': -122, 'LONG': -122, 'FLOAT': -122, 'DOUBLE': -122, 'VOID': -122, '}': -122, 'READONLY': -122, 'ATTRIBUTE': -122, 'CONST': -122, 'CREATOR': -122, 'DELETER': -122, 'GETTER': -122, 'INHERIT': -122, 'LEGACYCALLER': -122, 'SERIALIZER': -122, 'SETTER': -122, 'STATIC': -122, 'STRINGIFIER': -122, 'ITERABLE': -122, 'MAPLIKE': -122, 'SETLIKE': -122}, 406: {'[': -43, 'error': -43, 'identifier': -43, 'ANY': -43, '(': -43, 'SEQUENCE': -43, 'FROZENARRAY': -43, 'BOOLEAN': -43, 'BYTE': -43, 'OCTET': -43, 'OBJECT': -43, 'DATE': -43, 'REGEXP': -43, 'PROMISE': -43, 'RECORD': -43, 'UNSIGNED': -43, 'UNRESTRICTED': -43, 'BYTESTRING': -43, 'DOMSTRING': -43, 'USVSTRING': -43, 'SHORT': -43, 'LONG': -43, 'FLOAT': -43, 'DOUBLE': -43, '}': -43, 'REQUIRED': -43}, 417: {'[': -143, 'error': -143, 'identifier': -143, 'ANY': -143, '(': -143, 'SEQUENCE': -143, 'FROZENARRAY': -143, 'BOOLEAN': -143, 'BYTE': -143, 'OCTET': -143, 'OBJECT': -143, 'DATE': -143, 'REGEXP': -143, 'PROMISE': -143, 'RECORD': -143, 'UNSIGNED': -143, 'UNRESTRICTED': -143, 'BYTESTRING': -143, 'DOMSTRING': -143, 'USVSTRING': -143, 'SHORT': -143, 'LONG': -143, 'FLOAT': -143, 'DOUBLE': -143, 'VOID': -143, '}': -143, 'READONLY': -143, 'ATTRIBUTE': -143, 'CONST': -143, 'CREATOR': -143, 'DELETER': -143, 'GETTER': -143, 'INHERIT': -143, 'LEGACYCALLER': -143, 'SERIALIZER': -143, 'SETTER': -143, 'STATIC': -143, 'STRINGIFIER': -143, 'ITERABLE': -143, 'MAPLIKE': -143, 'SETLIKE': -143}, 418: {'[': -65, 'error': -65, 'identifier': -65, 'ANY': -65, '(': -65, 'SEQUENCE': -65, 'FROZENARRAY': -65, 'BOOLEAN': -65, 'BYTE': -65, 'OCTET': -65, 'OBJECT': -65, 'DATE': -65, 'REGEXP': -65, 'PROMISE': -65, 'RECORD': -65, 'UNSIGNED': -65, 'UNRESTRICTED': -65, 'BYTESTRING': -65, 'DOMSTRING': -65, 'USVSTRING': -65, 'SHORT': -65, 'LONG': -65, 'FLOAT': -65, 'DOUBLE': -65, 'VOID': -65, '}': -65, 'READONLY': -65, 'ATTRIBUTE': -65, 'CONST': -65, 'CREATOR': -65, 'DELETER': -65, 'GETTER': -65, 'INHERIT': -65, 'LEGACYCALLER': -65, 'SERIALIZER': -65, 'SETTER': -65, 'STATIC': -65, 'STRINGIFIER': -65, 'ITERABLE': -65, 'MAPLIKE': -65, 'SETLIKE': -65}, 420: {'[': -137, 'error': -137, 'identifier': -137, 'ANY': -137, '(': -137, 'SEQUENCE': -137, 'FROZENARRAY': -137, 'BOOLEAN': -137, 'BYTE': -137, 'OCTET': -137, 'OBJECT': -137, 'DATE': -137, 'REGEXP': -137, 'PROMISE': -137, 'RECORD': -137, 'UNSIGNED': -137, 'UNRESTRICTED': -137, 'BYTESTRING': -137, 'DOMSTRING': -137, 'USVSTRING': -137, 'SHORT': -137, 'LONG': -137, 'FLOAT': -137, 'DOUBLE': -137, 'VOID': -137, '}': -137, 'READONLY': -137, 'ATTRIBUTE': -137, 'CONST': -137, 'CREATOR': -137, 'DELETER': -137, 'GETTER': -137, 'INHERIT': -137, 'LEGACYCALLER': -137, 'SERIALIZER': -137, 'SETTER': -137, 'STATIC': -137, 'STRINGIFIER': -137, 'ITERABLE': -137, 'MAPLIKE': -137, 'SETLIKE': -137}, 422: {'[': -142, 'error': -142, 'identifier': -142, 'ANY': -142, '(': -142, 'SEQUENCE': -142, 'FROZENARRAY': -142, 'BOOLEAN': -142, 'BYTE': -142, 'OCTET': -142, 'OBJECT': -142, 'DATE': -142, 'REGEXP': -142, 'PROMISE': -142, 'RECORD': -142, 'UNSIGNED': -142, 'UNRESTRICTED': -142, 'BYTESTRING': -142, 'DOMSTRING': -142, 'USVSTRING': -142, 'SHORT': -142, 'LONG': -142, 'FLOAT': -142, 'DOUBLE': -142, 'VOID': -142, '}': -142, 'READONLY': -142, 'ATTRIBUTE': -142, 'CONST': -142, 'CREATOR': -142, 'DELETER': -142, 'GETTER': -142, 'INHERIT': -142, 'LEGACYCALLER': -142, 'SERIALIZER': -142, 'SETTER': -142, 'STATIC': -142, 'STRINGIFIER': -142, 'ITERABLE': -142, 'MAPLIKE': -142, 'SETLIKE': -142}, 3: {'error': 15, 'CALLBACK': 16, 'NAMESPACE': 18, 'PARTIAL': 20, 'DICTIONARY': 21, 'ENUM': 22, 'TYPEDEF': 23, 'identifier': 19, 'INTERFACE': 24}, 6: {'error': 15, 'CALLBACK': 16, 'NAMESPACE': 18, 'PARTIAL': 20, 'DICTIONARY': 21, 'ENUM': 22, 'TYPEDEF': 23, 'identifier': 19, 'INTERFACE': 24}, 20: {'error': 45, 'NAMESPACE': 18, 'DICTIONARY': 49, 'INTERFACE': 50}, 21: {'error': 52, 'identifier': 51}, 22: {'error': 54, 'identifier': 53}, 49: {'error': 68, 'identifier': 67}, 60: {'error': 113, 'identifier': 34}, 111: {'error': -151, 'CALLBACK': -151, 'NAMESPACE': -151, 'PARTIAL': -151, 'DICTIONARY': -151, 'ENUM': -151, 'TYPEDEF': -151, 'identifier': -151, 'INTERFACE': -151, 'ANY': -151, '(': -151, 'SEQUENCE': -151, 'FROZENARRAY': -151, 'BOOLEAN': -151, 'BYTE': -151, 'OCTET': -151, 'OBJECT': -151, 'DATE': -151, 'REGEXP': -151, 'PROMISE': -151, 'RECORD': -151, 'UNSIGNED': -151, 'UNRESTRICTED': -151, 'BYTESTRING': -151, 'DOMSTRING': -151, 'USVSTRING': -151, 'SHORT': -151, 'LONG': -151, 'FLOAT': -151, 'DOUBLE': -151, 'OPTIONAL': -151, 'string': -151, 'VOID': -151, 'READONLY': -151, 'ATTRIBUTE': -151, 'CONST': -151, 'CREATOR': -151, 'DELETER': -151, 'GETTER': -151, 'INHERIT': -151, 'LEGACYCALLER': -151, 'SERIALIZER': -151, 'SETTER': -151, 'STATIC': -151, 'STRINGIFIER': -151, 'REQUIRED': -151, 'ITERABLE': -151, 'MAPLIKE': -151, 'SETLIKE': -151}, 113: {'error': -153, 'CALLBACK': -153, 'NAMESPACE': -153, 'PARTIAL': -153, 'DICTIONARY': -153, 'ENUM': -153, 'TYPEDEF': -153, 'identifier': -153, 'INTERFACE': -153, 'ANY': -153, '(': -153, 'SEQUENCE': -153, 'FROZENARRAY': -153, 'BOOLEAN': -153, 'BYTE': -153, 'OCTET': -153, 'OBJECT': -153, 'DATE': -153, 'REGEXP': -153, 'PROMISE': -153, 'RECORD': -153, 'UNSIGNED': -153, 'UNRESTRICTED': -153, 'BYTESTRING': -153, 'DOMSTRING': -153, 'USVSTRING': -153, 'SHORT': -153, 'LONG': -153, 'FLOAT': -153, 'DOUBLE': -153, 'OPTIONAL': -153, 'string': -153, 'VOID': -153, 'READONLY': -153, 'ATTRIBUTE': -153, 'CONST': -153, 'CREATOR': -153, 'DELETER': -153, 'GETTER': -153, 'INHERIT': -153, 'LEGACYCALLER': -153, 'SERIALIZER': -153, 'SETTER': -153, 'STATIC': -153, 'STRINGIFIER': -153, 'REQUIRED': -153, 'ITERABLE': -153, 'MAPLIKE': -153, 'SETLIKE': -153}, 130: {'error': 174, 'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124, 'READONLY': 176}, 152: {'error': 193, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105}, 179: {'error': 216, 'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'REQUIRED': 217}, 77: {'CALLBACK': -184, 'NAMESPACE': -184, 'PARTIAL': -184, 'DICTIONARY': -184, 'ENUM': -184, 'TYPEDEF': -184, 'identifier': -184, 'IMPLEMENTS': -184, 'UNRESTRICTED': -184, ',': -184, '>': -184, 'ATTRIBUTE': -184, 'CONST': -184, 'CREATOR': -184, 'DELETER': -184, 'GETTER': -184, 'INHERIT': -184, 'LEGACYCALLER': -184, 'SERIALIZER': -184, 'SETTER': -184, 'STATIC': -184, 'STRINGIFIER': -184, 'REQUIRED': -184}, 78: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, 'UNRESTRICTED': -223, ',': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141}, 79: {'CALLBACK': -186, 'NAMESPACE': -186, 'PARTIAL': -186, 'DICTIONARY': -186, 'ENUM': -186, 'TYPEDEF': -186, 'identifier': -186, 'IMPLEMENTS': -186, '(': -186, 'UNRESTRICTED': -186, ',': -186, '>': -186, 'ATTRIBUTE': -186, 'CONST': -186, 'CREATOR': -186, 'DELETER': -186, 'GETTER': -186, 'INHERIT': -186, 'LEGACYCALLER': -186, 'SERIALIZER': -186, 'SETTER': -186, 'STATIC': -186, 'STRINGIFIER': -186, 'REQUIRED': -186, 'ELLIPSIS': -186}, 80: {'CALLBACK': -187, 'NAMESPACE': -187, 'PARTIAL': -187, 'DICTIONARY': -187, 'ENUM': -187, 'TYPEDEF': -187, 'identifier': -187, 'IMPLEMENTS': -187, '(': -187, 'UNRESTRICTED': -187, ',': -187, '>': -187, 'ATTRIBUTE': -187, 'CONST': -187, 'CREATOR': -187, 'DELETER': -187, 'GETTER': -187, 'INHERIT': -187, 'LEGACYCALLER': -187, 'SERIALIZER': -187, 'SETTER': -187, 'STATIC': -187, 'STRINGIFIER': -187, 'REQUIRED': -187, 'ELLIPSIS': -187}, 82: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, ',': -223, ')': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141, 'ELLIPSIS': -223, 'OR': -223}, 83: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, ',': -223, ')': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141, 'ELLIPSIS': -223, 'OR': -223}, 84: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, ',': -223, ')': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141, 'ELLIPSIS': -223, 'OR': -223}, 87: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, ',': -223, ')': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141, 'ELLIPSIS': -223, 'OR': -223}, 88: {'CALLBACK': -201, 'NAMESPACE': -201, 'PARTIAL': -201, 'DICTIONARY': -201, 'ENUM': -201, 'TYPEDEF': -201, 'identifier': -201, 'IMPLEMENTS': -201, '(': -201, 'UNRESTRICTED': -201, ',': -201, ')': -201, '>': -201, 'ATTRIBUTE': -201, 'CONST': -201, 'CREATOR': -201, 'DELETER': -201, 'GETTER': -201, 'INHERIT': -201, 'LEGACYCALLER': -201, 'SERIALIZER': -201, 'SETTER': -201, 'STATIC': -201, 'STRINGIFIER': -201, 'REQUIRED': -201, '?': -201, 'ELLIPSIS': -201, 'OR': -201}, 89: {'CALLBACK': -202, 'NAMESPACE': -202, 'PARTIAL': -202, 'DICTIONARY': -202, 'ENUM': -202, 'TYPEDEF': -202, 'identifier': -202, 'IMPLEMENTS': -202, '(': -202, 'UNRESTRICTED': -202, ',': -202, ')': -202, '>': -202, 'ATTRIBUTE': -202, 'CONST': -202, 'CREATOR': -202, 'DELETER': -202, 'GETTER': -202, 'INHERIT': -202, 'LEGACYCALLER': -202, 'SERIALIZER': -202, 'SETTER': -202, 'STATIC': -202, 'STRINGIFIER': -202, 'REQUIRED': -202, '?': -202, 'ELLIPSIS': -202, 'OR': -202}, 90: {'CALLBACK': -203, 'NAMESPACE': -203, 'PARTIAL': -203, 'DICTIONARY': -203, 'ENUM': -203, 'TYPEDEF': -203, 'identifier': -203, 'IMPLEMENTS': -203, '(': -203, 'UNRESTRICTED': -203, ',': -203, ')': -203, '>': -203, 'ATTRIBUTE': -203, 'CONST': -203, 'CREATOR': -203, 'DELETER': -203, 'GETTER': -203, 'INHERIT': -203, 'LEGACYCALLER': -203, 'SERIALIZER': -203, 'SETTER': -203, 'STATIC': -203, 'STRINGIFIER': -203, 'REQUIRED': -203, '?': -203, 'ELLIPSIS': -203, 'OR': -203}, 91: {'CALLBACK': -204, 'NAMESPACE': -204, 'PARTIAL': -204, 'DICTIONARY': -204, 'ENUM': -204, 'TYPEDEF': -204, 'identifier': -204, 'IMPLEMENTS': -204, '(': -204, 'UNRESTRICTED': -204, ',': -204, ')': -204, '>': -204, 'ATTRIBUTE': -204, 'CONST': -204, 'CREATOR': -204, 'DELETER': -204, 'GETTER': -204, 'INHERIT': -204, 'LEGACYCALLER': -204, 'SERIALIZER': -204, 'SETTER': -204, 'STATIC': -204, 'STRINGIFIER': -204, 'REQUIRED': -204, '?': -204, 'ELLIPSIS': -204, 'OR': -204}, 92: {'CALLBACK': -205, 'NAMESPACE': -205, 'PARTIAL': -205, 'DICTIONARY': -205, 'ENUM': -205, 'TYPEDEF': -205, 'identifier': -205, 'IMPLEMENTS': -205, '(': -205, 'UNRESTRICTED': -205, ',': -205, ')': -205, '>': -205, 'ATTRIBUTE': -205, 'CONST': -205, 'CREATOR': -205, 'DELETER': -205, 'GETTER': -205, 'INHERIT': -205, 'LEGACYCALLER': -205, 'SERIALIZER': -205, 'SETTER': -205, 'STATIC': -205, 'STRINGIFIER': -205, 'REQUIRED': -205, '?': -205, 'ELLIPSIS': -205, 'OR': -205}, 93: {'CALLBACK': -206, 'NAMESPACE': -206, 'PARTIAL': -206, 'DICTIONARY': -206, 'ENUM': -206, 'TYPEDEF': -206, 'identifier': -206, 'IMPLEMENTS': -206, '(': -206, 'UNRESTRICTED': -206, ',': -206, ')': -206, '>': -206, 'ATTRIBUTE': -206, 'CONST': -206, 'CREATOR': -206, 'DELETER': -206, 'GETTER': -206, 'INHERIT': -206, 'LEGACYCALLER': -206, 'SERIALIZER': -206, 'SETTER': -206, 'STATIC': -206, 'STRINGIFIER': -206, 'REQUIRED': -206, '?': -206, 'ELLIPSIS': -206, 'OR': -206}, 94: {'CALLBACK': -207, 'NAMESPACE': -207, 'PARTIAL': -207, 'DICTIONARY': -207, 'ENUM': -207, 'TYPEDEF': -207, 'identifier': -207, 'IMPLEMENTS': -207, '(': -207, 'UNRESTRICTED': -207, ',': -207, ')': -207, '>': -207, 'ATTRIBUTE': -207, 'CONST': -207, 'CREATOR': -207, 'DELETER': -207, 'GETTER': -207, 'INHERIT': -207, 'LEGACYCALLER': -207, 'SERIALIZER': -207, 'SETTER': -207, 'STATIC': -207, 'STRINGIFIER': -207, 'REQUIRED': -207, '?': -207, 'ELLIPSIS': -207, 'OR': -207}, 95: {'CALLBACK': -208, 'NAMESPACE': -208, 'PARTIAL': -208, 'DICTIONARY': -208, 'ENUM': -208, 'TYPEDEF': -208, 'identifier': -208, 'IMPLEMENTS': -208, '(': -208, 'UNRESTRICTED': -208, ',': -208, ')': -208, '>': -208, 'ATTRIBUTE': -208, 'CONST': -208, 'CREATOR': -208, 'DELETER': -208, 'GETTER': -208, 'INHERIT': -208, 'LEGACYCALLER': -208, 'SERIALIZER': -208, 'SETTER': -208, 'STATIC': -208, 'STRINGIFIER': -208, 'REQUIRED': -208, '?': -208, 'ELLIPSIS': -208, 'OR': -208}, 96: {'CALLBACK': -209, 'NAMESPACE': -209, 'PARTIAL': -209, 'DICTIONARY': -209, 'ENUM': -209, 'TYPEDEF': -209, 'identifier': -209, 'IMPLEMENTS': -209, '(': -209, 'UNRESTRICTED': -209, ',': -209, ')': -209, '>': -209, 'ATTRIBUTE': -209, 'CONST': -209, 'CREATOR': -209, 'DELETER': -209, 'GETTER': -209, 'INHERIT': -209, 'LEGACYCALLER': -209, 'SERIALIZER': -209, 'SETTER': -209, 'STATIC': -209, 'STRINGIFIER': -209, 'REQUIRED': -209, '?': -209, 'ELLIPSIS': -209, 'OR': -209}, 97: {'CALLBACK': -221, 'NAMESPACE': -221, 'PARTIAL': -221, 'DICTIONARY': -221, 'ENUM': -221, 'TYPEDEF': -221, 'identifier': -221, 'IMPLEMENTS': -221, '(': -221, 'UNRESTRICTED': -221, ',': -221, ')': -221, '>': -221, 'ATTRIBUTE': -221, 'CONST': -221, 'CREATOR': -221, 'DELETER': -221, 'GETTER': -221, 'INHERIT': -221, 'LEGACYCALLER': -221, 'SERIALIZER': -221, 'SETTER': -221, 'STATIC': -221, 'STRINGIFIER': -221, 'REQUIRED': -221, '?': -221, 'ELLIPSIS': -221, 'OR': -221, '<': 151}, 100: {'CALLBACK': -215, 'NAMESPACE': -215, 'PARTIAL': -215, 'DICTIONARY': -215, 'ENUM': -215, 'TYPEDEF': -215, 'identifier': -215, 'IMPLEMENTS': -215, '(': -215, 'UNRESTRICTED': -215, ',': -215, ')': -215, '>': -215, 'ATTRIBUTE': -215, 'CONST': -215, 'CREATOR': -215, 'DELETER': -215, 'GETTER': -215, 'INHERIT': -215, 'LEGACYCALLER': -215, 'SERIALIZER': -215, 'SETTER': -215, 'STATIC': -215, 'STRINGIFIER': -215, 'REQUIRED': -215, '?': -215, 'ELLIPSIS': -215, 'OR': -215}, 102: {'CALLBACK': -211, 'NAMESPACE': -211, 'PARTIAL': -211, 'DICTIONARY': -211, 'ENUM': -211, 'TYPEDEF': -211, 'identifier': -211, 'IMPLEMENTS': -211, '(': -211, 'UNRESTRICTED': -211, ',': -211, ')': -211, '>': -211, 'ATTRIBUTE': -211, 'CONST': -211, 'CREATOR': -211, 'DELETER': -211, 'GETTER': -211, 'INHERIT': -211, 'LEGACYCALLER': -211, 'SERIALIZER': -211, 'SETTER': -211, 'STATIC': -211, 'STRINGIFIER': -211, 'REQUIRED': -211, '?': -211, 'ELLIPSIS': -211, 'OR': -211}, 103: {'CALLBACK': -239, 'NAMESPACE': -239, 'PARTIAL': -239, 'DICTIONARY': -239, 'ENUM': -239, 'TYPEDEF': -239, 'identifier': -239, 'IMPLEMENTS': -239, '(': -239, 'UNRESTRICTED': -239, ',': -239, ')': -239, '>': -239, 'ATTRIBUTE': -239, 'CONST': -239, 'CREATOR': -239, 'DELETER': -239, 'GETTER': -239, 'INHERIT': -239, 'LEGACYCALLER': -239, 'SERIALIZER': -239, 'SETTER': -239, 'STATIC': -239, 'STRINGIFIER': -239, 'REQUIRED': -239, '?': -239, 'ELLIPSIS': -239, 'OR': -239}, 104: {'CALLBACK': -240, 'NAMESPACE': -240, 'PARTIAL': -240, 'DICTIONARY': -240, 'ENUM': -240, 'TYPEDEF': -240, 'identifier': -240, 'IMPLEMENTS': -240, '(': -240, 'UNRESTRICTED': -240, ',': -240, ')': -240, '>': -240, 'ATTRIBUTE': -240, 'CONST': -240, 'CREATOR': -240, 'DELETER': -240, 'GETTER': -240, 'INHERIT': -240, 'LEGACYCALLER': -240, 'SERIALIZER': -240, 'SETTER': -240, 'STATIC': -240, 'STRINGIFIER': -240, 'REQUIRED': -240, '?': -240, 'ELLIPSIS': -240, 'OR': -240}, 105: {'CALLBACK': -241, 'NAMESPACE': -241, 'PARTIAL': -241, 'DICTIONARY': -241, 'ENUM': -241, 'TYPEDEF': -241, 'identifier': -241, 'IMPLEMENTS': -241, '(': -241, 'UNRESTRICTED': -241, ',': -241, ')': -241, '>': -241, 'ATTRIBUTE': -241, 'CONST': -241, 'CREATOR': -241, 'DELETER': -241, 'GETTER': -241, 'INHERIT': -241, 'LEGACYCALLER': -241, 'SERIALIZER': -241, 'SETTER': -241, 'STATIC': -241, 'STRINGIFIER': -241, 'REQUIRED': -241, '?': -241, 'ELLIPSIS': -241, 'OR': -241}, 106: {'CALLBACK': -216, 'NAMESPACE': -216, 'PARTIAL': -216, 'DICTIONARY': -216, 'ENUM': -216, 'TYPEDEF': -216, 'identifier': -216, 'IMPLEMENTS': -216, '(': -216, 'UNRESTRICTED': -216, ',': -216, ')': -216, '>': -216, 'ATTRIBUTE': -216, 'CONST': -216, 'CREATOR': -216, 'DELETER': -216, 'GETTER': -216, 'INHERIT': -216, 'LEGACYCALLER': -216, 'SERIALIZER': -216, 'SETTER': -216, 'STATIC': -216, 'STRINGIFIER': -216, 'REQUIRED': -216, '?': -216, 'ELLIPSIS': -216, 'OR': -216}, 107: {'CALLBACK': -219, 'NAMESPACE': -219, 'PARTIAL': -219, 'DICTIONARY': -219, 'ENUM': -219, 'TYPEDEF': -219, 'identifier': -219, 'IMPLEMENTS': -219, '(': -219, 'UNRESTRICTED': -219, 'LONG': 155, ',': -219, ')': -219, '>': -219, 'ATTRIBUTE': -219, 'CONST': -219, 'CREATOR': -219, 'DELETER': -219, 'GETTER': -219, 'INHERIT': -219, 'LEGACYCALLER': -219, 'SERIALIZER': -219, 'SETTER': -219, 'STATIC': -219, 'STRINGIFIER': -219, 'REQUIRED': -219, '?': -219, 'ELLIPSIS': -219, 'OR': -219}, 108: {'CALLBACK': -212, 'NAMESPACE': -212, 'PARTIAL': -212, 'DICTIONARY': -212, 'ENUM': -212, 'TYPEDEF': -212, 'identifier': -212, 'IMPLEMENTS': -212, '(': -212, 'UNRESTRICTED': -212, ',': -212, ')': -212, '>': -212, 'ATTRIBUTE': -212, 'CONST': -212, 'CREATOR': -212, 'DELETER': -212, 'GETTER': -212, 'INHERIT': -212, 'LEGACYCALLER': -212, 'SERIALIZER': -212, 'SETTER': -212, 'STATIC': -212, 'STRINGIFIER': -212, 'REQUIRED': -212, '?': -212, 'ELLIPSIS': -212, 'OR': -212}, 109: {'CALLBACK': -213, 'NAMESPACE': -213, 'PARTIAL': -213, 'DICTIONARY': -213, 'ENUM': -213, 'TYPEDEF': -213, 'identifier': -213, 'IMPLEMENTS': -213, '(': -213, 'UNRESTRICTED': -213, ',': -213, ')': -213, '>': -213, 'ATTRIBUTE': -213, 'CONST': -213, 'CREATOR': -213, 'DELETER': -213, 'GETTER': -213, 'INHERIT': -213, 'LEGACYCALLER': -213, 'SERIALIZER': -213, 'SETTER': -213, 'STATIC': -213, 'STRINGIFIER': -213, 'REQUIRED': -213, '?': -213, 'ELLIPSIS': -213, 'OR': -213}, 125: {'CALLBACK': -182, 'NAMESPACE': -182, 'PARTIAL': -182, 'DICTIONARY': -182, 'ENUM': -182, 'TYPEDEF': -182, 'identifier': -182, 'IMPLEMENTS': -182, '(': -182, 'UNRESTRICTED': -182, '>': -182, 'ATTRIBUTE': -182, 'CONST': -182, 'CREATOR': -182, 'DELETER': -182, 'GETTER': -182, 'INHERIT': -182, 'LEGACYCALLER': -182, 'SERIALIZER': -182, 'SETTER': -182, 'STATIC': -182, 'STRINGIFIER': -182, 'ELLIPSIS': -182}, 126: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, '?': 141, 'ELLIPSIS': -223}, 140: {'CALLBACK': -185, 'NAMESPACE': -185, 'PARTIAL': -185, 'DICTIONARY': -185, 'ENUM': -185, 'TYPEDEF': -185, 'identifier': -185, 'IMPLEMENTS': -185, 'UNRESTRICTED': -185, ',': -185, '>': -185, 'ATTRIBUTE': -185, 'CONST': -185, 'CREATOR': -185, 'DELETER': -185, 'GETTER': -185, 'INHERIT': -185, 'LEGACYCALLER': -185, 'SERIALIZER': -185, 'SETTER': -185, 'STATIC': -185, 'STRINGIFIER': -185, 'REQUIRED': -185}, 141: {'CALLBACK': -222, 'NAMESPACE': -222, 'PARTIAL': -222, 'DICTIONARY': -222, 'ENUM': -222, 'TYPEDEF': -222, 'identifier': -222, 'IMPLEMENTS': -222, '(': -222, 'UNRESTRICTED': -222, ',': -222, ')': -222, '>': -222, 'ATTRIBUTE': -222, 'CONST': -222, 'CREATOR': -222, 'DELETER': -222, 'GETTER': -222, 'INHERIT': -222, 'LEGACYCALLER': -222, 'SERIALIZER': -222, 'SETTER': -222, 'STATIC': -222, 'STRINGIFIER': -222, 'REQUIRED': -222, 'ELLIPSIS': -222, 'OR': -222}, 145: {'CALLBACK': -193, 'NAMESPACE': -193, 'PARTIAL': -193, 'DICTIONARY': -193, 'ENUM': -193, 'TYPEDEF': -193, 'identifier': -193, 'IMPLEMENTS': -193, '(': -193, 'UNRESTRICTED': -193, ',': -193, ')': -193, '>': -193, 'ATTRIBUTE': -193, 'CONST': -193, 'CREATOR': -193, 'DELETER': -193, 'GETTER': -193, 'INHERIT': -193, 'LEGACYCALLER': -193, 'SERIALIZER': -193, 'SETTER': -193, 'STATIC': -193, 'STRINGIFIER': -193, 'REQUIRED': -193, 'ELLIPSIS': -193, 'OR': -193}, 146: {'CALLBACK': -194, 'NAMESPACE': -194, 'PARTIAL': -194, 'DICTIONARY': -194, 'ENUM': -194, 'TYPEDEF': -194, 'identifier': -194, 'IMPLEMENTS': -194, '(': -194, 'UNRESTRICTED': -194, ',': -194, ')': -194, '>': -194, 'ATTRIBUTE': -194, 'CONST': -194, 'CREATOR': -194, 'DELETER': -194, 'GETTER': -194, 'INHERIT': -194, 'LEGACYCALLER': -194, 'SERIALIZER': -194, 'SETTER': -194, 'STATIC': -194, 'STRINGIFIER': -194, 'REQUIRED': -194, 'ELLIPSIS': -194, 'OR': -194}, 147: {'CALLBACK': -195, 'NAMESPACE': -195, 'PARTIAL': -195, 'DICTIONARY': -195, 'ENUM': -195, 'TYPEDEF': -195, 'identifier': -195, 'IMPLEMENTS': -195, '(': -195, 'UNRESTRICTED': -195, ',': -195, ')': -195, '>': -195, 'ATTRIBUTE': -195, 'CONST': -195, 'CREATOR': -195, 'DELETER': -195, 'GETTER': -195, 'INHERIT': -195, 'LEGACYCALLER': -195, 'SERIALIZER': -195, 'SETTER': -195, 'STATIC': -195, 'STRINGIFIER': -195, 'REQUIRED': -195, 'ELLIPSIS': -195, 'OR': -195}, 150: {'CALLBACK': -198, 'NAMESPACE': -198, 'PARTIAL': -198, 'DICTIONARY': -198, 'ENUM': -198, 'TYPEDEF': -198, 'identifier': -198, 'IMPLEMENTS': -198, '(': -198, 'UNRESTRICTED': -198, ',': -198, ')': -198, '>': -198, 'ATTRIBUTE': -198, 'CONST': -198, 'CREATOR': -198, 'DELETER': -198, 'GETTER': -198, 'INHERIT': -198, 'LEGACYCALLER': -198, 'SERIALIZER': -198, 'SETTER': -198, 'STATIC': -198, 'STRINGIFIER': -198, 'REQUIRED': -198, 'ELLIPSIS': -198, 'OR': -198}, 153: {'CALLBACK': -214, 'NAMESPACE': -214, 'PARTIAL': -214, 'DICTIONARY': -214, 'ENUM': -214, 'TYPEDEF': -214, 'identifier': -214, 'IMPLEMENTS': -214, '(': -214, 'UNRESTRICTED': -214, ',': -214, ')': -214, '>': -214, 'ATTRIBUTE': -214, 'CONST': -214, 'CREATOR': -214, 'DELETER': -214, 'GETTER': -214, 'INHERIT': -214, 'LEGACYCALLER': -214, 'SERIALIZER': -214, 'SETTER': -214, 'STATIC': -214, 'STRINGIFIER': -214, 'REQUIRED': -214, '?': -214, 'ELLIPSIS': -214, 'OR': -214}, 154: {'CALLBACK': -210, 'NAMESPACE': -210, 'PARTIAL': -210, 'DICTIONARY': -210, 'ENUM': -210, 'TYPEDEF': -210, 'identifier': -210, 'IMPLEMENTS': -210, '(': -210, 'UNRESTRICTED': -210, ',': -210, ')': -210, '>': -210, 'ATTRIBUTE': -210, 'CONST': -210, 'CREATOR': -210, 'DELETER': -210, 'GETTER': -210, 'INHERIT': -210, 'LEGACYCALLER': -210, 'SERIALIZER': -210, 'SETTER': -210, 'STATIC': -210, 'STRINGIFIER': -210, 'REQUIRED': -210, '?': -210, 'ELLIPSIS': -210, 'OR': -210}, 155: {'CALLBACK': -218, 'NAMESPACE': -218, 'PARTIAL': -218, 'DICTIONARY': -218, 'ENUM': -218, 'TYPEDEF': -218, 'identifier': -218, 'IMPLEMENTS': -218, '(': -218, 'UNRESTRICTED': -218, ',': -218, ')': -218, '>': -218, 'ATTRIBUTE': -218, 'CONST': -218, 'CREATOR': -218, 'DELETER': -218, 'GETTER': -218, 'INHERIT': -218, 'LEGACYCALLER': -218, 'SERIALIZER': -218, 'SETTER': -218, 'STATIC': -218, 'STRINGIFIER': -218, 'REQUIRED': -218, '?': -218, 'ELLIPSIS': -218, 'OR': -218}, 156: {'CALLBACK': -217, 'NAMESPACE': -217, 'PARTIAL': -217, 'DICTIONARY': -217, 'ENUM': -217, 'TYPEDEF': -217, 'identifier': -217, 'IMPLEMENTS': -217, '(': -217, 'UNRESTRICTED': -217, ',': -217, ')': -217, '>': -217, 'ATTRIBUTE': -217, 'CONST': -217, 'CREATOR': -217, 'DELETER': -217, 'GETTER': -217, 'INHERIT': -217, 'LEGACYCALLER': -217, 'SERIALIZER': -217, 'SETTER': -217, 'STATIC': -217, 'STRINGIFIER': -217, 'REQUIRED': -217, '?': -217, 'ELLIPSIS': -217, 'OR': -217}, 164: {'CALLBACK': -136, 'NAMESPACE': -136, 'PARTIAL': -136, 'DICTIONARY': -136, 'ENUM': -136, 'TYPEDEF': -136, 'identifier': -136, 'IMPLEMENTS': -136, 'UNRESTRICTED': -136, 'ATTRIBUTE': -136, 'CONST': -136, 'CREATOR': -136, 'DELETER': -136, 'GETTER': -136, 'INHERIT': -136, 'LEGACYCALLER': -136, 'SERIALIZER': -136, 'SETTER': -136, 'STATIC': -136, 'STRINGIFIER': -136, 'ELLIPSIS': 200}, 171: {'CALLBACK': -183, 'NAMESPACE': -183, 'PARTIAL': -183, 'DICTIONARY': -183, 'ENUM': -183, 'TYPEDEF': -183, 'identifier': -183, 'IMPLEMENTS': -183, '(': -183, 'UNRESTRICTED': -183, '>': -183, 'ATTRIBUTE': -183, 'CONST': -183, 'CREATOR': -183, 'DELETER': -183, 'GETTER': -183, 'INHERIT': -183, 'LEGACYCALLER': -183, 'SERIALIZER': -183, 'SETTER': -183, 'STATIC': -183, 'STRINGIFIER': -183, 'ELLIPSIS': -183}, 198: {'CALLBACK': 267, 'NAMESPACE': 277, 'PARTIAL': 278, 'DICTIONARY': 271, 'ENUM': 272, 'TYPEDEF': 283, 'identifier': 265, 'IMPLEMENTS': 274, 'UNRESTRICTED': 284, 'ATTRIBUTE': 266, 'CONST': 268, 'CREATOR': 269, 'DELETER': 270, 'GETTER': 273, 'INHERIT': 275, 'LEGACYCALLER': 276, 'SERIALIZER': 279, 'SETTER': 280, 'STATIC': 281, 'STRINGIFIER': 282}, 199: {'CALLBACK': 267, 'NAMESPACE': 277, 'PARTIAL': 278, 'DICTIONARY': 271, 'ENUM': 272, 'TYPEDEF': 283, 'identifier': 265, 'IMPLEMENTS': 274, 'UNRESTRICTED': 284, 'ATTRIBUTE': 266, 'CONST': 268, 'CREATOR': 269, 'DELETER': 270, 'GETTER': 273, 'INHERIT': 275, 'LEGACYCALLER': 276, 'SERIALIZER': 279, 'SETTER': 280, 'STATIC': 281, 'STRINGIFIER': 282}, 200: {'CALLBACK': -135, 'NAMESPACE': -135, 'PARTIAL': -135, 'DICTIONARY': -135, 'ENUM': -135, 'TYPEDEF': -135, 'identifier': -135, 'IMPLEMENTS': -135, 'UNRESTRICTED': -135, 'ATTRIBUTE': -135, 'CONST': -135, 'CREATOR': -135, 'DELETER': -135, 'GETTER': -135, 'INHERIT': -135, 'LEGACYCALLER': -135, 'SERIALIZER': -135, 'SETTER': -135, 'STATIC': -135, 'STRINGIFIER': -135}, 256: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, ',': -223, ')': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141, 'ELLIPSIS': -223, 'OR': -223}, 257: {'CALLBACK': -223, 'NAMESPACE': -223, 'PARTIAL': -223, 'DICTIONARY': -223, 'ENUM': -223, 'TYPEDEF': -223, 'identifier': -223, 'IMPLEMENTS': -223, '(': -223, 'UNRESTRICTED': -223, ',': -223, ')': -223, '>': -223, 'ATTRIBUTE': -223, 'CONST': -223, 'CREATOR': -223, 'DELETER': -223, 'GETTER': -223, 'INHERIT': -223, 'LEGACYCALLER': -223, 'SERIALIZER': -223, 'SETTER': -223, 'STATIC': -223, 'STRINGIFIER': -223, 'REQUIRED': -223, '?': 141, 'ELLIPSIS': -223, 'OR': -223}, 258: {'CALLBACK': -220, 'NAMESPACE': -220, 'PARTIAL': -220, 'DICTIONARY': -220, 'ENUM': -220, 'TYPEDEF': -220, 'identifier': -220, 'IMPLEMENTS': -220, '(': -220, 'UNRESTRICTED': -220, ',': -220, ')': -220, '>': -220, 'ATTRIBUTE': -220, 'CONST': -220, 'CREATOR': -220, 'DELETER': -220, 'GETTER': -220, 'INHERIT': -220, 'LEGACYCALLER': -220, 'SERIALIZER': -220, 'SETTER': -220, 'STATIC': -220, 'STRINGIFIER': -220, 'REQUIRED': -220, '?': -220, 'ELLIPSIS': -220, 'OR': -220}, 328: {'CALLBACK': -196, 'NAMESPACE': -196, 'PARTIAL': -196, 'DICTIONARY': -196, 'ENUM': -196, 'TYPEDEF': -196, 'identifier': -196, 'IMPLEMENTS': -196, '(': -196, 'UNRESTRICTED': -196, ',': -196, ')': -196, '>': -196, 'ATTRIBUTE': -196, 'CONST': -196, 'CREATOR': -196, 'DELETER': -196, 'GETTER': -196, 'INHERIT': -196, 'LEGACYCALLER': -196, 'SERIALIZER': -196, 'SETTER': -196, 'STATIC': -196, 'STRINGIFIER': -196, 'REQUIRED': -196, 'ELLIPSIS': -196, 'OR': -196}, 329: {'CALLBACK': -197, 'NAMESPACE': -197, 'PARTIAL': -197, 'DICTIONARY': -197, 'ENUM': -197, 'TYPEDEF': -197, 'identifier': -197, 'IMPLEMENTS': -197, '(': -197, 'UNRESTRICTED': -197, ',': -197, ')': -197, '>': -197, 'ATTRIBUTE': -197, 'CONST': -197, 'CREATOR': -197, 'DELETER': -197, 'GETTER': -197, 'INHERIT': -197, 'LEGACYCALLER': -197, 'SERIALIZER': -197, 'SETTER': -197, 'STATIC': -197, 'STRINGIFIER': -197, 'REQUIRED': -197, 'ELLIPSIS': -197, 'OR': -197}, 364: {'CALLBACK': -188, 'NAMESPACE': -188, 'PARTIAL': -188, 'DICTIONARY': -188, 'ENUM': -188, 'TYPEDEF': -188, 'identifier': -188, 'IMPLEMENTS': -188, '(': -188, 'UNRESTRICTED': -188, ',': -188, ')': -188, '>': -188, 'ATTRIBUTE': -188, 'CONST': -188, 'CREATOR': -188, 'DELETER': -188, 'GETTER': -188, 'INHERIT': -188, 'LEGACYCALLER': -188, 'SERIALIZER': -188, 'SETTER': -188, 'STATIC': -188, 'STRINGIFIER': -188, 'REQUIRED': -188, '?': -188, 'ELLIPSIS': -188, 'OR': -188}, 365: {'CALLBACK': -242, 'NAMESPACE': -242, 'PARTIAL': -242, 'DICTIONARY': -242, 'ENUM': -242, 'TYPEDEF': -242, 'identifier': -242, 'IMPLEMENTS': -242, '(': -242, 'UNRESTRICTED': -242, ',': -242, ')': -242, '>': -242, 'ATTRIBUTE': -242, 'CONST': -242, 'CREATOR': -242, 'DELETER': -242, 'GETTER': -242, 'INHERIT': -242, 'LEGACYCALLER': -242, 'SERIALIZER': -242, 'SETTER': -242, 'STATIC': -242, 'STRINGIFIER': -242, 'REQUIRED': -242, '?': -242, 'ELLIPSIS': -242, 'OR': -242}, 366: {'CALLBACK': -243, 'NAMESPACE': -243, 'PARTIAL': -243, 'DICTIONARY': -243, 'ENUM': -243, 'TYPEDEF': -243, 'identifier': -243, 'IMPLEMENTS': -243, '(': -243, 'UNRESTRICTED': -243, ',': -243, ')': -243, '>': -243, 'ATTRIBUTE': -243, 'CONST': -243, 'CREATOR': -243, 'DELETER': -243, 'GETTER': -243, 'INHERIT': -243, 'LEGACYCALLER': -243, 'SERIALIZER': -243, 'SETTER': -243, 'STATIC': -243, 'STRINGIFIER': -243, 'REQUIRED': -243, '?': -243, 'ELLIPSIS': -243, 'OR': -243}, 5: {'identifier': 34}, 16: {'identifier': 41, 'INTERFACE': 24}, 18: {'identifier': 42}, 24: {'identifier': 58}, 43: {'identifier': 66}, 50: {'identifier': 69}, 55: {'identifier': 75}, 57: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109}, 62: {'identifier': 118, '(': 119, 'string': 121}, 64: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124}, 71: {'identifier': 136}, 81: {'identifier': 84, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109}, 117: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'OPTIONAL': 163}, 119: {'identifier': 166, 'string': 121}, 123: {'identifier': -224, '(': -224, '>': -224}, 124: {'identifier': -225, '(': -225, '>': -225}, 151: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124}, 158: {'identifier': 34}, 175: {'identifier': 211, '(': -124}, 181: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124, 'READONLY': 238, 'ATTRIBUTE': 213, 'CONST': 231, 'CREATOR': 248, 'DELETER': 249, 'GETTER': 246, 'INHERIT': 239, 'LEGACYCALLER': 250, 'SERIALIZER': 234, 'SETTER': 247, 'STATIC': 236, 'STRINGIFIER': 235, 'ITERABLE': 237, 'MAPLIKE': 244, 'SETLIKE': 245}, 187: {'identifier': 84, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109}, 203: {'identifier': 287}, 218: {'identifier': 294}, 231: {'identifier': 298, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109}, 232: {'identifier': 211, '(': -124}, 234: {'identifier': 84, ';': 304, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, '=': 303, 'VOID': 124}, 235: {'identifier': 84, ';': 308, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124, 'READONLY': 309, 'ATTRIBUTE': -111}, 236: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124, 'READONLY': 309, 'ATTRIBUTE': -111}, 243: {'identifier': -116, 'ANY': -116, '(': -116, 'SEQUENCE': -116, 'FROZENARRAY': -116, 'BOOLEAN': -116, 'BYTE': -116, 'OCTET': -116, 'OBJECT': -116, 'DATE': -116, 'REGEXP': -116, 'PROMISE': -116, 'RECORD': -116, 'UNSIGNED': -116, 'UNRESTRICTED': -116, 'BYTESTRING': -116, 'DOMSTRING': -116, 'USVSTRING': -116, 'SHORT': -116, 'LONG': -116, 'FLOAT': -116, 'DOUBLE': -116, 'VOID': -116, 'CREATOR': 248, 'DELETER': 249, 'GETTER': 246, 'LEGACYCALLER': 250, 'SETTER': 247}, 246: {'identifier': -117, 'ANY': -117, '(': -117, 'SEQUENCE': -117, 'FROZENARRAY': -117, 'BOOLEAN': -117, 'BYTE': -117, 'OCTET': -117, 'OBJECT': -117, 'DATE': -117, 'REGEXP': -117, 'PROMISE': -117, 'RECORD': -117, 'UNSIGNED': -117, 'UNRESTRICTED': -117, 'BYTESTRING': -117, 'DOMSTRING': -117, 'USVSTRING': -117, 'SHORT': -117, 'LONG': -117, 'FLOAT': -117, 'DOUBLE': -117, 'VOID': -117, 'CREATOR': -117, 'DELETER': -117, 'GETTER': -117, 'LEGACYCALLER': -117, 'SETTER': -117}, 247: {'identifier': -118, 'ANY': -118, '(': -118, 'SEQUENCE': -118, 'FROZENARRAY': -118, 'BOOLEAN': -118, 'BYTE': -118, 'OCTET': -118, 'OBJECT': -118, 'DATE': -118, 'REGEXP': -118, 'PROMISE': -118, 'RECORD': -118, 'UNSIGNED': -118, 'UNRESTRICTED': -118, 'BYTESTRING': -118, 'DOMSTRING': -118, 'USVSTRING': -118, 'SHORT': -118, 'LONG': -118, 'FLOAT': -118, 'DOUBLE': -118, 'VOID': -118, 'CREATOR': -118, 'DELETER': -118, 'GETTER': -118, 'LEGACYCALLER': -118, 'SETTER': -118}, 248: {'identifier': -119, 'ANY': -119, '(': -119, 'SEQUENCE': -119, 'FROZENARRAY': -119, 'BOOLEAN': -119, 'BYTE': -119, 'OCTET': -119, 'OBJECT': -119, 'DATE': -119, 'REGEXP': -119, 'PROMISE': -119, 'RECORD': -119, 'UNSIGNED': -119, 'UNRESTRICTED': -119, 'BYTESTRING': -119, 'DOMSTRING': -119, 'USVSTRING': -119, 'SHORT': -119, 'LONG': -119, 'FLOAT': -119, 'DOUBLE': -119, 'VOID': -119, 'CREATOR': -119, 'DELETER': -119, 'GETTER': -119, 'LEGACYCALLER': -119, 'SETTER': -119}, 249: {'identifier': -120, 'ANY': -120, '(': -120, 'SEQUENCE': -120, 'FROZENARRAY': -120, 'BOOLEAN': -120, 'BYTE': -120, 'OCTET': -120, 'OBJECT': -120, 'DATE': -120, 'REGEXP': -120, 'PROMISE': -120, 'RECORD': -120, 'UNSIGNED': -120, 'UNRESTRICTED': -120, 'BYTESTRING': -120, 'DOMSTRING': -120, 'USVSTRING': -120, 'SHORT': -120, 'LONG': -120, 'FLOAT': -120, 'DOUBLE': -120, 'VOID': -120, 'CREATOR': -120, 'DELETER': -120, 'GETTER': -120, 'LEGACYCALLER': -120, 'SETTER': -120}, 250: {'identifier': -121, 'ANY': -121, '(': -121, 'SEQUENCE': -121, 'FROZENARRAY': -121, 'BOOLEAN': -121, 'BYTE': -121, 'OCTET': -121, 'OBJECT': -121, 'DATE': -121, 'REGEXP': -121, 'PROMISE': -121, 'RECORD': -121, 'UNSIGNED': -121, 'UNRESTRICTED': -121, 'BYTESTRING': -121, 'DOMSTRING': -121, 'USVSTRING': -121, 'SHORT': -121, 'LONG': -121, 'FLOAT': -121, 'DOUBLE': -121, 'VOID': -121, 'CREATOR': -121, 'DELETER': -121, 'GETTER': -121, 'LEGACYCALLER': -121, 'SETTER': -121}, 260: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109}, 291: {'identifier': 340, 'REQUIRED': 341}, 293: {'identifier': 342}, 297: {'identifier': 344}, 298: {'identifier': -223, '?': 141}, 299: {'identifier': -223, '?': 141}, 302: {'identifier': 211, '(': -124}, 307: {'identifier': 211, '(': -124}, 312: {'identifier': 211, '(': -124}, 319: {'identifier': -116, 'ANY': -116, '(': -116, 'SEQUENCE': -116, 'FROZENARRAY': -116, 'BOOLEAN': -116, 'BYTE': -116, 'OCTET': -116, 'OBJECT': -116, 'DATE': -116, 'REGEXP': -116, 'PROMISE': -116, 'RECORD': -116, 'UNSIGNED': -116, 'UNRESTRICTED': -116, 'BYTESTRING': -116, 'DOMSTRING': -116, 'USVSTRING': -116, 'SHORT': -116, 'LONG': -116, 'FLOAT': -116, 'DOUBLE': -116, 'VOID': -116, 'CREATOR': 248, 'DELETER': 249, 'GETTER': 246, 'LEGACYCALLER': 250, 'SETTER': 247}, 320: {'identifier': 84, 'ANY': 80, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109, 'VOID': 124}, 326: {'identifier': 84, '(': 81, 'SEQUENCE': 85, 'FROZENARRAY': 86, 'BOOLEAN': 91, 'BYTE': 92, 'OCTET': 93, 'OBJECT': 94, 'DATE': 95, 'REGEXP': 96, 'PROMISE': 97, 'RECORD': 98, 'UNSIGNED': 99, 'UNRESTRICTED': 101, 'BYTESTRING': 103, 'DOMSTRING': 104, 'USVSTRING': 105, 'SHORT': 106, 'LONG': 107, 'FLOAT': 108, 'DOUBLE': 109}, 345: {'identifier': -200}, 346: {'identifier': -199}, 349: {'identifier': 392, '}': -89, 'ATTRIBUTE': 390, 'GETTER': 389, 'INHERIT': 391}, 350: {'identifier': 395, ']': -92, 'GETTER': 394}, 358: {'identifier': -115, 'ANY': -115, '(': -115, 'SEQUENCE': -115, 'FROZENARRAY': -115, 'BOOLEAN': -115, 'BYTE': -115, 'OCTET': -115, 'OBJECT': -115, 'DATE': -115, 'REGEXP': -115, 'PROMISE': -115, 'RECORD': -115, 'UNSIGNED': -115, 'UNRESTRICTED': -115, 'BYTESTRING': -115, 'DOMSTRING': -115, 'USVSTRING': -115, 'SHORT': -115, 'LONG': -115, 'FLOAT': -115, 'DOUBLE': -115, 'VOID': -115}, 359: {'identifier': 211, '(': -124}, 409: {'identifier': 287, 'ATTRIBUTE': 419}, 15: {';': 37}, 52: {';': 72}, 54: {';': 74}, 56: {';': 76}, 66: {';': 131}, 68: {';': 133}, 75: {';': 139}, 172: {';': 208}, 185: {';': 252}, 214: {';': 292}, 219: {';': 295}, 251: {';': 323}, 261: {';': 332}, 289: {';': 336}, 294: {';': -48, '=': 334}, 338: {';': 383}, 339: {';': -107}, 340: {';': -108}, 341: {';': -109}, 342: {';': -48, '=': 334}, 343: {';': 385}, 348: {';': 387}, 351: {';': -83}, 367: {';': -47, ',': -47, ')': -47}, 368: {';': -49, ',': -49, ')': -49}, 369: {';': -50, ',': -50, ')': -50}, 371: {';': -66, ',': -66, ')': -66}, 372: {';': -67, ',': -67, ')': -67}, 373: {';': -68, ',': -68, ')': -68}, 374: {';': -69, ',': -69, ')': -69}, 375: {';': -71, ',': -71, ')': -71}, 376: {';': -72, ',': -72, ')': -72}, 377: {';': -73, ',': -73, ')': -73}, 379: {';': -75, ',': -75, ')': -75}, 380: {';': -76, ',': -76, ')': -76}, 381: {';': -70, ',': -70, ')': -70}, 382: {';': 405}, 384: {';': 406}, 400: {';': 417}, 403: {';': -51, ',': -51, ')': -51}, 404: {';': -74, ',': -74, ')': -74}, 407: {';': 418}, 408: {';': -81}, 412: {';': -82}, 414: {';': 420}, 421: {';': 422}, 19: {'IMPLEMENTS': 43}, 34: {'(': 61, ',': -229, ']': -229, '=': 62}, 118: {'(': 165, ',': -231, ']': -231}, 122: {'(': 170}, 210: {'(': 290}, 211: {'(': -123}, 99: {'SHORT': 106, 'LONG': 107}, 101: {'FLOAT': 108, 'DOUBLE': 109}, 26: {',': 60, ']': -155}, 27: {',': -156, ']': -156}, 28: {',': -157, ']': -157}, 29: {',': -158, ']': -158}, 30: {',': -159, ']': -159}, 31: {',': -160, ']': -160}, 32: {',': -161, ']': -161}, 33: {',': -162, ']': -162}, 112: {',': 158, ']': -155}, 115: {',': 162, ')': -129}, 120: {',': -234, ']': -234}, 121: {',': -238, ']': -238, ')': -238}, 160: {',': -230, ']': -230}, 166: {',': 203, ')': -228}, 169: {',': 206, ')': -237}, 186: {',': 254, '}': -58}, 192: {',': 259}, 193: {',': 260}, 196: {',': 162, ')': -129}, 204: {',': -232, ']': -232}, 205: {',': -235, ']': -235}, 263: {',': -48, '=': 334, ')': -48}, 264: {',': -133, '=': -133, ')': -133}, 265: {',': -134, '=': -134, ')': -134}, 266: {',': -163, '=': -163, ')': -163}, 267: {',': -164, '=': -164, ')': -164}, 268: {',': -165, '=': -165, ')': -165}, 269: {',': -166, '=': -166, ')': -166}, 270: {',': -167, '=': -167, ')': -167}, 271: {',': -168, '=': -168, ')': -168}, 272: {',': -169, '=': -169, ')': -169}, 273: {',': -170, '=': -170, ')': -170}, 274: {',': -171, '=': -171, ')': -171}, 275: {',': -172, '=': -172, ')': -172}, 276: {',': -173, '=': -173, ')': -173}, 277: {',': -174, '=': -174, ')': -174}, 278: {',': -175, '=': -175, ')': -175}, 279: {',': -176, '=': -176, ')': -176}, 280: {',': -177, '=': -177, ')': -177}, 281: {',': -178, '=': -178, ')': -178}, 282: {',': -179, '=': -179, ')': -179}, 283: {',': -180, '=': -180, ')': -180}, 284: {',': -181, '=': -181, ')': -181}, 285: {',': -132, ')': -132}, 286: {',': -233, ']': -233}, 287: {',': 203, ']': -228, ')': -228, '}': -228}, 333: {',': -131, ')': -131}, 356: {',': 397, '>': -139}, 360: {',': 399}, 362: {',': 254, '}': -58}, 391: {',': 409, '}': -228}, 392: {',': 203, '}': -228}, 395: {',': 203, ']': -228}, 59: {']': 111}, 159: {']': -154}, 335: {']': -227, ')': -227, '}': -227}, 370: {']': 403}, 393: {']': 412}, 394: {']': -90}, 413: {']': -91}, 41: {'=': 64}, 344: {'=': 386}, 42: {'{': 65}, 51: {'{': -53, ':': 71}, 53: {'{': 73}, 58: {'{': -53, ':': 71}, 67: {'{': 132}, 69: {'{': 134}, 70: {'{': 135}, 110: {'{': 157}, 136: {'{': -52}, 114: {')': 160}, 116: {')': -127}, 143: {')': -189, 'OR': -189}, 144: {')': -223, '?': 141, 'OR': -223}, 161: {')': -125}, 167: {')': 204}, 168: {')': 205}, 188: {')': -190, 'OR': -190}, 197: {')': -130}, 201: {')': 286}, 202: {')': -226}, 207: {')': 289}, 255: {')': -192, 'OR': 326}, 262: {')': -128}, 288: {')': -236}, 327: {')': 364}, 337: {')': 382}, 363: {')': -192, 'OR': 326}, 402: {')': -191}, 138: {'string': 186}, 206: {'string': 121}, 325: {'string': 362}, 127: {'}': 172}, 137: {'}': 185}, 173: {'}': -146}, 174: {'}': -148}, 177: {'}': 214}, 180: {'}': 219}, 182: {'}': -26}, 183: {'}': 251}, 194: {'}': 261}, 215: {'}': -40}, 216: {'}': -42}, 253: {'}': -56}, 296: {'}': -24}, 324: {'}': -57}, 388: {'}': 408}, 389: {'}': -84}, 390: {'}': -85}, 401: {'}': -59}, 410: {'}': -87}, 411: {'}': -88}, 419: {'}': -86}, 239: {'READONLY': 309, 'ATTRIBUTE': -111}, 189: {'>': 256}, 190: {'>': 257}, 191: {'>': 258}, 330: {'>': 365}, 331: {'>': 366}, 361: {'>': 400}, 396: {'>': 414}, 415: {'>': -138}, 416: {'>': 421}, 176: {'ATTRIBUTE': 213}, 238: {'ATTRIBUTE': 213, 'MAPLIKE': 244, 'SETLIKE': 245}, 306: {'ATTRIBUTE': 213}, 309: {'ATTRIBUTE': -110}, 311: {'ATTRIBUTE': 213}, 318: {'ATTRIBUTE': 213}, 142: {'OR': 187}, 85: {'<': 148}, 86: {'<': 149}, 98: {'<': 152}, 237: {'<': 313}, 244: {'<': 321}, 245: {'<': 322}, 386: {'integer': 373, 'TRUE': 375, 'FALSE': 376, 'float': 377, '-': 378, 'INFINITY': 379, 'NAN': 380, 'NULL': 381}, 378: {'INFINITY': 404}},
+    '_lr_goto': {0: {'Definitions': 1, 'SpecialComments': 2, 'ExtendedAttributeList': 3}, 7: {'Definitions': 36, 'SpecialComments': 2, 'ExtendedAttributeList': 3}, 35: {'Definitions': 63, 'SpecialComments': 2, 'ExtendedAttributeList': 3}, 4: {'SpecialComments': 25}, 2: {'ExtendedAttributeList': 6}, 23: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 55}, 61: {'ExtendedAttributeList': 117, 'ArgumentList': 114, 'Argument': 115}, 65: {'ExtendedAttributeList': 130, 'NamespaceMembers': 127, 'NamespaceMember': 129}, 73: {'ExtendedAttributeList': 138, 'EnumValueList': 137}, 129: {'ExtendedAttributeList': 130, 'NamespaceMembers': 173, 'NamespaceMember': 129}, 132: {'ExtendedAttributeList': 179, 'DictionaryMembers': 177, 'DictionaryMember': 178}, 134: {'ExtendedAttributeList': 181, 'InterfaceMembers': 180}, 135: {'ExtendedAttributeList': 179, 'DictionaryMembers': 183, 'DictionaryMember': 178}, 148: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 189}, 149: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 190}, 157: {'ExtendedAttributeList': 181, 'InterfaceMembers': 194}, 162: {'ExtendedAttributeList': 117, 'Argument': 196}, 163: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 198}, 165: {'ExtendedAttributeList': 117, 'ArgumentList': 201, 'Argument': 115}, 170: {'ExtendedAttributeList': 117, 'ArgumentList': 207, 'Argument': 115}, 178: {'ExtendedAttributeList': 179, 'DictionaryMembers': 215, 'DictionaryMember': 178}, 213: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 291}, 217: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 293}, 220: {'ExtendedAttributeList': 181, 'InterfaceMembers': 296}, 254: {'ExtendedAttributeList': 325, 'EnumValueListString': 324}, 259: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 330}, 290: {'ExtendedAttributeList': 117, 'ArgumentList': 337, 'Argument': 115}, 313: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 356}, 321: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 360}, 322: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 361}, 397: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 415}, 399: {'ExtendedAttributeList': 57, 'TypeWithExtendedAttributes': 416}, 3: {'Definition': 7, 'CallbackOrInterface': 8, 'Namespace': 9, 'Partial': 10, 'Dictionary': 11, 'Enum': 12, 'Typedef': 13, 'ImplementsStatement': 14, 'Interface': 17}, 6: {'Definition': 35, 'CallbackOrInterface': 8, 'Namespace': 9, 'Partial': 10, 'Dictionary': 11, 'Enum': 12, 'Typedef': 13, 'ImplementsStatement': 14, 'Interface': 17}, 20: {'Namespace': 48, 'PartialDefinition': 44, 'PartialDictionary': 46, 'PartialInterface': 47}, 16: {'Interface': 40, 'CallbackRestOrInterface': 38, 'CallbackRest': 39}, 5: {'ExtendedAttribute': 26, 'ExtendedAttributeNoArgs': 27, 'ExtendedAttributeArgList': 28, 'ExtendedAttributeIdent': 29, 'ExtendedAttributeIdentList': 30, 'ExtendedAttributeNamedArgList': 31, 'ExtendedAttributeStringLiteral': 32, 'ExtendedAttributeStringLiteralList': 33}, 60: {'ExtendedAttribute': 112, 'ExtendedAttributeNoArgs': 27, 'ExtendedAttributeArgList': 28, 'ExtendedAttributeIdent': 29, 'ExtendedAttributeIdentList': 30, 'ExtendedAttributeNamedArgList': 31, 'ExtendedAttributeStringLiteral': 32, 'ExtendedAttributeStringLiteralList': 33}, 158: {'ExtendedAttribute': 112, 'ExtendedAttributeNoArgs': 27, 'ExtendedAttributeArgList': 28, 'ExtendedAttributeIdent': 29, 'ExtendedAttributeIdentList': 30, 'ExtendedAttributeNamedArgList': 31, 'ExtendedAttributeStringLiteral': 32, 'ExtendedAttributeStringLiteralList': 33}, 26: {'ExtendedAttributes': 59}, 112: {'ExtendedAttributes': 159}, 51: {'Inheritance': 70}, 58: {'Inheritance': 110}, 57: {'SingleType': 77, 'UnionType': 78, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102}, 64: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 122, 'Type': 123}, 117: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'Type': 164}, 130: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 175, 'Type': 123}, 151: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 191, 'Type': 123}, 179: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'Type': 218}, 181: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 232, 'Type': 123, 'AttributeRest': 240, 'InterfaceMember': 220, 'Const': 221, 'Operation': 222, 'Serializer': 223, 'Stringifier': 224, 'StaticMember': 225, 'Iterable': 226, 'ReadonlyMember': 227, 'ReadWriteAttribute': 228, 'ReadWriteMaplike': 229, 'ReadWriteSetlike': 230, 'SpecialOperation': 233, 'MaplikeRest': 241, 'SetlikeRest': 242, 'Special': 243}, 234: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 302, 'Type': 123, 'SerializerRest': 301}, 235: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 307, 'Type': 123, 'StringifierRest': 305, 'ReadOnly': 306}, 236: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 312, 'Type': 123, 'ReadOnly': 311, 'StaticMemberRest': 310}, 260: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'Type': 331}, 320: {'SingleType': 125, 'UnionType': 126, 'NonAnyType': 79, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ReturnType': 359, 'Type': 123}, 81: {'UnionType': 144, 'NonAnyType': 143, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'UnionMemberType': 142}, 187: {'UnionType': 144, 'NonAnyType': 143, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'UnionMemberType': 255}, 326: {'UnionType': 144, 'NonAnyType': 143, 'PrimitiveType': 82, 'PromiseType': 83, 'RecordType': 87, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'UnionMemberType': 363}, 231: {'PrimitiveType': 299, 'UnsignedIntegerType': 88, 'UnrestrictedFloatType': 89, 'StringType': 90, 'IntegerType': 100, 'FloatType': 102, 'ConstType': 297}, 152: {'StringType': 192}, 99: {'IntegerType': 153}, 101: {'FloatType': 154}, 62: {'StringLiteral': 120}, 119: {'StringLiteral': 169, 'IdentifierList': 167, 'StringLiteralList': 168}, 206: {'StringLiteral': 169, 'StringLiteralList': 288}, 78: {'Null': 140}, 82: {'Null': 145}, 83: {'Null': 146}, 84: {'Null': 147}, 87: {'Null': 150}, 126: {'Null': 171}, 144: {'Null': 188}, 256: {'Null': 328}, 257: {'Null': 329}, 298: {'Null': 345}, 299: {'Null': 346}, 107: {'OptionalLong': 156}, 115: {'Arguments': 161}, 196: {'Arguments': 262}, 164: {'Ellipsis': 199}, 166: {'Identifiers': 202}, 287: {'Identifiers': 335}, 391: {'Identifiers': 410}, 392: {'Identifiers': 411}, 395: {'Identifiers': 413}, 175: {'OperationRest': 209, 'OptionalIdentifier': 210}, 232: {'OperationRest': 300, 'OptionalIdentifier': 210}, 302: {'OperationRest': 347, 'OptionalIdentifier': 210}, 307: {'OperationRest': 353, 'OptionalIdentifier': 210}, 312: {'OperationRest': 355, 'OptionalIdentifier': 210}, 359: {'OperationRest': 398, 'OptionalIdentifier': 210}, 176: {'AttributeRest': 212}, 238: {'AttributeRest': 315, 'MaplikeRest': 316, 'SetlikeRest': 317, 'ReadonlyMemberRest': 314}, 306: {'AttributeRest': 352}, 311: {'AttributeRest': 354}, 318: {'AttributeRest': 357}, 243: {'Special': 319, 'Specials': 320}, 319: {'Special': 319, 'Specials': 358}, 186: {'EnumValueListComma': 253}, 362: {'EnumValueListComma': 401}, 198: {'ArgumentName': 263, 'ArgumentNameKeyword': 264}, 199: {'ArgumentName': 285, 'ArgumentNameKeyword': 264}, 239: {'ReadOnly': 318}, 255: {'UnionMemberTypes': 327}, 363: {'UnionMemberTypes': 402}, 263: {'Default': 333}, 294: {'Default': 343}, 342: {'Default': 384}, 291: {'AttributeName': 338, 'AttributeNameKeyword': 339}, 303: {'SerializationPattern': 348}, 334: {'DefaultValue': 367, 'ConstValue': 368, 'BooleanLiteral': 371, 'FloatLiteral': 372, 'null': 374}, 386: {'ConstValue': 407, 'BooleanLiteral': 371, 'FloatLiteral': 372, 'null': 374}, 349: {'SerializationPatternMap': 388}, 350: {'SerializationPatternList': 393}, 356: {'OptionalType': 396}},
+    '_lr_method': 'LALR',
+    '_lr_productions': [("S' -> Definitions", "S'", 1, None, None, None), ('Definitions -> SpecialComments ExtendedAttributeList Definition Definitions', 'Definitions', 4, 'p_Definitions', 'idl_parser.py', 244), ('Definitions -> ExtendedAttributeList Definition Definitions', 'Definitions', 3, 'p_Definitions', 'idl_parser.py', 245), ('Definitions -> <empty>', 'Definitions', 0, 'p_Definitions', 'idl_parser.py', 246), ('Definition -> CallbackOrInterface', 'Definition', 1, 'p_Definition', 'idl_parser.py', 256), ('Definition -> Namespace', 'Definition', 1, 'p_Definition', 'idl_parser.py', 257), ('Definition -> Partial', 'Definition', 1, 'p_Definition', 'idl_parser.py', 258), ('Definition -> Dictionary', 'Definition', 1, 'p_Definition', 'idl_parser.py', 259), ('Definition -> Enum', 'Definition', 1, 'p_Definition', 'idl_parser.py', 260), ('Definition -> Typedef', 'Definition', 1, 'p_Definition', 'idl_parser.py', 261), ('Definition -> ImplementsStatement', 'Definition', 1, 'p_Definition', 'idl_parser.py', 262), ('Definition -> error ;', 'Definition', 2, 'p_DefinitionError', 'idl_parser.py', 267), ('CallbackOrInterface -> CALLBACK CallbackRestOrInterface', 'CallbackOrInterface', 2, 'p_CallbackOrInterface', 'idl_parser.py', 271), ('CallbackOrInterface -> Interface', 'CallbackOrInterface', 1, 'p_CallbackOrInterface', 'idl_parser.py', 272), ('CallbackRestOrInterface -> CallbackRest', 'CallbackRestOrInterface', 1, 'p_CallbackRestOrInterface', 'idl_parser.py', 281), ('CallbackRestOrInterface -> Interface', 'CallbackRestOrInterface', 1, 'p_CallbackRestOrInterface', 'idl_parser.py', 282), ('Interface -> INTERFACE identifier Inheritance { InterfaceMembers } ;', 'Interface', 7, 'p_Interface', 'idl_parser.py', 286), ('Interface -> INTERFACE identifier Inheritance { error', 'Interface', 5, 'p_InterfaceError', 'idl_parser.py', 291), ('Partial -> PARTIAL PartialDefinition', 'Partial', 2, 'p_Partial', 'idl_parser.py', 295), ('Partial -> PARTIAL error', 'Partial', 2, 'p_PartialError', 'idl_parser.py', 301), ('PartialDefinition -> PartialDictionary', 'PartialDefinition', 1, 'p_PartialDefinition', 'idl_parser.py', 305), ('PartialDefinition -> PartialInterface', 'PartialDefinition', 1, 'p_PartialDefinition', 'idl_parser.py', 306), ('PartialDefinition -> Namespace', 'PartialDefinition', 1, 'p_PartialDefinition', 'idl_parser.py', 307), ('PartialInterface -> INTERFACE identifier { InterfaceMembers } ;', 'PartialInterface', 6, 'p_PartialInterface', 'idl_parser.py', 311), ('InterfaceMembers -> ExtendedAttributeList InterfaceMember InterfaceMembers', 'InterfaceMembers', 3, 'p_InterfaceMembers', 'idl_parser.py', 315), ('InterfaceMembers -> <empty>', 'InterfaceMembers', 0, 'p_InterfaceMembers', 'idl_parser.py', 316), ('InterfaceMembers -> error', 'InterfaceMembers', 1, 'p_InterfaceMembersError', 'idl_parser.py', 323), ('InterfaceMember -> Const', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 328), ('InterfaceMember -> Operation', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 329), ('InterfaceMember -> Serializer', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 330), ('InterfaceMember -> Stringifier', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 331), ('InterfaceMember -> StaticMember', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 332), ('InterfaceMember -> Iterable', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 333), ('InterfaceMember -> ReadonlyMember', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 334), ('InterfaceMember -> ReadWriteAttribute', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 335), ('InterfaceMember -> ReadWriteMaplike', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 336), ('InterfaceMember -> ReadWriteSetlike', 'InterfaceMember', 1, 'p_InterfaceMember', 'idl_parser.py', 337), ('Dictionary -> DICTIONARY identifier Inheritance { DictionaryMembers } ;', 'Dictionary', 7, 'p_Dictionary', 'idl_parser.py', 341), ('Dictionary -> DICTIONARY error ;', 'Dictionary', 3, 'p_DictionaryError', 'idl_parser.py', 346), ('Dictionary -> DICTIONARY identifier Inheritance { error', 'Dictionary', 5, 'p_DictionaryError2', 'idl_parser.py', 352), ('DictionaryMembers -> DictionaryMember DictionaryMembers', 'DictionaryMembers', 2, 'p_DictionaryMembers', 'idl_parser.py', 356), ('DictionaryMembers -> <empty>', 'DictionaryMembers', 0, 'p_DictionaryMembers', 'idl_parser.py', 357), ('DictionaryMembers -> ExtendedAttributeList error', 'DictionaryMembers', 2, 'p_DictionaryMembersError', 'idl_parser.py', 363), ('DictionaryMember -> ExtendedAttributeList REQUIRED TypeWithExtendedAttributes identifier Default ;', 'DictionaryMember', 6, 'p_DictionaryMember', 'idl_parser.py', 367), ('DictionaryMember -> ExtendedAttributeList Type identifier Default ;', 'DictionaryMember', 5, 'p_DictionaryMember', 'idl_parser.py', 368), ('PartialDictionary -> DICTIONARY identifier { DictionaryMembers } ;', 'PartialDictionary', 6, 'p_PartialDictionary', 'idl_parser.py', 387), ('PartialDictionary -> DICTIONARY error ;', 'PartialDictionary', 3, 'p_PartialDictionaryError', 'idl_parser.py', 392), ('Default -> = DefaultValue', 'Default', 2, 'p_Default', 'idl_parser.py', 396), ('Default -> <empty>', 'Default', 0, 'p_Default', 'idl_parser.py', 397), ('DefaultValue -> ConstValue', 'DefaultValue', 1, 'p_DefaultValue', 'idl_parser.py', 402), ('DefaultValue -> string', 'DefaultValue', 1, 'p_DefaultValue', 'idl_parser.py', 403), ('DefaultValue -> [ ]', 'DefaultValue', 2, 'p_DefaultValue', 'idl_parser.py', 404), ('Inheritance -> : identifier', 'Inheritance', 2, 'p_Inheritance', 'idl_parser.py', 415), ('Inheritance -> <empty>', 'Inheritance', 0, 'p_Inheritance', 'idl_parser.py', 416), ('Enum -> ENUM identifier { EnumValueList } ;', 'Enum', 6, 'p_Enum', 'idl_parser.py', 421), ('Enum -> ENUM error ;', 'Enum', 3, 'p_EnumError', 'idl_parser.py', 426), ('EnumValueList -> ExtendedAttributeList string EnumValueListComma', 'EnumValueList', 3, 'p_EnumValueList', 'idl_parser.py', 430), ('EnumValueListComma -> , EnumValueListString', 'EnumValueListComma', 2, 'p_EnumValueListComma', 'idl_parser.py', 435), ('EnumValueListComma -> <empty>', 'EnumValueListComma', 0, 'p_EnumValueListComma', 'idl_parser.py', 436), ('EnumValueListString -> ExtendedAttributeList string EnumValueListComma', 'EnumValueListString', 3, 'p_EnumValueListString', 'idl_parser.py', 441), ('EnumValueListString -> <empty>', 'EnumValueListString', 0, 'p_EnumValueListString', 'idl_parser.py', 442), ('CallbackRest -> identifier = ReturnType ( ArgumentList ) ;', 'CallbackRest', 7, 'p_CallbackRest', 'idl_parser.py', 448), ('Typedef -> TYPEDEF TypeWithExtendedAttributes identifier ;', 'Typedef', 4, 'p_Typedef', 'idl_parser.py', 453), ('Typedef -> TYPEDEF error ;', 'Typedef', 3, 'p_TypedefError', 'idl_parser.py', 458), ('ImplementsStatement -> identifier IMPLEMENTS identifier ;', 'ImplementsStatement', 4, 'p_ImplementsStatement', 'idl_parser.py', 462), ('Const -> CONST ConstType identifier = ConstValue ;', 'Const', 6, 'p_Const', 'idl_parser.py', 467), ('ConstValue -> BooleanLiteral', 'ConstValue', 1, 'p_ConstValue', 'idl_parser.py', 472), ('ConstValue -> FloatLiteral', 'ConstValue', 1, 'p_ConstValue', 'idl_parser.py', 473), ('ConstValue -> integer', 'ConstValue', 1, 'p_ConstValue', 'idl_parser.py', 474), ('ConstValue -> null', 'ConstValue', 1, 'p_ConstValue', 'idl_parser.py', 475), ('null -> NULL', 'null', 1, 'p_null', 'idl_parser.py', 484), ('BooleanLiteral -> TRUE', 'BooleanLiteral', 1, 'p_BooleanLiteral', 'idl_parser.py', 489), ('BooleanLiteral -> FALSE', 'BooleanLiteral', 1, 'p_BooleanLiteral', 'idl_parser.py', 490), ('FloatLiteral -> float', 'FloatLiteral', 1, 'p_FloatLiteral', 'idl_parser.py', 495), ('FloatLiteral -> - INFINITY', 'FloatLiteral', 2, 'p_FloatLiteral', 'idl_parser.py', 496), ('FloatLiteral -> INFINITY', 'FloatLiteral', 1, 'p_FloatLiteral', 'idl_parser.py', 497), ('FloatLiteral -> NAN', 'FloatLiteral', 1, 'p_FloatLiteral', 'idl_parser.py', 498), ('Serializer -> SERIALIZER SerializerRest', 'Serializer', 2, 'p_Serializer', 'idl_parser.py', 507), ('SerializerRest -> ReturnType OperationRest', 'SerializerRest', 2, 'p_SerializerRest', 'idl_parser.py', 513), ('SerializerRest -> = SerializationPattern ;', 'SerializerRest', 3, 'p_SerializerRest', 'idl_parser.py', 514), ('SerializerRest -> ;', 'SerializerRest', 1, 'p_SerializerRest', 'idl_parser.py', 515), ('SerializationPattern -> { SerializationPatternMap }', 'SerializationPattern', 3, 'p_SerializationPattern', 'idl_parser.py', 523), ('SerializationPattern -> [ SerializationPatternList ]', 'SerializationPattern', 3, 'p_SerializationPattern', 'idl_parser.py', 524), ('SerializationPattern -> identifier', 'SerializationPattern', 1, 'p_SerializationPattern', 'idl_parser.py', 525), ('SerializationPatternMap -> GETTER', 'SerializationPatternMap', 1, 'p_SerializationPatternMap', 'idl_parser.py', 535), ('SerializationPatternMap -> ATTRIBUTE', 'SerializationPatternMap', 1, 'p_SerializationPatternMap', 'idl_parser.py', 536), ('SerializationPatternMap -> INHERIT , ATTRIBUTE', 'SerializationPatternMap', 3, 'p_SerializationPatternMap', 'idl_parser.py', 537), ('SerializationPatternMap -> INHERIT Identifiers', 'SerializationPatternMap', 2, 'p_SerializationPatternMap', 'idl_parser.py', 538), ('SerializationPatternMap -> identifier Identifiers', 'SerializationPatternMap', 2, 'p_SerializationPatternMap', 'idl_parser.py', 539), ('SerializationPatternMap -> <empty>', 'SerializationPatternMap', 0, 'p_SerializationPatternMap', 'idl_parser.py', 540), ('SerializationPatternList -> GETTER', 'SerializationPatternList', 1, 'p_SerializationPatternList', 'idl_parser.py', 559), ('SerializationPatternList -> identifier Identifiers', 'SerializationPatternList', 2, 'p_SerializationPatternList', 'idl_parser.py', 560), ('SerializationPatternList -> <empty>', 'SerializationPatternList', 0, 'p_SerializationPatternList', 'idl_parser.py', 561), ('Stringifier -> STRINGIFIER StringifierRest', 'Stringifier', 2, 'p_Stringifier', 'idl_parser.py', 571), ('StringifierRest -> ReadOnly AttributeRest', 'StringifierRest', 2, 'p_StringifierRest', 'idl_parser.py', 575), ('StringifierRest -> ReturnType OperationRest', 'StringifierRest', 2, 'p_StringifierRest', 'idl_parser.py', 576), ('StringifierRest -> ;', 'StringifierRest', 1, 'p_StringifierRest', 'idl_parser.py', 577), ('StaticMember -> STATIC StaticMemberRest', 'StaticMember', 2, 'p_StaticMember', 'idl_parser.py', 583), ('StaticMemberRest -> ReadOnly AttributeRest', 'StaticMemberRest', 2, 'p_StaticMemberRest', 'idl_parser.py', 588), ('StaticMemberRest -> ReturnType OperationRest', 'StaticMemberRest', 2, 'p_StaticMemberRest', 'idl_parser.py', 589), ('ReadonlyMember -> READONLY ReadonlyMemberRest', 'ReadonlyMember', 2, 'p_ReadonlyMember', 'idl_parser.py', 597), ('ReadonlyMemberRest -> AttributeRest', 'ReadonlyMemberRest', 1, 'p_ReadonlyMemberRest', 'idl_parser.py', 602), ('ReadonlyMemberRest -> MaplikeRest', 'ReadonlyMemberRest', 1, 'p_ReadonlyMemberRest', 'idl_parser.py', 603), ('ReadonlyMemberRest -> SetlikeRest', 'ReadonlyMemberRest', 1, 'p_ReadonlyMemberRest', 'idl_parser.py', 604), ('ReadWriteAttribute -> INHERIT ReadOnly AttributeRest', 'ReadWriteAttribute', 3, 'p_ReadWriteAttribute', 'idl_parser.py', 608), ('ReadWriteAttribute -> AttributeRest', 'ReadWriteAttribute', 1, 'p_ReadWriteAttribute', 'idl_parser.py', 609), ('AttributeRest -> ATTRIBUTE TypeWithExtendedAttributes AttributeName ;', 'AttributeRest', 4, 'p_AttributeRest', 'idl_parser.py', 618), ('AttributeName -> AttributeNameKeyword', 'AttributeName', 1, 'p_AttributeName', 'idl_parser.py', 622), ('AttributeName -> identifier', 'AttributeName', 1, 'p_AttributeName', 'idl_parser.py', 623), ('AttributeNameKeyword -> REQUIRED', 'AttributeNameKeyword', 1, 'p_AttributeNameKeyword', 'idl_parser.py', 627), ('ReadOnly -> READONLY', 'ReadOnly', 1, 'p_ReadOnly', 'idl_parser.py', 631), ('ReadOnly -> <empty>', 'ReadOnly', 0, 'p_ReadOnly', 'idl_parser.py', 632), ('Operation -> ReturnType OperationRest', 'Operation', 2, 'p_Operation', 'idl_parser.py', 637), ('Operation -> SpecialOperation', 'Operation', 1, 'p_Operation', 'idl_parser.py', 638), ('SpecialOperation -> Special Specials ReturnType OperationRest', 'SpecialOperation', 4, 'p_SpecialOperation', 'idl_parser.py', 646), ('Specials -> Special Specials', 'Specials', 2, 'p_Specials', 'idl_parser.py', 651), ('Specials -> <empty>', 'Specials', 0, 'p_Specials', 'idl_parser.py', 652), ('Special -> GETTER', 'Special', 1, 'p_Special', 'idl_parser.py', 657), ('Special -> SETTER', 'Special', 1, 'p_Special', 'idl_parser.py', 658), ('Special -> CREATOR', 'Special', 1, 'p_Special', 'idl_parser.py', 659), ('Special -> DELETER', 'Special', 1, 'p_Special', 'idl_parser.py', 660), ('Special -> LEGACYCALLER', 'Special', 1, 'p_Special', 'idl_parser.py', 661), ('OperationRest -> OptionalIdentifier ( ArgumentList ) ;', 'OperationRest', 5, 'p_OperationRest', 'idl_parser.py', 665), ('OptionalIdentifier -> identifier', 'OptionalIdentifier', 1, 'p_OptionalIdentifier', 'idl_parser.py', 670), ('OptionalIdentifier -> <empty>', 'OptionalIdentifier', 0, 'p_OptionalIdentifier', 'idl_parser.py', 671), ('ArgumentList -> Argument Arguments', 'ArgumentList', 2, 'p_ArgumentList', 'idl_parser.py', 678), ('ArgumentList -> <empty>', 'ArgumentList', 0, 'p_ArgumentList', 'idl_parser.py', 679), ('ArgumentList -> error', 'ArgumentList', 1, 'p_ArgumentListError', 'idl_parser.py', 685), ('Arguments -> , Argument Arguments', 'Arguments', 3, 'p_Arguments', 'idl_parser.py', 689), ('Arguments -> <empty>', 'Arguments', 0, 'p_Arguments', 'idl_parser.py', 690), ('Arguments -> , error', 'Arguments', 2, 'p_ArgumentsError', 'idl_parser.py', 696), ('Argument -> ExtendedAttributeList OPTIONAL TypeWithExtendedAttributes ArgumentName Default', 'Argument', 5, 'p_Argument', 'idl_parser.py', 700), ('Argument -> ExtendedAttributeList Type Ellipsis ArgumentName', 'Argument', 4, 'p_Argument', 'idl_parser.py', 701), ('ArgumentName -> ArgumentNameKeyword', 'ArgumentName', 1, 'p_ArgumentName', 'idl_parser.py', 720), ('ArgumentName -> identifier', 'ArgumentName', 1, 'p_ArgumentName', 'idl_parser.py', 721), ('Ellipsis -> ELLIPSIS', 'Ellipsis', 1, 'p_Ellipsis', 'idl_parser.py', 725), ('Ellipsis -> <empty>', 'Ellipsis', 0, 'p_Ellipsis', 'idl_parser.py', 726), ('Iterable -> ITERABLE < TypeWithExtendedAttributes OptionalType > ;', 'Iterable', 6, 'p_Iterable', 'idl_parser.py', 732), ('OptionalType -> , TypeWithExtendedAttributes', 'OptionalType', 2, 'p_OptionalType', 'idl_parser.py', 737), ('OptionalType -> <empty>', 'OptionalType', 0, 'p_OptionalType', 'idl_parser.py', 738), ('ReadWriteMaplike -> MaplikeRest', 'ReadWriteMaplike', 1, 'p_ReadWriteMaplike', 'idl_parser.py', 743), ('ReadWriteSetlike -> SetlikeRest', 'ReadWriteSetlike', 1, 'p_ReadWriteSetlike', 'idl_parser.py', 747), ('MaplikeRest -> MAPLIKE < TypeWithExtendedAttributes , TypeWithExtendedAttributes > ;', 'MaplikeRest', 7, 'p_MaplikeRest', 'idl_parser.py', 751), ('SetlikeRest -> SETLIKE < TypeWithExtendedAttributes > ;', 'SetlikeRest', 5, 'p_SetlikeRest', 'idl_parser.py', 756), ('Namespace -> NAMESPACE identifier { NamespaceMembers } ;', 'Namespace', 6, 'p_Namespace', 'idl_parser.py', 760), ('Namespace -> NAMESPACE identifier { error', 'Namespace', 4, 'p_NamespaceError', 'idl_parser.py', 765), ('NamespaceMembers -> NamespaceMember NamespaceMembers', 'NamespaceMembers', 2, 'p_NamespaceMembers', 'idl_parser.py', 769), ('NamespaceMembers -> <empty>', 'NamespaceMembers', 0, 'p_NamespaceMembers', 'idl_parser.py', 770), ('NamespaceMembers -> ExtendedAttributeList error', 'NamespaceMembers', 2, 'p_NamespaceMembersError', 'idl_parser.py', 776), ('NamespaceMember -> ExtendedAttributeList ReturnType OperationRest', 'NamespaceMember', 3, 'p_NamespaceMember', 'idl_parser.py', 780), ('NamespaceMember -> ExtendedAttributeList READONLY AttributeRest', 'NamespaceMember', 3, 'p_NamespaceMember', 'idl_parser.py', 781), ('ExtendedAttributeList -> [ ExtendedAttribute ExtendedAttributes ]', 'ExtendedAttributeList', 4, 'p_ExtendedAttributeList', 'idl_parser.py', 801), ('ExtendedAttributeList -> <empty>', 'ExtendedAttributeList', 0, 'p_ExtendedAttributeList', 'idl_parser.py', 802), ('ExtendedAttributeList -> [ ExtendedAttribute , error', 'ExtendedAttributeList', 4, 'p_ExtendedAttributeListError', 'idl_parser.py', 809), ('ExtendedAttributes -> , ExtendedAttribute ExtendedAttributes', 'ExtendedAttributes', 3, 'p_ExtendedAttributes', 'idl_parser.py', 813), ('ExtendedAttributes -> <empty>', 'ExtendedAttributes', 0, 'p_ExtendedAttributes', 'idl_parser.py', 814), ('ExtendedAttribute -> ExtendedAttributeNoArgs', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 830), ('ExtendedAttribute -> ExtendedAttributeArgList', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 831), ('ExtendedAttribute -> ExtendedAttributeIdent', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 832), ('ExtendedAttribute -> ExtendedAttributeIdentList', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 833), ('ExtendedAttribute -> ExtendedAttributeNamedArgList', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 834), ('ExtendedAttribute -> ExtendedAttributeStringLiteral', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 835), ('ExtendedAttribute -> ExtendedAttributeStringLiteralList', 'ExtendedAttribute', 1, 'p_ExtendedAttribute', 'idl_parser.py', 836), ('ArgumentNameKeyword -> ATTRIBUTE', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 840), ('ArgumentNameKeyword -> CALLBACK', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 841), ('ArgumentNameKeyword -> CONST', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 842), ('ArgumentNameKeyword -> CREATOR', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 843), ('ArgumentNameKeyword -> DELETER', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 844), ('ArgumentNameKeyword -> DICTIONARY', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 845), ('ArgumentNameKeyword -> ENUM', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 846), ('ArgumentNameKeyword -> GETTER', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 847), ('ArgumentNameKeyword -> IMPLEMENTS', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 848), ('ArgumentNameKeyword -> INHERIT', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 849), ('ArgumentNameKeyword -> LEGACYCALLER', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 850), ('ArgumentNameKeyword -> NAMESPACE', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 851), ('ArgumentNameKeyword -> PARTIAL', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 852), ('ArgumentNameKeyword -> SERIALIZER', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 853), ('ArgumentNameKeyword -> SETTER', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 854), ('ArgumentNameKeyword -> STATIC', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 855), ('ArgumentNameKeyword -> STRINGIFIER', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 856), ('ArgumentNameKeyword -> TYPEDEF', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 857), ('ArgumentNameKeyword -> UNRESTRICTED', 'ArgumentNameKeyword', 1, 'p_ArgumentNameKeyword', 'idl_parser.py', 858), ('Type -> SingleType', 'Type', 1, 'p_Type', 'idl_parser.py', 862), ('Type -> UnionType Null', 'Type', 2, 'p_Type', 'idl_parser.py', 863), ('TypeWithExtendedAttributes -> ExtendedAttributeList SingleType', 'TypeWithExtendedAttributes', 2, 'p_TypeWithExtendedAttributes', 'idl_parser.py', 870), ('TypeWithExtendedAttributes -> ExtendedAttributeList UnionType Null', 'TypeWithExtendedAttributes', 3, 'p_TypeWithExtendedAttributes', 'idl_parser.py', 871), ('SingleType -> NonAnyType', 'SingleType', 1, 'p_SingleType', 'idl_parser.py', 879), ('SingleType -> ANY', 'SingleType', 1, 'p_SingleType', 'idl_parser.py', 880), ('UnionType -> ( UnionMemberType OR UnionMemberType UnionMemberTypes )', 'UnionType', 6, 'p_UnionType', 'idl_parser.py', 887), ('UnionMemberType -> NonAnyType', 'UnionMemberType', 1, 'p_UnionMemberType', 'idl_parser.py', 892), ('UnionMemberType -> UnionType Null', 'UnionMemberType', 2, 'p_UnionMemberType', 'idl_parser.py', 893), ('UnionMemberTypes -> OR UnionMemberType UnionMemberTypes', 'UnionMemberTypes', 3, 'p_UnionMemberTypes', 'idl_parser.py', 900), ('UnionMemberTypes -> <empty>', 'UnionMemberTypes', 0, 'p_UnionMemberTypes', 'idl_parser.py', 901), ('NonAnyType -> PrimitiveType Null', 'NonAnyType', 2, 'p_NonAnyType', 'idl_parser.py', 910), ('NonAnyType -> PromiseType Null', 'NonAnyType', 2, 'p_NonAnyType', 'idl_parser.py', 911), ('NonAnyType -> identifier Null', 'NonAnyType', 2, 'p_NonAnyType', 'idl_parser.py', 912), ('NonAnyType -> SEQUENCE < TypeWithExtendedAttributes > Null', 'NonAnyType', 5, 'p_NonAnyType', 'idl_parser.py', 913), ('NonAnyType -> FROZENARRAY < TypeWithExtendedAttributes > Null', 'NonAnyType', 5, 'p_NonAnyType', 'idl_parser.py', 914), ('NonAnyType -> RecordType Null', 'NonAnyType', 2, 'p_NonAnyType', 'idl_parser.py', 915), ('ConstType -> PrimitiveType Null', 'ConstType', 2, 'p_ConstType', 'idl_parser.py', 928), ('ConstType -> identifier Null', 'ConstType', 2, 'p_ConstType', 'idl_parser.py', 929), ('PrimitiveType -> UnsignedIntegerType', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 939), ('PrimitiveType -> UnrestrictedFloatType', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 940), ('PrimitiveType -> StringType', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 941), ('PrimitiveType -> BOOLEAN', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 942), ('PrimitiveType -> BYTE', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 943), ('PrimitiveType -> OCTET', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 944), ('PrimitiveType -> OBJECT', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 945), ('PrimitiveType -> DATE', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 946), ('PrimitiveType -> REGEXP', 'PrimitiveType', 1, 'p_PrimitiveType', 'idl_parser.py', 947), ('UnrestrictedFloatType -> UNRESTRICTED FloatType', 'UnrestrictedFloatType', 2, 'p_UnrestrictedFloatType', 'idl_parser.py', 954), ('UnrestrictedFloatType -> FloatType', 'UnrestrictedFloatType', 1, 'p_UnrestrictedFloatType', 'idl_parser.py', 955), ('FloatType -> FLOAT', 'FloatType', 1, 'p_FloatType', 'idl_parser.py', 964), ('FloatType -> DOUBLE', 'FloatType', 1, 'p_FloatType', 'idl_parser.py', 965), ('UnsignedIntegerType -> UNSIGNED IntegerType', 'UnsignedIntegerType', 2, 'p_UnsignedIntegerType', 'idl_parser.py', 969), ('UnsignedIntegerType -> IntegerType', 'UnsignedIntegerType', 1, 'p_UnsignedIntegerType', 'idl_parser.py', 970), ('IntegerType -> SHORT', 'IntegerType', 1, 'p_IntegerType', 'idl_parser.py', 977), ('IntegerType -> LONG OptionalLong', 'IntegerType', 2, 'p_IntegerType', 'idl_parser.py', 978), ('OptionalLong -> LONG', 'OptionalLong', 1, 'p_OptionalLong', 'idl_parser.py', 985), ('OptionalLong -> <empty>', 'OptionalLong', 0, 'p_OptionalLong', 'idl_parser.py', 986), ('PromiseType -> PROMISE < ReturnType >', 'PromiseType', 4, 'p_PromiseType', 'idl_parser.py', 994), ('PromiseType -> PROMISE', 'PromiseType', 1, 'p_PromiseType', 'idl_parser.py', 995), ('Null -> ?', 'Null', 1, 'p_Null', 'idl_parser.py', 1007), ('Null -> <empty>', 'Null', 0, 'p_Null', 'idl_parser.py', 1008), ('ReturnType -> Type', 'ReturnType', 1, 'p_ReturnType', 'idl_parser.py', 1013), ('ReturnType -> VOID', 'ReturnType', 1, 'p_ReturnType', 'idl_parser.py', 1014), ('IdentifierList -> identifier Identifiers', 'IdentifierList', 2, 'p_IdentifierList', 'idl_parser.py', 1022), ('Identifiers -> , identifier Identifiers', 'Identifiers', 3, 'p_Identifiers', 'idl_parser.py', 1026), ('Identifiers -> <empty>', 'Identifiers', 0, 'p_Identifiers', 'idl_parser.py', 1027), ('ExtendedAttributeNoArgs -> identifier', 'ExtendedAttributeNoArgs', 1, 'p_ExtendedAttributeNoArgs', 'idl_parser.py', 1032), ('ExtendedAttributeArgList -> identifier ( ArgumentList )', 'ExtendedAttributeArgList', 4, 'p_ExtendedAttributeArgList', 'idl_parser.py', 1036), ('ExtendedAttributeIdent -> identifier = identifier', 'ExtendedAttributeIdent', 3, 'p_ExtendedAttributeIdent', 'idl_parser.py', 1041), ('ExtendedAttributeIdentList -> identifier = ( IdentifierList )', 'ExtendedAttributeIdentList', 5, 'p_ExtendedAttributeIdentList', 'idl_parser.py', 1046), ('ExtendedAttributeNamedArgList -> identifier = identifier ( ArgumentList )', 'ExtendedAttributeNamedArgList', 6, 'p_ExtendedAttributeNamedArgList', 'idl_parser.py', 1051), ('ExtendedAttributeStringLiteral -> identifier = StringLiteral', 'ExtendedAttributeStringLiteral', 3, 'p_ExtendedAttributeStringLiteral', 'idl_parser.py', 1058), ('ExtendedAttributeStringLiteralList -> identifier = ( StringLiteralList )', 'ExtendedAttributeStringLiteralList', 5, 'p_ExtendedAttributeStringLiteralList', 'idl_parser.py', 1069), ('StringLiteralList -> StringLiteral , StringLiteralList', 'StringLiteralList', 3, 'p_StringLiteralList', 'idl_parser.py', 1076), ('StringLiteralList -> StringLiteral', 'StringLiteralList', 1, 'p_StringLiteralList', 'idl_parser.py', 1077), ('StringLiteral -> string', 'StringLiteral', 1, 'p_StringLiteral', 'idl_parser.py', 1089), ('StringType -> BYTESTRING', 'StringType', 1, 'p_StringType', 'idl_parser.py', 1094), ('StringType -> DOMSTRING', 'StringType', 1, 'p_StringType', 'idl_parser.py', 1095), ('StringType -> USVSTRING', 'StringType', 1, 'p_StringType', 'idl_parser.py', 1096), ('RecordType -> RECORD < StringType , TypeWithExtendedAttributes >', 'RecordType', 6, 'p_RecordType', 'idl_parser.py', 1100), ('RecordType -> RECORD < error , Type >', 'RecordType', 6, 'p_RecordTypeError', 'idl_parser.py', 1105), ('SpecialComments -> SPECIAL_COMMENT SpecialComments', 'SpecialComments', 2, 'p_SpecialComments', 'idl_parser.py', 1111), ('SpecialComments -> <empty>', 'SpecialComments', 0, 'p_SpecialComments', 'idl_parser.py', 1112)],
+    '_lr_signature': "ANY ATTRIBUTE BOOLEAN BYTE BYTESTRING CALLBACK CONST CREATOR DATE DELETER DICTIONARY DOMSTRING DOUBLE ELLIPSIS ENUM FALSE FLOAT FROZENARRAY GETTER IMPLEMENTS INFINITY INHERIT INTERFACE ITERABLE LEGACYCALLER LONG MAPLIKE NAMESPACE NAN NULL OBJECT OCTET OPTIONAL OR PARTIAL PROMISE READONLY RECORD REGEXP REQUIRED SEQUENCE SERIALIZER SETLIKE SETTER SHORT SPECIAL_COMMENT STATIC STRINGIFIER TRUE TYPEDEF UNRESTRICTED UNSIGNED USVSTRING VOID float identifier integer stringDefinitions : SpecialComments ExtendedAttributeList Definition Definitions\n                   | ExtendedAttributeList Definition Definitions\n                   | Definition : CallbackOrInterface\n                  | Namespace\n                  | Partial\n                  | Dictionary\n                  | Enum\n                  | Typedef\n                  | ImplementsStatementDefinition : error ';'CallbackOrInterface : CALLBACK CallbackRestOrInterface\n                           | InterfaceCallbackRestOrInterface : CallbackRest\n                               | InterfaceInterface : INTERFACE identifier Inheritance '{' InterfaceMembers '}' ';'Interface : INTERFACE identifier Inheritance '{' errorPartial : PARTIAL PartialDefinitionPartial : PARTIAL errorPartialDefinition : PartialDictionary\n                         | PartialInterface\n                         | NamespacePartialInterface : INTERFACE identifier '{' InterfaceMembers '}' ';'InterfaceMembers : ExtendedAttributeList InterfaceMember InterfaceMembers\n                        |InterfaceMembers : errorInterfaceMember : Const\n                       | Operation\n                       | Serializer\n                       | Stringifier\n                       | StaticMember\n                       | Iterable\n                       | ReadonlyMember\n                       | ReadWriteAttribute\n                       | ReadWriteMaplike\n                       | ReadWriteSetlikeDictionary : DICTIONARY identifier Inheritance '{' DictionaryMembers '}' ';'Dictionary : DICTIONARY error ';'Dictionary : DICTIONARY identifier Inheritance '{' errorDictionaryMembers : DictionaryMember DictionaryMembers\n                         |DictionaryMembers : ExtendedAttributeList errorDictionaryMember : ExtendedAttributeList REQUIRED TypeWithExtendedAttributes identifier Default ';'\n                        | ExtendedAttributeList Type identifier Default ';'PartialDictionary : DICTIONARY identifier '{' DictionaryMembers '}' ';'PartialDictionary : DICTIONARY error ';'Default : '=' DefaultValue\n               |DefaultValue : ConstValue\n                    | string\n                    | '[' ']'Inheritance : ':' identifier\n                   |Enum : ENUM identifier '{' EnumValueList '}' ';'Enum : ENUM error ';'EnumValueList : ExtendedAttributeList string EnumValueListCommaEnumValueListComma : ',' EnumValueListString\n                          |EnumValueListString : ExtendedAttributeList string EnumValueListComma\n                           |CallbackRest : identifier '=' ReturnType '(' ArgumentList ')' ';'Typedef : TYPEDEF TypeWithExtendedAttributes identifier ';'Typedef : TYPEDEF error ';'ImplementsStatement : identifier IMPLEMENTS identifier ';'Const : CONST ConstType identifier '=' ConstValue ';'ConstValue : BooleanLiteral\n                  | FloatLiteral\n                  | integer\n                  | nullnull : NULLBooleanLiteral : TRUE\n                      | FALSEFloatLiteral : float\n                    | '-' INFINITY\n                    | INFINITY\n                    | NAN Serializer : SERIALIZER SerializerRestSerializerRest : ReturnType OperationRest\n                      | '=' SerializationPattern ';'\n                      | ';'SerializationPattern : '{' SerializationPatternMap '}'\n                            | '[' SerializationPatternList ']'\n                            | identifierSerializationPatternMap : GETTER\n                               | ATTRIBUTE\n                               | INHERIT ',' ATTRIBUTE\n                               | INHERIT Identifiers\n                               | identifier Identifiers\n                               |SerializationPatternList : GETTER\n                                | identifier Identifiers\n                                |Stringifier : STRINGIFIER StringifierRestStringifierRest : ReadOnly AttributeRest\n                       | ReturnType OperationRest\n                       | ';'StaticMember : STATIC StaticMemberRestStaticMemberRest : ReadOnly AttributeRest\n                        | ReturnType OperationRestReadonlyMember : READONLY ReadonlyMemberRestReadonlyMemberRest : AttributeRest\n                          | MaplikeRest\n                          | SetlikeRestReadWriteAttribute : INHERIT ReadOnly AttributeRest\n                          | AttributeRestAttributeRest : ATTRIBUTE TypeWithExtendedAttributes AttributeName ';'AttributeName : AttributeNameKeyword\n                     | identifierAttributeNameKeyword : REQUIREDReadOnly : READONLY\n                |Operation : ReturnType OperationRest\n                 | SpecialOperationSpecialOperation : Special Specials ReturnType OperationRestSpecials : Special Specials\n                | Special : GETTER\n               | SETTER\n               | CREATOR\n               | DELETER\n               | LEGACYCALLEROperationRest : OptionalIdentifier '(' ArgumentList ')' ';'OptionalIdentifier : identifier\n                          |ArgumentList : Argument Arguments\n                    |ArgumentList : error Arguments : ',' Argument Arguments\n                 |Arguments : ',' errorArgument : ExtendedAttributeList OPTIONAL TypeWithExtendedAttributes ArgumentName Default\n                | ExtendedAttributeList Type Ellipsis ArgumentNameArgumentName : ArgumentNameKeyword\n                    | identifierEllipsis : ELLIPSIS\n                |Iterable : ITERABLE '<' TypeWithExtendedAttributes OptionalType '>' ';'OptionalType : ',' TypeWithExtendedAttributes\n                    |ReadWriteMaplike : MaplikeRestReadWriteSetlike : SetlikeRestMaplikeRest : MAPLIKE '<' TypeWithExtendedAttributes ',' TypeWithExtendedAttributes '>' ';'SetlikeRest : SETLIKE '<' TypeWithExtendedAttributes '>' ';'Namespace : NAMESPACE identifier '{' NamespaceMembers '}' ';'Namespace : NAMESPACE identifier '{' errorNamespaceMembers : NamespaceMember NamespaceMembers\n                        | NamespaceMembers : ExtendedAttributeList errorNamespaceMember : ExtendedAttributeList ReturnType OperationRest\n                       | ExtendedAttributeList READONLY AttributeRestExtendedAttributeList : '[' ExtendedAttribute ExtendedAttributes ']'\n                             | ExtendedAttributeList : '[' ExtendedAttribute ',' errorExtendedAttributes : ',' ExtendedAttribute ExtendedAttributes\n                          |ExtendedAttribute : ExtendedAttributeNoArgs\n                         | ExtendedAttributeArgList\n                         | ExtendedAttributeIdent\n                         | ExtendedAttributeIdentList\n                         | ExtendedAttributeNamedArgList\n                         | ExtendedAttributeStringLiteral\n                         | ExtendedAttributeStringLiteralListArgumentNameKeyword : ATTRIBUTE\n                           | CALLBACK\n                           | CONST\n                           | CREATOR\n                           | DELETER\n                           | DICTIONARY\n                           | ENUM\n                           | GETTER\n                           | IMPLEMENTS\n                           | INHERIT\n                           | LEGACYCALLER\n                           | NAMESPACE\n                           | PARTIAL\n                           | SERIALIZER\n                           | SETTER\n                           | STATIC\n                           | STRINGIFIER\n                           | TYPEDEF\n                           | UNRESTRICTEDType : SingleType\n            | UnionType Null TypeWithExtendedAttributes : ExtendedAttributeList SingleType\n                                   | ExtendedAttributeList UnionType NullSingleType : NonAnyType\n                  | ANYUnionType : '(' UnionMemberType OR UnionMemberType UnionMemberTypes ')'UnionMemberType : NonAnyType\n                       | UnionType NullUnionMemberTypes : OR UnionMemberType UnionMemberTypes\n                        |NonAnyType : PrimitiveType Null\n                  | PromiseType Null\n                  | identifier Null\n                  | SEQUENCE '<' TypeWithExtendedAttributes '>' Null\n                  | FROZENARRAY '<' TypeWithExtendedAttributes '>' Null\n                  | RecordType NullConstType : PrimitiveType Null\n                 | identifier NullPrimitiveType : UnsignedIntegerType\n                     | UnrestrictedFloatType\n                     | StringType\n                     | BOOLEAN\n                     | BYTE\n                     | OCTET\n                     | OBJECT\n                     | DATE\n                     | REGEXPUnrestrictedFloatType : UNRESTRICTED FloatType\n                             | FloatTypeFloatType : FLOAT\n                 | DOUBLEUnsignedIntegerType : UNSIGNED IntegerType\n                           | IntegerTypeIntegerType : SHORT\n                   | LONG OptionalLongOptionalLong : LONG\n                    | PromiseType : PROMISE '<' ReturnType '>'\n                   | PROMISENull : '?'\n            |ReturnType : Type\n                  | VOIDIdentifierList : identifier IdentifiersIdentifiers : ',' identifier Identifiers\n                   |ExtendedAttributeNoArgs : identifierExtendedAttributeArgList : identifier '(' ArgumentList ')'ExtendedAttributeIdent : identifier '=' identifierExtendedAttributeIdentList : identifier '=' '(' IdentifierList ')'ExtendedAttributeNamedArgList : identifier '=' identifier '(' ArgumentList ')'ExtendedAttributeStringLiteral : identifier '=' StringLiteralExtendedAttributeStringLiteralList : identifier '=' '(' StringLiteralList ')'StringLiteralList : StringLiteral ',' StringLiteralList\n                         | StringLiteralStringLiteral : stringStringType : BYTESTRING\n                  | DOMSTRING\n                  | USVSTRINGRecordType : RECORD '<' StringType ',' TypeWithExtendedAttributes '>'RecordType : RECORD '<' error ',' Type '>'SpecialComments : SPECIAL_COMMENT SpecialComments\n                       | ",
+    '_tabversion': '3.10',
+    '_v': ([356], [396]),
+    '_x': 356,
+    '_y': 396,
+}
@@ -6,9 +6,17 @@
 
 """Unit tests for blink_idl_parser.py."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
+import blink_idl_parser_tables
+from blink_idl_lexer import BlinkIDLLexer
+from blink_idl_lexer import lexer_signature
 from blink_idl_parser import BlinkIDLParser
+from blink_idl_parser import parse_file
+from blink_idl_parser import parser_signature
 
 
 class BlinkIDLParserTest(unittest.TestCase):
@@ -19,3 +27,32 @@ class BlinkIDLParserTest(unittest.TestCase):
         parser = BlinkIDLParser()
         parser.ParseText(filename='', data=text)
         self.assertGreater(parser.GetErrors(), 0)
+
+    def test_parse_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(temp_dir, 'Foo.idl')
+            with open(filename, 'wb') as idl_file:
+                idl_file.write(b'enum E {\r\n  "a"\r\n};\r\ninterface Foo {};\r\n')
+            ast = parse_file(BlinkIDLParser(), filename)
+            interface = ast.GetOneOf('Interface')
+            # Newlines are translated, as when reading in text mode.
+            self.assertEqual(interface.GetProperty('LINENO'), 4)
+            self.assertEqual(interface.GetProperty('POSITION'), 28)
+            self.assertEqual(ast.GetProperty('ERRORS'), 0)
+
+            empty_filename = os.path.join(temp_dir, 'Empty.idl')
+            open(empty_filename, 'w').close()
+            self.assertEqual(
+                parse_file(BlinkIDLParser(), empty_filename).GetChildren(), [])
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_tables_are_up_to_date(self):
+        # Otherwise run blink_idl_parser.py to regenerate the tables.
+        parser = BlinkIDLParser(lexer=BlinkIDLLexer(optimize=False, engine='ply'),
+                                optimize=False)
+        self.assertEqual(blink_idl_parser_tables.LEXER_SIGNATURE,
+                         lexer_signature(parser.lexer))
+        self.assertEqual(blink_idl_parser_tables.PARSE_TABLES['_lr_signature'],
+                         parser_signature(parser))
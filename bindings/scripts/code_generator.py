@@ -6,30 +6,34 @@
 
 """Plumbing for a Jinja-based code generator, including CodeGeneratorBase, a base class for all generators."""
 
+import functools
+import io
 import os
 import posixpath
 import re
 import sys
 
-from idl_types import set_ancestors, IdlType
+from idl_types import TypeRegistry
+from idl_types import current_type_registry
+from idl_types import use_type_registry
+from trace_events import trace_event
+from trace_events import tracing_enabled
 from v8_globals import includes
 from v8_interface import constant_filters
-from v8_types import set_component_dirs
 from v8_methods import method_filters
 import v8_utilities
 from v8_utilities import capitalize
 from utilities import (idl_filename_to_component, is_valid_component_dependency,
                        format_remove_duplicates, format_blink_cpp_source_code,
-                       to_snake_case)
+                       format_blink_cpp_source_code_chunks, to_snake_case,
+                       write_file_atomically)
 
 # Path handling for libraries and templates
 # Paths have to be normalized because Jinja uses the exact template path to
-# determine the hash used in the cache filename, and we need a pre-caching step
-# to be concurrency-safe. Use absolute path because __file__ is absolute if
-# module is imported, and relative if executed directly.
-# If paths differ between pre-caching and individual file compilation, the cache
-# is regenerated, which causes a race condition and breaks concurrent build,
-# since some compile processes will try to read the partially written cache.
+# determine the hash used in the cache filename.  Use absolute path because
+# __file__ is absolute if module is imported, and relative if executed
+# directly.  Differing paths are not a correctness problem, as the bytecode
+# cache is concurrency-safe, but they would cache each template twice.
 MODULE_PATH, _ = os.path.split(os.path.realpath(__file__))
 THIRD_PARTY_DIR = os.path.normpath(os.path.join(
     MODULE_PATH, os.pardir, os.pardir, os.pardir, os.pardir))
@@ -75,12 +79,45 @@ def runtime_enabled_if(code, name):
     function = v8_utilities.runtime_enabled_function(name)
     return generate_indented_conditional(code, function)
 
+class AtomicFileSystemBytecodeCache(jinja2.BytecodeCache):
+    """A Jinja bytecode cache that many processes can populate concurrently.
+
+    jinja2.FileSystemBytecodeCache writes cache files in place, so a process
+    can read a partially written file, and files are keyed by template name
+    only, so a reader may see bytecode of another version of the template.
+    Here cache files are keyed by the template name *and* a checksum of its
+    source, and are written to a temporary file which is then renamed, so a
+    reader either finds a complete, matching file or none at all.  No
+    pre-caching step is needed.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _cache_filename(self, bucket):
+        return os.path.join(self.directory, '__jinja2_%s_%s.cache' %
+                            (bucket.key, bucket.checksum))
+
+    def load_bytecode(self, bucket):
+        try:
+            cache_file = open(self._cache_filename(bucket), 'rb')
+        except (IOError, OSError):
+            return
+        with cache_file:
+            # Resets the bucket if the bytecode is for another Jinja version.
+            bucket.load_bytecode(cache_file)
+
+    def dump_bytecode(self, bucket):
+        data = io.BytesIO()
+        bucket.write_bytecode(data)
+        write_file_atomically(data.getvalue(), self._cache_filename(bucket),
+                              'wb')
+
+
 def initialize_jinja_env(cache_dir):
     jinja_env = jinja2.Environment(
         loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
-        # Bytecode cache is not concurrency-safe unless pre-cached:
-        # if pre-cached this is read-only, but writing creates a race condition.
-        bytecode_cache=jinja2.FileSystemBytecodeCache(cache_dir),
+        bytecode_cache=(AtomicFileSystemBytecodeCache(cache_dir)
+                        if cache_dir else None),
         keep_trailing_newline=True,  # newline-terminate generated files
         lstrip_blocks=True,  # so can indent control flow tags
         trim_blocks=True)
@@ -113,15 +150,94 @@ def normalize_and_sort_includes(include_paths, snake_case):
     return sorted(normalized_include_paths)
 
 
-def render_template(template, context):
+def jinja_template_filename(template):
     filename = str(template.filename)
-    filename = filename[filename.rfind('third_party'):]
-    context['jinja_template_filename'] = filename
-    return template.render(context)
+    return filename[filename.rfind('third_party'):]
+
+
+def render_template(template, context):
+    context['jinja_template_filename'] = jinja_template_filename(template)
+    with trace_event('render_template',
+                     template=context['jinja_template_filename']):
+        return template.render(context)
+
+
+class TemplateOutput(object):
+    """The output of a template, rendered chunk by chunk with
+    Template.generate() when iterated, or as a whole by str().
+
+    utilities.write_file() writes the chunks as they are rendered, so the
+    output is never built as a single str.  The context is copied, and the
+    template is rendered with the type registry which was current on
+    creation, so that it can be rendered after generate_code() returns.
+
+    |formatter|, e.g. format_blink_cpp_source_code_chunks, formats the
+    chunks as they are rendered, so that formatting does not need the
+    rendered str either.  It leaves formatted code unchanged, so templates
+    may keep a format_blink_cpp_source_code filter block.
+    """
+    def __init__(self, template, context, formatter=None):
+        self.template = template
+        self.context = dict(context)
+        self.context['jinja_template_filename'] = jinja_template_filename(template)
+        self.type_registry = current_type_registry()
+        self.formatter = formatter
+
+    def __iter__(self):
+        with use_type_registry(self.type_registry):
+            chunks = self.template.generate(self.context)
+            if tracing_enabled():
+                # Render and format up front, so that the trace tells them
+                # apart from writing the output.
+                with trace_event('render_template',
+                                 template=self.context['jinja_template_filename']):
+                    chunks = list(chunks)
+                if self.formatter:
+                    with trace_event(self.formatter.__name__):
+                        chunks = list(self.formatter(chunks))
+            elif self.formatter:
+                chunks = self.formatter(chunks)
+            for chunk in chunks:
+                yield chunk
+
+    def __str__(self):
+        return ''.join(self)
+
+
+def create_type_registry(info_provider):
+    """Returns a TypeRegistry with the type information of |info_provider|."""
+    interfaces_info = info_provider.interfaces_info
+    registry = TypeRegistry()
+    registry.ancestors.update(interfaces_info['ancestors'])
+    registry.callback_interfaces.update(interfaces_info['callback_interfaces'])
+    registry.dictionaries.update(interfaces_info['dictionaries'])
+    registry.enums.update(info_provider.enumerations)
+    registry.callback_functions.update(info_provider.callback_functions)
+    registry.implemented_as_interfaces.update(
+        interfaces_info['implemented_as_interfaces'])
+    registry.garbage_collected_types.update(
+        interfaces_info['garbage_collected_interfaces'])
+    registry.component_dirs.update(interfaces_info['component_dirs'])
+    return registry
+
+
+def uses_type_registry(generate):
+    """Decorates methods of code generators to run with the type registry of
+    the generator."""
+    @functools.wraps(generate)
+    def generate_with_type_registry(self, *args, **kwargs):
+        with use_type_registry(self.type_registry):
+            return generate(self, *args, **kwargs)
+    return generate_with_type_registry
 
 
 class CodeGeneratorBase(object):
     """Base class for jinja-powered jinja template generation.
+
+    Generators keep the type information of their info provider in their own
+    TypeRegistry, which their generate_code() methods run with (see
+    uses_type_registry()), so that generators for different info providers
+    can run in one process, and concurrently in threads.
     """
     def __init__(self, generator_name, info_provider, cache_dir, output_dir, snake_case):
         self.generator_name = generator_name
@@ -129,22 +245,11 @@ class CodeGeneratorBase(object):
         self.jinja_env = initialize_jinja_env(cache_dir)
         self.output_dir = output_dir
         self.snake_case_generated_files = snake_case
-        self.set_global_type_info()
+        self.type_registry = create_type_registry(info_provider)
 
     def should_generate_code(self, definitions):
         return definitions.interfaces or definitions.dictionaries
 
-    def set_global_type_info(self):
-        interfaces_info = self.info_provider.interfaces_info
-        set_ancestors(interfaces_info['ancestors'])
-        IdlType.set_callback_interfaces(interfaces_info['callback_interfaces'])
-        IdlType.set_dictionaries(interfaces_info['dictionaries'])
-        IdlType.set_enums(self.info_provider.enumerations)
-        IdlType.set_callback_functions(self.info_provider.callback_functions)
-        IdlType.set_implemented_as_interfaces(interfaces_info['implemented_as_interfaces'])
-        IdlType.set_garbage_collected_types(interfaces_info['garbage_collected_interfaces'])
-        set_component_dirs(interfaces_info['component_dirs'])
-
     def render_template(self, include_paths, header_template, cpp_template,
                         template_context, component=None):
         template_context['code_generator'] = self.generator_name
@@ -161,9 +266,12 @@ class CodeGeneratorBase(object):
 
         template_context['cpp_includes'] = normalize_and_sort_includes(includes, self.snake_case_generated_files)
 
-        header_text = render_template(header_template, template_context)
-        cpp_text = render_template(cpp_template, template_context)
-        return header_text, cpp_text
+        # The outputs of interfaces are large; they are rendered and
+        # formatted while being written.
+        return (TemplateOutput(header_template, template_context,
+                               format_blink_cpp_source_code_chunks),
+                TemplateOutput(cpp_template, template_context,
+                               format_blink_cpp_source_code_chunks))
 
     def generate_code(self, definitions, definition_name):
         """Invokes code generation. The [definitions] argument is a list of definitions,
@@ -172,30 +280,3 @@ class CodeGeneratorBase(object):
         # This should be implemented in subclasses.
         raise NotImplementedError()
 
-
-def main(argv):
-    # If file itself executed, cache templates
-    try:
-        cache_dir = argv[1]
-        dummy_filename = argv[2]
-    except IndexError:
-        print('Usage: %s CACHE_DIR DUMMY_FILENAME' % argv[0])
-        return 1
-
-    # Cache templates
-    jinja_env = initialize_jinja_env(cache_dir)
-    template_filenames = [filename for filename in os.listdir(TEMPLATES_DIR)
-                          # Skip .svn, directories, etc.
-                          if filename.endswith(('.tmpl', '.txt'))]
-    for template_filename in template_filenames:
-        jinja_env.get_template(template_filename)
-
-    # Create a dummy file as output for the build system,
-    # since filenames of individual cache files are unpredictable and opaque
-    # (they are hashes of the template path, which varies based on environment)
-    with open(dummy_filename, 'w') as dummy_file:
-        pass  # |open| creates or touches the file
-
-
-if __name__ == '__main__':
-    sys.exit(main(sys.argv))
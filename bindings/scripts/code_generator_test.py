@@ -0,0 +1,96 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for code_generator.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from code_generator import TemplateOutput
+from code_generator import initialize_jinja_env
+from idl_types import TypeRegistry
+from idl_types import current_type_registry
+from idl_types import use_type_registry
+from utilities import format_blink_cpp_source_code_chunks
+
+TEMPLATE_FILENAME = 'copyright_block.txt'
+
+
+class AtomicFileSystemBytecodeCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_populated_lazily_and_reused(self):
+        jinja_env = initialize_jinja_env(self.cache_dir)
+        expected = jinja_env.get_template(TEMPLATE_FILENAME).render()
+        cache_files = os.listdir(self.cache_dir)
+        self.assertEqual(len(cache_files), 1)
+        # No temporary files are left behind.
+        self.assertTrue(cache_files[0].endswith('.cache'))
+
+        # A fresh environment (as in another compiler process) loads the
+        # cached bytecode.
+        jinja_env = initialize_jinja_env(self.cache_dir)
+        self.assertEqual(jinja_env.get_template(TEMPLATE_FILENAME).render(),
+                         expected)
+        self.assertEqual(os.listdir(self.cache_dir), cache_files)
+
+    def test_corrupt_cache_file_is_ignored(self):
+        initialize_jinja_env(self.cache_dir).get_template(TEMPLATE_FILENAME)
+        cache_filename = os.path.join(self.cache_dir,
+                                      os.listdir(self.cache_dir)[0])
+        with open(cache_filename, 'wb') as cache_file:
+            cache_file.write(b'partial')
+        template = initialize_jinja_env(self.cache_dir).get_template(
+            TEMPLATE_FILENAME)
+        self.assertTrue(template.render())
+
+
+class TemplateOutputTest(unittest.TestCase):
+
+    def test_renders_when_iterated(self):
+        template = initialize_jinja_env(None).from_string(
+            '{% for name in names %}{{name}} {% endfor %}{{registry() == expected}}')
+        registry = TypeRegistry()
+        context = {'names': ['a', 'b'], 'registry': current_type_registry,
+                   'expected': registry}
+        with use_type_registry(registry):
+            output = TemplateOutput(template, context)
+        # The context is copied.
+        context['names'].append('c')
+        context['names'] = []
+        self.assertEqual(''.join(output), 'a b c True')
+        self.assertEqual(str(output), 'a b c True')
+        self.assertIsNot(current_type_registry(), registry)
+
+    def test_formats_chunks(self):
+        template = initialize_jinja_env(None).from_string(
+            '\n{% for name in names %}\nvoid {{name}}() {\n\n}\n\n\n{% endfor %}')
+        output = TemplateOutput(template, {'names': ['a', 'b']},
+                                format_blink_cpp_source_code_chunks)
+        self.assertEqual(str(output), 'void a() {\n}\n\nvoid b() {\n}\n')
+
+    def test_formats_formatted_chunks_unchanged(self):
+        # Templates may still format their output with a filter block.
+        template = initialize_jinja_env(None).from_string(
+            '{% filter format_blink_cpp_source_code %}\n'
+            '{% for name in names %}\nvoid {{name}}() {\n\n}\n\n\n{% endfor %}'
+            '{% endfilter %}')
+        context = {'names': ['a', 'b']}
+        output = TemplateOutput(template, context,
+                                format_blink_cpp_source_code_chunks)
+        self.assertEqual(str(output), str(TemplateOutput(template, context)))
+        self.assertEqual(str(output), 'void a() {\n}\n\nvoid b() {\n}\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
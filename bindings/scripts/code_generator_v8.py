@@ -30,14 +30,9 @@
 
 """Generate Blink V8 bindings (.h and .cpp files).
 
-If run itself, caches Jinja templates (and creates dummy file for build,
-since cache filenames are unpredictable and opaque).
-
-This module is *not* concurrency-safe without care: bytecode caching creates
-a race condition on cache *write* (crashes if one process tries to read a
-partially-written cache). However, if you pre-cache the templates (by running
-the module itself), then you can parallelize compiling individual files, since
-cache *reading* is safe.
+Compiling individual files can be parallelized: the Jinja bytecode cache
+(AtomicFileSystemBytecodeCache in code_generator.py) is concurrency-safe, and
+is populated lazily without a pre-caching step.
 
 Input: An object of class IdlDefinitions, containing an IDL interface X
 Output: V8X.h and V8X.cpp
@@ -48,9 +43,10 @@ Design doc: http://www.chromium.org/developers/design-documents/idl-compiler
 import os
 import posixpath
 
-from code_generator import CodeGeneratorBase, render_template, normalize_and_sort_includes
+from code_generator import CodeGeneratorBase, render_template, normalize_and_sort_includes, uses_type_registry
 from idl_definitions import Visitor
 from idl_types import IdlType
+from trace_events import trace_event
 import v8_callback_function
 import v8_callback_interface
 import v8_dictionary
@@ -138,6 +134,7 @@ class CodeGeneratorV8Base(CodeGeneratorBase):
         CodeGeneratorBase.__init__(self, MODULE_PYNAME, info_provider, cache_dir, output_dir, snake_case)
         self.typedef_resolver = TypedefResolver(info_provider)
 
+    @uses_type_registry
     def generate_code(self, definitions, definition_name):
         """Returns .h/.cpp code as ((path, content)...)."""
         # Set local type info
@@ -145,7 +142,8 @@ class CodeGeneratorV8Base(CodeGeneratorBase):
             return set()
 
         # Resolve typedefs
-        self.typedef_resolver.resolve(definitions, definition_name)
+        with trace_event('resolve_typedefs'):
+            self.typedef_resolver.resolve(definitions, definition_name)
         return self.generate_code_internal(definitions, definition_name)
 
     def generate_code_internal(self, definitions, definition_name):
@@ -357,6 +355,7 @@ class CodeGeneratorUnionType(CodeGeneratorBase):
                 container_cpp_types.add(cpp_type)
         return union_types_for_containers
 
+    @uses_type_registry
     def generate_code(self):
         union_types = self._get_union_types_for_containers()
         if not union_types:
@@ -399,6 +398,7 @@ class CodeGeneratorCallbackFunction(CodeGeneratorBase):
         )
 
     # pylint: disable=W0221
+    @uses_type_registry
     def generate_code(self):
         callback_functions = self.info_provider.callback_functions
         if not callback_functions:
@@ -23,7 +23,7 @@ import os
 import posixpath
 import sys
 
-from code_generator import CodeGeneratorBase, render_template
+from code_generator import CodeGeneratorBase, render_template, uses_type_registry
 # TODO(dglazkov): Move TypedefResolver to code_generator.py
 from code_generator_v8 import TypedefResolver
 
@@ -35,6 +35,8 @@ MODULE_PYNAME = os.path.splitext(os.path.basename(__file__))[0] + '.py'
 
 STRING_INCLUDE_PATH = 'platform/wtf/text/WTFString.h'
 WEB_AGENT_API_IDL_ATTRIBUTE = 'WebAgentAPI'
+# The maximum number of C++ methods generated for an operation.
+MAX_OVERLOADS = 64
 
 
 def interface_context(idl_interface, type_resolver):
@@ -91,24 +93,30 @@ class MethodOverloadSplitter(object):
     """Because of union and optional types being used as arguments, some
        operations may result in more than one generated method. This class
        contains the logic for spliting an operation into multiple C++ overloads.
+
+       The argument lists are produced lazily, one at a time, and argument
+       lists which would generate the same C++ method are produced once.  An
+       operation which splits into more than |max_overloads| argument lists
+       is reported with a ValueError, rather than generating an unusable
+       class.
     """
 
-    def __init__(self, idl_operation):
+    def __init__(self, idl_operation, max_overloads=MAX_OVERLOADS):
         self.idl_operation = idl_operation
+        self.max_overloads = max_overloads
 
     def _update_argument_lists(self, argument_lists, idl_types):
-        """Given a list of IdlTypes and an existing list of argument lists (yes,
-           this is a list of lists), produces a next generation of the list of
-           lists. This is where the actual splitting into overloads happens.
+        """Given a list of IdlTypes and an existing iterable of argument lists
+           (yes, these are lists of lists), lazily produces a next generation
+           of the argument lists. This is where the actual splitting into
+           overloads happens.
         """
-        result = []
         for argument_list in argument_lists:
             for idl_type in idl_types:
                 new_argument_list = list(argument_list)
                 if idl_type is not None:
                     new_argument_list.append(idl_type)
-                result.append(new_argument_list)
-        return result
+                yield new_argument_list
 
     def _enumerate_argument_types(self, idl_argument):
         """Given an IdlArgument, returns a list of types that are included
@@ -128,6 +136,42 @@ class MethodOverloadSplitter(object):
             idl_types.append(argument_type)
         return idl_types
 
+    def iterate_overloads(self):
+        """Yields the argument lists of split_into_overloads() one at a time,
+           without building the cartesian product of the argument types."""
+        argument_types = [self._enumerate_argument_types(idl_argument)
+                          for idl_argument in self.idl_operation.arguments]
+        argument_lists = iter([[]])
+        for idl_types in argument_types:
+            argument_lists = self._update_argument_lists(argument_lists,
+                                                         idl_types)
+
+        # Argument lists are equivalent if they have the same types but for
+        # nullability, which the C++ types do not reflect, e.g. those of a
+        # union of A and A?, or of two optional arguments of the same type of
+        # which either is given.
+        signatures = set()
+        for argument_list in argument_lists:
+            signature = tuple(
+                idl_type.inner_type if idl_type.is_nullable else idl_type
+                for idl_type in argument_list)
+            if signature in signatures:
+                continue
+            if len(signatures) == self.max_overloads:
+                raise ValueError(
+                    'Operation %s splits into more than %d overloads (up to %d '
+                    'argument lists), which is not supported.' % (
+                        self.idl_operation.name, self.max_overloads,
+                        self._argument_list_count(argument_types)))
+            signatures.add(signature)
+            yield argument_list
+
+    def _argument_list_count(self, argument_types):
+        count = 1
+        for idl_types in argument_types:
+            count *= len(idl_types)
+        return count
+
     def split_into_overloads(self):
         """Splits an operation into one or more overloads that correctly reflect
            the WebIDL semantics of the operation arguments. For example,
@@ -151,19 +195,15 @@ class MethodOverloadSplitter(object):
             This example is also captured as test in
             MethodOverloadSplitterTest.test_split_add_event_listener.
         """
-
-        argument_lists = [[]]
-        for idl_argument in self.idl_operation.arguments:
-            idl_types = self._enumerate_argument_types(idl_argument)
-            argument_lists = self._update_argument_lists(argument_lists,
-                                                         idl_types)
-        return argument_lists
+        return list(self.iterate_overloads())
 
 
 class InterfaceContextBuilder(object):
-    def __init__(self, code_generator, type_resolver):
+    def __init__(self, code_generator, type_resolver,
+                 max_overloads=MAX_OVERLOADS):
         self.result = {'code_generator': code_generator}
         self.type_resolver = type_resolver
+        self.max_overloads = max_overloads
 
     def set_class_name(self, class_name):
         converter = NameStyleConverter(class_name)
@@ -195,11 +235,11 @@ class InterfaceContextBuilder(object):
     def add_operation(self, idl_operation):
         if not idl_operation.name:
             return
-        overload_splitter = MethodOverloadSplitter(idl_operation)
-        overloads = overload_splitter.split_into_overloads()
+        overload_splitter = MethodOverloadSplitter(idl_operation,
+                                                   self.max_overloads)
         argument_names = [argument.name for argument
                           in idl_operation.arguments]
-        for argument_types in overloads:
+        for argument_types in overload_splitter.iterate_overloads():
             arguments = []
             for position, argument_type in enumerate(argument_types):
                 arguments.append(
@@ -271,6 +311,7 @@ class CodeGeneratorWebAgentAPI(CodeGeneratorBase):
             self.generate_file(template_context, 'cc')
         )
 
+    @uses_type_registry
     def generate_code(self, definitions, definition_name):
         self.typedef_resolver.resolve(definitions, definition_name)
 
@@ -122,29 +122,29 @@ class MethodOverloadSplitterTest(unittest.TestCase):
         baz_type = IdlType('Baz')
         qux_type = IdlType('Qux')
 
-        result = splitter._update_argument_lists([[]], [foo_type])
+        result = list(splitter._update_argument_lists([[]], [foo_type]))
         self.assertEqual(result, [[foo_type]])
 
-        result = splitter._update_argument_lists([[]], [foo_type, bar_type])
+        result = list(splitter._update_argument_lists([[]], [foo_type, bar_type]))
         self.assertEqual(result, [[foo_type], [bar_type]])
 
         existing_list = [[foo_type]]
-        result = splitter._update_argument_lists(existing_list, [bar_type])
+        result = list(splitter._update_argument_lists(existing_list, [bar_type]))
         self.assertEqual(result, [[foo_type, bar_type]])
 
         existing_list = [[foo_type]]
-        result = splitter._update_argument_lists(existing_list,
-                                                 [None, bar_type])
+        result = list(splitter._update_argument_lists(existing_list,
+                                                      [None, bar_type]))
         self.assertEqual(result, [[foo_type], [foo_type, bar_type]])
 
         existing_list = [[foo_type]]
-        result = splitter._update_argument_lists(existing_list,
-                                                 [bar_type, baz_type])
+        result = list(splitter._update_argument_lists(existing_list,
+                                                      [bar_type, baz_type]))
         self.assertEqual(result, [[foo_type, bar_type], [foo_type, baz_type]])
 
         existing_list = [[foo_type], [qux_type]]
-        result = splitter._update_argument_lists(existing_list,
-                                                 [bar_type, baz_type])
+        result = list(splitter._update_argument_lists(existing_list,
+                                                      [bar_type, baz_type]))
         self.assertEqual(result, [
             [foo_type, bar_type],
             [foo_type, baz_type],
@@ -153,8 +153,8 @@ class MethodOverloadSplitterTest(unittest.TestCase):
         ])
 
         existing_list = [[foo_type], [qux_type]]
-        result = splitter._update_argument_lists(existing_list,
-                                                 [None, bar_type, baz_type])
+        result = list(splitter._update_argument_lists(existing_list,
+                                                      [None, bar_type, baz_type]))
         self.assertEqual(result, [
             [foo_type],
             [foo_type, bar_type],
@@ -165,8 +165,8 @@ class MethodOverloadSplitterTest(unittest.TestCase):
         ])
 
         existing_list = [[foo_type, qux_type]]
-        result = splitter._update_argument_lists(existing_list,
-                                                 [bar_type, baz_type])
+        result = list(splitter._update_argument_lists(existing_list,
+                                                      [bar_type, baz_type]))
         self.assertEqual(result, [
             [foo_type, qux_type, bar_type],
             [foo_type, qux_type, baz_type],
@@ -229,6 +229,49 @@ class MethodOverloadSplitterTest(unittest.TestCase):
              [type_dom_string, type_listener, type_options],
              [type_dom_string, type_listener, type_boolean]])
 
+    def test_iterate_overloads_is_lazy(self):
+        helper = IdlTestingHelper()
+        type_union = IdlUnionType([IdlType('double'), IdlType('DOMString'),
+                                   IdlType('Foo'), IdlType('Bar')])
+        idl_operation = IdlOperation()
+        idl_operation.name = 'drawImage'
+        # 5 ** 12 argument lists.
+        idl_operation.arguments = [
+            helper.make_stub_idl_argument('a%d' % index, type_union,
+                                          is_optional=True)
+            for index in range(12)]
+        splitter = MethodOverloadSplitter(idl_operation, max_overloads=2)
+        overloads = splitter.iterate_overloads()
+        self.assertEqual(next(overloads), [])
+        self.assertEqual(next(overloads), [IdlType('double')])
+        with self.assertRaises(ValueError) as context:
+            next(overloads)
+        self.assertIn('drawImage splits into more than 2 overloads (up to '
+                      '244140625 argument lists)', str(context.exception))
+
+    def test_split_removes_equivalent_overloads(self):
+        helper = IdlTestingHelper()
+        type_foo = IdlType('Foo')
+        type_bar = IdlType('Bar')
+        idl_operation = IdlOperation()
+        idl_operation.name = 'texImage2D'
+        idl_operation.arguments = [
+            helper.make_stub_idl_argument(
+                'foo', IdlUnionType([type_foo, IdlNullableType(type_bar)])),
+            helper.make_stub_idl_argument('bar', type_bar, is_optional=True),
+            helper.make_stub_idl_argument('baz', type_bar, is_optional=True)]
+        splitter = MethodOverloadSplitter(idl_operation)
+        self.assertEqual(
+            splitter.split_into_overloads(),
+            [[type_foo], [type_foo, type_bar], [type_foo, type_bar, type_bar],
+             [IdlNullableType(type_bar)],
+             [IdlNullableType(type_bar), type_bar],
+             [IdlNullableType(type_bar), type_bar, type_bar]])
+
+        splitter = MethodOverloadSplitter(idl_operation, max_overloads=5)
+        with self.assertRaises(ValueError):
+            splitter.split_into_overloads()
+
 
 class InterfaceContextBuilderTest(unittest.TestCase):
 
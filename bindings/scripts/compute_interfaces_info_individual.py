@@ -42,6 +42,7 @@ Design doc: http://www.chromium.org/developers/design-documents/idl-build
 """
 
 from collections import defaultdict
+import multiprocessing
 import optparse
 import os
 import posixpath
@@ -49,6 +50,14 @@ import sys
 
 from idl_definitions import Visitor
 from idl_reader import IdlReader
+from trace_events import add_events
+from trace_events import add_trace_output_option
+from trace_events import start_tracing
+from trace_events import tagged_with_idl_file
+from trace_events import take_events
+from trace_events import trace_event
+from trace_events import tracing
+from trace_events import tracing_enabled
 from utilities import idl_filename_to_component
 from utilities import idl_filename_to_basename
 from utilities import merge_dict_recursively
@@ -77,12 +86,17 @@ def parse_options():
     parser.add_option('--component-info-file', help='component wide info pickle file')
     # TODO(tkent): Remove the option after the great mv. crbug.com/760462
     parser.add_option('--snake-case-generated-files', action='store_true', default=False)
+    parser.add_option('--jobs', type='int', default=1,
+                      help='number of worker processes reading IDL files')
+    add_trace_output_option(parser)
 
     options, args = parser.parse_args()
     if options.interfaces_info_file is None:
         parser.error('Must specify an output file using --interfaces-info-file.')
     if options.idl_files_list is None:
         parser.error('Must specify a file listing IDL files using --idl-files-list.')
+    if options.jobs < 1:
+        parser.error('--jobs must be a positive number.')
     return options, args
 
 
@@ -179,8 +193,8 @@ def collect_union_types_from_definitions(definitions):
 
 class InterfaceInfoCollector(object):
     """A class that collects interface information from idl files."""
-    def __init__(self, cache_directory=None):
-        self.reader = IdlReader(interfaces_info=None, outputdir=cache_directory)
+    def __init__(self, cache_directory=None, reader=None):
+        self.reader = reader or IdlReader(interfaces_info=None, outputdir=cache_directory)
         self.interfaces_info = {}
         self.partial_interface_files = defaultdict(lambda: {
             'full_paths': [],
@@ -191,10 +205,10 @@ class InterfaceInfoCollector(object):
         self.typedefs = {}
         self.callback_functions = {}
 
-    def add_paths_to_partials_dict(self, partial_interface_name, full_path,
+    def add_paths_to_partials_dict(self, partial_interface_name, full_paths,
                                    include_paths):
         paths_dict = self.partial_interface_files[partial_interface_name]
-        paths_dict['full_paths'].append(full_path)
+        paths_dict['full_paths'].extend(full_paths)
         paths_dict['include_paths'].extend(include_paths)
 
     def check_enum_consistency(self, enum):
@@ -295,7 +309,7 @@ class InterfaceInfoCollector(object):
             partial_include_paths = []
             if this_include_path:
                 partial_include_paths.append(this_include_path)
-            self.add_paths_to_partials_dict(definition.name, full_path, partial_include_paths)
+            self.add_paths_to_partials_dict(definition.name, [full_path], partial_include_paths)
             # Collects C++ header paths which should be included from generated
             # .cpp files.  The resulting structure is as follows.
             #   interfaces_info[interface_name] = {
@@ -334,6 +348,42 @@ class InterfaceInfoCollector(object):
         })
         merge_dict_recursively(self.interfaces_info[definition.name], interface_info)
 
+    def get_partial_info(self):
+        """Returns everything collected so far, for merge_partial_info().
+
+        Unlike get_info_as_dict(), this keeps the IdlEnum objects so that the
+        enum consistency checks can be repeated when merging.
+        """
+        return {
+            'interfaces_info': self.interfaces_info,
+            'partial_interface_files': dict(self.partial_interface_files),
+            'enumerations': self.enumerations,
+            'union_types': self.union_types,
+            'typedefs': self.typedefs,
+            'callback_functions': self.callback_functions,
+        }
+
+    def merge_partial_info(self, partial_info):
+        """Merges info collected from files that follow the ones seen so far.
+
+        Merging the partial info of consecutive slices of the IDL files list,
+        in list order, yields the same info as collecting all files serially.
+        """
+        merge_dict_recursively(self.interfaces_info,
+                               partial_info['interfaces_info'])
+        for interface_name, paths_dict in partial_info['partial_interface_files'].items():
+            self.add_paths_to_partials_dict(interface_name,
+                                            paths_dict['full_paths'],
+                                            paths_dict['include_paths'])
+        for enum in partial_info['enumerations'].values():
+            if not self.check_enum_consistency(enum):
+                raise Exception('Enumeration "%s" is defined more than once '
+                                'with different valid values' % enum.name)
+        self.enumerations.update(partial_info['enumerations'])
+        self.union_types.update(partial_info['union_types'])
+        self.typedefs.update(partial_info['typedefs'])
+        self.callback_functions.update(partial_info['callback_functions'])
+
     def get_info_as_dict(self):
         """Returns info packaged as a dict."""
         return {
@@ -354,25 +404,103 @@ class InterfaceInfoCollector(object):
         }
 
 
+################################################################################
+# Parallel collection
 ################################################################################
 
-def main():
-    options, _ = parse_options()
+# Number of slices per worker process; more slices than workers balance the
+# load, as files vary a lot in size.
+SLICES_PER_JOB = 4
+
+# IdlReader of a worker process, created once by init_worker().
+worker_reader = None
 
-    # IDL files are passed in a file, due to OS command line length limits
-    idl_files = read_idl_files_list_from_file(options.idl_files_list, is_gyp_format=False)
 
-    # Compute information for individual files
-    # Information is stored in global variables interfaces_info and
-    # partial_interface_files.
-    info_collector = InterfaceInfoCollector(options.cache_directory)
+def init_worker(cache_directory, trace):
+    global worker_reader  # pylint: disable=global-statement
+    worker_reader = IdlReader(interfaces_info=None, outputdir=cache_directory)
+    if trace:
+        start_tracing('%s worker' % os.path.basename(sys.argv[0]))
+
+
+def collect_info_of_file(info_collector, idl_filename,
+                         snake_case_generated_files):
+    with tagged_with_idl_file(idl_filename):
+        with trace_event('collect_info'):
+            info_collector.collect_info(idl_filename,
+                                        snake_case_generated_files)
+
+
+def collect_partial_info(args):
+    """Returns the partial info of a slice of IDL files and the trace events
+    recorded while collecting it."""
+    idl_files, snake_case_generated_files = args
+    info_collector = InterfaceInfoCollector(reader=worker_reader)
     for idl_filename in idl_files:
-        info_collector.collect_info(idl_filename, options.snake_case_generated_files)
+        collect_info_of_file(info_collector, idl_filename,
+                             snake_case_generated_files)
+    return info_collector.get_partial_info(), take_events()
+
 
-    write_pickle_file(options.interfaces_info_file,
-                      info_collector.get_info_as_dict())
-    write_pickle_file(options.component_info_file,
-                      info_collector.get_component_info_as_dict())
+def split_into_slices(items, number_of_slices):
+    """Splits |items| into at most |number_of_slices| consecutive slices."""
+    slice_size = -(-len(items) // number_of_slices)  # Round up.
+    return [items[i:i + slice_size]
+            for i in range(0, len(items), max(slice_size, 1))]
+
+
+def collect_info_in_parallel(info_collector, idl_files, jobs,
+                             cache_directory, snake_case_generated_files):
+    """Collects info with |jobs| worker processes into |info_collector|.
+
+    Workers read consecutive slices of |idl_files|; the partial results are
+    merged in list order, so the info is pickled to the same bytes as that of
+    a serial run, although strings which the serial run shares are copies
+    when returned by different workers.
+    """
+    slices = split_into_slices(idl_files, jobs * SLICES_PER_JOB)
+    pool = multiprocessing.Pool(jobs, init_worker,
+                                (cache_directory, tracing_enabled()))
+    try:
+        results = pool.map(
+            collect_partial_info,
+            [(idl_files_slice, snake_case_generated_files)
+             for idl_files_slice in slices],
+            chunksize=1)
+    finally:
+        pool.terminate()
+        pool.join()
+    for partial_info, events in results:
+        info_collector.merge_partial_info(partial_info)
+        add_events(events)
+
+
+################################################################################
+
+def main():
+    options, _ = parse_options()
+
+    with tracing(options.trace_output):
+        # IDL files are passed in a file, due to OS command line length limits
+        idl_files = read_idl_files_list_from_file(options.idl_files_list, is_gyp_format=False)
+
+        # Compute information for individual files
+        # Information is stored in global variables interfaces_info and
+        # partial_interface_files.
+        info_collector = InterfaceInfoCollector(options.cache_directory)
+        if options.jobs > 1:
+            collect_info_in_parallel(info_collector, idl_files, options.jobs,
+                                     options.cache_directory,
+                                     options.snake_case_generated_files)
+        else:
+            for idl_filename in idl_files:
+                collect_info_of_file(info_collector, idl_filename,
+                                     options.snake_case_generated_files)
+
+        write_pickle_file(options.interfaces_info_file,
+                          info_collector.get_info_as_dict())
+        write_pickle_file(options.component_info_file,
+                          info_collector.get_component_info_as_dict())
 
 if __name__ == '__main__':
     sys.exit(main())
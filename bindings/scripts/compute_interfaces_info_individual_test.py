@@ -0,0 +1,73 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for the parallel mode of compute_interfaces_info_individual.py."""
+
+import glob
+import os
+import unittest
+
+from compute_interfaces_info_individual import InterfaceInfoCollector
+from compute_interfaces_info_individual import collect_info_in_parallel
+from compute_interfaces_info_individual import split_into_slices
+from utilities import pickle_dumps_deterministically
+
+TEST_IDLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'tests', 'idls')
+
+
+def idl_files_of_tests():
+    # Includes partial interfaces, implements and union types, in core and
+    # modules.
+    return (sorted(glob.glob(os.path.join(TEST_IDLS_DIR, 'core', '*.idl'))) +
+            sorted(glob.glob(os.path.join(TEST_IDLS_DIR, 'modules', '*.idl'))))
+
+
+def pickled_info(info_collector):
+    """Returns the info as written to the info pickle files."""
+    return (pickle_dumps_deterministically(info_collector.get_info_as_dict()),
+            pickle_dumps_deterministically(
+                info_collector.get_component_info_as_dict()))
+
+
+def collect_info_serially(idl_files):
+    info_collector = InterfaceInfoCollector()
+    for idl_filename in idl_files:
+        info_collector.collect_info(idl_filename)
+    return info_collector
+
+
+class ParallelCollectionTest(unittest.TestCase):
+
+    def test_split_into_slices(self):
+        self.assertEqual(split_into_slices(list(range(7)), 3),
+                         [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(split_into_slices([0, 1], 8), [[0], [1]])
+        self.assertEqual(split_into_slices([], 4), [])
+
+    def test_merge_partial_info(self):
+        idl_files = idl_files_of_tests()
+        expected = collect_info_serially(idl_files)
+        info_collector = InterfaceInfoCollector()
+        for idl_files_slice in split_into_slices(idl_files, 5):
+            info_collector.merge_partial_info(
+                collect_info_serially(idl_files_slice).get_partial_info())
+        self.assertEqual(pickled_info(info_collector), pickled_info(expected))
+
+    def test_collect_info_in_parallel(self):
+        idl_files = idl_files_of_tests()
+        expected = collect_info_serially(idl_files)
+        info_collector = InterfaceInfoCollector()
+        collect_info_in_parallel(info_collector, idl_files, jobs=2,
+                                 cache_directory=None,
+                                 snake_case_generated_files=False)
+        # The workers return separate copies of strings which the serial run
+        # shares, yet the pickles are identical.
+        self.assertEqual(pickled_info(info_collector), pickled_info(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
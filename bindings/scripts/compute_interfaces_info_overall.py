@@ -48,6 +48,13 @@ extended attributes), as this would cause unnecessary rebuilds.
 
 |interfaces_info| is a dict, keyed by |interface_name|.
 
+To limit what each generated file depends on, |interfaces_info| is also
+written as one shard per interface, next to the pickle, plus an index holding
+the global type info (see compute_global_type_info()) and the interface names.
+Shards are only rewritten when their content changes, and the IDL compiler can
+read shards lazily and report which ones it used (see --info-depfile), so
+editing an IDL file only reruns the build steps which used its info.
+
 Current keys are:
 * dependencies:
     'implements_interfaces': targets of 'implements' statements
@@ -84,14 +91,23 @@ Design doc: http://www.chromium.org/developers/design-documents/idl-build
 # pylint: disable=relative-import
 
 import optparse
+import os
 import sys
 
 from collections import defaultdict
+from trace_events import add_trace_output_option
+from trace_events import trace_event
+from trace_events import tracing
+from utilities import GLOBAL_TYPE_INFO_KEYS
+from utilities import INTERFACES_INFO_INDEX_FILENAME
+from utilities import INTERFACES_INFO_SHARDS_DIRNAME
 from utilities import idl_filename_to_component
+from utilities import interfaces_info_shard_filename
 from utilities import merge_dict_recursively
 from utilities import read_pickle_files
 from utilities import shorten_union_name
 from utilities import write_pickle_file
+from utilities import write_pickle_file_if_changed
 
 INHERITED_EXTENDED_ATTRIBUTES = set([
     'ActiveScriptWrappable',
@@ -119,6 +135,7 @@ class IdlInterfaceFileNotFoundError(Exception):
 def parse_options():
     usage = 'Usage: %prog [InfoIndividual.pickle]... [Info.pickle]'
     parser = optparse.OptionParser(usage=usage)
+    add_trace_output_option(parser)
 
     return parser.parse_args()
 
@@ -306,16 +323,57 @@ def compute_interfaces_info_overall(info_individuals):
     compute_global_type_info()
 
 
+def write_interfaces_info_shards(shards_dir):
+    """Writes |interfaces_info| as per-interface shards plus an index.
+
+    Returns the number of files written; unchanged files are not touched, so
+    that their timestamps (and the build steps depending on them) stay put.
+    """
+    if not os.path.isdir(shards_dir):
+        os.makedirs(shards_dir)
+    interface_names = sorted(name for name in interfaces_info
+                             if name not in GLOBAL_TYPE_INFO_KEYS)
+    index = {
+        'global_type_info': dict((key, interfaces_info[key])
+                                 for key in sorted(GLOBAL_TYPE_INFO_KEYS)),
+        'interface_names': interface_names,
+    }
+    written = 0
+    if write_pickle_file_if_changed(
+            os.path.join(shards_dir, INTERFACES_INFO_INDEX_FILENAME), index):
+        written += 1
+    shard_filenames = set([INTERFACES_INFO_INDEX_FILENAME])
+    for interface_name in interface_names:
+        shard_filename = interfaces_info_shard_filename(
+            shards_dir, interface_name)
+        shard_filenames.add(os.path.basename(shard_filename))
+        if write_pickle_file_if_changed(shard_filename,
+                                        interfaces_info[interface_name]):
+            written += 1
+    # Remove shards of interfaces which no longer exist.
+    for filename in os.listdir(shards_dir):
+        if filename.endswith('.pickle') and filename not in shard_filenames:
+            os.remove(os.path.join(shards_dir, filename))
+    return written
+
+
 ################################################################################
 
 def main():
-    _, args = parse_options()
+    options, args = parse_options()
     # args = Input1, Input2, ..., Output
     interfaces_info_filename = args.pop()
-    info_individuals = read_pickle_files(args)
-
-    compute_interfaces_info_overall(info_individuals)
-    write_pickle_file(interfaces_info_filename, interfaces_info)
+    with tracing(options.trace_output):
+        with trace_event('read_pickle_files'):
+            info_individuals = read_pickle_files(args)
+
+        with trace_event('compute_interfaces_info_overall'):
+            compute_interfaces_info_overall(info_individuals)
+        write_pickle_file(interfaces_info_filename, interfaces_info)
+        with trace_event('write_interfaces_info_shards'):
+            write_interfaces_info_shards(os.path.join(
+                os.path.dirname(interfaces_info_filename),
+                INTERFACES_INFO_SHARDS_DIRNAME))
 
 
 if __name__ == '__main__':
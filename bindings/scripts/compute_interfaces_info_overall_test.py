@@ -0,0 +1,77 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for compute_interfaces_info_overall.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import compute_interfaces_info_overall
+from compute_interfaces_info_overall import write_interfaces_info_shards
+from utilities import GLOBAL_TYPE_INFO_KEYS
+from utilities import OUTPUT_DIGESTS_BASENAME
+from utilities import ShardedInterfacesInfo
+
+
+def make_interfaces_info():
+    interfaces_info = dict((key, {}) for key in GLOBAL_TYPE_INFO_KEYS)
+    interfaces_info['ancestors'] = {'Bar': ['Foo']}
+    interfaces_info['Foo'] = {
+        'cpp_includes': {'core': set(['core/Foo.h', 'core/FooPartial.h'])},
+        'full_path': '/src/core/Foo.idl',
+    }
+    interfaces_info['Bar'] = {
+        'cpp_includes': {'core': set(['core/Bar.h'])},
+        'full_path': '/src/core/Bar.idl',
+    }
+    return interfaces_info
+
+
+class InterfacesInfoShardsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.shards_dir = os.path.join(tempfile.mkdtemp(), 'shards')
+        compute_interfaces_info_overall.interfaces_info = make_interfaces_info()
+
+    def tearDown(self):
+        shutil.rmtree(os.path.dirname(self.shards_dir))
+        compute_interfaces_info_overall.interfaces_info = {}
+
+    def test_shards_are_read_lazily(self):
+        self.assertEqual(write_interfaces_info_shards(self.shards_dir), 3)
+        interfaces_info = ShardedInterfacesInfo(self.shards_dir)
+        self.assertEqual(len(interfaces_info), len(make_interfaces_info()))
+        self.assertIn('Foo', interfaces_info)
+        self.assertNotIn('Baz', interfaces_info)
+        self.assertEqual(interfaces_info['ancestors'], {'Bar': ['Foo']})
+        self.assertEqual(len(interfaces_info.read_filenames), 1)
+
+        self.assertEqual(interfaces_info['Bar'], make_interfaces_info()['Bar'])
+        self.assertEqual(
+            sorted(os.path.basename(filename)
+                   for filename in interfaces_info.read_filenames),
+            ['Bar.pickle', 'index.pickle'])
+
+    def test_only_changed_shards_are_written(self):
+        write_interfaces_info_shards(self.shards_dir)
+        self.assertEqual(write_interfaces_info_shards(self.shards_dir), 0)
+
+        compute_interfaces_info_overall.interfaces_info['Bar']['full_path'] = (
+            '/src/core/bar/Bar.idl')
+        self.assertEqual(write_interfaces_info_shards(self.shards_dir), 1)
+
+    def test_stale_shards_are_removed(self):
+        write_interfaces_info_shards(self.shards_dir)
+        del compute_interfaces_info_overall.interfaces_info['Bar']
+        write_interfaces_info_shards(self.shards_dir)
+        self.assertEqual(sorted(os.listdir(self.shards_dir)),
+                         [OUTPUT_DIGESTS_BASENAME, 'Foo.pickle', 'index.pickle'])
+
+
+if __name__ == '__main__':
+    unittest.main()
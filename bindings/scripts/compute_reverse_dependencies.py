@@ -0,0 +1,347 @@
+#!/usr/bin/python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=relative-import
+
+"""Computes which generated files depend on which IDL files.
+
+compute_interfaces_info_overall.py records, for each interface, the IDL files
+it depends on (partial interfaces, implemented interfaces), its ancestors and
+the interfaces it references.  The generated code of a definition also depends
+on the global type info of the types its members use ([ImplementedAs],
+[GarbageCollected], callback interfaces, components and ancestors), so the IDL
+files are read to find those types.  This step inverts those relations into a
+graph from an IDL file to the definitions whose generated code it affects, and
+persists it as a pickle:
+
+  {
+    'dependents': {idl_full_path: [definition key, ...]},
+    'outputs': {definition key: [generated file, ...]},
+  }
+
+Definition keys are strings such as 'interface Node', 'dictionary EventInit',
+'union NodeOrString', 'partial_interface Window' or 'callback_function
+VoidCallback'.  'dependents' is transitively closed (a change of an interface
+affects all of its descendants), so a query is a plain lookup.  Generated
+files are relative to the root of the generated code, e.g.
+'bindings/core/v8/V8Node.h' or 'core/dom/ElementDefinitionOptions.h'.
+
+Usage:
+  compute_reverse_dependencies.py --info-dir DIR [--cache-directory DIR]
+      [--snake-case-generated-files] ReverseDependencies.pickle
+  compute_reverse_dependencies.py --query ReverseDependencies.pickle
+      CHANGED.idl...
+
+A query prints the generated files to regenerate, one per line.  IDL files not
+in the graph (e.g. new files) may affect anything, so all generated files are
+printed for them.
+"""
+
+import optparse
+import os
+import posixpath
+import sys
+from collections import defaultdict
+
+from idl_definitions import Visitor
+from idl_reader import IdlReader
+from idl_types import IdlType
+from utilities import GLOBAL_TYPE_INFO_KEYS
+from utilities import read_pickle_file
+from utilities import shorten_union_name
+from utilities import to_snake_case
+from utilities import write_pickle_file_if_changed
+from v8_utilities import build_basename
+from v8_utilities import cpp_name_from_interfaces_info
+
+
+def parse_options():
+    usage = ('Usage: %prog --info-dir DIR [options] ReverseDependencies.pickle\n'
+             '       %prog --query ReverseDependencies.pickle CHANGED.idl...')
+    parser = optparse.OptionParser(usage=usage)
+    parser.add_option('--info-dir', help='directory of the info pickles')
+    parser.add_option('--cache-directory',
+                      help='cache directory of the parsed IDL files')
+    parser.add_option('--snake-case-generated-files',
+                      action='store_true', default=False)
+    parser.add_option('--query', action='store_true', default=False,
+                      help='print the generated files affected by the given '
+                      'IDL files')
+    options, args = parser.parse_args()
+    if not args:
+        parser.error('Must specify the reverse dependencies pickle file.')
+    if not options.query:
+        if options.info_dir is None:
+            parser.error('Must specify the info directory using --info-dir.')
+        if len(args) != 1:
+            parser.error('Must specify exactly 1 output file, but %d given.'
+                         % len(args))
+    return options, args
+
+
+def bindings_output_dir(component):
+    return posixpath.join('bindings', component, 'v8')
+
+
+def collect_type_names_from_definitions(definitions):
+    """Traverse definitions and collect the names of all types used."""
+    class TypeNameCollector(Visitor):
+        def collect(self, definitions):
+            self._type_names = set()
+            definitions.accept(self)
+            return self._type_names
+
+        def visit_typed_object(self, typed_object):
+            for attribute_name in typed_object.idl_type_attributes:
+                attribute = getattr(typed_object, attribute_name, None)
+                if not attribute:
+                    continue
+                for idl_type in attribute.idl_types():
+                    if isinstance(idl_type, IdlType):
+                        self._type_names.add(idl_type.base_type)
+
+    return TypeNameCollector().collect(definitions)
+
+
+class ReverseDependenciesBuilder(object):
+    """Builds the reverse dependency graph from the info pickles."""
+
+    def __init__(self, interfaces_info, component_infos, snake_case,
+                 read_idl_file=None):
+        """
+        Args:
+          interfaces_info: the contents of InterfacesInfoOverall.pickle.
+          component_infos: dict of component -> ComponentInfo pickle contents.
+          snake_case: whether generated files are named in snake_case.
+          read_idl_file: function returning the IdlDefinitions of an IDL file,
+              used to find the types the members of definitions use.  If
+              None, uses of types are not followed.
+        """
+        self.interfaces_info = dict(
+            (name, info) for name, info in interfaces_info.items()
+            if name not in GLOBAL_TYPE_INFO_KEYS)
+        self.component_dirs = interfaces_info['component_dirs']
+        self.component_infos = component_infos
+        self.snake_case = snake_case
+        self.read_idl_file = read_idl_file
+        self.direct_dependents = defaultdict(set)  # full path -> keys
+        self.definition_files = defaultdict(set)  # key -> full paths
+        self.outputs = {}  # key -> generated files
+        self.descendants = defaultdict(set)  # interface -> interfaces
+
+    def v8_outputs(self, component, name, prefix='V8'):
+        return [posixpath.join(bindings_output_dir(component),
+                               build_basename(name, self.snake_case,
+                                              prefix=prefix, ext=ext))
+                for ext in ('.h', '.cpp')]
+
+    def add_interfaces(self):
+        for name, info in self.interfaces_info.items():
+            kind = 'dictionary' if info['is_dictionary'] else 'interface'
+            key = '%s %s' % (kind, name)
+            component = self.component_dirs[name]
+            outputs = self.v8_outputs(component, name)
+            if info['is_dictionary']:
+                # Dictionary impl classes are named by [ImplementedAs]; see
+                # CodeGeneratorDictionaryImpl.
+                cpp_name = cpp_name_from_interfaces_info(
+                    name, self.interfaces_info)
+                outputs.extend(
+                    posixpath.join(info['relative_dir'],
+                                   build_basename(cpp_name, self.snake_case,
+                                                  ext=ext))
+                    for ext in ('.h', '.cpp'))
+            self.outputs[key] = outputs
+            self.add_definition_files(
+                key, [info['full_path']] + info['dependencies_full_paths'])
+            # Partial interfaces in another component are generated as
+            # V8<Name>Partial in that component.
+            for full_path in info['dependencies_other_component_full_paths']:
+                partial_key = 'partial_interface %s' % name
+                self.outputs[partial_key] = self.v8_outputs(
+                    'modules', name + 'Partial')
+                self.add_definition_files(key, [full_path])
+                self.add_definition_files(partial_key, [full_path])
+            for ancestor in info['ancestors']:
+                self.descendants[ancestor].add(name)
+
+        # Interfaces introspect the interfaces they reference (e.g. by
+        # [PutForwards]) and implement.
+        for name, info in self.interfaces_info.items():
+            key = self.definition_key(name)
+            for other in ((info['referenced_interfaces'] or []) +
+                          (info['implements_interfaces'] or [])):
+                if other in self.interfaces_info:
+                    self.direct_dependents[
+                        self.interfaces_info[other]['full_path']].add(key)
+
+    def add_definition_files(self, key, full_paths):
+        for full_path in full_paths:
+            self.direct_dependents[full_path].add(key)
+            self.definition_files[key].add(full_path)
+
+    def definition_key(self, name):
+        if self.interfaces_info[name]['is_dictionary']:
+            return 'dictionary %s' % name
+        return 'interface %s' % name
+
+    def add_callback_functions(self):
+        for component_info in self.component_infos.values():
+            for name, info in component_info['callback_functions'].items():
+                key = 'callback_function %s' % name
+                self.outputs[key] = [
+                    posixpath.join(bindings_output_dir(info['component_dir']),
+                                   to_snake_case('V8%s' % name) + ext)
+                    for ext in ('.h', '.cc')]
+                self.add_definition_files(key, [info['full_path']])
+
+    def add_union_types(self):
+        callback_functions = {}
+        for component_info in self.component_infos.values():
+            callback_functions.update(component_info['callback_functions'])
+        for component, component_info in self.component_infos.items():
+            typedefs = dict((name, typedef.idl_type) for name, typedef
+                            in component_info['typedefs'].items())
+            for union_type in component_info['union_types']:
+                union_type = union_type.resolve_typedefs(typedefs)
+                if union_type.is_nullable:
+                    union_type = union_type.inner_type
+                name = shorten_union_name(union_type)
+                key = 'union %s' % name
+                self.outputs[key] = [
+                    posixpath.join(bindings_output_dir(component),
+                                   to_snake_case(name) + ext)
+                    for ext in ('.h', '.cc')]
+                # The container depends on the definitions of its members.
+                for idl_type in union_type.idl_types():
+                    if not isinstance(idl_type, IdlType):
+                        continue
+                    member_name = idl_type.base_type
+                    if member_name in self.interfaces_info:
+                        full_path = self.interfaces_info[member_name]['full_path']
+                    elif member_name in callback_functions:
+                        full_path = callback_functions[member_name]['full_path']
+                    else:
+                        continue
+                    self.direct_dependents[full_path].add(key)
+
+    def add_type_uses(self):
+        """Adds edges from the files defining types to the definitions whose
+        members use them, as the generated code depends on the global type
+        info of the types used, on enumeration values and on typedefs."""
+        type_names = {}  # full path -> names of the types used
+        defining_files = defaultdict(set)  # type name -> full paths
+        for full_path in sorted(set().union(*self.definition_files.values())):
+            definitions = self.read_idl_file(full_path)
+            type_names[full_path] = collect_type_names_from_definitions(
+                definitions)
+            for name in list(definitions.enumerations) + list(definitions.typedefs):
+                defining_files[name].add(full_path)
+        for name, info in self.interfaces_info.items():
+            defining_files[name].add(info['full_path'])
+            # Extended attributes inherited from ancestors.
+            defining_files[name].update(
+                self.interfaces_info[ancestor]['full_path']
+                for ancestor in info['ancestors']
+                if ancestor in self.interfaces_info)
+        typedefs = {}
+        for component_info in self.component_infos.values():
+            for name, info in component_info['callback_functions'].items():
+                defining_files[name].add(info['full_path'])
+            typedefs.update(component_info['typedefs'])
+
+        for key, full_paths in self.definition_files.items():
+            used_names = set()
+            pending = set().union(*(type_names[full_path]
+                                    for full_path in full_paths))
+            while pending:
+                name = pending.pop()
+                used_names.add(name)
+                if name in typedefs:
+                    for idl_type in typedefs[name].idl_type.idl_types():
+                        if (isinstance(idl_type, IdlType) and
+                                idl_type.base_type not in used_names):
+                            pending.add(idl_type.base_type)
+            for name in used_names:
+                for full_path in defining_files.get(name, ()):
+                    self.direct_dependents[full_path].add(key)
+
+    def all_descendants(self, name):
+        descendants = set()
+        pending = [name]
+        while pending:
+            for descendant in self.descendants[pending.pop()]:
+                if descendant not in descendants:
+                    descendants.add(descendant)
+                    pending.append(descendant)
+        return descendants
+
+    def build(self):
+        self.add_interfaces()
+        self.add_callback_functions()
+        self.add_union_types()
+        if self.read_idl_file:
+            self.add_type_uses()
+        dependents = {}
+        for full_path, keys in self.direct_dependents.items():
+            closed_keys = set(keys)
+            for key in keys:
+                kind, name = key.split(' ', 1)
+                if kind in ('interface', 'dictionary'):
+                    closed_keys.update(self.definition_key(descendant)
+                                       for descendant in self.all_descendants(name))
+            dependents[full_path] = sorted(closed_keys)
+        return {
+            'dependents': dependents,
+            'outputs': self.outputs,
+        }
+
+
+def compute_reverse_dependencies(info_dir, snake_case, cache_directory=None):
+    interfaces_info = read_pickle_file(
+        os.path.join(info_dir, 'modules', 'InterfacesInfoOverall.pickle'))
+    component_infos = {
+        'core': read_pickle_file(
+            os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle')),
+        'modules': read_pickle_file(
+            os.path.join(info_dir, 'modules', 'ComponentInfoModules.pickle')),
+    }
+    reader = IdlReader(outputdir=cache_directory)
+    return ReverseDependenciesBuilder(interfaces_info, component_infos,
+                                      snake_case, reader.read_idl_file).build()
+
+
+def affected_outputs(reverse_dependencies, changed_filenames):
+    """Returns the sorted generated files affected by |changed_filenames|."""
+    dependents = reverse_dependencies['dependents']
+    outputs = reverse_dependencies['outputs']
+    keys = set()
+    for filename in changed_filenames:
+        full_path = os.path.realpath(filename)
+        if full_path not in dependents:
+            sys.stderr.write('%s is unknown; all files are affected.\n'
+                             % filename)
+            keys = outputs.keys()
+            break
+        keys.update(dependents[full_path])
+    return sorted(output for key in keys for output in outputs[key])
+
+
+def main():
+    options, args = parse_options()
+    if options.query:
+        reverse_dependencies = read_pickle_file(args[0])
+        for output in affected_outputs(reverse_dependencies, args[1:]):
+            print(output)
+        return 0
+    write_pickle_file_if_changed(
+        args[0], compute_reverse_dependencies(
+            options.info_dir, options.snake_case_generated_files,
+            options.cache_directory))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for compute_reverse_dependencies.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from compute_reverse_dependencies import ReverseDependenciesBuilder
+from compute_reverse_dependencies import affected_outputs
+from idl_reader import IdlReader
+from idl_types import IdlType
+from idl_types import IdlUnionType
+
+
+def interface_info(full_path, ancestors=None, dependencies=None,
+                   other_component_dependencies=None, is_dictionary=False,
+                   implemented_as=None):
+    return {
+        'ancestors': ancestors or [],
+        'dependencies_full_paths': dependencies or [],
+        'dependencies_other_component_full_paths':
+            other_component_dependencies or [],
+        'full_path': full_path,
+        'implemented_as': implemented_as,
+        'implements_interfaces': [],
+        'is_dictionary': is_dictionary,
+        'referenced_interfaces': None,
+        'relative_dir': 'core/dom',
+    }
+
+
+def component_info(union_types=(), typedefs=None):
+    return {
+        'callback_functions': {},
+        'typedefs': typedefs or {},
+        'union_types': set(union_types),
+    }
+
+
+class ReverseDependenciesTest(unittest.TestCase):
+
+    def setUp(self):
+        interfaces_info = {
+            'component_dirs': {
+                'Node': 'core', 'Element': 'core', 'Init': 'core',
+            },
+            'Node': interface_info('/core/Node.idl'),
+            'Element': interface_info(
+                '/core/Element.idl', ancestors=['Node'],
+                dependencies=['/core/ParentNode.idl'],
+                other_component_dependencies=['/modules/ElementFoo.idl']),
+            'Init': interface_info('/core/Init.idl', is_dictionary=True,
+                                   implemented_as='InitImpl'),
+        }
+        union_type = IdlUnionType([IdlType('Node'), IdlType('DOMString')])
+        self.reverse_dependencies = ReverseDependenciesBuilder(
+            interfaces_info,
+            {'core': component_info([union_type]), 'modules': component_info()},
+            snake_case=False).build()
+
+    def affected_outputs(self, *changed_filenames):
+        return affected_outputs(self.reverse_dependencies, changed_filenames)
+
+    def test_descendants_and_unions_are_affected(self):
+        self.assertEqual(self.affected_outputs('/core/Node.idl'), [
+            'bindings/core/v8/V8Element.cpp',
+            'bindings/core/v8/V8Element.h',
+            'bindings/core/v8/V8Node.cpp',
+            'bindings/core/v8/V8Node.h',
+            'bindings/core/v8/node_or_string.cc',
+            'bindings/core/v8/node_or_string.h',
+        ])
+
+    def test_partial_interfaces(self):
+        self.assertEqual(self.affected_outputs('/core/ParentNode.idl'), [
+            'bindings/core/v8/V8Element.cpp',
+            'bindings/core/v8/V8Element.h',
+        ])
+        self.assertEqual(self.affected_outputs('/modules/ElementFoo.idl'), [
+            'bindings/core/v8/V8Element.cpp',
+            'bindings/core/v8/V8Element.h',
+            'bindings/modules/v8/V8ElementPartial.cpp',
+            'bindings/modules/v8/V8ElementPartial.h',
+        ])
+
+    def test_dictionary_impl(self):
+        self.assertEqual(self.affected_outputs('/core/Init.idl'), [
+            'bindings/core/v8/V8Init.cpp',
+            'bindings/core/v8/V8Init.h',
+            'core/dom/InitImpl.cpp',
+            'core/dom/InitImpl.h',
+        ])
+
+    def test_unknown_file_affects_everything(self):
+        self.assertEqual(len(self.affected_outputs('/core/New.idl')), 12)
+
+
+class TypeUsesTest(unittest.TestCase):
+
+    IDL_FILES = {
+        'Node.idl': ('interface Node {\n'
+                     '  readonly attribute Event event;\n'
+                     '  void dispatch(Targets targets);\n'
+                     '};\n'),
+        'Event.idl': ('typedef sequence<Target> Targets;\n'
+                      'interface Event {};\n'),
+        'Target.idl': 'interface Target : Base {};\n',
+        'Base.idl': '[DependentLifetime] interface Base {};\n',
+    }
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        interfaces_info = {'component_dirs': {}}
+        for basename, contents in self.IDL_FILES.items():
+            full_path = os.path.join(self.temp_dir, basename)
+            with open(full_path, 'w') as idl_file:
+                idl_file.write(contents)
+            name = os.path.splitext(basename)[0]
+            interfaces_info['component_dirs'][name] = 'core'
+            interfaces_info[name] = interface_info(full_path)
+        interfaces_info['Target']['ancestors'] = ['Base']
+        reader = IdlReader()
+        typedefs = reader.read_idl_file(self.full_path('Event.idl')).typedefs
+        self.reverse_dependencies = ReverseDependenciesBuilder(
+            interfaces_info,
+            {'core': component_info(typedefs=typedefs),
+             'modules': component_info()},
+            snake_case=False, read_idl_file=reader.read_idl_file).build()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def full_path(self, basename):
+        return os.path.join(self.temp_dir, basename)
+
+    def affected_names(self, basename):
+        return sorted(
+            os.path.splitext(os.path.basename(output))[0][len('V8'):]
+            for output in affected_outputs(self.reverse_dependencies,
+                                           [self.full_path(basename)])
+            if output.endswith('.h'))
+
+    def test_users_of_types_are_affected(self):
+        self.assertEqual(self.affected_names('Node.idl'), ['Node'])
+        self.assertEqual(self.affected_names('Event.idl'), ['Event', 'Node'])
+
+    def test_users_of_typedefs_and_ancestors_are_affected(self):
+        # Node uses Target through the typedef Targets, and Target inherits
+        # [DependentLifetime] from Base.
+        self.assertEqual(self.affected_names('Target.idl'),
+                         ['Event', 'Node', 'Target'])
+        self.assertEqual(self.affected_names('Base.idl'),
+                         ['Base', 'Event', 'Node', 'Target'])
+
+
+if __name__ == '__main__':
+    unittest.main()
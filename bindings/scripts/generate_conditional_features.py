@@ -17,6 +17,8 @@ from collections import defaultdict, namedtuple
 from code_generator import (initialize_jinja_env, normalize_and_sort_includes,
                             render_template)
 from idl_reader import IdlReader
+from trace_events import add_trace_output_option
+from trace_events import tracing
 from utilities import (create_component_info_provider, write_file,
                        idl_filename_to_component)
 from v8_utilities import (binding_header_basename, v8_class_name,
@@ -198,6 +200,7 @@ def parse_options():
     # TODO(tkent): Remove the option after the great mv. crbug.com/760462
     parser.add_option('--snake-case-generated-files',
                       action='store_true', default=False)
+    add_trace_output_option(parser)
 
     options, _ = parser.parse_args()
     if options.output_directory is None:
@@ -238,12 +241,13 @@ def generate_conditional_features(info_provider, options, idl_filenames):
 def main():
     options = parse_options()
 
-    info_provider = create_component_info_provider(
-        os.path.normpath(options.info_dir), options.target_component.lower())
-    idl_filenames = list(map(str.strip, open(options.idl_files_list)))
+    with tracing(options.trace_output):
+        info_provider = create_component_info_provider(
+            os.path.normpath(options.info_dir), options.target_component.lower())
+        idl_filenames = list(map(str.strip, open(options.idl_files_list)))
 
-    generate_conditional_features(info_provider, options, idl_filenames)
-    return 0
+        generate_conditional_features(info_provider, options, idl_filenames)
+        return 0
 
 
 if __name__ == '__main__':
@@ -45,6 +45,8 @@ import os
 import posixpath
 import sys
 
+from trace_events import add_trace_output_option
+from trace_events import tracing
 from utilities import (get_file_contents, get_first_interface_name_from_idl,
                        read_file_to_list, write_file,
                        get_interface_extended_attributes_from_idl)
@@ -62,6 +64,7 @@ def parse_options():
     parser.add_option('--event-idl-files-list', help='file listing event IDL files')
     parser.add_option('--event-interfaces-file', help='output file')
     parser.add_option('--suffix', help='specify a suffix to the namespace, i.e., "Modules". Default is None.')
+    add_trace_output_option(parser)
 
     options, args = parser.parse_args()
     if options.event_idl_files_list is None:
@@ -127,10 +130,11 @@ def write_event_interfaces_file(event_idl_files, destination_filename, suffix):
 
 def main():
     options = parse_options()
-    event_idl_files = read_file_to_list(options.event_idl_files_list)
-    write_event_interfaces_file(event_idl_files,
-                                options.event_interfaces_file,
-                                options.suffix)
+    with tracing(options.trace_output):
+        event_idl_files = read_file_to_list(options.event_idl_files_list)
+        write_event_interfaces_file(event_idl_files,
+                                    options.event_interfaces_file,
+                                    options.suffix)
 
 
 if __name__ == '__main__':
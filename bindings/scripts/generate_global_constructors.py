@@ -26,6 +26,10 @@ import re
 import sys
 
 from collections import defaultdict
+from trace_events import add_trace_output_option
+from trace_events import tagged_with_idl_file
+from trace_events import trace_event
+from trace_events import tracing
 from utilities import get_file_contents
 from utilities import get_first_interface_name_from_idl
 from utilities import get_interface_exposed_arguments
@@ -50,6 +54,7 @@ def parse_options():
     parser = optparse.OptionParser()
     parser.add_option('--idl-files-list', help='file listing IDL files')
     parser.add_option('--global-objects-file', help='pickle file of global objects')
+    add_trace_output_option(parser)
     options, args = parser.parse_args()
 
     if options.idl_files_list is None:
@@ -153,38 +158,42 @@ def write_global_constructors_partial_interface(interface_name, idl_filename, co
 def main():
     options, args = parse_options()
 
-    # Input IDL files are passed in a file, due to OS command line length
-    # limits. This is generated at GYP time, which is ok b/c files are static.
-    idl_files = read_file_to_list(options.idl_files_list)
-
-    # Output IDL files (to generate) are passed at the command line, since
-    # these are in the build directory, which is determined at build time, not
-    # GYP time.
-    # These are passed as pairs of GlobalObjectName, GlobalObject.idl
-    interface_name_idl_filename = [(args[i], args[i + 1])
-                                   for i in range(0, len(args), 2)]
-
-    interface_name_to_global_names.update(read_pickle_file(options.global_objects_file))
-
-    for idl_filename in idl_files:
-        record_global_constructors(idl_filename)
-
-    # Check for [Exposed] / [Global] mismatch.
-    known_global_names = list(EXPOSED_EXECUTION_CONTEXT_METHOD.keys())
-    exposed_global_names = frozenset(global_name_to_constructors)
-    if not exposed_global_names.issubset(known_global_names):
-        unknown_global_names = exposed_global_names.difference(known_global_names)
-        raise ValueError('The following global names were used in '
-                         '[Exposed=xxx] but do not match any [Global] / '
-                         '[PrimaryGlobal] interface: %s'
-                         % list(unknown_global_names))
-
-    # Write partial interfaces containing constructor attributes for each
-    # global interface.
-    for interface_name, idl_filename in interface_name_idl_filename:
-        constructors = interface_name_to_constructors(interface_name)
-        write_global_constructors_partial_interface(
-            interface_name, idl_filename, constructors)
+    with tracing(options.trace_output):
+        # Input IDL files are passed in a file, due to OS command line length
+        # limits. This is generated at GYP time, which is ok b/c files are
+        # static.
+        idl_files = read_file_to_list(options.idl_files_list)
+
+        # Output IDL files (to generate) are passed at the command line, since
+        # these are in the build directory, which is determined at build time,
+        # not GYP time.
+        # These are passed as pairs of GlobalObjectName, GlobalObject.idl
+        interface_name_idl_filename = [(args[i], args[i + 1])
+                                       for i in range(0, len(args), 2)]
+
+        interface_name_to_global_names.update(read_pickle_file(options.global_objects_file))
+
+        for idl_filename in idl_files:
+            with tagged_with_idl_file(idl_filename):
+                with trace_event('record_global_constructors'):
+                    record_global_constructors(idl_filename)
+
+        # Check for [Exposed] / [Global] mismatch.
+        known_global_names = list(EXPOSED_EXECUTION_CONTEXT_METHOD.keys())
+        exposed_global_names = frozenset(global_name_to_constructors)
+        if not exposed_global_names.issubset(known_global_names):
+            unknown_global_names = exposed_global_names.difference(known_global_names)
+            raise ValueError('The following global names were used in '
+                             '[Exposed=xxx] but do not match any [Global] / '
+                             '[PrimaryGlobal] interface: %s'
+                             % list(unknown_global_names))
+
+        # Write partial interfaces containing constructor attributes for each
+        # global interface.
+        for interface_name, idl_filename in interface_name_idl_filename:
+            constructors = interface_name_to_constructors(interface_name)
+            write_global_constructors_partial_interface(
+                interface_name, idl_filename, constructors)
 
 
 if __name__ == '__main__':
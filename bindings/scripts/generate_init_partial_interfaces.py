@@ -12,6 +12,9 @@ import os
 import posixpath
 import sys
 
+from trace_events import add_trace_output_option
+from trace_events import trace_event
+from trace_events import tracing
 from utilities import get_file_contents
 from utilities import get_first_interface_name_from_idl
 from utilities import read_idl_files_list_from_file
@@ -50,6 +53,7 @@ def parse_options():
     # TODO(tkent): Remove the option after the great mv. crbug.com/760462
     parser.add_option('--snake-case-generated-files',
                       action='store_true', default=False)
+    add_trace_output_option(parser)
 
     options, args = parser.parse_args()
     if options.output is None:
@@ -89,25 +93,27 @@ def extract_meta_data(file_paths):
 def main():
     options = parse_options()
 
-    idl_file_names = read_idl_files_list_from_file(options.idl_files_list, is_gyp_format=options.gyp_format_list)
+    with tracing(options.trace_output):
+        idl_file_names = read_idl_files_list_from_file(options.idl_files_list, is_gyp_format=options.gyp_format_list)
 
-    meta_data_list = extract_meta_data(idl_file_names)
-    interface_names = ['V8%sPartial' % meta_data['basename']
-                       for meta_data in meta_data_list]
-    interface_names.sort()
+        with trace_event('extract_meta_data'):
+            meta_data_list = extract_meta_data(idl_file_names)
+        interface_names = ['V8%sPartial' % meta_data['basename']
+                           for meta_data in meta_data_list]
+        interface_names.sort()
 
-    includes = ['#include "bindings/modules/v8/%s"' %
-                build_basename(interface_name, options.snake_case_generated_files, ext='.h')
-                for interface_name in interface_names]
-    initialize_calls = ['  %s::initialize();' % interface_name
-                        for interface_name in interface_names]
+        includes = ['#include "bindings/modules/v8/%s"' %
+                    build_basename(interface_name, options.snake_case_generated_files, ext='.h')
+                    for interface_name in interface_names]
+        initialize_calls = ['  %s::initialize();' % interface_name
+                            for interface_name in interface_names]
 
-    content = _INIT_PARTIAL_INTERFACE % (
-        _COPYRIGHT,
-        '\n'.join(includes),
-        '\n'.join(initialize_calls))
+        content = _INIT_PARTIAL_INTERFACE % (
+            _COPYRIGHT,
+            '\n'.join(includes),
+            '\n'.join(initialize_calls))
 
-    write_file(content, options.output)
+        write_file(content, options.output)
 
 
 if __name__ == '__main__':
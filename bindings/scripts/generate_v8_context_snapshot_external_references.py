@@ -10,6 +10,10 @@ import posixpath
 
 from code_generator import initialize_jinja_env
 from idl_reader import IdlReader
+from trace_events import add_trace_output_option
+from trace_events import tagged_with_idl_file
+from trace_events import trace_event
+from trace_events import tracing
 from utilities import create_component_info_provider, write_file
 import utilities
 import v8_attributes
@@ -58,6 +62,7 @@ def parse_args():
                         help='target component')
     parser.add_argument('--snake-case-generated-files', action='store_true',
                         default=False)
+    add_trace_output_option(parser)
     return parser.parse_known_args()
 
 
@@ -222,23 +227,26 @@ class ExternalReferenceTableGenerator(object):
         jinja_env = initialize_jinja_env(self._opts.cache_dir)
         context = self._create_template_context()
         cpp_template = jinja_env.get_template(TEMPLATE_FILE)
-        cpp_text = cpp_template.render(context)
+        with trace_event('render_template', template=TEMPLATE_FILE):
+            cpp_text = cpp_template.render(context)
         return cpp_text
 
 
 def main():
     opts, _ = parse_args()
-    # TODO(peria): get rid of |info_provider|
-    info_provider = create_component_info_provider(
-        opts.info_dir, opts.target_component)
-    generator = ExternalReferenceTableGenerator(opts, info_provider)
-
-    idl_files = utilities.read_idl_files_list_from_file(opts.idl_files_list, False)
-    for idl_file in idl_files:
-        generator.process_idl_file(idl_file)
-    output_code = generator.generate()
-    output_path = opts.output
-    write_file(output_code, output_path)
+    with tracing(opts.trace_output):
+        # TODO(peria): get rid of |info_provider|
+        info_provider = create_component_info_provider(
+            opts.info_dir, opts.target_component)
+        generator = ExternalReferenceTableGenerator(opts, info_provider)
+
+        idl_files = utilities.read_idl_files_list_from_file(opts.idl_files_list, False)
+        for idl_file in idl_files:
+            with tagged_with_idl_file(idl_file):
+                generator.process_idl_file(idl_file)
+        output_code = generator.generate()
+        output_path = opts.output
+        write_file(output_code, output_path)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,308 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""A persistent cache of the code generated for IDL files.
+
+Generating the bindings of an interface builds large template contexts and
+renders them, while the outputs only change when the interface, the
+information about the types it uses, or the generator change.  Like ccache
+in direct mode, GeneratedCodeCache looks the outputs up in two steps:
+
+  1. The primary key is a digest of everything generation reads up front:
+     the sources of the generator and of the modules it imports, the
+     templates, the generator class and options,
+     the type information of the info provider (its TypeRegistry, typedefs
+     and union types), and the resolved IdlDefinitions.
+  2. Generation also reads entries of interfaces_info, e.g. those of the
+     ancestors and of the types of members.  The names read and digests of
+     their values are recorded with the outputs, and an entry is only
+     returned if the current interfaces info has the same values for them.
+
+Entries are stored as cache_directory/generated_code/<key[:2]>/<key>, written
+atomically, so that many build processes can share a cache directory.  Hits
+update the modification time of the entry, and each subdirectory is kept
+below 1/256 of the maximum size by removing its least recently used entries.
+"""
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping  # pylint: disable=no-name-in-module
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+import sysconfig
+import types
+
+import code_generator
+from idl_reader import file_digest
+from idl_reader import modules_digest
+from utilities import pickle_dumps_deterministically
+from utilities import write_file_atomically
+
+CACHE_DIRNAME = 'generated_code'
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+# Outputs kept per primary key, for different interfaces info.
+MAX_ENTRIES_PER_KEY = 4
+# Entries are spread over this many subdirectories, by the first two hex
+# digits of their keys.
+SUBDIRECTORY_COUNT = 256
+# The modules whose code the generated code depends on, besides the module
+# of the generator class.  The modules they import are followed, too.
+GENERATOR_MODULE_NAMES = [
+    'code_generator',
+    'code_generator_v8',
+    'idl_definitions',
+    'idl_types',
+    'utilities',
+    'v8_attributes',
+    'v8_callback_function',
+    'v8_callback_interface',
+    'v8_dictionary',
+    'v8_globals',
+    'v8_interface',
+    'v8_methods',
+    'v8_types',
+    'v8_union',
+    'v8_utilities',
+]
+
+
+# Modules of the standard library and installed packages are not followed.
+LIBRARY_DIRS = tuple(
+    os.path.join(os.path.realpath(sysconfig.get_paths()[name]), '')
+    for name in ('stdlib', 'platstdlib', 'purelib', 'platlib'))
+
+
+def imported_modules(modules):
+    """Returns |modules| and the modules they import transitively, except
+    for library modules, sorted by name.
+
+    Both 'import module' and 'from module import name' are found, as the
+    latter leaves a function or class of |module| in the importer."""
+    found = {}
+    pending = list(modules)
+    while pending:
+        module = pending.pop()
+        filename = getattr(module, '__file__', None)
+        if (module.__name__ in found or not filename or
+                not filename.endswith(('.py', '.pyc')) or
+                os.path.realpath(filename).startswith(LIBRARY_DIRS)):
+            continue
+        found[module.__name__] = module
+        for value in list(vars(module).values()):
+            if isinstance(value, types.ModuleType):
+                pending.append(value)
+            elif isinstance(value, (type, types.FunctionType)):
+                imported_module = sys.modules.get(value.__module__)
+                if imported_module:
+                    pending.append(imported_module)
+    return [found[name] for name in sorted(found)]
+
+
+def value_digest(value):
+    return hashlib.sha1(pickle_dumps_deterministically(value)).hexdigest()
+
+
+def templates_digest(templates_dir=code_generator.TEMPLATES_DIR):
+    digest = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(templates_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, templates_dir).encode('utf-8'))
+            digest.update(file_digest(path).encode('ascii'))
+    return digest.hexdigest()
+
+
+class InterfacesInfoReads(Mapping):
+    """Wraps interfaces info, recording digests of the entries read.
+
+    |reads| maps the names looked up to the digests of their values at the
+    first lookup, or to None for names which were not found.  Iterating
+    over the mapping sets |read_all|, as the outputs may then depend on any
+    entry.
+    """
+    def __init__(self, interfaces_info):
+        self.interfaces_info = interfaces_info
+        self.reads = {}
+        self.read_all = False
+
+    def _record(self, name):
+        if name not in self.reads:
+            if name in self.interfaces_info:
+                self.reads[name] = value_digest(self.interfaces_info[name])
+            else:
+                self.reads[name] = None
+
+    def __getitem__(self, name):
+        self._record(name)
+        return self.interfaces_info[name]
+
+    def __contains__(self, name):
+        self._record(name)
+        return self.reads[name] is not None
+
+    def __iter__(self):
+        self.read_all = True
+        return iter(self.interfaces_info)
+
+    def __len__(self):
+        self.read_all = True
+        return len(self.interfaces_info)
+
+
+class GeneratedCodeCache(object):
+    """A persistent cache of the outputs of code generators; see the module
+    docstring."""
+
+    def __init__(self, cache_directory, max_size=DEFAULT_MAX_SIZE):
+        self.cache_directory = os.path.join(cache_directory, CACHE_DIRNAME)
+        self.max_size = max_size
+        generator_modules = imported_modules(
+            [importlib.import_module(name) for name in GENERATOR_MODULE_NAMES])
+        digest = hashlib.sha1()
+        digest.update(modules_digest(generator_modules).encode('ascii'))
+        digest.update(templates_digest().encode('ascii'))
+        # Pickles are not portable across Python major versions.
+        digest.update(('%s:%d' % (code_generator.jinja2.__version__,
+                                  sys.version_info[0])).encode('ascii'))
+        self.version_digest = digest.hexdigest()
+        # id(code generator) -> (code generator, digest of its setup)
+        self._generator_digests = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def statistics(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
+
+    def generator_digest(self, generator):
+        """Returns a digest of the class, options and type information of
+        |generator|, which are fixed once it is created."""
+        entry = self._generator_digests.get(id(generator))
+        if entry is None:
+            info_provider = generator.info_provider
+            registry = generator.type_registry
+            generator_module = sys.modules[type(generator).__module__]
+            entry = self._generator_digests[id(generator)] = (generator, value_digest([
+                modules_digest(imported_modules([generator_module])),
+                type(generator).__module__,
+                type(generator).__name__,
+                type(info_provider).__name__,
+                generator.output_dir,
+                generator.snake_case_generated_files,
+                [registry.ancestors, registry.callback_functions,
+                 registry.callback_interfaces, registry.component_dirs,
+                 registry.dictionaries, registry.enums,
+                 registry.garbage_collected_types,
+                 registry.implemented_as_interfaces],
+                info_provider.typedefs,
+                info_provider.union_types,
+            ]))
+        return entry[1]
+
+    def key(self, generator, definitions, definition_name):
+        """Returns the primary key of generating |definition_name| of
+        |definitions|; to be called before generation, which modifies the
+        definitions."""
+        digest = hashlib.sha1(self.version_digest.encode('ascii'))
+        digest.update(self.generator_digest(generator).encode('ascii'))
+        digest.update(value_digest([definition_name, definitions]).encode('ascii'))
+        return digest.hexdigest()
+
+    def cache_filename(self, key):
+        return os.path.join(self.cache_directory, key[:2], key)
+
+    def load_entries(self, cache_filename):
+        try:
+            with open(cache_filename, 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except Exception:  # pylint: disable=broad-except
+            # Missing or unreadable entries are treated as misses.
+            return []
+
+    def lookup(self, key, interfaces_info):
+        """Returns the cached list of (output path, output code) for |key|,
+        or None on a miss."""
+        cache_filename = self.cache_filename(key)
+        digests = {}
+
+        def current_digest(name):
+            if name not in digests:
+                digests[name] = (value_digest(interfaces_info[name])
+                                 if name in interfaces_info else None)
+            return digests[name]
+
+        for reads, outputs in self.load_entries(cache_filename):
+            if all(current_digest(name) == digest
+                   for name, digest in sorted(reads.items())):
+                self.hits += 1
+                try:
+                    os.utime(cache_filename, None)
+                except OSError:
+                    # Evicted concurrently.
+                    pass
+                return outputs
+        self.misses += 1
+        return None
+
+    def generate(self, generator, definitions, definition_name):
+        """Returns the outputs of generator.generate_code(definitions,
+        definition_name), from the cache if possible."""
+        info_provider = generator.info_provider
+        key = self.key(generator, definitions, definition_name)
+        outputs = self.lookup(key, info_provider.interfaces_info)
+        if outputs is not None:
+            return outputs
+        with info_provider.interfaces_info_wrapped_in(InterfacesInfoReads) as info_reads:
+            outputs = generator.generate_code(definitions, definition_name)
+        if outputs is not None:
+            # Render TemplateOutputs once, for both the cache and the caller.
+            outputs = [(path, str(code)) for path, code in outputs]
+        if not info_reads.read_all:
+            # The generator may choose to omit the files.
+            self.store(key, info_reads.reads, outputs or [])
+        return outputs
+
+    def store(self, key, reads, outputs):
+        cache_filename = self.cache_filename(key)
+        entries = [(reads, outputs)]
+        entries.extend(entry for entry in self.load_entries(cache_filename)
+                       if entry[0] != reads)
+        write_file_atomically(
+            pickle.dumps(entries[:MAX_ENTRIES_PER_KEY], pickle.HIGHEST_PROTOCOL),
+            cache_filename, 'wb')
+        self.evict(os.path.dirname(cache_filename))
+
+    def evict(self, subdirectory):
+        """Removes the least recently used entries of |subdirectory| while it
+        is larger than its share of the maximum size."""
+        max_size = self.max_size // SUBDIRECTORY_COUNT
+        entries = []
+        for entry in os.scandir(subdirectory):
+            if entry.name.startswith('.'):
+                # A temporary file of write_file_atomically().
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= max_size:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except OSError:
+                # Removed concurrently.
+                pass
+            size -= entry_size
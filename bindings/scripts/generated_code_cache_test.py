@@ -0,0 +1,144 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for generated_code_cache.py."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import generated_code_cache
+from generated_code_cache import GeneratedCodeCache
+from generated_code_cache import imported_modules
+from idl_types import TypeRegistry
+from utilities import ComponentInfoProviderCore
+
+
+class FakeCodeGenerator(object):
+    """Generates a file listing the ancestors of the definition."""
+
+    def __init__(self, interfaces_info):
+        self.info_provider = ComponentInfoProviderCore(
+            interfaces_info,
+            {'callback_functions': {}, 'enumerations': {}, 'typedefs': {},
+             'union_types': set()})
+        self.type_registry = TypeRegistry()
+        self.output_dir = 'out'
+        self.snake_case_generated_files = False
+        self.generated = []
+
+    def generate_code(self, definitions, definition_name):
+        self.generated.append(definition_name)
+        interfaces_info = self.info_provider.interfaces_info
+        ancestors = interfaces_info[definition_name]['ancestors']
+        if 'Missing' in interfaces_info:
+            ancestors = ancestors + ['Missing']
+        return [('out/V8%s.h' % definition_name,
+                 '%s: %s' % (definitions['text'], ' '.join(ancestors)))]
+
+
+class GeneratedCodeCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.interfaces_info = {
+            'Node': {'ancestors': ['EventTarget']},
+            'Element': {'ancestors': ['Node', 'EventTarget']},
+        }
+        self.generator = FakeCodeGenerator(self.interfaces_info)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, cache, text='interface', name='Element'):
+        return cache.generate(self.generator, {'text': text}, name)
+
+    def test_hit_skips_generation(self):
+        outputs = self.generate(GeneratedCodeCache(self.temp_dir))
+        cache = GeneratedCodeCache(self.temp_dir)
+        self.assertEqual(self.generate(cache), outputs)
+        self.assertEqual(outputs, [('out/V8Element.h',
+                                    'interface: Node EventTarget')])
+        self.assertEqual(self.generator.generated, ['Element'])
+        self.assertEqual(cache.statistics(),
+                         {'hits': 1, 'misses': 0, 'evictions': 0})
+
+    def test_change_of_definitions_misses(self):
+        cache = GeneratedCodeCache(self.temp_dir)
+        self.generate(cache)
+        self.generate(cache, text='changed interface')
+        self.assertEqual(self.generator.generated, ['Element', 'Element'])
+
+    def test_change_of_interfaces_info_read_misses(self):
+        cache = GeneratedCodeCache(self.temp_dir)
+        self.generate(cache)
+        # Not read when generating Element.
+        self.interfaces_info['Node']['ancestors'] = []
+        self.generate(cache)
+        self.assertEqual(self.generator.generated, ['Element'])
+
+        self.interfaces_info['Element']['ancestors'] = ['Node']
+        self.assertEqual(self.generate(cache),
+                         [('out/V8Element.h', 'interface: Node')])
+        # A name which was not found is recorded, too.
+        self.interfaces_info['Missing'] = {}
+        self.assertEqual(self.generate(cache),
+                         [('out/V8Element.h', 'interface: Node Missing')])
+        self.assertEqual(self.generator.generated, ['Element'] * 3)
+
+        # Entries for earlier interfaces info are kept.
+        del self.interfaces_info['Missing']
+        self.interfaces_info['Element']['ancestors'] = ['Node', 'EventTarget']
+        self.generate(cache)
+        self.assertEqual(self.generator.generated, ['Element'] * 3)
+
+    def write_module(self, name, source):
+        with open(os.path.join(self.temp_dir, name + '.py'), 'w') as module_file:
+            module_file.write(source)
+
+    def test_change_of_imported_module_misses(self):
+        self.write_module('fake_generator_module',
+                          'from fake_generator_dependency import style\n')
+        self.write_module('fake_generator_dependency',
+                          'def style(name):\n    return name\n')
+        sys.path.insert(0, self.temp_dir)
+        self.addCleanup(sys.path.remove, self.temp_dir)
+        for name in ['fake_generator_module', 'fake_generator_dependency']:
+            self.addCleanup(sys.modules.pop, name, None)
+        with mock.patch.object(generated_code_cache, 'GENERATOR_MODULE_NAMES',
+                               ['fake_generator_module']):
+            cache = GeneratedCodeCache(self.temp_dir)
+            self.assertEqual([module.__name__ for module in imported_modules(
+                [sys.modules['fake_generator_module']])],
+                ['fake_generator_dependency', 'fake_generator_module'])
+            self.generate(cache)
+            self.generate(GeneratedCodeCache(self.temp_dir))
+            self.assertEqual(self.generator.generated, ['Element'])
+
+            self.write_module('fake_generator_dependency',
+                              'def style(name):\n    return name.lower()\n')
+            self.generate(GeneratedCodeCache(self.temp_dir))
+            self.assertEqual(self.generator.generated, ['Element', 'Element'])
+
+    def test_evicts_least_recently_used(self):
+        cache = GeneratedCodeCache(self.temp_dir, max_size=256 * 250)
+        subdirectory = os.path.join(self.temp_dir, 'entries')
+        os.makedirs(subdirectory)
+        for index, basename in enumerate(['b', 'a', 'c']):
+            filename = os.path.join(subdirectory, basename)
+            with open(filename, 'wb') as entry_file:
+                entry_file.write(b'x' * 100)
+            os.utime(filename, (index, index))
+        cache.evict(subdirectory)
+        self.assertEqual(sorted(os.listdir(subdirectory)), ['a', 'c'])
+        self.assertEqual(cache.evictions, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
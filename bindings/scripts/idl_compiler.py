@@ -33,21 +33,36 @@ Design doc: http://www.chromium.org/developers/design-documents/idl-compiler
 """
 
 import abc
+import multiprocessing
 from optparse import OptionParser
 import os
 import sys
+import traceback
 
 from code_generator_v8 import CodeGeneratorDictionaryImpl
 from code_generator_v8 import CodeGeneratorV8
 from code_generator_v8 import CodeGeneratorUnionType
 from code_generator_v8 import CodeGeneratorCallbackFunction
+from generated_code_cache import DEFAULT_MAX_SIZE
+from generated_code_cache import GeneratedCodeCache
 from idl_reader import IdlReader
+from idl_types import set_strict_type_traits
+from idl_types import strict_type_traits
+from trace_events import add_events
+from trace_events import add_trace_output_option
+from trace_events import start_tracing
+from trace_events import tagged_with_idl_file
+from trace_events import take_events
+from trace_events import trace_event
+from trace_events import tracing
+from trace_events import tracing_enabled
 from utilities import create_component_info_provider
 from utilities import read_idl_files_list_from_file
 from utilities import write_file
+from v8_types import conversion_cache
 
 
-def parse_options():
+def parse_options(argv=None):
     parser = OptionParser()
     parser.add_option('--cache-directory',
                       help='cache directory, defaults to output directory')
@@ -61,6 +76,33 @@ def parse_options():
     parser.add_option('--output-directory')
     parser.add_option('--impl-output-directory')
     parser.add_option('--info-dir')
+    parser.add_option('--use-info-shards', action='store_true', default=False,
+                      help='read interfaces info lazily from per-interface '
+                      'shards instead of InterfacesInfoOverall.pickle')
+    parser.add_option('--info-depfile',
+                      help='write a depfile listing the interfaces info '
+                      'shards read (implies --use-info-shards)')
+    parser.add_option('--info-depfile-target',
+                      help='target of the depfile, usually the first output')
+    parser.add_option('--conversion-cache-statistics', action='store_true',
+                      default=False,
+                      help='print the hit rates of the memoized type '
+                      'conversions to stderr')
+    parser.add_option('--strict-type-traits', action='store_true',
+                      default=False,
+                      help='fail on reading undefined attributes of IDL types '
+                      'rather than reading None')
+    parser.add_option('--generated-code-cache-directory',
+                      help='directory of a cache of the generated code, which '
+                      'may be shared between builds')
+    parser.add_option('--generated-code-cache-size', type='int',
+                      default=DEFAULT_MAX_SIZE // (1024 * 1024),
+                      help='maximum size of the generated code cache in MiB '
+                      '[default: %default]')
+    parser.add_option('--jobs', type='int', default=1,
+                      help='number of worker processes compiling a list of '
+                      'IDL files')
+    add_trace_output_option(parser)
     # FIXME: We should always explicitly specify --target-component and
     # remove the default behavior.
     parser.add_option('--target-component',
@@ -71,11 +113,20 @@ def parse_options():
     # ensure output comes last, so command line easy to parse via regexes
     parser.disable_interspersed_args()
 
-    options, args = parser.parse_args()
+    options, args = parser.parse_args(argv)
     if options.output_directory is None:
         parser.error('Must specify output directory using --output-directory.')
     if len(args) != 1:
         parser.error('Must specify exactly 1 input file as argument, but %d given.' % len(args))
+    if options.jobs < 1:
+        parser.error('--jobs must be a positive number.')
+    if options.generated_code_cache_size < 1:
+        parser.error('--generated-code-cache-size must be a positive number.')
+    if bool(options.info_depfile) != bool(options.info_depfile_target):
+        parser.error('--info-depfile and --info-depfile-target must be '
+                     'specified together.')
+    if options.info_depfile:
+        options.use_info_shards = True
     idl_filename = os.path.realpath(args[0])
     return options, idl_filename
 
@@ -87,7 +138,9 @@ class IdlCompiler(object, metaclass=abc.ABCMeta):
 
     def __init__(self, output_directory, cache_directory=None,
                  code_generator_class=None, snake_case_generated_files=False,
-                 info_provider=None, target_component=None):
+                 info_provider=None, target_component=None,
+                 generated_code_cache_directory=None,
+                 generated_code_cache_size=DEFAULT_MAX_SIZE):
         """
         Args:
           output_directory: directory to put output files.
@@ -95,6 +148,9 @@ class IdlCompiler(object, metaclass=abc.ABCMeta):
           code_generator_class: code generator class to be used.
           info_provider: component-specific information provider.
           target_component: component to be processed.
+          generated_code_cache_directory: directory of a GeneratedCodeCache
+              to look the outputs up in, if any.
+          generated_code_cache_size: maximum size of the cache in bytes.
         """
         self.cache_directory = cache_directory
         self.info_provider = info_provider
@@ -105,13 +161,23 @@ class IdlCompiler(object, metaclass=abc.ABCMeta):
                                                    self.cache_directory,
                                                    self.output_directory,
                                                    snake_case_generated_files)
+        if generated_code_cache_directory:
+            self.generated_code_cache = GeneratedCodeCache(
+                generated_code_cache_directory, generated_code_cache_size)
+        else:
+            self.generated_code_cache = None
 
     def compile_and_write(self, idl_filename):
         definitions = self.reader.read_idl_definitions(idl_filename)
         target_definitions = definitions[self.target_component]
         interface_name = target_definitions.first_name
-        output_code_list = self.code_generator.generate_code(
-            target_definitions, interface_name)
+        with trace_event('generate_code'):
+            if self.generated_code_cache:
+                output_code_list = self.generated_code_cache.generate(
+                    self.code_generator, target_definitions, interface_name)
+            else:
+                output_code_list = self.code_generator.generate_code(
+                    target_definitions, interface_name)
 
         # Generator may choose to omit the file.
         if output_code_list is None:
@@ -121,35 +187,116 @@ class IdlCompiler(object, metaclass=abc.ABCMeta):
             write_file(output_code, output_path)
 
     def compile_file(self, idl_filename):
-        self.compile_and_write(idl_filename)
+        with tagged_with_idl_file(idl_filename):
+            with trace_event('compile_file'):
+                self.compile_and_write(idl_filename)
+
+
+# Arguments and IdlCompiler of a worker process.  The compiler is created on
+# the first file rather than in the pool initializer, as the pool would keep
+# restarting workers whose initializer raises.
+worker_idl_compiler_args = None
+worker_idl_compiler = None
+
+
+def init_worker(idl_compiler_args, strict, trace):
+    global worker_idl_compiler_args  # pylint: disable=global-statement
+    worker_idl_compiler_args = idl_compiler_args
+    set_strict_type_traits(strict)
+    if trace:
+        start_tracing('%s worker' % os.path.basename(sys.argv[0]))
+
+
+def read_info_filenames(info_provider):
+    """Returns the interfaces info files read so far, if read lazily."""
+    return getattr(info_provider.interfaces_info, 'read_filenames', set())
+
+
+def compile_file_in_worker(idl_filename):
+    """Returns a tuple of None on success or the error message, the
+    interfaces info files read by the worker so far, the statistics of the
+    conversion cache for the file, and the trace events recorded since the
+    last file.
+    """
+    global worker_idl_compiler  # pylint: disable=global-statement
+    conversion_cache.reset_statistics()
+    try:
+        if not worker_idl_compiler:
+            worker_idl_compiler = IdlCompiler(**worker_idl_compiler_args)
+        worker_idl_compiler.compile_file(idl_filename)
+        error = None
+    except Exception:  # pylint: disable=broad-except
+        error = traceback.format_exc()
+    return (error, read_info_filenames(worker_idl_compiler_args['info_provider']),
+            conversion_cache.statistics(), take_events())
+
+
+def compile_files(idl_compiler_args, input_filenames, jobs=1):
+    """Compiles |input_filenames|, using |jobs| worker processes if > 1.
+
+    Each worker builds its IdlCompiler (reader, info provider and Jinja
+    environment) once and compiles many files.  A failure does not stop the
+    other files from being compiled; failures are reported per file.
+
+    Returns the number of files that failed to compile.  Interfaces info files
+    read by the workers are added to those of the given info provider, and
+    the conversion cache statistics and trace events of the workers to those
+    of this process.
+    """
+    if jobs == 1 or len(input_filenames) <= 1:
+        idl_compiler = IdlCompiler(**idl_compiler_args)
+        for idl_filename in input_filenames:
+            idl_compiler.compile_file(idl_filename)
+        return 0
+
+    pool = multiprocessing.Pool(min(jobs, len(input_filenames)),
+                                init_worker,
+                                (idl_compiler_args, strict_type_traits(),
+                                 tracing_enabled()))
+    try:
+        results = pool.map(compile_file_in_worker, input_filenames, chunksize=1)
+    finally:
+        pool.terminate()
+        pool.join()
+    failures = 0
+    read_filenames = read_info_filenames(idl_compiler_args['info_provider'])
+    for idl_filename, result in zip(input_filenames, results):
+        error, worker_read_filenames, statistics, events = result
+        read_filenames.update(worker_read_filenames)
+        conversion_cache.add_statistics(statistics)
+        add_events(events)
+        if error:
+            sys.stderr.write('Failed to compile %s:\n%s\n' % (idl_filename, error))
+            failures += 1
+    return failures
 
 
 def generate_bindings(code_generator_class, info_provider, options,
                       input_filenames):
-    idl_compiler = IdlCompiler(
-        output_directory=options.output_directory,
-        cache_directory=options.cache_directory,
-        code_generator_class=code_generator_class,
-        snake_case_generated_files=options.snake_case_generated_files,
-        info_provider=info_provider,
-        target_component=options.target_component)
-
-    for idl_filename in input_filenames:
-        idl_compiler.compile_file(idl_filename)
+    return compile_files({
+        'output_directory': options.output_directory,
+        'cache_directory': options.cache_directory,
+        'code_generator_class': code_generator_class,
+        'snake_case_generated_files': options.snake_case_generated_files,
+        'info_provider': info_provider,
+        'target_component': options.target_component,
+        'generated_code_cache_directory': options.generated_code_cache_directory,
+        'generated_code_cache_size': options.generated_code_cache_size * 1024 * 1024,
+    }, input_filenames, options.jobs)
 
 
 def generate_dictionary_impl(code_generator_class, info_provider, options,
                              input_filenames):
-    idl_compiler = IdlCompiler(
-        output_directory=options.impl_output_directory,
-        cache_directory=options.cache_directory,
-        code_generator_class=code_generator_class,
-        snake_case_generated_files=options.snake_case_generated_files,
-        info_provider=info_provider,
-        target_component=options.target_component)
-
-    for idl_filename in input_filenames:
-        idl_compiler.compile_file(idl_filename)
+    return compile_files({
+        'output_directory': options.impl_output_directory,
+        'cache_directory': options.cache_directory,
+        'code_generator_class': code_generator_class,
+        'snake_case_generated_files': options.snake_case_generated_files,
+        'info_provider': info_provider,
+        'target_component': options.target_component,
+        'generated_code_cache_directory': options.generated_code_cache_directory,
+        'generated_code_cache_size': options.generated_code_cache_size * 1024 * 1024,
+    }, input_filenames, options.jobs)
 
 
 def generate_union_type_containers(code_generator_class, info_provider,
@@ -160,7 +307,8 @@ def generate_union_type_containers(code_generator_class, info_provider,
         options.output_directory,
         options.snake_case_generated_files,
         options.target_component)
-    output_code_list = generator.generate_code()
+    with trace_event('generate_code'):
+        output_code_list = generator.generate_code()
     for output_path, output_code in output_code_list:
         write_file(output_code, output_path)
 
@@ -173,36 +321,57 @@ def generate_callback_function_impl(code_generator_class, info_provider,
         options.output_directory,
         options.snake_case_generated_files,
         options.target_component)
-    output_code_list = generator.generate_code()
+    with trace_event('generate_code'):
+        output_code_list = generator.generate_code()
     for output_path, output_code in output_code_list:
         write_file(output_code, output_path)
 
 
+def write_info_depfile(info_provider, options):
+    """Writes a depfile listing the interfaces info shards that were read."""
+    dependencies = sorted(read_info_filenames(info_provider))
+    write_file('%s: %s\n' % (
+        options.info_depfile_target,
+        ' '.join(dependency.replace(' ', '\\ ')
+                 for dependency in dependencies)),
+        options.info_depfile)
+
+
 def main():
     options, input_filename = parse_options()
-    info_provider = create_component_info_provider(
-        options.info_dir, options.target_component)
-    if options.generate_impl or options.read_idl_list_from_file:
-        # |input_filename| should be a file which contains a list of IDL
-        # dictionary paths.
-        input_filenames = read_idl_files_list_from_file(input_filename,
-                                                        is_gyp_format=True)
-    else:
-        input_filenames = [input_filename]
-
-    if options.generate_impl:
-        if not info_provider.interfaces_info:
-            raise Exception('Interfaces info is required to generate '
-                            'impl classes')
-        generate_dictionary_impl(CodeGeneratorDictionaryImpl, info_provider,
-                                 options, input_filenames)
-        generate_union_type_containers(CodeGeneratorUnionType, info_provider,
-                                       options)
-        generate_callback_function_impl(CodeGeneratorCallbackFunction,
-                                        info_provider, options)
-    else:
-        generate_bindings(CodeGeneratorV8, info_provider, options,
-                          input_filenames)
+    with tracing(options.trace_output):
+        set_strict_type_traits(options.strict_type_traits)
+        with trace_event('create_component_info_provider'):
+            info_provider = create_component_info_provider(
+                options.info_dir, options.target_component,
+                options.use_info_shards)
+        if options.generate_impl or options.read_idl_list_from_file:
+            # |input_filename| should be a file which contains a list of IDL
+            # dictionary paths.
+            input_filenames = read_idl_files_list_from_file(input_filename,
+                                                            is_gyp_format=True)
+        else:
+            input_filenames = [input_filename]
+
+        if options.generate_impl:
+            if not info_provider.interfaces_info:
+                raise Exception('Interfaces info is required to generate '
+                                'impl classes')
+            failures = generate_dictionary_impl(CodeGeneratorDictionaryImpl,
+                                                info_provider, options,
+                                                input_filenames)
+            generate_union_type_containers(CodeGeneratorUnionType,
+                                           info_provider, options)
+            generate_callback_function_impl(CodeGeneratorCallbackFunction,
+                                            info_provider, options)
+        else:
+            failures = generate_bindings(CodeGeneratorV8, info_provider,
+                                         options, input_filenames)
+        if options.info_depfile:
+            write_info_depfile(info_provider, options)
+        if options.conversion_cache_statistics:
+            sys.stderr.write(conversion_cache.format_statistics() + '\n')
+        return 1 if failures else 0
 
 
 if __name__ == '__main__':
@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=relative-import
+
+"""Thin client of idl_compiler_server.py.
+
+Takes the same arguments as idl_compiler.py, plus --server-socket, and asks a
+running server to compile.  Only the standard library is imported, so the
+client starts quickly.  If no server is listening on the socket, or the
+server closes the connection without a valid response, the client falls back
+to running idl_compiler.py itself.
+
+Usage:
+  idl_compiler_client.py --server-socket PATH [idl_compiler.py arguments]
+  idl_compiler_client.py --server-socket PATH --shutdown
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+MODULE_PATH = os.path.dirname(os.path.realpath(__file__))
+IDL_COMPILER_PATH = os.path.join(MODULE_PATH, 'idl_compiler.py')
+
+
+def send_message(connection, message):
+    connection.sendall(json.dumps(message).encode('utf-8'))
+
+
+def receive_message(connection):
+    """Reads a JSON message; the peer shuts down writing after sending it.
+
+    Raises ValueError if the peer closed the connection without a valid
+    message.
+    """
+    chunks = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    data = b''.join(chunks)
+    if not data:
+        raise ValueError('The connection was closed without a message.')
+    message = json.loads(data.decode('utf-8'))
+    if not isinstance(message, dict):
+        raise ValueError('Invalid message: %r' % message)
+    return message
+
+
+def request(socket_path, message):
+    """Returns the response of the server to |message|.
+
+    Raises socket.error if no server is listening, and ValueError if the
+    server did not respond with a valid response, e.g. because it crashed.
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+        send_message(connection, message)
+        connection.shutdown(socket.SHUT_WR)
+        response = receive_message(connection)
+    finally:
+        connection.close()
+    if response.get('status') not in ('ok', 'error'):
+        raise ValueError('Invalid response: %r' % response)
+    return response
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(allow_abbrev=False)
+    parser.add_argument('--server-socket', required=True,
+                        help='Unix socket of idl_compiler_server.py')
+    parser.add_argument('--shutdown', action='store_true', default=False,
+                        help='stop the server')
+    return parser.parse_known_args(argv)
+
+
+def main(argv):
+    args, compiler_argv = parse_args(argv[1:])
+    if args.shutdown:
+        message = {'command': 'shutdown'}
+    else:
+        message = {
+            'command': 'compile',
+            'argv': compiler_argv,
+            'cwd': os.getcwd(),
+        }
+
+    try:
+        response = request(args.server_socket, message)
+    except (AttributeError, socket.error, ValueError):
+        # No server (or no Unix sockets on this platform), or the server
+        # failed without responding.
+        if args.shutdown:
+            return 0
+        sys.stdout.flush()
+        os.execv(sys.executable,
+                 [sys.executable, IDL_COMPILER_PATH] + compiler_argv)
+
+    sys.stderr.write(response.get('output', ''))
+    if response['status'] != 'ok':
+        sys.stderr.write(response['error'])
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,240 @@
+#!/usr/bin/python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=relative-import
+
+"""Long-lived IDL compiler server.
+
+Running idl_compiler.py once per IDL file pays the full startup cost every
+time: importing jinja2 and PLY, building the parser tables, loading the
+interfaces info pickles and setting up the Jinja environments.  This server
+keeps all of that warm and compiles on behalf of idl_compiler_client.py, which
+build actions invoke with the arguments they would pass to idl_compiler.py.
+
+Requests are handled one at a time, since handling one changes the working
+directory to that of the client and redirects sys.stdout and sys.stderr to
+collect its output, and both are shared by all threads of the process.
+Info providers are reloaded whenever their pickle files change.
+
+Usage:
+  idl_compiler_server.py --socket PATH
+"""
+
+from io import StringIO
+import optparse
+import os
+import socket
+import socketserver
+import sys
+import traceback
+
+from code_generator_v8 import CodeGeneratorCallbackFunction
+from code_generator_v8 import CodeGeneratorDictionaryImpl
+from code_generator_v8 import CodeGeneratorUnionType
+from code_generator_v8 import CodeGeneratorV8
+from idl_compiler import IdlCompiler
+from idl_compiler import parse_options as parse_compiler_options
+from idl_compiler_client import receive_message
+from idl_compiler_client import send_message
+from trace_events import tracing
+from utilities import component_info_provider_files
+from utilities import create_component_info_provider
+from utilities import read_idl_files_list_from_file
+from utilities import write_file
+
+
+def parse_options():
+    parser = optparse.OptionParser()
+    parser.add_option('--socket', help='Unix socket to listen on')
+    options, _ = parser.parse_args()
+    if options.socket is None:
+        parser.error('Must specify a socket using --socket.')
+    return options
+
+
+def files_signature(filenames):
+    signature = []
+    for filename in filenames:
+        stat = os.stat(filename)
+        signature.append((filename, stat.st_mtime, stat.st_size))
+    return tuple(signature)
+
+
+class WarmInfoProvider(object):
+    """An info provider together with the compilers built on top of it."""
+    def __init__(self, info_provider, signature):
+        self.info_provider = info_provider
+        self.signature = signature
+        self.compilers = {}
+        self.generators = {}
+
+
+class IdlCompilerService(object):
+    """Compiles IDL files like idl_compiler.main(), reusing warm objects."""
+    def __init__(self):
+        self.info_providers = {}  # (info_dir, component) -> WarmInfoProvider
+
+    def warm_info_provider(self, info_dir, component):
+        key = (info_dir, component)
+        signature = files_signature(
+            component_info_provider_files(info_dir, component))
+        warm = self.info_providers.get(key)
+        if not warm or warm.signature != signature:
+            warm = WarmInfoProvider(
+                create_component_info_provider(info_dir, component),
+                signature)
+            self.info_providers[key] = warm
+        return warm
+
+    def idl_compiler(self, warm, code_generator_class, output_directory,
+                     options):
+        key = (code_generator_class, output_directory,
+               options.cache_directory, options.snake_case_generated_files,
+               options.target_component,
+               options.generated_code_cache_directory,
+               options.generated_code_cache_size)
+        if key not in warm.compilers:
+            warm.compilers[key] = IdlCompiler(
+                output_directory=output_directory,
+                cache_directory=options.cache_directory,
+                code_generator_class=code_generator_class,
+                snake_case_generated_files=options.snake_case_generated_files,
+                info_provider=warm.info_provider,
+                target_component=options.target_component,
+                generated_code_cache_directory=options.generated_code_cache_directory,
+                generated_code_cache_size=options.generated_code_cache_size * 1024 * 1024)
+        return warm.compilers[key]
+
+    def generator(self, warm, code_generator_class, options):
+        key = (code_generator_class, options.output_directory,
+               options.cache_directory, options.snake_case_generated_files,
+               options.target_component)
+        if key not in warm.generators:
+            warm.generators[key] = code_generator_class(
+                warm.info_provider,
+                options.cache_directory,
+                options.output_directory,
+                options.snake_case_generated_files,
+                options.target_component)
+        return warm.generators[key]
+
+    def generate_and_write(self, generator):
+        for output_path, output_code in generator.generate_code():
+            write_file(output_code, output_path)
+
+    def compile(self, argv):
+        options, input_filename = parse_compiler_options(argv)
+        with tracing(options.trace_output):
+            if options.use_info_shards:
+                # Warm info providers hold the whole interfaces info anyway.
+                raise Exception('Interfaces info shards are not supported by '
+                                'the server; use idl_compiler.py.')
+            warm = self.warm_info_provider(options.info_dir,
+                                           options.target_component)
+            if options.generate_impl or options.read_idl_list_from_file:
+                input_filenames = read_idl_files_list_from_file(input_filename,
+                                                                is_gyp_format=True)
+            else:
+                input_filenames = [input_filename]
+
+            if options.generate_impl:
+                if not warm.info_provider.interfaces_info:
+                    raise Exception('Interfaces info is required to generate '
+                                    'impl classes')
+                idl_compiler = self.idl_compiler(
+                    warm, CodeGeneratorDictionaryImpl,
+                    options.impl_output_directory, options)
+                for idl_filename in input_filenames:
+                    idl_compiler.compile_file(idl_filename)
+                self.generate_and_write(
+                    self.generator(warm, CodeGeneratorUnionType, options))
+                self.generate_and_write(
+                    self.generator(warm, CodeGeneratorCallbackFunction, options))
+            else:
+                idl_compiler = self.idl_compiler(
+                    warm, CodeGeneratorV8, options.output_directory, options)
+                for idl_filename in input_filenames:
+                    idl_compiler.compile_file(idl_filename)
+
+
+class IdlCompilerRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            message = receive_message(self.request)
+        except ValueError:
+            # E.g. a server checking whether this one is running.
+            return
+        # Forward what the compiler prints to the client.
+        output = StringIO()
+        sys.stdout = sys.stderr = output
+        try:
+            if message['command'] == 'shutdown':
+                self.server.should_exit = True
+            elif message['command'] == 'compile':
+                # Paths in the arguments are relative to the client.
+                os.chdir(message['cwd'])
+                self.server.service.compile(message['argv'])
+            else:
+                raise ValueError('Unknown command: %s' % message['command'])
+            response = {'status': 'ok'}
+        except SystemExit:
+            # Option parsing errors; the message is already in |output|.
+            response = {'status': 'error', 'error': ''}
+        except Exception:  # pylint: disable=broad-except
+            response = {'status': 'error', 'error': traceback.format_exc()}
+        finally:
+            sys.stdout = sys.__stdout__
+            sys.stderr = sys.__stderr__
+        response['output'] = output.getvalue()
+        send_message(self.request, response)
+
+
+class IdlCompilerServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path):
+        socketserver.UnixStreamServer.__init__(self, socket_path,
+                                               IdlCompilerRequestHandler)
+        self.service = IdlCompilerService()
+        self.should_exit = False
+
+    def serve_until_shutdown(self):
+        while not self.should_exit:
+            self.handle_request()
+
+
+def remove_stale_socket(socket_path):
+    """Removes a socket left behind by a server that did not exit cleanly.
+
+    Returns False if a server is listening on |socket_path|, which is then
+    left alone.
+    """
+    if not os.path.exists(socket_path):
+        return True
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except ConnectionRefusedError:
+        os.unlink(socket_path)
+        return True
+    finally:
+        connection.close()
+    return False
+
+
+def main():
+    options = parse_options()
+    socket_path = os.path.realpath(options.socket)
+    if not remove_stale_socket(socket_path):
+        sys.stderr.write('A server is already listening on %s.\n' % socket_path)
+        return 1
+    server = IdlCompilerServer(socket_path)
+    try:
+        server.serve_until_shutdown()
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for idl_compiler_server.py and idl_compiler_client.py."""
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import idl_compiler_client
+from idl_compiler_client import request
+from idl_compiler_server import IdlCompilerServer
+from idl_compiler_server import remove_stale_socket
+
+
+class IdlCompilerServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        # Removed after the server is stopped.
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.socket_path = os.path.join(self.temp_dir, 'server.sock')
+
+    def start_server(self):
+        server = IdlCompilerServer(self.socket_path)
+        thread = threading.Thread(target=server.serve_until_shutdown)
+        thread.start()
+
+        def stop_server():
+            if thread.is_alive():
+                request(self.socket_path, {'command': 'shutdown'})
+            thread.join()
+            server.server_close()
+        self.addCleanup(stop_server)
+        return thread
+
+    def compile_request(self, argv):
+        return {'command': 'compile', 'argv': argv, 'cwd': self.temp_dir}
+
+    def test_round_trip(self):
+        thread = self.start_server()
+        # Option errors are reported in the output.
+        response = request(self.socket_path, self.compile_request(['Node.idl']))
+        self.assertEqual(response['status'], 'error')
+        self.assertIn('Must specify output directory', response['output'])
+
+        # Exceptions are reported with their traceback, and the server keeps
+        # serving.
+        response = request(self.socket_path, self.compile_request(
+            ['--output-directory', self.temp_dir,
+             '--info-dir', os.path.join(self.temp_dir, 'missing'),
+             '--target-component', 'core', 'Node.idl']))
+        self.assertEqual(response['status'], 'error')
+        self.assertIn('Traceback', response['error'])
+
+        response = request(self.socket_path, {'command': 'unknown'})
+        self.assertEqual(response['status'], 'error')
+        self.assertIn('Unknown command: unknown', response['error'])
+
+        self.assertEqual(request(self.socket_path, {'command': 'shutdown'}),
+                         {'status': 'ok', 'output': ''})
+        thread.join()
+
+    def test_client_falls_back_without_response(self):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(listener.close)
+        listener.bind(self.socket_path)
+        listener.listen(1)
+
+        def close_without_response():
+            connection, _ = listener.accept()
+            connection.recv(65536)
+            connection.close()
+        thread = threading.Thread(target=close_without_response)
+        thread.start()
+        with mock.patch.object(idl_compiler_client.os, 'execv',
+                               side_effect=SystemExit) as execv:
+            with self.assertRaises(SystemExit):
+                idl_compiler_client.main(
+                    ['idl_compiler_client.py', '--server-socket',
+                     self.socket_path, '--output-directory', 'out', 'Node.idl'])
+        thread.join()
+        self.assertEqual(execv.call_args[0][1][1:],
+                         [idl_compiler_client.IDL_COMPILER_PATH,
+                          '--output-directory', 'out', 'Node.idl'])
+
+    def test_remove_stale_socket(self):
+        self.assertTrue(remove_stale_socket(self.socket_path))
+
+        self.start_server()
+        self.assertFalse(remove_stale_socket(self.socket_path))
+        self.assertTrue(os.path.exists(self.socket_path))
+
+        stale_path = os.path.join(self.temp_dir, 'stale.sock')
+        stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale_socket.bind(stale_path)
+        stale_socket.close()
+        self.assertTrue(remove_stale_socket(stale_path))
+        self.assertFalse(os.path.exists(stale_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
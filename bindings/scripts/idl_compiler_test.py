@@ -0,0 +1,104 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for the batch mode of idl_compiler.py."""
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from idl_compiler import compile_files
+from utilities import ComponentInfoProviderCore
+from utilities import OUTPUT_DIGESTS_BASENAME
+from utilities import OutputDigests
+
+
+class FakeCodeGenerator(object):
+    """Generates a header naming the interface; fails for 'Broken'."""
+
+    def __init__(self, info_provider, cache_dir, output_dir, snake_case):
+        self.info_provider = info_provider
+        self.output_dir = output_dir
+
+    def generate_code(self, definitions, definition_name):
+        if definition_name == 'Broken':
+            raise ValueError('Cannot generate Broken')
+        return [(os.path.join(self.output_dir, definition_name + '.h'),
+                 'class %s;\n' % definition_name)]
+
+
+class CompileFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, 'gen')
+        # Components are named by the directories of the IDL files.
+        self.idl_dir = os.path.join(self.temp_dir, 'core')
+        os.makedirs(self.idl_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_idl_files(self, interface_names):
+        idl_filenames = []
+        for interface_name in interface_names:
+            idl_filename = os.path.join(self.idl_dir, interface_name + '.idl')
+            with open(idl_filename, 'w') as idl_file:
+                idl_file.write('interface %s { void f(); };\n' % interface_name)
+            idl_filenames.append(idl_filename)
+        return idl_filenames
+
+    def compile_files(self, idl_filenames, jobs):
+        info_provider = ComponentInfoProviderCore(
+            {}, {'callback_functions': {}, 'enumerations': {}, 'typedefs': {},
+                 'union_types': set()})
+        idl_compiler_args = {
+            'output_directory': self.output_dir,
+            'code_generator_class': FakeCodeGenerator,
+            'info_provider': info_provider,
+            'target_component': 'core',
+        }
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            failures = compile_files(idl_compiler_args, idl_filenames, jobs)
+        return failures, stderr.getvalue()
+
+    def output_filenames(self):
+        return sorted(basename for basename in os.listdir(self.output_dir)
+                      if basename != OUTPUT_DIGESTS_BASENAME)
+
+    def test_jobs(self):
+        interface_names = ['Node', 'Element', 'Document', 'Window', 'Event']
+        failures, errors = self.compile_files(
+            self.write_idl_files(interface_names), jobs=3)
+        self.assertEqual((failures, errors), (0, ''))
+        self.assertEqual(self.output_filenames(),
+                         sorted(name + '.h' for name in interface_names))
+        with open(os.path.join(self.output_dir, 'Node.h')) as output_file:
+            self.assertEqual(output_file.read(), 'class Node;\n')
+        # The digests of the files written by all workers are saved.
+        digests = OutputDigests(self.output_dir)
+        for name in interface_names:
+            self.assertEqual(
+                digests.digest(os.path.join(self.output_dir, name + '.h')),
+                hashlib.sha1(('class %s;\n' % name).encode('utf-8')).hexdigest())
+
+    def test_failures_are_reported_per_file(self):
+        idl_filenames = self.write_idl_files(['Node', 'Broken', 'Element'])
+        failures, errors = self.compile_files(idl_filenames, jobs=2)
+        self.assertEqual(failures, 1)
+        self.assertIn('Failed to compile %s:\n' % idl_filenames[1], errors)
+        self.assertIn('ValueError: Cannot generate Broken', errors)
+        self.assertNotIn('Node.idl', errors)
+        # The other files are compiled.
+        self.assertEqual(self.output_filenames(), ['Element.h', 'Node.h'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,15 +32,28 @@ Design doc:
 http://www.chromium.org/developers/design-documents/idl-compiler#TOC-Front-end
 """
 
+import hashlib
 import os
+import pickle
+import sys
 
+import blink_idl_lexer
 import blink_idl_parser
 from blink_idl_parser import BlinkIDLParser
+import idl_definitions
 from idl_definitions import IdlDefinitions
-from idl_validator import EXTENDED_ATTRIBUTES_RELATIVE_PATH, IDLInvalidExtendedAttributeError, IDLExtendedAttributeValidator
+import idl_types
+import idl_validator
+from idl_validator import EXTENDED_ATTRIBUTES_FILENAME, EXTENDED_ATTRIBUTES_RELATIVE_PATH, IDLInvalidExtendedAttributeError, IDLExtendedAttributeValidator
 from interface_dependency_resolver import InterfaceDependencyResolver
+from trace_events import trace_event
+import utilities
 from utilities import idl_filename_to_component
 from utilities import to_snake_case
+from utilities import write_file_atomically
+
+# Subdirectory of the cache directory holding pickled IdlDefinitions.
+DEFINITIONS_CACHE_DIRNAME = 'idl_definitions_cache'
 
 
 def validate_blink_idl_definitions(idl_filename, idl_file_basename,
@@ -80,6 +93,74 @@ def validate_blink_idl_definitions(idl_filename, idl_file_basename,
             .format(target.name, idl_file_basename))
 
 
+def file_digest(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def modules_digest(modules):
+    """Returns a digest of the source files of the given Python modules."""
+    digest = hashlib.sha1()
+    for module in modules:
+        # Hash the source rather than a possibly stale .pyc.
+        source_filename = os.path.splitext(module.__file__)[0] + '.py'
+        digest.update(file_digest(source_filename).encode('ascii'))
+    return digest.hexdigest()
+
+
+class IdlDefinitionsCache(object):
+    """A persistent cache of parsed and validated IdlDefinitions objects.
+
+    Entries are keyed by a digest of the IDL file contents, the front end
+    (lexer, parser and IR classes) sources and IDLExtendedAttributes.txt, so a
+    cache directory can be shared between build steps and processes without
+    ever returning stale definitions.  Each lookup unpickles a fresh object,
+    hence callers may modify the returned definitions in place.
+    """
+    def __init__(self, cache_directory, multi_interface=False):
+        self.cache_directory = os.path.join(cache_directory,
+                                            DEFINITIONS_CACHE_DIRNAME)
+        base_parser_module = sys.modules[blink_idl_parser.IDLParser.__module__]
+        # Validation is part of reading, so its modules count, too.
+        front_end_modules = [
+            blink_idl_lexer, blink_idl_parser, idl_definitions, idl_types,
+            idl_validator, utilities, sys.modules[__name__],
+            sys.modules[blink_idl_lexer.IDLLexer.__module__],
+            base_parser_module,
+            sys.modules[base_parser_module.IDLNode.__module__],
+        ]
+        digest = hashlib.sha1()
+        digest.update(modules_digest(front_end_modules).encode('ascii'))
+        digest.update(file_digest(EXTENDED_ATTRIBUTES_FILENAME).encode('ascii'))
+        # Validation differs in multi-interface mode, and pickles are not
+        # portable across Python major versions.
+        digest.update(('%s:%d' % (multi_interface, sys.version_info[0])).encode('ascii'))
+        self.version_digest = digest.hexdigest()
+
+    def cache_filename(self, idl_filename):
+        digest = hashlib.sha1(self.version_digest.encode('ascii'))
+        # The file path is part of the key because parsed nodes and
+        # validation depend on it, not only on the contents.
+        digest.update(os.path.realpath(idl_filename).encode('utf-8'))
+        digest.update(file_digest(idl_filename).encode('ascii'))
+        key = digest.hexdigest()
+        return os.path.join(self.cache_directory, key[:2], key + '.pickle')
+
+    def load(self, cache_filename):
+        """Returns the cached IdlDefinitions, or None on a cache miss."""
+        try:
+            with open(cache_filename, 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except Exception:  # pylint: disable=broad-except
+            # Missing or unreadable entries are treated as misses.
+            return None
+
+    def store(self, cache_filename, definitions):
+        write_file_atomically(
+            pickle.dumps(definitions, pickle.HIGHEST_PROTOCOL),
+            cache_filename, 'wb')
+
+
 class IdlReader(object):
     # FIXMEDART: Added multi_interface argument and property for IdlReader class.
     def __init__(self, interfaces_info=None, outputdir='', multi_interface=False):
@@ -93,11 +174,17 @@ class IdlReader(object):
         else:
             self.interface_dependency_resolver = None
 
-        self.parser = BlinkIDLParser(outputdir=outputdir)
+        self.parser = BlinkIDLParser()
+
+        if outputdir:
+            self.definitions_cache = IdlDefinitionsCache(outputdir, multi_interface)
+        else:
+            self.definitions_cache = None
 
     def read_idl_definitions(self, idl_filename):
         """Returns a dictionary whose key is component and value is an IdlDefinitions object for an IDL file, including all dependencies."""
-        definitions = self.read_idl_file(idl_filename)
+        with trace_event('read_idl_file'):
+            definitions = self.read_idl_file(idl_filename)
         component = idl_filename_to_component(idl_filename)
 
         if not self.interface_dependency_resolver:
@@ -108,19 +195,35 @@ class IdlReader(object):
         if not definitions.interfaces:
             return {component: definitions}
 
-        return self.interface_dependency_resolver.resolve_dependencies(definitions, component)
+        with trace_event('resolve_dependencies'):
+            return self.interface_dependency_resolver.resolve_dependencies(definitions, component)
 
     def read_idl_file(self, idl_filename):
         """Returns an IdlDefinitions object for an IDL file, without any dependencies.
 
         The IdlDefinitions object is guaranteed to contain a single
         IdlInterface; it may also contain other definitions, such as
-        callback functions and enumerations."""
-        ast = blink_idl_parser.parse_file(self.parser, idl_filename)
-        if not ast:
-            raise Exception('Failed to parse %s' % idl_filename)
+        callback functions and enumerations.
+
+        If a cache directory was given, parsed definitions are cached there
+        and reused by later reads of an unchanged file."""
+        if not self.definitions_cache:
+            return self.parse_and_validate_idl_file(idl_filename)
+
+        cache_filename = self.definitions_cache.cache_filename(idl_filename)
+        definitions = self.definitions_cache.load(cache_filename)
+        if definitions is None:
+            definitions = self.parse_and_validate_idl_file(idl_filename)
+            self.definitions_cache.store(cache_filename, definitions)
+        return definitions
+
+    def parse_and_validate_idl_file(self, idl_filename):
+        with trace_event('parse_idl_file'):
+            ast = blink_idl_parser.parse_file(self.parser, idl_filename)
+            if not ast:
+                raise Exception('Failed to parse %s' % idl_filename)
+            definitions = IdlDefinitions(ast)
         idl_file_basename, _ = os.path.splitext(os.path.basename(idl_filename))
-        definitions = IdlDefinitions(ast)
 
         # FIXMEDART: Added multi_interface.
         if not self.multi_interface:
@@ -0,0 +1,87 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for idl_reader.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import idl_reader
+from idl_reader import DEFINITIONS_CACHE_DIRNAME
+from idl_reader import IdlReader
+
+
+class IdlDefinitionsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.idl_filename = os.path.join(self.temp_dir, 'TestInterface.idl')
+        self.write_idl('interface TestInterface { attribute long foo; };')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_idl(self, text):
+        with open(self.idl_filename, 'w') as idl_file:
+            idl_file.write(text)
+
+    def cached_entries(self):
+        cache_dir = os.path.join(self.temp_dir, DEFINITIONS_CACHE_DIRNAME)
+        return [filename
+                for _, _, filenames in os.walk(cache_dir)
+                for filename in filenames]
+
+    def test_reuses_cached_definitions(self):
+        reader = IdlReader(outputdir=self.temp_dir)
+        definitions = reader.read_idl_file(self.idl_filename)
+        self.assertEqual(len(self.cached_entries()), 1)
+
+        # A new reader (as in a later build step) must not reparse the file.
+        reader = IdlReader(outputdir=self.temp_dir)
+        reader.parse_and_validate_idl_file = None
+        cached_definitions = reader.read_idl_file(self.idl_filename)
+        interface = cached_definitions.interfaces['TestInterface']
+        self.assertEqual([attribute.name for attribute in interface.attributes],
+                         ['foo'])
+        self.assertIsNot(cached_definitions, definitions)
+
+    def test_changed_file_is_reparsed(self):
+        reader = IdlReader(outputdir=self.temp_dir)
+        reader.read_idl_file(self.idl_filename)
+        self.write_idl('interface TestInterface { attribute long bar; };')
+        definitions = reader.read_idl_file(self.idl_filename)
+        interface = definitions.interfaces['TestInterface']
+        self.assertEqual([attribute.name for attribute in interface.attributes],
+                         ['bar'])
+        self.assertEqual(len(self.cached_entries()), 2)
+
+    def test_changed_validation_invalidates_cache(self):
+        version_digest = IdlReader(
+            outputdir=self.temp_dir).definitions_cache.version_digest
+        file_digest = idl_reader.file_digest
+        for module_filename in ['idl_validator.py', 'utilities.py']:
+            def changed_file_digest(filename):
+                if os.path.basename(filename) == module_filename:
+                    return 'changed'
+                return file_digest(filename)
+            with mock.patch.object(idl_reader, 'file_digest',
+                                   changed_file_digest):
+                reader = IdlReader(outputdir=self.temp_dir)
+            self.assertNotEqual(reader.definitions_cache.version_digest,
+                                version_digest)
+
+    def test_no_cache_without_output_directory(self):
+        reader = IdlReader()
+        self.assertIsNone(reader.definitions_cache)
+        reader.read_idl_file(self.idl_filename)
+        self.assertEqual(self.cached_entries(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
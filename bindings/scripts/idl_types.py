@@ -13,8 +13,29 @@ IdlTypeBase
  IdlNullableType
 
 IdlTypes are picklable because we store them in interfaces_info.
+
+IdlTypes are interned: constructing a type which is structurally identical to
+an existing one (same class, base type, extended attributes and inner types)
+returns the existing instance, as long as that one is in use.  Hence IdlTypes
+are immutable; e.g. resolve_typedefs() returns a new type rather than
+modifying |self|.  All IdlTypes are hashable and compare structurally, except
+IdlUnionType, which compares by name.
+
+Type traits (is_nullable, is_dictionary, is_interface_type, ...) are declared
+with defaults on IdlTypeBase, and computed once per type by the classes which
+have them, so that querying them is a plain attribute read; see TypeTrait.
+Reading an attribute which is not a trait nor otherwise defined returns None,
+unless strict type traits are set, in which case it raises AttributeError.
+
+Information about the types defined by all IDL files (ancestors of interfaces,
+dictionaries, enums, ...) is kept in a TypeRegistry.  Code generators run with
+their own registry, made current with use_type_registry(), so that generators
+with different information can run concurrently in threads.
 """
 
+import contextlib
+import contextvars
+import weakref
 from collections import defaultdict
 
 
@@ -93,31 +114,271 @@ STANDARD_CALLBACK_FUNCTIONS = frozenset([
 
 
 ################################################################################
-# Inheritance
+# Type information
 ################################################################################
 
-ancestors = defaultdict(list)  # interface_name -> ancestors
+class TypeRegistry(object):
+    """Information about the types defined by a set of IDL files.
+
+    Traits and conversions of types which depend on the information are cached
+    in the registry, keyed by type, and dropped by changed().
+    """
+
+    def __init__(self):
+        self.ancestors = defaultdict(list)  # interface_name -> ancestors
+        self.callback_functions = {}
+        self.callback_interfaces = set()
+        self.component_dirs = {}  # interface_name -> 'core' or 'modules'
+        self.dictionaries = set()
+        self.enums = {}  # name -> values
+        self.garbage_collected_types = set()
+        self.implemented_as_interfaces = {}
+        # id(idl_type) -> (idl_type, {key: value}); holding the type keeps
+        # its id unique.
+        self._cached_values = {}
+        # name -> {key: value}, for values which depend on several types.
+        self._caches = {}
+
+    def changed(self):
+        """Drops the cached values; to be called after changing the
+        information."""
+        self._cached_values.clear()
+        self._caches.clear()
+
+    def cached_values(self, idl_type):
+        """Returns the dict of cached values of |idl_type|."""
+        entry = self._cached_values.get(id(idl_type))
+        if entry is None:
+            entry = self._cached_values[id(idl_type)] = (idl_type, {})
+        return entry[1]
+
+    def cache(self, name):
+        """Returns the dict |name| of cached values keyed by other than a
+        single type, e.g. by the signatures of overloaded methods."""
+        return self._caches.setdefault(name, {})
+
+
+# The registry used outside of use_type_registry(), e.g. by the scripts
+# computing the interfaces info, and by new threads.
+_default_type_registry = TypeRegistry()
+_current_type_registry = contextvars.ContextVar('type_registry')
+
+
+def current_type_registry():
+    return _current_type_registry.get(_default_type_registry)
+
+
+@contextlib.contextmanager
+def use_type_registry(registry):
+    """Makes |registry| the current registry of this thread (or asyncio
+    task) within the with statement."""
+    token = _current_type_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_type_registry.reset(token)
+
+
+################################################################################
+# Inheritance
+################################################################################
 
 def inherits_interface(interface_name, ancestor_name):
     return (interface_name == ancestor_name or
-            ancestor_name in ancestors[interface_name])
+            ancestor_name in current_type_registry().ancestors[interface_name])
 
 
 def set_ancestors(new_ancestors):
-    ancestors.update(new_ancestors)
+    registry = current_type_registry()
+    registry.ancestors.update(new_ancestors)
+    registry.changed()
+
+
+################################################################################
+# Type traits
+################################################################################
+
+_strict_type_traits = [False]
+
+
+def set_strict_type_traits(strict):
+    """Makes reading attributes of IdlTypes which are neither type traits nor
+    otherwise defined raise AttributeError, rather than return None."""
+    _strict_type_traits[0] = strict
+
+
+def strict_type_traits():
+    return _strict_type_traits[0]
+
+
+class TypeTrait(object):
+    """A trait of IdlTypes, computed once per type.
+
+    The value is stored in the type's __dict__, which then shadows this
+    (non-data) descriptor, so that later reads are plain attribute reads.
+    Values of traits depending on type information are stored in the current
+    TypeRegistry instead.
+    """
+
+    def __init__(self, compute, uses_type_info=False, name=None):
+        self.compute = compute
+        self.uses_type_info = uses_type_info
+        self.name = name or compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, idl_type, owner=None):
+        if idl_type is None:
+            return self
+        if not self.uses_type_info:
+            value = idl_type.__dict__[self.name] = self.compute(idl_type)
+            return value
+        # current_type_registry().cached_values(idl_type), inlined.
+        registry = _current_type_registry.get(_default_type_registry)
+        entry = registry._cached_values.get(id(idl_type))  # pylint: disable=protected-access
+        if entry is None:
+            values = registry.cached_values(idl_type)
+        else:
+            values = entry[1]
+        try:
+            return values[self.name]
+        except KeyError:
+            value = values[self.name] = self.compute(idl_type)
+            return value
+
+
+def type_trait(compute, name=None):
+    """Decorates a method computing a trait which depends on the type only.
+
+    |name| is needed if the trait is set on a class after its definition, and
+    |compute| is a lambda.
+    """
+    return TypeTrait(compute, name=name)
+
+
+def type_info_trait(compute, name=None):
+    """Decorates a method computing a trait which depends on global type
+    information too."""
+    return TypeTrait(compute, uses_type_info=True, name=name)
 
 
-class IdlTypeBase(object):
+# trait name -> value for types which do not have the trait
+TYPE_TRAIT_DEFAULTS = {}
+
+
+def declare_type_traits(defaults):
+    """Declares type traits and their values for types which do not have them.
+
+    Nullable types take the traits they do not define from their inner type.
+    """
+    for name, default in defaults.items():
+        TYPE_TRAIT_DEFAULTS[name] = default
+        setattr(IdlTypeBase, name, default)
+        if name not in IdlNullableType.__dict__:
+            setattr(IdlNullableType, name, InnerTypeTrait(name))
+
+
+class InnerTypeTrait(TypeTrait):
+    """A trait of nullable types taken from their inner type."""
+
+    def __init__(self, name):
+        super(InnerTypeTrait, self).__init__(
+            lambda idl_type: getattr(idl_type.inner_type, name),
+            uses_type_info=True, name=name)
+
+    def __get__(self, idl_type, owner=None):
+        if idl_type is None:
+            return self
+        # Traits of the inner type which are not computed (class or instance
+        # attributes) or do not depend on type information are stored on the
+        # nullable type, too.
+        inner_trait = getattr(type(idl_type.inner_type), self.name)
+        if isinstance(inner_trait, TypeTrait):
+            uses_type_info = inner_trait.uses_type_info
+        else:
+            uses_type_info = hasattr(inner_trait, '__get__')
+        if not uses_type_info:
+            value = idl_type.__dict__[self.name] = self.compute(idl_type)
+            return value
+        return super(InnerTypeTrait, self).__get__(idl_type, owner)
+
+
+################################################################################
+# Interning
+################################################################################
+
+# (class, interning key) -> the shared instance.  Types are only kept alive by
+# their users, so that long-lived processes do not accumulate them.
+_interned_types = weakref.WeakValueDictionary()
+
+
+def freeze(value):
+    """Returns a hashable equivalent of an extended attribute value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class IdlTypeMeta(type):
+    """Interns the instances of IdlTypes."""
+
+    def __call__(cls, *args, **kwargs):
+        idl_type = super(IdlTypeMeta, cls).__call__(*args, **kwargs)
+        try:
+            key = (cls, freeze(idl_type.interning_key()))
+            return _interned_types.setdefault(key, idl_type)
+        except TypeError:
+            # Unhashable extended attribute values; not shared.
+            return idl_type
+
+
+def interned_types_count():
+    return len(_interned_types)
+
+
+class IdlTypeBase(object, metaclass=IdlTypeMeta):
     """Base class for IdlType, IdlUnionType, IdlArrayOrSequenceType and IdlNullableType."""
 
+    def interning_key(self):
+        """Returns the arguments to construct the type with, which identify
+        it within its class."""
+        raise NotImplementedError(
+            'interning_key() should be defined in subclasses')
+
+    def __reduce__(self):
+        # Unpickled types are interned, too.
+        return type(self), self.interning_key()
+
+    def __eq__(self, rhs):
+        if self is rhs:
+            return True
+        if not isinstance(rhs, IdlTypeBase):
+            return NotImplemented
+        return (type(self) is type(rhs) and
+                self.interning_key() == rhs.interning_key())
+
+    def __hash__(self):
+        # Types are immutable, so the hash is computed once.
+        if '_hash' not in self.__dict__:
+            self.__dict__['_hash'] = hash(
+                (type(self).__name__, freeze(self.interning_key())))
+        return self.__dict__['_hash']
+
     def __str__(self):
         raise NotImplementedError(
             '__str__() should be defined in subclasses')
 
     def __getattr__(self, name):
-        # Default undefined attributes to None (analogous to Jinja variables).
-        # This allows us to not define default properties in the base class, and
-        # allows us to relay __getattr__ in IdlNullableType to the inner type.
+        # Only reached for attributes which are neither type traits (see
+        # declare_type_traits()) nor defined by the type's class.  These
+        # default to None (analogous to Jinja variables).
+        if _strict_type_traits[0] or name.startswith('__'):
+            raise AttributeError('%s has no attribute %r' % (
+                type(self).__name__, name))
         return None
 
     def resolve_typedefs(self, typedefs):
@@ -138,10 +399,6 @@ class IdlType(IdlTypeBase):
     # FIXME: incorporate Nullable, etc.
     # to support types like short?[] vs. short[]?, instead of treating these
     # as orthogonal properties (via flags).
-    callback_functions = {}
-    callback_interfaces = set()
-    dictionaries = set()
-    enums = {}  # name -> values
 
     def __init__(self, base_type, is_unrestricted=False, extended_attributes=None):
         super(IdlType, self).__init__()
@@ -149,82 +406,81 @@ class IdlType(IdlTypeBase):
             self.base_type = 'unrestricted %s' % base_type
         else:
             self.base_type = base_type
+        # Copied, as the type may be shared while the caller's dict changes.
+        if extended_attributes is not None:
+            extended_attributes = dict(extended_attributes)
         self.extended_attributes = extended_attributes
 
     def __str__(self):
         return self.base_type
 
-    def __getstate__(self):
-        return {
-            'base_type': self.base_type,
-            'extended_attributes': self.extended_attributes,
-        }
+    def interning_key(self):
+        return (self.base_type, False, self.extended_attributes)
 
-    def __setstate__(self, state):
-        self.base_type = state['base_type']
-        self.extended_attributes = state['extended_attributes']
-
-    def set_extended_attributes(self, extended_attributes):
-        self.extended_attributes = extended_attributes
+    def with_extended_attributes(self, extended_attributes):
+        return IdlType(self.base_type, extended_attributes=extended_attributes)
 
-    @property
+    @type_trait
     def is_basic_type(self):
         return self.base_type in BASIC_TYPES
 
-    @property
+    @type_info_trait
     def is_callback_function(self):  # pylint: disable=C0103
-        return self.base_type in IdlType.callback_functions or self.base_type in STANDARD_CALLBACK_FUNCTIONS
+        return (self.base_type in current_type_registry().callback_functions or
+                self.base_type in STANDARD_CALLBACK_FUNCTIONS)
 
-    @property
+    @type_info_trait
     def is_custom_callback_function(self):
         # Treat standard callback functions as custom as they aren't generated.
         if self.base_type in STANDARD_CALLBACK_FUNCTIONS:
             return True
-        entry = IdlType.callback_functions.get(self.base_type)
+        entry = current_type_registry().callback_functions.get(self.base_type)
+        if not entry:
+            return False
         callback_function = entry.get('callback_function')
         if not callback_function:
             return False
         return 'Custom' in callback_function.extended_attributes
 
-    @property
+    @type_info_trait
     def is_callback_interface(self):
-        return self.base_type in IdlType.callback_interfaces
+        return self.base_type in current_type_registry().callback_interfaces
 
-    @property
+    @type_info_trait
     def is_dictionary(self):
-        return self.base_type in IdlType.dictionaries
+        return self.base_type in current_type_registry().dictionaries
 
-    @property
+    @type_info_trait
     def is_enum(self):
         # FIXME: add an IdlEnumType class and a resolve_enums step at end of
         # IdlDefinitions constructor
-        return self.name in IdlType.enums
+        return self.name in current_type_registry().enums
 
-    @property
+    @type_info_trait
     def enum_values(self):
-        return IdlType.enums.get(self.name)
+        return current_type_registry().enums.get(self.name)
 
-    @property
+    @type_info_trait
     def enum_type(self):
         return self.name if self.is_enum else None
 
-    @property
+    @type_trait
     def is_integer_type(self):
         return self.base_type in INTEGER_TYPES
 
-    @property
+    @type_trait
     def is_void(self):
         return self.base_type == 'void'
 
-    @property
+    @type_trait
     def is_numeric_type(self):
         return self.base_type in NUMERIC_TYPES
 
-    @property
+    @type_trait
     def is_primitive_type(self):
         return self.base_type in PRIMITIVE_TYPES
 
-    @property
+    @type_info_trait
     def is_interface_type(self):
         # Anything that is not another type is an interface type.
         # http://www.w3.org/TR/WebIDL/#idl-types
@@ -238,11 +494,11 @@ class IdlType(IdlTypeBase):
                    self.name == 'Object' or
                    self.name == 'Promise')  # Promise will be basic in future
 
-    @property
+    @type_trait
     def is_string_type(self):
         return self.name in STRING_TYPES
 
-    @property
+    @type_trait
     def name(self):
         """Return type name
 
@@ -251,21 +507,30 @@ class IdlType(IdlTypeBase):
         base_type = self.base_type
         return TYPE_NAMES.get(base_type, base_type)
 
-    @classmethod
-    def set_callback_functions(cls, new_callback_functions):
-        cls.callback_functions.update(new_callback_functions)
-
-    @classmethod
-    def set_callback_interfaces(cls, new_callback_interfaces):
-        cls.callback_interfaces.update(new_callback_interfaces)
-
-    @classmethod
-    def set_dictionaries(cls, new_dictionaries):
-        cls.dictionaries.update(new_dictionaries)
-
-    @classmethod
-    def set_enums(cls, new_enums):
-        cls.enums.update(new_enums)
+    # The set_*() methods add to the current type registry.
+    @staticmethod
+    def set_callback_functions(new_callback_functions):
+        registry = current_type_registry()
+        registry.callback_functions.update(new_callback_functions)
+        registry.changed()
+
+    @staticmethod
+    def set_callback_interfaces(new_callback_interfaces):
+        registry = current_type_registry()
+        registry.callback_interfaces.update(new_callback_interfaces)
+        registry.changed()
+
+    @staticmethod
+    def set_dictionaries(new_dictionaries):
+        registry = current_type_registry()
+        registry.dictionaries.update(new_dictionaries)
+        registry.changed()
+
+    @staticmethod
+    def set_enums(new_enums):
+        registry = current_type_registry()
+        registry.enums.update(new_enums)
+        registry.changed()
 
     def resolve_typedefs(self, typedefs):
         # This function either returns |self| or a different object.
@@ -279,40 +544,37 @@ class IdlType(IdlTypeBase):
 
 class IdlUnionType(IdlTypeBase):
     # http://heycam.github.io/webidl/#idl-union
-    # IdlUnionType has __hash__() and __eq__() methods because they are stored
-    # in sets.
+    # Union types compare by name rather than structurally, as union
+    # containers are generated per name; see v8_union.py.
     def __init__(self, member_types):
         super(IdlUnionType, self).__init__()
-        self.member_types = member_types
+        self.member_types = list(member_types)
 
     def __str__(self):
         return '(' + ' or '.join(str(member_type) for member_type in self.member_types) + ')'
 
+    def interning_key(self):
+        return (tuple(self.member_types),)
+
     def __hash__(self):
         return hash(self.name)
 
     def __eq__(self, rhs):
+        if not isinstance(rhs, IdlTypeBase):
+            return NotImplemented
         return self.name == rhs.name
 
-    def __getstate__(self):
-        return {
-            'member_types': self.member_types,
-        }
-
-    def __setstate__(self, state):
-        self.member_types = state['member_types']
-
     @property
     def flattened_member_types(self):
         """Returns the set of the union's flattened member types.
 
         https://heycam.github.io/webidl/#dfn-flattened-union-member-types
         """
-        # We cannot use a set directly because each member is an IdlTypeBase-derived class, and
-        # comparing two objects of the same type is not the same as comparing their names. In
-        # other words:
-        #   x = IdlType('ByteString')
-        #   y = IdlType('ByteString')
+        # We cannot use a set directly because types compare structurally,
+        # and types of the same name may differ, e.g. in their extended
+        # attributes:
+        #   x = IdlType('long', extended_attributes={'Clamp': None})
+        #   y = IdlType('long')
         #   x == y  # False
         #   x.name == y.name  # True
         # |flattened_members|'s keys are type names, the values are type |objects.
@@ -343,9 +605,7 @@ class IdlUnionType(IdlTypeBase):
                 count += member.number_of_nullable_member_types
         return count
 
-    @property
-    def is_union_type(self):
-        return True
+    is_union_type = True
 
     def single_matching_member_type(self, predicate):
         matching_types = list(filter(predicate, self.flattened_member_types))
@@ -374,7 +634,7 @@ class IdlUnionType(IdlTypeBase):
         # Note: Use this to "look through" a possible IdlNullableType wrapper.
         return self
 
-    @property
+    @type_trait
     def name(self):
         """Return type name (or inner type name if nullable)
 
@@ -383,10 +643,12 @@ class IdlUnionType(IdlTypeBase):
         return 'Or'.join(member_type.name for member_type in self.member_types)
 
     def resolve_typedefs(self, typedefs):
-        self.member_types = [
-            member_type.resolve_typedefs(typedefs)
-            for member_type in self.member_types]
-        return self
+        member_types = [member_type.resolve_typedefs(typedefs)
+                        for member_type in self.member_types]
+        if all(resolved is member_type for resolved, member_type
+               in zip(member_types, self.member_types)):
+            return self
+        return IdlUnionType(member_types)
 
     def idl_types(self):
         yield self
@@ -407,35 +669,22 @@ class IdlArrayOrSequenceType(IdlTypeBase):
         super(IdlArrayOrSequenceType, self).__init__()
         self.element_type = element_type
 
-    def __getstate__(self):
-        return {
-            'element_type': self.element_type,
-        }
-
-    def __setstate__(self, state):
-        self.element_type = state['element_type']
+    def interning_key(self):
+        return (self.element_type,)
 
     def resolve_typedefs(self, typedefs):
-        self.element_type = self.element_type.resolve_typedefs(typedefs)
-        return self
-
-    @property
-    def is_array_or_sequence_type(self):
-        return True
-
-    @property
-    def is_sequence_type(self):
-        return False
+        element_type = self.element_type.resolve_typedefs(typedefs)
+        if element_type is self.element_type:
+            return self
+        return type(self)(element_type)
 
-    @property
-    def is_frozen_array(self):
-        return False
+    is_array_or_sequence_type = True
 
-    @property
+    @type_info_trait
     def enum_values(self):
         return self.element_type.enum_values
 
-    @property
+    @type_info_trait
     def enum_type(self):
         return self.element_type.enum_type
 
@@ -452,14 +701,12 @@ class IdlSequenceType(IdlArrayOrSequenceType):
     def __str__(self):
         return 'sequence<%s>' % self.element_type
 
-    @property
+    is_sequence_type = True
+
+    @type_trait
     def name(self):
         return self.element_type.name + 'Sequence'
 
-    @property
-    def is_sequence_type(self):
-        return True
-
 
 class IdlFrozenArrayType(IdlArrayOrSequenceType):
     def __init__(self, element_type):
@@ -468,14 +715,12 @@ class IdlFrozenArrayType(IdlArrayOrSequenceType):
     def __str__(self):
         return 'FrozenArray<%s>' % self.element_type
 
-    @property
+    is_frozen_array = True
+
+    @type_trait
     def name(self):
         return self.element_type.name + 'Array'
 
-    @property
-    def is_frozen_array(self):
-        return True
-
 
 ################################################################################
 # IdlRecordType
@@ -490,15 +735,8 @@ class IdlRecordType(IdlTypeBase):
     def __str__(self):
         return 'record<%s, %s>' % (self.key_type, self.value_type)
 
-    def __getstate__(self):
-        return {
-            'key_type': self.key_type,
-            'value_type': self.value_type,
-        }
-
-    def __setstate__(self, state):
-        self.key_type = state['key_type']
-        self.value_type = state['value_type']
+    def interning_key(self):
+        return (self.key_type, self.value_type)
 
     def idl_types(self):
         yield self
@@ -508,15 +746,15 @@ class IdlRecordType(IdlTypeBase):
             yield idl_type
 
     def resolve_typedefs(self, typedefs):
-        self.key_type = self.key_type.resolve_typedefs(typedefs)
-        self.value_type = self.value_type.resolve_typedefs(typedefs)
-        return self
+        key_type = self.key_type.resolve_typedefs(typedefs)
+        value_type = self.value_type.resolve_typedefs(typedefs)
+        if key_type is self.key_type and value_type is self.value_type:
+            return self
+        return IdlRecordType(key_type, value_type)
 
-    @property
-    def is_record_type(self):
-        return True
+    is_record_type = True
 
-    @property
+    @type_trait
     def name(self):
         return self.key_type.name + self.value_type.name + 'Record'
 
@@ -539,29 +777,52 @@ class IdlNullableType(IdlTypeBase):
         return str(self.inner_type)
 
     def __getattr__(self, name):
+        # Type traits are taken from the inner type by inner_type_trait(),
+        # other attributes here.
         return getattr(self.inner_type, name)
 
-    def __getstate__(self):
-        return {
-            'inner_type': self.inner_type,
-        }
-
-    def __setstate__(self, state):
-        self.inner_type = state['inner_type']
+    def interning_key(self):
+        return (self.inner_type,)
 
-    @property
-    def is_nullable(self):
-        return True
+    is_nullable = True
 
-    @property
+    @type_trait
     def name(self):
         return self.inner_type.name + 'OrNull'
 
     def resolve_typedefs(self, typedefs):
-        self.inner_type = self.inner_type.resolve_typedefs(typedefs)
-        return self
+        inner_type = self.inner_type.resolve_typedefs(typedefs)
+        if inner_type is self.inner_type:
+            return self
+        return IdlNullableType(inner_type)
 
     def idl_types(self):
         yield self
         for idl_type in self.inner_type.idl_types():
             yield idl_type
+
+
+declare_type_traits({
+    'base_type': None,
+    'enum_type': None,
+    'enum_values': None,
+    'extended_attributes': None,
+    'is_array_or_sequence_type': False,
+    'is_basic_type': False,
+    'is_callback_function': False,
+    'is_callback_interface': False,
+    'is_custom_callback_function': False,
+    'is_dictionary': False,
+    'is_enum': False,
+    'is_frozen_array': False,
+    'is_integer_type': False,
+    'is_interface_type': False,
+    'is_nullable': False,
+    'is_numeric_type': False,
+    'is_primitive_type': False,
+    'is_record_type': False,
+    'is_sequence_type': False,
+    'is_string_type': False,
+    'is_union_type': False,
+    'is_void': False,
+})
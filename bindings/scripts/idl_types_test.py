@@ -6,13 +6,23 @@
 
 """Unit tests for idl_types.py."""
 
+import gc
+import pickle
+import threading
 import unittest
 
+from idl_types import IdlFrozenArrayType
 from idl_types import IdlNullableType
 from idl_types import IdlRecordType
 from idl_types import IdlSequenceType
 from idl_types import IdlType
 from idl_types import IdlUnionType
+from idl_types import TYPE_TRAIT_DEFAULTS
+from idl_types import TypeRegistry
+from idl_types import current_type_registry
+from idl_types import interned_types_count
+from idl_types import set_strict_type_traits
+from idl_types import use_type_registry
 
 
 class IdlTypeTest(unittest.TestCase):
@@ -23,6 +33,122 @@ class IdlTypeTest(unittest.TestCase):
         idl_type = IdlType('somethingElse')
         self.assertFalse(idl_type.is_void)
 
+    def test_interning(self):
+        self.assertIs(IdlType('long'), IdlType('long'))
+        self.assertIs(IdlType('double', is_unrestricted=True),
+                      IdlType('unrestricted double'))
+        self.assertIs(IdlNullableType(IdlSequenceType(IdlType('Node'))),
+                      IdlNullableType(IdlSequenceType(IdlType('Node'))))
+        self.assertIs(IdlRecordType(IdlType('DOMString'), IdlType('long')),
+                      IdlRecordType(IdlType('DOMString'), IdlType('long')))
+        self.assertIsNot(IdlSequenceType(IdlType('Node')),
+                         IdlFrozenArrayType(IdlType('Node')))
+
+        extended_attributes = {'TreatNullAs': 'EmptyString'}
+        idl_type = IdlType('DOMString', extended_attributes=extended_attributes)
+        self.assertIs(idl_type, IdlType('DOMString').with_extended_attributes(
+            {'TreatNullAs': 'EmptyString'}))
+        self.assertIsNot(idl_type, IdlType('DOMString'))
+        self.assertNotEqual(idl_type, IdlType('DOMString'))
+        # The type does not change with the dictionary it was created from.
+        extended_attributes['Clamp'] = None
+        self.assertEqual(idl_type.extended_attributes, {'TreatNullAs': 'EmptyString'})
+
+    def test_unused_types_are_released(self):
+        gc.collect()
+        count = interned_types_count()
+        idl_type = IdlNullableType(IdlSequenceType(IdlType('UnusedInterface')))
+        self.assertEqual(interned_types_count(), count + 3)
+        del idl_type
+        gc.collect()
+        self.assertEqual(interned_types_count(), count)
+
+    def test_equality(self):
+        self.assertEqual(len(set([IdlType('long'), IdlType('long'),
+                                  IdlNullableType(IdlType('long'))])), 2)
+        self.assertNotEqual(IdlType('long'), 'long')
+        # Union types compare by name.
+        self.assertEqual(
+            IdlUnionType([IdlType('long', extended_attributes={'Clamp': None}),
+                          IdlType('Node')]),
+            IdlUnionType([IdlType('long'), IdlType('Node')]))
+
+    def test_pickle(self):
+        idl_type = IdlNullableType(IdlUnionType([
+            IdlType('DOMString', extended_attributes={'TreatNullAs': 'EmptyString'}),
+            IdlSequenceType(IdlType('long'))]))
+        self.assertIs(pickle.loads(pickle.dumps(idl_type)), idl_type)
+
+    def test_type_traits(self):
+        record_type = IdlRecordType(IdlType('DOMString'), IdlType('long'))
+        for name, default in TYPE_TRAIT_DEFAULTS.items():
+            if name != 'is_record_type':
+                self.assertEqual(getattr(record_type, name), default, name)
+        sequence_type = IdlSequenceType(IdlType('long'))
+        self.assertTrue(sequence_type.is_sequence_type)
+        self.assertTrue(IdlNullableType(sequence_type).is_sequence_type)
+        self.assertTrue(IdlNullableType(sequence_type).is_nullable)
+        self.assertTrue(IdlType('long').is_integer_type)
+        # Computed traits are stored on the type.
+        self.assertIn('is_integer_type', IdlType('long').__dict__)
+
+    def test_type_info_change_invalidates_traits(self):
+        idl_type = IdlNullableType(IdlType('TraitTestDictionary'))
+        with use_type_registry(TypeRegistry()):
+            self.assertTrue(idl_type.is_interface_type)
+            self.assertFalse(idl_type.is_dictionary)
+            IdlType.set_dictionaries(['TraitTestDictionary'])
+            self.assertFalse(idl_type.is_interface_type)
+            self.assertTrue(idl_type.is_dictionary)
+
+    def test_type_registries(self):
+        idl_type = IdlSequenceType(IdlType('TraitTestEnum'))
+        registry = TypeRegistry()
+        registry.enums['TraitTestEnum'] = ['a', 'b']
+        with use_type_registry(registry):
+            self.assertIs(current_type_registry(), registry)
+            self.assertEqual(idl_type.enum_values, ['a', 'b'])
+            with use_type_registry(TypeRegistry()):
+                self.assertIsNone(idl_type.enum_values)
+            self.assertEqual(idl_type.enum_values, ['a', 'b'])
+        self.assertIsNot(current_type_registry(), registry)
+        self.assertIsNone(idl_type.enum_values)
+
+    def test_type_registries_in_threads(self):
+        idl_type = IdlNullableType(IdlType('TraitTestType'))
+        results = {}
+
+        def run(name, registry):
+            with use_type_registry(registry):
+                results[name] = [(idl_type.is_dictionary, idl_type.is_enum)
+                                 for _ in range(1000)]
+
+        dictionary_registry = TypeRegistry()
+        dictionary_registry.dictionaries.add('TraitTestType')
+        enum_registry = TypeRegistry()
+        enum_registry.enums['TraitTestType'] = ['a']
+        threads = [
+            threading.Thread(target=run, args=('dictionary', dictionary_registry)),
+            threading.Thread(target=run, args=('enum', enum_registry)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(set(results['dictionary']), set([(True, False)]))
+        self.assertEqual(set(results['enum']), set([(False, True)]))
+
+    def test_strict_type_traits(self):
+        idl_type = IdlNullableType(IdlType('long'))
+        self.assertIsNone(idl_type.is_unknown_trait)
+        set_strict_type_traits(True)
+        try:
+            self.assertFalse(idl_type.is_union_type)
+            with self.assertRaises(AttributeError):
+                idl_type.is_unknown_trait  # pylint: disable=pointless-statement
+        finally:
+            set_strict_type_traits(False)
+
 
 class IdlRecordTypeTest(unittest.TestCase):
 
@@ -172,3 +298,9 @@ class IdlUnionTypeTest(unittest.TestCase):
         self.assertEqual(union.member_types[1].element_type.member_types[1].name,
                          'Double')
         self.assertEqual(2, len(union.flattened_member_types))
+
+        # Types are shared, hence not modified.
+        union = IdlUnionType([IdlType('Foo'), IdlType('long')])
+        self.assertEqual(union.resolve_typedefs(typedefs).name, 'UnsignedShortOrLong')
+        self.assertEqual(union.name, 'FooOrLong')
+        self.assertIs(union.resolve_typedefs({}), union)
@@ -36,7 +36,10 @@ entire interface.
 Design doc: http://www.chromium.org/developers/design-documents/idl-compiler#TOC-Dependency-resolution
 """
 
-import os.path
+from collections import OrderedDict
+import os
+import pickle
+
 from utilities import idl_filename_to_component, is_valid_component_dependency, merge_dict_recursively
 
 # The following extended attributes can be applied to a dependency interface,
@@ -51,8 +54,65 @@ DEPENDENCY_EXTENDED_ATTRIBUTES = frozenset([
 ])
 
 
+def file_signature(filename):
+    stat = os.stat(filename)
+    return filename, stat.st_mtime, stat.st_size
+
+
+# Default number of definitions kept by DefinitionsCache.
+DEFAULT_DEFINITIONS_CACHE_SIZE = 256
+
+
+class DefinitionsCache(object):
+    """Bounded LRU cache of definitions read from IDL files.
+
+    Definitions are merged in place, so entries are kept pickled and each
+    lookup returns a fresh copy; unpickling is much cheaper than parsing (or
+    deep copying).  Entries are keyed on the paths, modification times and
+    sizes of the files read, so that a long-lived reader does not return
+    stale definitions.
+    """
+    def __init__(self, max_entries=DEFAULT_DEFINITIONS_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, kind, idl_filenames, read_function):
+        """Returns a copy of the cached |kind| definitions of idl_filenames[0],
+        calling |read_function| to read them on a miss.
+
+        |idl_filenames| lists the main file followed by the files the
+        definitions depend on; a change of any of them invalidates the entry.
+        """
+        key = (kind,) + tuple(file_signature(idl_filename)
+                              for idl_filename in idl_filenames)
+        data = self.entries.pop(key, None)
+        if data is None:
+            self.misses += 1
+            definitions = read_function(idl_filenames[0])
+            self.entries[key] = pickle.dumps(definitions, pickle.HIGHEST_PROTOCOL)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return definitions
+        self.hits += 1
+        self.entries[key] = data
+        return pickle.loads(data)
+
+    def statistics(self):
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
 class InterfaceDependencyResolver(object):
-    def __init__(self, interfaces_info, reader):
+    def __init__(self, interfaces_info, reader,
+                 cache_size=DEFAULT_DEFINITIONS_CACHE_SIZE):
         """Initialize dependency resolver.
 
         Args:
@@ -60,9 +120,36 @@ class InterfaceDependencyResolver(object):
                 dict of interfaces information, from compute_dependencies.py
             reader:
                 IdlReader, used for reading dependency files
+            cache_size:
+                number of definitions of dependency and referenced files to
+                keep in memory; 0 disables the cache.
         """
         self.interfaces_info = interfaces_info
         self.reader = reader
+        self.definitions_cache = DefinitionsCache(cache_size) if cache_size else None
+
+    def read_dependency_file(self, idl_filename):
+        """Returns IdlDefinitions of a dependency or referenced file, which
+        may be modified."""
+        if not self.definitions_cache:
+            return self.reader.read_idl_file(idl_filename)
+        return self.definitions_cache.get('dependency', [idl_filename],
+                                          self.reader.read_idl_file)
+
+    def read_referenced_definitions(self, interface_name):
+        """Returns the resolved definitions of a referenced interface.
+
+        Only the reads of the files are cached: the resolved definitions also
+        depend on the files of the interfaces referenced in turn and on
+        interfaces_info, so they are resolved on each call."""
+        idl_filename = self.interfaces_info[interface_name]['full_path']
+        if not self.definitions_cache:
+            return self.reader.read_idl_definitions(idl_filename)
+        definitions = self.read_dependency_file(idl_filename)
+        component = idl_filename_to_component(idl_filename)
+        if not definitions.interfaces:
+            return {component: definitions}
+        return self.resolve_dependencies(definitions, component)
 
     def resolve_dependencies(self, definitions, component):
         """Resolve dependencies, merging them into IDL definitions of main file.
@@ -117,13 +204,13 @@ class InterfaceDependencyResolver(object):
             target_interface,
             interface_info['dependencies_full_paths'] +
             interface_info['dependencies_other_component_full_paths'],
-            self.reader)
+            self.read_dependency_file)
 
         inherit_unforgeable_attributes(resolved_definitions, self.interfaces_info)
 
         for referenced_interface_name in interface_info['referenced_interfaces']:
-            referenced_definitions = self.reader.read_idl_definitions(
-                self.interfaces_info[referenced_interface_name]['full_path'])
+            referenced_definitions = self.read_referenced_definitions(
+                referenced_interface_name)
 
             for referenced_component in referenced_definitions:
                 if not is_valid_component_dependency(component, referenced_component):
@@ -139,7 +226,7 @@ class InterfaceDependencyResolver(object):
         return resolved_definitions
 
 
-def merge_interface_dependencies(definitions, component, target_interface, dependency_idl_filenames, reader):
+def merge_interface_dependencies(definitions, component, target_interface, dependency_idl_filenames, read_idl_file):
     """Merge dependencies ('partial interface' and 'implements') in dependency_idl_filenames into target_interface.
 
     Args:
@@ -150,7 +237,9 @@ def merge_interface_dependencies(definitions, component, target_interface, depen
         target_interface: IdlInterface object, modified in place
         dependency_idl_filenames:
             Idl filenames which depend on the above definitions.
-        reader: IdlReader object.
+        read_idl_file:
+            function returning IdlDefinitions of a dependency file, which are
+            modified in place.
     Returns:
         A dictionary whose key is component and value is IdlDefinitions
         object whose dependency is resolved.
@@ -158,7 +247,7 @@ def merge_interface_dependencies(definitions, component, target_interface, depen
     resolved_definitions = {component: definitions}
     # Sort so order consistent, so can compare output from run to run.
     for dependency_idl_filename in sorted(dependency_idl_filenames):
-        dependency_definitions = reader.read_idl_file(dependency_idl_filename)
+        dependency_definitions = read_idl_file(dependency_idl_filename)
         dependency_component = idl_filename_to_component(dependency_idl_filename)
 
         dependency_interface = next(iter(dependency_definitions.interfaces.values()))
@@ -0,0 +1,125 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for interface_dependency_resolver.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from interface_dependency_resolver import DefinitionsCache
+from idl_reader import IdlReader
+
+
+class DefinitionsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.reads = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_file(self, basename, text):
+        filename = os.path.join(self.temp_dir, basename)
+        with open(filename, 'w') as idl_file:
+            idl_file.write(text)
+        return filename
+
+    def read(self, filename):
+        self.reads.append(os.path.basename(filename))
+        with open(filename) as idl_file:
+            return {'text': idl_file.read()}
+
+    def test_returns_copies(self):
+        cache = DefinitionsCache()
+        filename = self.write_file('A.idl', 'a')
+        cache.get('dependency', [filename], self.read)['text'] = 'modified'
+        self.assertEqual(cache.get('dependency', [filename], self.read),
+                         {'text': 'a'})
+        self.assertEqual(self.reads, ['A.idl'])
+        self.assertEqual(cache.statistics(),
+                         {'entries': 1, 'hits': 1, 'misses': 1, 'evictions': 0})
+
+    def test_evicts_least_recently_used(self):
+        cache = DefinitionsCache(max_entries=2)
+        filenames = [self.write_file(basename, basename)
+                     for basename in ('A.idl', 'B.idl', 'C.idl')]
+        cache.get('dependency', [filenames[0]], self.read)
+        cache.get('dependency', [filenames[1]], self.read)
+        cache.get('dependency', [filenames[0]], self.read)
+        cache.get('dependency', [filenames[2]], self.read)
+        cache.get('dependency', [filenames[0]], self.read)
+        cache.get('dependency', [filenames[1]], self.read)
+        self.assertEqual(self.reads, ['A.idl', 'B.idl', 'C.idl', 'B.idl'])
+        self.assertEqual(cache.evictions, 2)
+
+    def test_change_of_dependency_invalidates(self):
+        cache = DefinitionsCache()
+        filename = self.write_file('A.idl', 'a')
+        dependency_filename = self.write_file('APartial.idl', 'partial')
+        cache.get('referenced', [filename, dependency_filename], self.read)
+        self.write_file('APartial.idl', 'changed partial')
+        cache.get('referenced', [filename, dependency_filename], self.read)
+        self.assertEqual(self.reads, ['A.idl', 'A.idl'])
+
+
+class ReferencedDefinitionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        # Components are named by the directories of the IDL files.
+        os.makedirs(os.path.join(self.temp_dir, 'core'))
+        # Node references Element, which references Attr in turn.
+        self.interfaces_info = {
+            'Node': self.interface_info('Node', ['Element']),
+            'Element': self.interface_info('Element', ['Attr']),
+            'Attr': self.interface_info('Attr', []),
+        }
+        self.write_file('Node', 'attribute Element element;')
+        self.write_file('Element', 'attribute Attr attr;')
+        self.write_file('Attr', 'attribute long value;')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def full_path(self, name):
+        return os.path.join(self.temp_dir, 'core', name + '.idl')
+
+    def interface_info(self, name, referenced_interfaces):
+        return {
+            'dependencies_full_paths': [],
+            'dependencies_other_component_full_paths': [],
+            'full_path': self.full_path(name),
+            'referenced_interfaces': referenced_interfaces,
+        }
+
+    def write_file(self, name, members):
+        with open(self.full_path(name), 'w') as idl_file:
+            idl_file.write('interface %s { %s };\n' % (name, members))
+
+    def read_attr(self, reader):
+        definitions = reader.read_idl_definitions(self.full_path('Node'))['core']
+        return definitions.interfaces['Attr']
+
+    def test_changes_of_nested_references_are_read(self):
+        reader = IdlReader(self.interfaces_info)
+        self.assertEqual([attribute.name for attribute
+                          in self.read_attr(reader).attributes], ['value'])
+        self.write_file('Attr', 'attribute long value; attribute long length;')
+        self.assertEqual([attribute.name for attribute
+                          in self.read_attr(reader).attributes],
+                         ['value', 'length'])
+
+        self.interfaces_info['Attr']['inherited_extended_attributes'] = {
+            'DependentLifetime': None}
+        self.assertIn('DependentLifetime',
+                      self.read_attr(reader).extended_attributes)
+
+
+if __name__ == '__main__':
+    unittest.main()
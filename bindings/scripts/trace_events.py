@@ -0,0 +1,187 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Tracing of the phases of the bindings scripts.
+
+Run with --trace-output FILE, the scripts record the time spent in each
+phase -- parsing, dependency and typedef resolution, building the template
+contexts, rendering templates, formatting and writing files -- and write it
+to FILE in the JSON trace event format, which chrome://tracing and other
+trace viewers load:
+https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+
+Each phase is a complete event ('ph': 'X') of the process and thread which
+ran it, and events recorded while an IDL file is processed have the file in
+their args.  Worker processes return their events to the main process,
+which writes all of them.
+
+Tracing is off unless started; trace_event() then returns a shared no-op
+context manager, so instrumenting a function costs little more than a call.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+DEFAULT_CATEGORY = 'bindings'
+
+# The events recorded by this process, or None if tracing is off.
+_events = None
+# The basename of the IDL file being processed, which tags the events.
+_current_idl_file = contextvars.ContextVar('current_idl_file', default=None)
+
+
+class NoTraceEvent(object):
+    """A trace event which records nothing, used while tracing is off."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return False
+
+
+NO_TRACE_EVENT = NoTraceEvent()
+
+
+class TraceEvent(object):
+    """Records a complete event of the time spent in a with statement."""
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start_time = None
+
+    def __enter__(self):
+        idl_file = _current_idl_file.get()
+        if idl_file:
+            self.args['idl_file'] = idl_file
+        self.start_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        end_time = time.time()
+        if _events is not None:
+            _events.append({
+                'name': self.name,
+                'cat': self.category,
+                'ph': 'X',
+                'ts': self.start_time * 1000000,
+                'dur': (end_time - self.start_time) * 1000000,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': self.args,
+            })
+        return False
+
+
+def tracing_enabled():
+    return _events is not None
+
+
+def trace_event(name, category=DEFAULT_CATEGORY, **args):
+    """Returns a context manager recording the time spent in its with
+    statement as an event |name|, with |args| shown in trace viewers."""
+    if _events is None:
+        return NO_TRACE_EVENT
+    return TraceEvent(name, category, args)
+
+
+def traced(category=DEFAULT_CATEGORY):
+    """Decorates functions to record an event named after the function for
+    each call."""
+    def decorate(function):
+        @functools.wraps(function)
+        def traced_function(*args, **kwargs):
+            if _events is None:
+                return function(*args, **kwargs)
+            with TraceEvent(function.__name__, category, {}):
+                return function(*args, **kwargs)
+        return traced_function
+    return decorate
+
+
+@contextlib.contextmanager
+def tagged_with_idl_file(idl_filename):
+    """Tags the events recorded in the with statement with |idl_filename|."""
+    token = _current_idl_file.set(os.path.basename(idl_filename))
+    try:
+        yield
+    finally:
+        _current_idl_file.reset(token)
+
+
+def start_tracing(process_name=None):
+    """Starts recording events in this process, dropping any recorded."""
+    global _events  # pylint: disable=global-statement
+    _events = []
+    _events.append({
+        'name': 'process_name',
+        'ph': 'M',
+        'pid': os.getpid(),
+        'args': {'name': process_name or os.path.basename(sys.argv[0])},
+    })
+
+
+def stop_tracing():
+    """Stops recording events and returns the events recorded."""
+    global _events  # pylint: disable=global-statement
+    events = _events or []
+    _events = None
+    return events
+
+
+def take_events():
+    """Returns the events recorded so far, e.g. by a worker process for its
+    main process, and keeps recording."""
+    global _events  # pylint: disable=global-statement
+    if _events is None:
+        return []
+    events = _events
+    _events = []
+    return events
+
+
+def add_events(events):
+    """Adds events recorded by another process."""
+    if _events is not None:
+        _events.extend(events)
+
+
+def write_trace_file(trace_filename, events):
+    with open(trace_filename, 'w') as trace_file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'},
+                  trace_file)
+
+
+@contextlib.contextmanager
+def tracing(trace_filename):
+    """Traces the with statement into |trace_filename|, if not None.
+
+    The trace is written even if the with statement raises, to show where
+    a failing run spent its time.
+    """
+    if not trace_filename:
+        yield
+        return
+    start_tracing()
+    try:
+        yield
+    finally:
+        write_trace_file(trace_filename, stop_tracing())
+
+
+def add_trace_output_option(parser):
+    """Adds --trace-output, for tracing(options.trace_output), to an optparse
+    or argparse |parser|."""
+    add_option = getattr(parser, 'add_argument', None) or parser.add_option
+    add_option('--trace-output',
+               help='write the time spent in each phase to this file, in the '
+               'trace event format of chrome://tracing')
@@ -0,0 +1,116 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for trace_events.py."""
+
+import argparse
+import json
+import optparse
+import os
+import shutil
+import tempfile
+import unittest
+
+from trace_events import NO_TRACE_EVENT
+from trace_events import add_events
+from trace_events import add_trace_output_option
+from trace_events import start_tracing
+from trace_events import stop_tracing
+from trace_events import tagged_with_idl_file
+from trace_events import take_events
+from trace_events import trace_event
+from trace_events import traced
+from trace_events import tracing
+from trace_events import tracing_enabled
+
+
+@traced('test')
+def interface_context(interface):
+    return {'interface_name': interface}
+
+
+class TraceEventsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        stop_tracing()
+        shutil.rmtree(self.temp_dir)
+
+    def test_nothing_is_recorded_unless_tracing(self):
+        self.assertFalse(tracing_enabled())
+        self.assertIs(trace_event('parse_idl_file'), NO_TRACE_EVENT)
+        self.assertEqual(interface_context('Node'), {'interface_name': 'Node'})
+        self.assertEqual(take_events(), [])
+
+    def test_events(self):
+        start_tracing('idl_compiler.py')
+        with tagged_with_idl_file('/src/core/dom/Node.idl'):
+            with trace_event('compile_file'):
+                self.assertEqual(interface_context('Node'),
+                                 {'interface_name': 'Node'})
+        with trace_event('write_file', filename='V8Node.h'):
+            pass
+        metadata, context, compile_file, write_file = stop_tracing()
+        self.assertFalse(tracing_enabled())
+
+        self.assertEqual(metadata['ph'], 'M')
+        self.assertEqual(metadata['args'], {'name': 'idl_compiler.py'})
+        self.assertEqual(
+            [(event['name'], event['cat'], event['ph'], event['args'])
+             for event in [context, compile_file, write_file]],
+            [('interface_context', 'test', 'X', {'idl_file': 'Node.idl'}),
+             ('compile_file', 'bindings', 'X', {'idl_file': 'Node.idl'}),
+             ('write_file', 'bindings', 'X', {'filename': 'V8Node.h'})])
+        # The context is built within compiling the file.
+        self.assertLessEqual(compile_file['ts'], context['ts'])
+        self.assertLessEqual(context['ts'] + context['dur'],
+                             compile_file['ts'] + compile_file['dur'])
+        self.assertEqual(compile_file['pid'], os.getpid())
+
+    def test_events_of_workers(self):
+        start_tracing()
+        with trace_event('parse_idl_file'):
+            pass
+        worker_events = take_events()
+        self.assertEqual([event['name'] for event in worker_events],
+                         ['process_name', 'parse_idl_file'])
+        self.assertEqual(take_events(), [])
+        add_events(worker_events)
+        self.assertEqual(stop_tracing(), worker_events)
+
+    def test_tracing_writes_trace_file(self):
+        trace_filename = os.path.join(self.temp_dir, 'trace.json')
+        with tracing(None):
+            self.assertFalse(tracing_enabled())
+        self.assertFalse(os.path.exists(trace_filename))
+
+        with self.assertRaises(ValueError):
+            with tracing(trace_filename):
+                with trace_event('resolve_typedefs'):
+                    raise ValueError()
+        self.assertFalse(tracing_enabled())
+        with open(trace_filename) as trace_file:
+            trace = json.load(trace_file)
+        self.assertEqual([event['name'] for event in trace['traceEvents']],
+                         ['process_name', 'resolve_typedefs'])
+
+    def test_trace_output_option(self):
+        parser = optparse.OptionParser()
+        add_trace_output_option(parser)
+        options, _ = parser.parse_args(['--trace-output', 'trace.json'])
+        self.assertEqual(options.trace_output, 'trace.json')
+        self.assertIsNone(parser.parse_args([])[0].trace_output)
+
+        parser = argparse.ArgumentParser()
+        add_trace_output_option(parser)
+        args = parser.parse_args(['--trace-output', 'trace.json'])
+        self.assertEqual(args.trace_output, 'trace.json')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,11 @@
 Design doc: http://www.chromium.org/developers/design-documents/idl-build
 """
 
+import contextlib
+import contextvars
+import functools
+import hashlib
+import io
 import os
 import pickle as pickle
 import re
@@ -20,11 +25,25 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..',
                              'blink', 'tools'))
 from blinkpy.common.name_style_converter import NameStyleConverter
+from trace_events import trace_event
+from trace_events import traced
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping  # pylint: disable=no-name-in-module
 
 
 KNOWN_COMPONENTS = frozenset(['core', 'modules'])
 KNOWN_COMPONENTS_WITH_TESTING = frozenset(['core', 'modules', 'testing'])
 
+# The directory of OutputDigests in each output directory.  Its name does not
+# end with .pickle, as the directory of interfaces info shards must only
+# contain .pickle files.
+OUTPUT_DIGESTS_BASENAME = '.output_digests'
+# Number of characters write_file() copies from a file at a time.
+FILE_BLOCK_SIZE = 64 * 1024
+
 
 def idl_filename_to_basename(idl_filename):
     """Returns the basename without the extension."""
@@ -67,16 +86,39 @@ def is_valid_component_dependency(component, dependency):
     return True
 
 
+# id(info provider) -> the mapping its interfaces_info returns instead of its
+# own, within ComponentInfoProvider.interfaces_info_wrapped_in().
+_interfaces_info_wrappers = contextvars.ContextVar('interfaces_info_wrappers',
+                                                   default=None)
+
+
 class ComponentInfoProvider(object):
     """Base class of information provider which provides component-specific
     information.
     """
     def __init__(self):
-        pass
+        self._interfaces_info = {}
 
     @property
     def interfaces_info(self):
-        return {}
+        wrappers = _interfaces_info_wrappers.get()
+        if wrappers:
+            return wrappers.get(id(self), self._interfaces_info)
+        return self._interfaces_info
+
+    @contextlib.contextmanager
+    def interfaces_info_wrapped_in(self, wrap):
+        """Makes interfaces_info return wrap(interfaces_info) in this thread
+        (or asyncio task) within the with statement, e.g. to record which
+        entries code generation reads.  Yields the wrapper.
+        """
+        wrappers = dict(_interfaces_info_wrappers.get() or {})
+        wrapper = wrappers[id(self)] = wrap(self._interfaces_info)
+        token = _interfaces_info_wrappers.set(wrappers)
+        try:
+            yield wrapper
+        finally:
+            _interfaces_info_wrappers.reset(token)
 
     @property
     def component_info(self):
@@ -109,10 +151,6 @@ class ComponentInfoProviderCore(ComponentInfoProvider):
         self._interfaces_info = interfaces_info
         self._component_info = component_info
 
-    @property
-    def interfaces_info(self):
-        return self._interfaces_info
-
     @property
     def component_info(self):
         return self._component_info
@@ -154,10 +192,6 @@ class ComponentInfoProviderModules(ComponentInfoProvider):
         self._component_info_core = component_info_core
         self._component_info_modules = component_info_modules
 
-    @property
-    def interfaces_info(self):
-        return self._interfaces_info
-
     @property
     def component_info(self):
         return self._component_info_modules
@@ -202,8 +236,75 @@ class ComponentInfoProviderModules(ComponentInfoProvider):
         return 'modules/ModulesExport.h'
 
 
-def load_interfaces_info_overall_pickle(info_dir):
-    with open(os.path.join(info_dir, 'modules', 'InterfacesInfoOverall.pickle')) as interface_info_file:
+# Keys of interfaces info which hold global type info rather than the info of
+# an interface; see compute_global_type_info() in
+# compute_interfaces_info_overall.py.
+GLOBAL_TYPE_INFO_KEYS = frozenset([
+    'ancestors',
+    'callback_interfaces',
+    'component_dirs',
+    'dictionaries',
+    'garbage_collected_interfaces',
+    'implemented_as_interfaces',
+])
+
+# Directory, next to InterfacesInfoOverall.pickle, holding one pickle file
+# per interface, plus an index with the global type info.
+INTERFACES_INFO_SHARDS_DIRNAME = 'InterfacesInfoOverall'
+INTERFACES_INFO_INDEX_FILENAME = 'index.pickle'
+
+
+def interfaces_info_shard_filename(shards_dir, interface_name):
+    return os.path.join(shards_dir, interface_name + '.pickle')
+
+
+class ShardedInterfacesInfo(MutableMapping):
+    """Interfaces info backed by per-interface shard files.
+
+    Behaves like the interfaces info dict, but the info of an interface is
+    only read when it is looked up.  |read_filenames| records the files that
+    were read, so that a generator depends only on the shards it used rather
+    than on the info of all interfaces.
+    """
+    def __init__(self, shards_dir):
+        self.shards_dir = shards_dir
+        index_filename = os.path.join(shards_dir, INTERFACES_INFO_INDEX_FILENAME)
+        index = read_pickle_file(index_filename)
+        self.read_filenames = set([index_filename])
+        self._interface_names = frozenset(index['interface_names'])
+        self._info = dict(index['global_type_info'])
+
+    def __getitem__(self, key):
+        if key not in self._info:
+            if key not in self._interface_names:
+                raise KeyError(key)
+            filename = interfaces_info_shard_filename(self.shards_dir, key)
+            self._info[key] = read_pickle_file(filename)
+            self.read_filenames.add(filename)
+        return self._info[key]
+
+    def __setitem__(self, key, value):
+        self._info[key] = value
+
+    def __delitem__(self, key):
+        # Only in-memory info can be deleted; shards are read-only.
+        del self._info[key]
+
+    def __contains__(self, key):
+        return key in self._info or key in self._interface_names
+
+    def __iter__(self):
+        return iter(self._interface_names.union(self._info))
+
+    def __len__(self):
+        return len(self._interface_names.union(self._info))
+
+
+def load_interfaces_info_overall_pickle(info_dir, use_shards=False):
+    if use_shards:
+        return ShardedInterfacesInfo(os.path.join(
+            info_dir, 'modules', INTERFACES_INFO_SHARDS_DIRNAME))
+    with open(os.path.join(info_dir, 'modules', 'InterfacesInfoOverall.pickle'), 'rb') as interface_info_file:
         return pickle.load(interface_info_file)
 
 
@@ -227,28 +328,45 @@ def merge_dict_recursively(target, diff):
             target[key] = value
 
 
-def create_component_info_provider_core(info_dir):
-    interfaces_info = load_interfaces_info_overall_pickle(info_dir)
-    with open(os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle')) as component_info_file:
+def create_component_info_provider_core(info_dir, use_shards=False):
+    interfaces_info = load_interfaces_info_overall_pickle(info_dir, use_shards)
+    with open(os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle'), 'rb') as component_info_file:
         component_info = pickle.load(component_info_file)
     return ComponentInfoProviderCore(interfaces_info, component_info)
 
 
-def create_component_info_provider_modules(info_dir):
-    interfaces_info = load_interfaces_info_overall_pickle(info_dir)
-    with open(os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle')) as component_info_file:
+def create_component_info_provider_modules(info_dir, use_shards=False):
+    interfaces_info = load_interfaces_info_overall_pickle(info_dir, use_shards)
+    with open(os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle'), 'rb') as component_info_file:
         component_info_core = pickle.load(component_info_file)
-    with open(os.path.join(info_dir, 'modules', 'ComponentInfoModules.pickle')) as component_info_file:
+    with open(os.path.join(info_dir, 'modules', 'ComponentInfoModules.pickle'), 'rb') as component_info_file:
         component_info_modules = pickle.load(component_info_file)
     return ComponentInfoProviderModules(
         interfaces_info, component_info_core, component_info_modules)
 
 
-def create_component_info_provider(info_dir, component):
+def component_info_provider_files(info_dir, component):
+    """Returns the pickle files read by create_component_info_provider()."""
     if component == 'core':
-        return create_component_info_provider_core(info_dir)
+        return [os.path.join(info_dir, 'modules', 'InterfacesInfoOverall.pickle'),
+                os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle')]
     elif component == 'modules':
-        return create_component_info_provider_modules(info_dir)
+        return [os.path.join(info_dir, 'modules', 'InterfacesInfoOverall.pickle'),
+                os.path.join(info_dir, 'core', 'ComponentInfoCore.pickle'),
+                os.path.join(info_dir, 'modules', 'ComponentInfoModules.pickle')]
+    return []
+
+
+def create_component_info_provider(info_dir, component, use_shards=False):
+    """Creates the info provider of |component|.
+
+    If |use_shards| is True, interfaces info is read lazily from the
+    per-interface shards instead of InterfacesInfoOverall.pickle.
+    """
+    if component == 'core':
+        return create_component_info_provider_core(info_dir, use_shards)
+    elif component == 'modules':
+        return create_component_info_provider_modules(info_dir, use_shards)
     else:
         return ComponentInfoProvider()
 
@@ -310,36 +428,274 @@ def read_pickle_files(pickle_filenames):
 
 
 def read_pickle_file(pickle_filename):
-    with open(pickle_filename) as pickle_file:
+    with open(pickle_filename, 'rb') as pickle_file:
         return pickle.load(pickle_file)
 
 
-def write_file(new_text, destination_filename):
-    # If |new_text| is same with the file content, we skip updating.
-    if os.path.isfile(destination_filename):
-        with open(destination_filename) as destination_file:
-            if destination_file.read() == new_text:
-                return
+def create_temporary_file(destination_filename):
+    """Creates a hidden temporary file next to |destination_filename| and
+    returns its file descriptor and name.
 
+    Unlike tempfile.mkstemp(), which creates files readable only by the
+    owner, the file gets the permissions of files created by open(): the
+    kernel applies the umask, which is never changed, as threads may be
+    creating files concurrently.
+    """
     destination_dirname = os.path.dirname(destination_filename)
-    if not os.path.exists(destination_dirname):
-        os.makedirs(destination_dirname)
-    with open(destination_filename, 'w') as destination_file:
-        destination_file.write(new_text)
+    prefix = '.' + os.path.basename(destination_filename) + '.'
+    while True:
+        temp_filename = os.path.join(
+            destination_dirname, prefix + os.urandom(6).hex() + '.tmp')
+        try:
+            fd = os.open(temp_filename,
+                         os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        return fd, temp_filename
 
 
-def write_pickle_file(pickle_filename, data):
-    # If |data| is same with the file content, we skip updating.
-    if os.path.isfile(pickle_filename):
-        with open(pickle_filename) as pickle_file:
+@contextlib.contextmanager
+def open_file_atomically(destination_filename, mode='w'):
+    """Opens a temporary file, which is renamed over the destination when the
+    with statement completes, or removed if it raises.
+
+    Readers never observe a partially written file, so this is safe for files
+    that concurrent build processes read and write.
+    """
+    destination_dirname = os.path.dirname(destination_filename)
+    if destination_dirname and not os.path.exists(destination_dirname):
+        try:
+            os.makedirs(destination_dirname)
+        except OSError:
+            # Created concurrently by another process.
+            if not os.path.isdir(destination_dirname):
+                raise
+    fd, temp_filename = create_temporary_file(destination_filename)
+    try:
+        with os.fdopen(fd, mode) as temp_file:
+            yield temp_file
+        os.replace(temp_filename, destination_filename)
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
+
+def write_file_atomically(data, destination_filename, mode='w'):
+    """Writes |data| to a temporary file and renames it over the destination;
+    see open_file_atomically().  Returns the os.stat_result of the file."""
+    with open_file_atomically(destination_filename, mode) as destination_file:
+        destination_file.write(data)
+        destination_file.flush()
+        return os.fstat(destination_file.fileno())
+
+
+class OutputDigests(object):
+    """Digests of the contents of the files written to a directory.
+
+    write_file() and the pickle writers record the digest of each file they
+    write or find unchanged, so that later writes of the same contents are
+    detected without reading (or unpickling) the file.  A digest is kept with
+    the size, modification time and inode of the file, and only used while
+    the file still has them, so a file written by other means is compared by
+    reading it.
+
+    Each digest is stored in its own file, named as the output, in the
+    OUTPUT_DIGESTS_BASENAME subdirectory and written atomically: processes
+    writing to the same directory do not lose each other's digests, and
+    recording or looking up a digest costs the same however many outputs
+    the directory has.
+    """
+    def __init__(self, directory):
+        self.digests_dir = os.path.join(directory, OUTPUT_DIGESTS_BASENAME)
+
+    def digest_filename(self, filename):
+        return os.path.join(self.digests_dir, os.path.basename(filename))
+
+    def digest(self, filename):
+        """Returns the digest of the contents of |filename|, if known."""
+        try:
+            with open(self.digest_filename(filename)) as digest_file:
+                digest, size, mtime_ns, inode = digest_file.read().split()
+            stat = os.stat(filename)
+            if (int(size), int(mtime_ns), int(inode)) != (
+                    stat.st_size, stat.st_mtime_ns, stat.st_ino):
+                return None
+        except (OSError, ValueError):
+            # No digest, an unreadable one or no file.
+            return None
+        return digest
+
+    def record(self, filename, digest, stat):
+        """Records |digest| for |filename|, as of |stat|."""
+        if os.path.isfile(self.digests_dir):
+            # A single file holding all digests, written by earlier versions.
             try:
-                if pickle.load(pickle_file) == data:
-                    return
-            except Exception:
-                # If trouble unpickling, overwrite
+                os.remove(self.digests_dir)
+            except OSError:
+                # Removed concurrently.
                 pass
-    with open(pickle_filename, 'w') as pickle_file:
-        pickle.dump(data, pickle_file)
+        write_file_atomically(
+            '%s %d %d %d\n' % (digest, stat.st_size, stat.st_mtime_ns,
+                                stat.st_ino),
+            self.digest_filename(filename))
+
+
+def output_digests(filename):
+    """Returns the OutputDigests of the directory of |filename|."""
+    return OutputDigests(os.path.dirname(os.path.abspath(filename)))
+
+
+def _write_file_if_changed(chunks, destination_filename):
+    """Writes |chunks| unless the file already has the same contents, and
+    returns the os.stat_result of the file."""
+    try:
+        destination_file = open(destination_filename)
+    except (IOError, OSError):
+        destination_file = None
+    if not destination_file:
+        with open_file_atomically(destination_filename) as new_file:
+            for chunk in chunks:
+                new_file.write(chunk)
+            new_file.flush()
+            return os.fstat(new_file.fileno())
+
+    with destination_file:
+        same_length = 0
+        for chunk in chunks:
+            if destination_file.read(len(chunk)) != chunk:
+                break
+            same_length += len(chunk)
+        else:
+            if not destination_file.read(1):
+                return os.fstat(destination_file.fileno())
+            # The new contents are a prefix of the file.
+            chunk = ''
+        with open_file_atomically(destination_filename) as new_file:
+            # Copy the common prefix from the file rather than keeping the
+            # chunks compared so far.
+            destination_file.seek(0)
+            while same_length:
+                text = destination_file.read(min(same_length, FILE_BLOCK_SIZE))
+                new_file.write(text)
+                same_length -= len(text)
+            new_file.write(chunk)
+            for chunk in chunks:
+                new_file.write(chunk)
+            new_file.flush()
+            return os.fstat(new_file.fileno())
+
+
+def write_file(new_text, destination_filename):
+    """Writes |new_text| unless the file already has the same contents.
+
+    |new_text| is a str or an iterable of str chunks, e.g. a template rendered
+    with Template.generate().  A str is compared with the file by its digest
+    if the digest of the file is known (see OutputDigests).  Otherwise chunks
+    are compared with the file as they are generated, and only written once
+    they differ from it, so neither the new nor the old contents are held in
+    memory as a whole.
+    """
+    with trace_event('write_file',
+                     filename=os.path.basename(destination_filename)):
+        digests = output_digests(destination_filename)
+        if isinstance(new_text, str):
+            new_digest = hashlib.sha1(new_text.encode('utf-8')).hexdigest()
+            known_digest = digests.digest(destination_filename)
+            if known_digest == new_digest:
+                return
+            if known_digest:
+                stat = write_file_atomically(new_text, destination_filename)
+                digests.record(destination_filename, new_digest, stat)
+                return
+            new_text = [new_text]
+
+        digest = hashlib.sha1()
+
+        def hashed_chunks():
+            for chunk in new_text:
+                digest.update(chunk.encode('utf-8'))
+                yield chunk
+        stat = _write_file_if_changed(hashed_chunks(), destination_filename)
+        digests.record(destination_filename, digest.hexdigest(), stat)
+
+
+def _write_pickle_bytes_if_changed(pickle_filename, new_bytes):
+    """Writes |new_bytes| unless the file already holds them.  Returns True if
+    the file was written."""
+    digests = output_digests(pickle_filename)
+    new_digest = hashlib.sha1(new_bytes).hexdigest()
+    if digests.digest(pickle_filename) == new_digest:
+        return False
+    try:
+        with open(pickle_filename, 'rb') as pickle_file:
+            old_bytes = pickle_file.read()
+            stat = os.fstat(pickle_file.fileno())
+    except (IOError, OSError):
+        old_bytes = None
+    if old_bytes == new_bytes:
+        digests.record(pickle_filename, new_digest, stat)
+        return False
+    digests.record(pickle_filename, new_digest,
+                   write_file_atomically(new_bytes, pickle_filename, 'wb'))
+    return True
+
+
+# The C pickler serializes sets without consulting reducer_override(), so
+# this derives from the pure Python one.
+class DeterministicPickler(pickle._Pickler):  # pylint: disable=protected-access
+    """Pickles sets in sorted order, and equal strings as one object.
+
+    The iteration order of a set of strings depends on the hash seed, which
+    differs between processes, so the same data would otherwise be pickled to
+    different bytes from run to run.  Likewise pickle memoizes strings by
+    identity, so data merged from several worker processes, which holds
+    distinct copies of strings, would otherwise be pickled differently from
+    the same data collected in one process.
+    """
+    def __init__(self, *args, **kwargs):
+        pickle._Pickler.__init__(self, *args, **kwargs)  # pylint: disable=protected-access
+        self.strings = {}
+
+    def save(self, obj, save_persistent_id=True):
+        if type(obj) is str:
+            obj = self.strings.setdefault(obj, obj)
+        pickle._Pickler.save(self, obj, save_persistent_id)  # pylint: disable=protected-access
+
+    def reducer_override(self, obj):
+        if type(obj) in (set, frozenset):
+            try:
+                items = sorted(obj)
+            except TypeError:
+                # Distinct objects may have the same string, e.g. union types
+                # whose members are unions themselves.
+                items = sorted(obj, key=lambda item: (
+                    str(item), pickle_dumps_deterministically(item)))
+            return type(obj), (items,)
+        return NotImplemented
+
+
+def pickle_dumps_deterministically(data):
+    output = io.BytesIO()
+    DeterministicPickler(output, pickle.HIGHEST_PROTOCOL).dump(data)
+    return output.getvalue()
+
+
+def write_pickle_file_if_changed(pickle_filename, data):
+    """Writes |data| unless the file already holds the same pickled bytes.
+
+    Data is pickled deterministically, so unchanged data is detected by the
+    recorded digest of the file, or else by comparing bytes, without
+    unpickling the file; this also works for objects without __eq__ (e.g.
+    IdlAttribute).  Returns True if the file was written.
+    """
+    return _write_pickle_bytes_if_changed(
+        pickle_filename, pickle_dumps_deterministically(data))
+
+
+def write_pickle_file(pickle_filename, data):
+    with trace_event('write_pickle_file',
+                     filename=os.path.basename(pickle_filename)):
+        write_pickle_file_if_changed(pickle_filename, data)
 
 
 ################################################################################
@@ -463,6 +819,41 @@ def to_snake_case(name):
     return NameStyleConverter(name).to_snake_case()
 
 
+@functools.lru_cache(maxsize=None)
+def _searched_patterns(patterns):
+    """Returns the distinct patterns of the tuple |patterns| which may occur
+    in a line, or None if every line contains one (the empty pattern)."""
+    if '' in patterns:
+        return None
+    return tuple(sorted(set(pattern for pattern in patterns
+                            if '\n' not in pattern)))
+
+
+def _lines_containing_patterns(text, patterns):
+    """Returns the sorted offsets of the lines of |text| containing any of
+    |patterns|."""
+    searched_patterns = _searched_patterns(tuple(patterns))
+    if searched_patterns is None:
+        line_starts = [0]
+        index = text.find('\n')
+        while index >= 0:
+            line_starts.append(index + 1)
+            index = text.find('\n', index + 1)
+        return line_starts
+    line_starts = set()
+    for pattern in searched_patterns:
+        index = text.find(pattern)
+        while index >= 0:
+            line_starts.add(text.rfind('\n', 0, index) + 1)
+            # Further occurrences in the line do not matter.
+            line_end = text.find('\n', index + len(pattern))
+            if line_end < 0:
+                break
+            index = text.find(pattern, line_end + 1)
+    return sorted(line_starts)
+
+
+@traced()
 def format_remove_duplicates(text, patterns):
     """Removes duplicated line-basis patterns.
 
@@ -472,6 +863,10 @@ def format_remove_duplicates(text, patterns):
 
     Designed to be used as a filter function for Jinja2.
 
+    The lines containing any of the patterns are found by searching the
+    text for each pattern, so only those lines are checked against each
+    pattern; the other lines are copied as they are.
+
     Args:
         text: A str of multi-line text.
         patterns: A list of str where each str represents a simple
@@ -483,7 +878,13 @@ def format_remove_duplicates(text, patterns):
     """
     pattern_founds = [False] * len(patterns)
     output = []
-    for line in text.split('\n'):
+    # Start of the text which is not yet output.
+    position = 0
+    for line_start in _lines_containing_patterns(text, patterns):
+        line_end = text.find('\n', line_start)
+        if line_end < 0:
+            line_end = len(text)
+        line = text[line_start:line_end]
         to_be_removed = False
         for i, pattern in enumerate(patterns):
             if pattern not in line:
@@ -493,16 +894,139 @@ def format_remove_duplicates(text, patterns):
             else:
                 pattern_founds[i] = True
         if to_be_removed:
-            continue
-        output.append(line)
+            output.append(text[position:line_start])
+            position = line_end + 1
+    output.append(text[position:])
+
+    # Every line is newline-terminated, including the last one.
+    if position <= len(text):
+        output.append('\n')
+    return ''.join(output)
 
-    # Let |'\n'.join| emit the last newline.
-    if output:
-        output.append('')
 
-    return '\n'.join(output)
+# A maximal run of empty lines, i.e. lines of whitespace only.
+BLANK_LINES_RE = re.compile(r'^[^\S\n]*\n(?:[^\S\n]*\n)*', re.MULTILINE)
+# Number of characters BlinkCppSourceCodeFormatter formats at a time.
+FORMAT_BLOCK_SIZE = 64 * 1024
 
 
+class BlinkCppSourceCodeFormatter(object):
+    """Formats C++ source code given in chunks, in a single pass.
+
+    See format_blink_cpp_source_code() for the modifications.  Only the
+    empty lines and the lines around them are examined: the chunks are
+    buffered into blocks of complete lines, the runs of empty lines are
+    found in a block with a single regex search, and the lines between them
+    are copied as they are.  An empty line is kept only if the last line
+    before the run does not open a brace and the first line after it does
+    not close one, so only these lines are searched for braces.
+    """
+    def __init__(self):
+        self.buffer = []
+        self.buffer_size = 0
+        self.was_open_brace = True  # Trick to remove the empty lines at the beginning.
+        self.was_empty_line = False
+
+    def feed(self, chunk):
+        """Adds |chunk| of the source code and returns the formatted code
+        which is known so far, possibly an empty str."""
+        self.buffer.append(chunk)
+        self.buffer_size += len(chunk)
+        if self.buffer_size < FORMAT_BLOCK_SIZE or '\n' not in chunk:
+            return ''
+        text = ''.join(self.buffer)
+        # Only complete lines are formatted.
+        block_end = text.rfind('\n') + 1
+        self.buffer = [text[block_end:]]
+        self.buffer_size = len(self.buffer[0])
+        return self.format_lines(text, block_end)
+
+    def close(self):
+        """Returns the rest of the formatted code."""
+        text = ''.join(self.buffer)
+        self.buffer = []
+        self.buffer_size = 0
+        if text.endswith('\n'):
+            return self.format_lines(text, len(text))
+        # The last line is not terminated by a newline.
+        if not text[text.rfind('\n') + 1:].strip():
+            # Drop the trailing empty line.
+            return self.format_lines(text, text.rfind('\n') + 1)
+        return self.format_lines(text + '\n', len(text) + 1)
+
+    def format_lines(self, text, end):
+        """Returns the formatted code of text[:end], which consists of
+        newline-terminated lines."""
+        output = []
+        position = 0
+        for match in BLANK_LINES_RE.finditer(text, 0, end):
+            if match.start() > position:
+                self.append_lines(output, text, position, match.start())
+            self.was_empty_line = True
+            position = match.end()
+        if end > position:
+            self.append_lines(output, text, position, end)
+        return ''.join(output)
+
+    def append_lines(self, output, text, start, end):
+        """Appends text[start:end], newline-terminated lines none of which is
+        empty, to |output|, preceded by a single empty line if needed."""
+        if self.was_empty_line:
+            self.was_empty_line = False
+            first_line = text[start:text.find('\n', start)]
+            if self.was_open_brace:
+                # No empty line just after an open brace.
+                pass
+            elif (first_brace(first_line) == '}' and
+                  'namespace' not in first_line):
+                # No empty line just before a closing brace.
+                pass
+            else:
+                # Preserve a single empty line.
+                output.append('\n')
+        output.append(text[start:end])
+        # Remember an open brace.
+        last_line_start = text.rfind('\n', start, end - 1) + 1 or start
+        last_line = text[last_line_start:end - 1]
+        self.was_open_brace = (last_brace(last_line) == '{' and
+                               'namespace' not in last_line)
+
+
+def first_brace(line):
+    """Returns the first brace in |line|, or None."""
+    open_index = line.find('{')
+    close_index = line.find('}')
+    if close_index < 0:
+        return '{' if open_index >= 0 else None
+    return '{' if 0 <= open_index < close_index else '}'
+
+
+def last_brace(line):
+    """Returns the last brace in |line|, or None."""
+    open_index = line.rfind('{')
+    close_index = line.rfind('}')
+    if open_index < 0 and close_index < 0:
+        return None
+    return '{' if open_index > close_index else '}'
+
+
+def format_blink_cpp_source_code_chunks(chunks):
+    """Yields the chunks of the formatted C++ source code given as
+    |chunks|, e.g. those of Template.generate().
+
+    See format_blink_cpp_source_code() for the modifications.
+    """
+    formatter = BlinkCppSourceCodeFormatter()
+    for chunk in chunks:
+        formatted_code = formatter.feed(chunk)
+        if formatted_code:
+            yield formatted_code
+    formatted_code = formatter.close()
+    if formatted_code:
+        yield formatted_code
+
+
+@traced()
 def format_blink_cpp_source_code(text):
     """Formats C++ source code.
 
@@ -519,41 +1043,5 @@ def format_blink_cpp_source_code(text):
     Returns:
         A formatted str of the source code.
     """
-    re_empty_line = re.compile(r'^\s*$')
-    re_first_brace = re.compile(r'(?P<first>[{}])')
-    re_last_brace = re.compile(r'.*(?P<last>[{}]).*?$')
-    was_open_brace = True  # Trick to remove the empty lines at the beginning.
-    was_empty_line = False
-    output = []
-    for line in text.split('\n'):
-        # Skip empty lines.
-        if re_empty_line.match(line):
-            was_empty_line = True
-            continue
-
-        # Emit a single empty line if needed.
-        if was_empty_line:
-            was_empty_line = False
-            match = re_first_brace.search(line)
-            if was_open_brace:
-                # No empty line just after an open brace.
-                pass
-            elif match and match.group('first') == '}' and 'namespace' not in line:
-                # No empty line just before a closing brace.
-                pass
-            else:
-                # Preserve a single empty line.
-                output.append('')
-
-        # Emit the line itself.
-        output.append(line)
-
-        # Remember an open brace.
-        match = re_last_brace.search(line)
-        was_open_brace = (match and match.group('last') == '{' and 'namespace' not in line)
-
-    # Let |'\n'.join| emit the last newline.
-    if output:
-        output.append('')
-
-    return '\n'.join(output)
+    formatter = BlinkCppSourceCodeFormatter()
+    return formatter.feed(text) + formatter.close()
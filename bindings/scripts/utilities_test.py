@@ -0,0 +1,285 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for utilities.py."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import utilities
+from utilities import OUTPUT_DIGESTS_BASENAME
+from utilities import OutputDigests
+from utilities import format_blink_cpp_source_code
+from utilities import format_blink_cpp_source_code_chunks
+from utilities import format_remove_duplicates
+from utilities import output_digests
+from utilities import pickle_dumps_deterministically
+from utilities import write_file
+from utilities import write_pickle_file
+
+
+class WriteFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.temp_dir, 'gen', 'V8Node.h')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read(self):
+        with open(self.filename) as output_file:
+            return output_file.read()
+
+    def write(self, chunks):
+        write_file(iter(chunks), self.filename)
+        # No temporary files are left behind.
+        directory = os.path.dirname(self.filename)
+        self.assertEqual(sorted(os.listdir(directory)),
+                         [OUTPUT_DIGESTS_BASENAME, 'V8Node.h'])
+        self.assertEqual(
+            os.listdir(os.path.join(directory, OUTPUT_DIGESTS_BASENAME)),
+            ['V8Node.h'])
+
+    def test_writes_chunks(self):
+        self.write(['// header\n', '', 'class Node;\n'])
+        self.assertEqual(self.read(), '// header\nclass Node;\n')
+        write_file('text', self.filename)
+        self.assertEqual(self.read(), 'text')
+
+    def test_unchanged_file_is_not_written(self):
+        self.write(['abc', 'def'])
+        os.utime(self.filename, (0, 0))
+        self.write(['ab', 'cde', 'f'])
+        self.assertEqual(os.stat(self.filename).st_mtime, 0)
+
+    def test_changed_file_is_written(self):
+        for chunks in (['abc', 'dxf'], ['abc', 'de'], ['abc', 'defg'],
+                       ['', 'x'], ['abc', 'def', 'g', 'hij'], []):
+            self.write(['abc', 'def'])
+            self.write(chunks)
+            self.assertEqual(self.read(), ''.join(chunks))
+
+    def test_files_get_permissions_of_umask(self):
+        old_umask = os.umask(0o027)
+        try:
+            self.write(['abc'])
+        finally:
+            os.umask(old_umask)
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o640)
+
+
+class OutputDigestsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.temp_dir, 'V8Node.h')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def digest(self):
+        return output_digests(self.filename).digest(self.filename)
+
+    def test_records_digests_of_written_files(self):
+        write_file('text', self.filename)
+        self.assertEqual(self.digest(), hashlib.sha1(b'text').hexdigest())
+        inode = os.stat(self.filename).st_ino
+        write_file(iter(['te', 'xt']), self.filename)
+        write_file('text', self.filename)
+        self.assertEqual(os.stat(self.filename).st_ino, inode)
+        write_file('new text', self.filename)
+        with open(self.filename) as output_file:
+            self.assertEqual(output_file.read(), 'new text')
+
+    def test_files_changed_otherwise_are_read(self):
+        write_file('text', self.filename)
+        with open(self.filename, 'w') as output_file:
+            output_file.write('changed')
+        self.assertEqual(self.digest(), None)
+        write_file('text', self.filename)
+        with open(self.filename) as output_file:
+            self.assertEqual(output_file.read(), 'text')
+
+    def test_digests_of_other_processes(self):
+        other_filename = os.path.join(self.temp_dir, 'V8Element.h')
+        write_file('text', self.filename)
+        # A digest recorded by another process.
+        with open(other_filename, 'w') as output_file:
+            output_file.write('other text')
+        OutputDigests(self.temp_dir).record(other_filename, 'digest',
+                                            os.stat(other_filename))
+        self.assertEqual(self.digest(), hashlib.sha1(b'text').hexdigest())
+        self.assertEqual(output_digests(other_filename).digest(other_filename),
+                         'digest')
+        self.assertEqual(sorted(os.listdir(self.temp_dir)),
+                         [OUTPUT_DIGESTS_BASENAME, 'V8Element.h', 'V8Node.h'])
+
+    def test_concurrent_writers(self):
+        script = ('import sys\n'
+                  'from utilities import write_file\n'
+                  'for index in range(5):\n'
+                  '    write_file("%s %d" % (sys.argv[2], index),\n'
+                  '               "%s/V8%s%d.h" % (sys.argv[1], sys.argv[2], index))\n')
+        env = dict(os.environ,
+                   PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+        process_count = 32
+        processes = [subprocess.Popen([sys.executable, '-c', script,
+                                       self.temp_dir, 'Node%d' % process],
+                                      env=env)
+                     for process in range(process_count)]
+        for process in processes:
+            self.assertEqual(process.wait(), 0)
+        digests = OutputDigests(self.temp_dir)
+        for process in range(process_count):
+            for index in range(5):
+                filename = os.path.join(self.temp_dir,
+                                        'V8Node%d%d.h' % (process, index))
+                self.assertEqual(
+                    digests.digest(filename),
+                    hashlib.sha1(b'Node%d %d' % (process, index)).hexdigest())
+
+    def test_replaces_digests_of_earlier_versions(self):
+        # Earlier versions kept all digests in one file.
+        digests_filename = os.path.join(self.temp_dir, OUTPUT_DIGESTS_BASENAME)
+        with open(digests_filename, 'wb') as digests_file:
+            digests_file.write(b'digests')
+        self.assertEqual(self.digest(), None)
+        write_file('text', self.filename)
+        self.assertEqual(self.digest(), hashlib.sha1(b'text').hexdigest())
+
+    def test_pickle_files(self):
+        filename = os.path.join(self.temp_dir, 'Info.pickle')
+        write_pickle_file(filename, {'names': set(['a', 'b'])})
+        inode = os.stat(filename).st_ino
+        write_pickle_file(filename, {'names': set(['b', 'a'])})
+        self.assertEqual(os.stat(filename).st_ino, inode)
+        write_pickle_file(filename, {'names': set(['a'])})
+        self.assertNotEqual(os.stat(filename).st_ino, inode)
+
+    def test_pickle_files_across_hash_seeds(self):
+        # Sets of strings iterate in an order depending on the hash seed.
+        # The file is pickled to the same bytes, and found unchanged without
+        # unpickling it.
+        filename = os.path.join(self.temp_dir, 'Info.pickle')
+        script = ('import pickle, sys\n'
+                  'from utilities import write_pickle_file\n'
+                  'def loads(*args):\n'
+                  '    raise AssertionError("unpickled")\n'
+                  'pickle.loads = loads\n'
+                  'write_pickle_file(sys.argv[1], {"names": set('
+                  '"name%d" % index for index in range(100))})\n')
+        inodes = []
+        for hash_seed in ['1', '2', '3']:
+            env = dict(os.environ, PYTHONHASHSEED=hash_seed,
+                       PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+            subprocess.check_call([sys.executable, '-c', script, filename],
+                                  env=env)
+            inodes.append(os.stat(filename).st_ino)
+            if hash_seed == '2':
+                # Without a recorded digest, bytes are compared.
+                shutil.rmtree(os.path.join(self.temp_dir, OUTPUT_DIGESTS_BASENAME))
+        self.assertEqual(len(set(inodes)), 1)
+
+
+class PickleDumpsDeterministicallyTest(unittest.TestCase):
+
+    def test_sets(self):
+        self.assertEqual(pickle_dumps_deterministically(set(['b', 'a', 'c'])),
+                         pickle_dumps_deterministically(set(['c', 'a', 'b'])))
+
+    def test_equal_strings(self):
+        # Equal strings are pickled the same whether or not they are
+        # identical, e.g. copies returned by different worker processes.
+        name = 'Name'
+        copy = ''.join(['Na', 'me'])
+        self.assertIsNot(name, copy)
+        self.assertEqual(pickle_dumps_deterministically([name, name]),
+                         pickle_dumps_deterministically([name, copy]))
+
+
+class FormatRemoveDuplicatesTest(unittest.TestCase):
+
+    def test_removes_later_lines_matching_a_pattern(self):
+        text = ('  ExceptionState exceptionState(a);\n'
+                '  foo();\n'
+                '  ExceptionState exceptionState(b);\n'
+                '  ScriptState* scriptState = c;\n'
+                '  ScriptState* scriptState = d;  ExceptionState exceptionState;\n'
+                '  bar();')
+        self.assertEqual(
+            format_remove_duplicates(text, ['ExceptionState exceptionState',
+                                            'ScriptState* scriptState = ']),
+            '  ExceptionState exceptionState(a);\n'
+            '  foo();\n'
+            '  ScriptState* scriptState = c;\n'
+            '  bar();\n')
+
+    def test_line_matching_several_patterns(self):
+        # A line duplicating one pattern is removed, even if it is the
+        # first occurrence of another pattern.
+        self.assertEqual(format_remove_duplicates('a\nab\nb\nc\n', ['a', 'b']),
+                         'a\nc\n\n')
+        self.assertEqual(format_remove_duplicates('x\na\na', ['a']), 'x\na\n')
+        self.assertEqual(format_remove_duplicates('a\n\n\n', ['']), 'a\n')
+        self.assertEqual(format_remove_duplicates('', ['a']), '\n')
+        self.assertEqual(format_remove_duplicates('a\nb', ['a\nb']), 'a\nb\n')
+
+
+class FormatBlinkCppSourceCodeTest(unittest.TestCase):
+
+    SOURCE_CODE = ('\n  \n'
+                   'namespace blink {\n'
+                   '\n'
+                   'void f() {\n'
+                   '\n'
+                   '  if (a) {  // }\n'
+                   '\n'
+                   '  \t\n'
+                   '  }\n'
+                   '  g(); }\n'
+                   '\n'
+                   '\n'
+                   '}  // namespace blink\n'
+                   '\n')
+    FORMATTED_CODE = ('namespace blink {\n'
+                      '\n'
+                      'void f() {\n'
+                      '  if (a) {  // }\n'
+                      '  }\n'
+                      '  g(); }\n'
+                      '\n'
+                      '}  // namespace blink\n')
+
+    def test_format(self):
+        self.assertEqual(format_blink_cpp_source_code(self.SOURCE_CODE),
+                         self.FORMATTED_CODE)
+        self.assertEqual(format_blink_cpp_source_code('\n \n'), '')
+        self.assertEqual(format_blink_cpp_source_code('a\n\nb'), 'a\n\nb\n')
+
+    def test_format_chunks(self):
+        for block_size in [1, 7, utilities.FORMAT_BLOCK_SIZE]:
+            for size in [1, 2, 5, 100]:
+                chunks = [self.SOURCE_CODE[index:index + size]
+                          for index in range(0, len(self.SOURCE_CODE), size)]
+                original_block_size = utilities.FORMAT_BLOCK_SIZE
+                utilities.FORMAT_BLOCK_SIZE = block_size
+                try:
+                    formatted_code = ''.join(
+                        format_blink_cpp_source_code_chunks(iter(chunks)))
+                finally:
+                    utilities.FORMAT_BLOCK_SIZE = original_block_size
+                self.assertEqual(formatted_code, self.FORMATTED_CODE)
+        self.assertEqual(list(format_blink_cpp_source_code_chunks([])), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ implementation classes that are used by blink's core/modules.
 
 import operator
 from idl_types import IdlType
+from trace_events import traced
 from utilities import to_snake_case
 from v8_globals import includes
 import v8_types
@@ -57,6 +58,7 @@ def unwrap_nullable_if_needed(idl_type):
 
 # Context for V8 bindings
 
+@traced()
 def dictionary_context(dictionary, interfaces_info):
     includes.clear()
     includes.update(DICTIONARY_CPP_INCLUDES)
@@ -155,6 +157,7 @@ def member_context(dictionary, member):
 
 # Context for implementation classes
 
+@traced()
 def dictionary_impl_context(dictionary, interfaces_info):
     def remove_duplicate_members(members):
         # When [ImplementedAs] is used, cpp_name can conflict. For example,
@@ -28,4 +28,54 @@
 
 """Module to share global variables (includes and interfaces) across modules."""
 
-includes = set()
+import contextvars
+
+
+class ContextLocalSet(object):
+    """A set with separate contents in each thread and asyncio task.
+
+    Used for the state collected while generating a file, so that generators
+    can run concurrently in threads or tasks.  The contents live in a context
+    variable, and clear() starts a new set in the current context: a task
+    copies the context it is created in, so it shares the set of its creator
+    only until it clears it, as generators do before collecting.
+    """
+
+    def __init__(self, name):
+        self._var = contextvars.ContextVar(name)
+
+    @property
+    def _set(self):
+        try:
+            return self._var.get()
+        except LookupError:
+            return self._new_set()
+
+    def _new_set(self):
+        new_set = set()
+        self._var.set(new_set)
+        return new_set
+
+    def add(self, item):
+        self._set.add(item)
+
+    def clear(self):
+        self._new_set()
+
+    def discard(self, item):
+        self._set.discard(item)
+
+    def update(self, *items):
+        self._set.update(*items)
+
+    def __contains__(self, item):
+        return item in self._set
+
+    def __iter__(self):
+        return iter(self._set)
+
+    def __len__(self):
+        return len(self._set)
+
+
+includes = ContextLocalSet('includes')
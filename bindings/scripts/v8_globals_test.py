@@ -0,0 +1,62 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for v8_globals.py."""
+
+import asyncio
+import threading
+import unittest
+
+from v8_globals import ContextLocalSet
+
+
+class ContextLocalSetTest(unittest.TestCase):
+
+    def test_set_operations(self):
+        items = ContextLocalSet('items')
+        items.update(['a', 'b'])
+        items.add('c')
+        items.discard('a')
+        self.assertEqual(sorted(items), ['b', 'c'])
+        self.assertIn('b', items)
+        self.assertEqual(len(items), 2)
+        items.clear()
+        self.assertEqual(len(items), 0)
+
+    def test_threads(self):
+        items = ContextLocalSet('items')
+        items.add('main')
+        thread_items = []
+
+        def run():
+            items.add('thread')
+            thread_items.extend(items)
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(thread_items, ['thread'])
+        self.assertEqual(list(items), ['main'])
+
+    def test_asyncio_tasks(self):
+        items = ContextLocalSet('items')
+        items.add('main')
+
+        async def collect(name):
+            items.clear()
+            items.add(name)
+            # Let the other task run between clearing and reading.
+            await asyncio.sleep(0)
+            items.add(name + '2')
+            return sorted(items)
+
+        async def run():
+            return await asyncio.gather(collect('a'), collect('b'))
+        self.assertEqual(asyncio.run(run()), [['a', 'a2'], ['b', 'b2']])
+        self.assertEqual(list(items), ['main'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,9 +36,10 @@ Design doc: http://www.chromium.org/developers/design-documents/idl-compiler
 from operator import or_
 
 from idl_definitions import IdlAttribute, IdlOperation, IdlArgument
-from idl_types import IdlType, inherits_interface
+from idl_types import IdlType, current_type_registry, inherits_interface
 from overload_set_algorithm import effective_overload_set_by_length
 from overload_set_algorithm import method_overloads_by_name
+from trace_events import traced
 
 import v8_attributes
 from v8_globals import includes
@@ -184,6 +185,7 @@ def runtime_call_stats_context(interface):
         'named_property_setter_counter': counter_prefix + 'NamedPropertySetter',
     }
 
+@traced()
 def interface_context(interface, interfaces):
     """Creates a Jinja template context for an interface.
 
@@ -525,6 +527,7 @@ def interface_context(interface, interfaces):
     return context
 
 
+@traced()
 def attributes_context(interface, interfaces):
     """Creates a list of Jinja template contexts for attributes of an interface.
 
@@ -564,6 +567,7 @@ def attributes_context(interface, interfaces):
     return attributes
 
 
+@traced()
 def methods_context(interface):
     """Creates a list of Jinja template contexts for methods of an interface.
 
@@ -856,6 +860,81 @@ def constant_context(constant, interface):
 # Overloads
 ################################################################################
 
+class OverloadResolutionCache(object):
+    """Memoizes the effective overload sets and resolution tests of
+    overloaded methods.
+
+    These depend only on the types and optionality of the arguments of the
+    overloads, and on the type information of the current TypeRegistry, and
+    the same signatures recur, e.g. in partial interfaces and interfaces
+    implementing the same mixins, and in the WebGL and canvas contexts.  The
+    results are cached in the registry by signature, with methods replaced by
+    their indices in the overloads, and are dropped when the type information
+    changes.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, overloads):
+        """Returns (effective overload set by length, length tests methods)
+        of |overloads|, as effective_overload_set_by_length() and
+        length_tests_methods() do.  The type lists of the effective overload
+        set may be equal types of the overloads of an earlier call."""
+        cache = current_type_registry().cache('overload_resolution')
+        key = overload_signatures(overloads)
+        resolution = cache.get(key)
+        if resolution is None:
+            self.misses += 1
+            effective_overloads_by_length = effective_overload_set_by_length(
+                overloads)
+            indices = dict((id(method), index)
+                           for index, method in enumerate(overloads))
+            resolution = cache[key] = (
+                [(length, [(indices[id(method)], type_list, optionality_list)
+                           for method, type_list, optionality_list
+                           in effective_overloads])
+                 for length, effective_overloads in effective_overloads_by_length],
+                [(length, [(test, indices[id(method)])
+                           for test, method in tests_methods])
+                 for length, tests_methods
+                 in length_tests_methods(effective_overloads_by_length)])
+        else:
+            self.hits += 1
+        effective_indices_by_length, length_tests_indices = resolution
+        return ([(length, [(overloads[index], type_list, optionality_list)
+                           for index, type_list, optionality_list in entries])
+                 for length, entries in effective_indices_by_length],
+                [(length, [(test, overloads[index])
+                           for test, index in tests_indices])
+                 for length, tests_indices in length_tests_indices])
+
+    def statistics(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def reset_statistics(self):
+        self.hits = 0
+        self.misses = 0
+
+    def add_statistics(self, statistics):
+        """Adds statistics() of another cache, e.g. of a worker process."""
+        self.hits += statistics['hits']
+        self.misses += statistics['misses']
+
+
+overload_resolution_cache = OverloadResolutionCache()
+
+
+def overload_signatures(overloads):
+    """Returns the types and optionality of the arguments of |overloads|, as
+    a hashable key."""
+    return tuple(tuple((argument['idl_type_object'], argument['is_optional'],
+                        argument['is_variadic'])
+                       for argument in method['arguments'])
+                 for method in overloads)
+
+
 def compute_method_overloads_context(interface, methods):
     # Regular methods
     compute_method_overloads_context_by_type(
@@ -902,7 +981,8 @@ def overloads_context(interface, overloads):
         raise Exception('[OriginTrialEnabled] cannot be specified on '
                         'overloaded methods: %s.%s' % (interface.name, overloads[0]['name']))
 
-    effective_overloads_by_length = effective_overload_set_by_length(overloads)
+    effective_overloads_by_length, overload_length_tests_methods = (
+        overload_resolution_cache.resolve(overloads))
     lengths = [length for length, _ in effective_overloads_by_length]
     name = overloads[0].get('name', '<constructor>')
 
@@ -984,7 +1064,7 @@ def overloads_context(interface, overloads):
         'deprecate_all_as': common_value(overloads, 'deprecate_as'),  # [DeprecateAs]
         'exposed_test_all': common_value(overloads, 'exposed_test'),  # [Exposed]
         'length': function_length,
-        'length_tests_methods': length_tests_methods(effective_overloads_by_length),
+        'length_tests_methods': overload_length_tests_methods,
         # 1. Let maxarg be the length of the longest type list of the
         # entries in S.
         'maxarg': maxarg,
@@ -0,0 +1,95 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for the memoized overload resolution of v8_interface.py."""
+
+import unittest
+
+from idl_types import IdlType
+from idl_types import TypeRegistry
+from idl_types import use_type_registry
+from overload_set_algorithm import effective_overload_set_by_length
+from v8_interface import length_tests_methods
+from v8_interface import overload_resolution_cache
+
+
+def method(name, *arguments):
+    return {
+        'name': name,
+        'arguments': [{'idl_type_object': IdlType(type_name),
+                       'is_optional': is_optional,
+                       'is_variadic': False}
+                      for type_name, is_optional in arguments],
+    }
+
+
+def overloads(name):
+    # As fillText(text, x, y, optional maxWidth) and an overload by a path.
+    return [method(name, ('DOMString', False), ('double', False),
+                   ('double', False), ('double', True)),
+            method(name, ('DOMString', False), ('Path2D', False))]
+
+
+class OverloadResolutionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        overload_resolution_cache.reset_statistics()
+
+    def test_same_signatures_hit(self):
+        with use_type_registry(TypeRegistry()):
+            fill_text = overloads('fillText')
+            self.assertEqual(
+                overload_resolution_cache.resolve(fill_text),
+                (effective_overload_set_by_length(fill_text),
+                 length_tests_methods(
+                     effective_overload_set_by_length(fill_text))))
+            # Hits return the methods given.
+            stroke_text = overloads('strokeText')
+            effective_overloads_by_length, tests_methods = (
+                overload_resolution_cache.resolve(stroke_text))
+            self.assertEqual(
+                [length for length, _ in effective_overloads_by_length],
+                [2, 3, 4])
+            self.assertIs(effective_overloads_by_length[0][1][0][0],
+                          stroke_text[1])
+            self.assertEqual(tests_methods[0],
+                             (2, [('true', stroke_text[1])]))
+            self.assertEqual(
+                [test for test, _ in tests_methods[1][1]], ['true'])
+            self.assertIs(tests_methods[1][1][0][1], stroke_text[0])
+        self.assertEqual(overload_resolution_cache.statistics(),
+                         {'hits': 1, 'misses': 1})
+
+    def test_different_signatures_miss(self):
+        with use_type_registry(TypeRegistry()):
+            overload_resolution_cache.resolve(overloads('fillText'))
+            optional_path = overloads('fillText')
+            optional_path[1]['arguments'][1]['is_optional'] = True
+            overload_resolution_cache.resolve(optional_path)
+        self.assertEqual(overload_resolution_cache.statistics(),
+                         {'hits': 0, 'misses': 2})
+
+    def test_type_info_change_invalidates(self):
+        registry = TypeRegistry()
+        with use_type_registry(registry):
+            overload_resolution_cache.resolve(overloads('fillText'))
+            registry.changed()
+            overload_resolution_cache.resolve(overloads('fillText'))
+        self.assertEqual(overload_resolution_cache.statistics(),
+                         {'hits': 0, 'misses': 2})
+
+    def test_errors_are_not_cached(self):
+        ambiguous = [method('f', ('long', False)), method('f', ('long', False))]
+        with use_type_registry(TypeRegistry()):
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    overload_resolution_cache.resolve(ambiguous)
+        self.assertEqual(overload_resolution_cache.statistics(),
+                         {'hits': 0, 'misses': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -40,6 +40,7 @@ Design doc: http://www.chromium.org/developers/design-documents/idl-compiler
 """
 
 import posixpath
+from collections import defaultdict
 
 from idl_types import IdlArrayOrSequenceType
 from idl_types import IdlNullableType
@@ -47,12 +48,81 @@ from idl_types import IdlRecordType
 from idl_types import IdlType
 from idl_types import IdlTypeBase
 from idl_types import IdlUnionType
+from idl_types import current_type_registry
+from idl_types import declare_type_traits
+from idl_types import freeze
+from idl_types import type_info_trait
+from idl_types import type_trait
 from utilities import to_snake_case
 import v8_attributes  # for IdlType.constructor_type_name
 from v8_globals import includes
 from v8_utilities import extended_attribute_value_contains
 
 
+################################################################################
+# Memoization
+################################################################################
+
+class ConversionCache(object):
+    """Memoizes the C++ types and V8 conversions of IDL types.
+
+    These depend only on the type, some of the extended attributes of the
+    attribute, argument or return value, a few flags, and the type
+    information of the current TypeRegistry.  Results are cached in the
+    registry, keyed by type, conversion, relevant extended attributes and
+    flags, and are dropped when the type information changes.  Hits and misses
+    are counted over all registries.
+    """
+
+    def __init__(self):
+        self.hits = defaultdict(int)  # conversion -> count
+        self.misses = defaultdict(int)  # conversion -> count
+
+    def get(self, conversion, idl_type, key, compute):
+        values = current_type_registry().cached_values(idl_type)
+        key = (conversion,) + key
+        if key in values:
+            self.hits[conversion] += 1
+            return values[key]
+        self.misses[conversion] += 1
+        value = compute()
+        values[key] = value
+        return value
+
+    def statistics(self):
+        """Returns {conversion: (hits, misses)}."""
+        return dict((conversion, (self.hits[conversion], self.misses[conversion]))
+                    for conversion in set(self.hits) | set(self.misses))
+
+    def reset_statistics(self):
+        self.hits.clear()
+        self.misses.clear()
+
+    def add_statistics(self, statistics):
+        """Adds statistics() of another cache, e.g. of a worker process."""
+        for conversion, (hits, misses) in statistics.items():
+            self.hits[conversion] += hits
+            self.misses[conversion] += misses
+
+    def format_statistics(self):
+        lines = []
+        for conversion, (hits, misses) in sorted(self.statistics().items()):
+            lines.append('%s: %d hits, %d misses (%.1f%% hit rate)' % (
+                conversion, hits, misses, 100.0 * hits / (hits + misses)))
+        return '\n'.join(lines)
+
+
+conversion_cache = ConversionCache()
+
+
+def relevant_extended_attributes(extended_attributes, names):
+    """Returns the extended attributes in |names| as a hashable key."""
+    if not extended_attributes:
+        return ()
+    return tuple((name, freeze(extended_attributes[name]))
+                 for name in names if name in extended_attributes)
+
+
 ################################################################################
 # V8-specific handling of IDL types
 ################################################################################
@@ -86,19 +156,22 @@ ARRAY_BUFFER_AND_VIEW_TYPES = TYPED_ARRAY_TYPES.union(frozenset([
 ]))
 
 
-IdlType.is_array_buffer_or_view = property(
-    lambda self: self.base_type in ARRAY_BUFFER_AND_VIEW_TYPES)
+IdlType.is_array_buffer_or_view = type_trait(
+    lambda self: self.base_type in ARRAY_BUFFER_AND_VIEW_TYPES,
+    'is_array_buffer_or_view')
 
-IdlType.is_array_buffer_view_or_typed_array = property(
-    lambda self: self.base_type in ARRAY_BUFFER_VIEW_AND_TYPED_ARRAY_TYPES)
+IdlType.is_array_buffer_view_or_typed_array = type_trait(
+    lambda self: self.base_type in ARRAY_BUFFER_VIEW_AND_TYPED_ARRAY_TYPES,
+    'is_array_buffer_view_or_typed_array')
 
-IdlType.is_typed_array = property(
-    lambda self: self.base_type in TYPED_ARRAY_TYPES)
+IdlType.is_typed_array = type_trait(
+    lambda self: self.base_type in TYPED_ARRAY_TYPES, 'is_typed_array')
 
-IdlType.is_wrapper_type = property(
+IdlType.is_wrapper_type = type_info_trait(
     lambda self: (self.is_interface_type and
                   not self.is_callback_interface and
-                  self.base_type not in NON_WRAPPER_TYPES))
+                  self.base_type not in NON_WRAPPER_TYPES),
+    'is_wrapper_type')
 
 
 ################################################################################
@@ -135,7 +208,21 @@ CPP_SPECIAL_CONVERSION_RULES = {
 }
 
 
+# Extended attributes cpp_type() depends on.
+CPP_TYPE_EXTENDED_ATTRIBUTES = ('AllowShared', 'FlexibleArrayBufferView', 'TreatNullAs')
+
+
 def cpp_type(idl_type, extended_attributes=None, raw_type=False, used_as_rvalue_type=False, used_as_variadic_argument=False, used_in_cpp_sequence=False):
+    """Returns C++ type corresponding to IDL type; see uncached_cpp_type()."""
+    key = (relevant_extended_attributes(extended_attributes, CPP_TYPE_EXTENDED_ATTRIBUTES),
+           raw_type, used_as_rvalue_type, used_as_variadic_argument, used_in_cpp_sequence)
+    return conversion_cache.get(
+        'cpp_type', idl_type, key,
+        lambda: uncached_cpp_type(idl_type, extended_attributes, raw_type, used_as_rvalue_type,
+                                  used_as_variadic_argument, used_in_cpp_sequence))
+
+
+def uncached_cpp_type(idl_type, extended_attributes=None, raw_type=False, used_as_rvalue_type=False, used_as_variadic_argument=False, used_in_cpp_sequence=False):
     """Returns C++ type corresponding to IDL type.
 
     |idl_type| argument is of type IdlType, while return value is a string
@@ -288,8 +375,8 @@ IdlTypeBase.cpp_type_args = cpp_type
 IdlUnionType.cpp_type_initializer = ''
 
 
-IdlArrayOrSequenceType.native_array_element_type = property(
-    lambda self: self.element_type)
+IdlArrayOrSequenceType.native_array_element_type = type_trait(
+    lambda self: self.element_type, 'native_array_element_type')
 
 
 def cpp_template_type(template, inner_type):
@@ -316,32 +403,35 @@ def v8_type(interface_name):
 # when generating bindings for Foo, the [ImplementedAs] on Bar is needed.
 # This data is external to Foo.idl, and hence computed as global information in
 # compute_interfaces_info.py to avoid having to parse IDLs of all used interfaces.
-IdlType.implemented_as_interfaces = {}
-
-
 def implemented_as(idl_type):
     base_idl_type = idl_type.base_type
-    if base_idl_type in IdlType.implemented_as_interfaces:
-        return IdlType.implemented_as_interfaces[base_idl_type]
+    implemented_as_interfaces = current_type_registry().implemented_as_interfaces
+    if base_idl_type in implemented_as_interfaces:
+        return implemented_as_interfaces[base_idl_type]
     return base_idl_type
 
 
-IdlType.implemented_as = property(implemented_as)
+IdlType.implemented_as = type_info_trait(implemented_as)
 
-IdlType.set_implemented_as_interfaces = classmethod(
-    lambda cls, new_implemented_as_interfaces:
-        cls.implemented_as_interfaces.update(new_implemented_as_interfaces))
+def set_implemented_as_interfaces(new_implemented_as_interfaces):
+    registry = current_type_registry()
+    registry.implemented_as_interfaces.update(new_implemented_as_interfaces)
+    registry.changed()
+
+IdlType.set_implemented_as_interfaces = staticmethod(set_implemented_as_interfaces)
 
 
 # [GarbageCollected]
-IdlType.garbage_collected_types = set()
+IdlType.is_garbage_collected = type_info_trait(
+    lambda self: self.base_type in current_type_registry().garbage_collected_types,
+    'is_garbage_collected')
 
-IdlType.is_garbage_collected = property(
-    lambda self: self.base_type in IdlType.garbage_collected_types)
+def set_garbage_collected_types(new_garbage_collected_types):
+    registry = current_type_registry()
+    registry.garbage_collected_types.update(new_garbage_collected_types)
+    registry.changed()
 
-IdlType.set_garbage_collected_types = classmethod(
-    lambda cls, new_garbage_collected_types:
-        cls.garbage_collected_types.update(new_garbage_collected_types))
+IdlType.set_garbage_collected_types = staticmethod(set_garbage_collected_types)
 
 
 def is_gc_type(idl_type):
@@ -362,6 +452,17 @@ IdlRecordType.is_traceable = property(
     lambda self: self.value_type.is_traceable)
 
 
+declare_type_traits({
+    'implemented_as': None,
+    'is_array_buffer_or_view': False,
+    'is_array_buffer_view_or_typed_array': False,
+    'is_garbage_collected': False,
+    'is_typed_array': False,
+    'is_wrapper_type': False,
+    'native_array_element_type': None,
+})
+
+
 ################################################################################
 # Includes
 ################################################################################
@@ -403,11 +504,12 @@ def includes_for_type(idl_type, extended_attributes=None):
 
     # Simple types
     base_idl_type = idl_type.base_type
+    component_dirs = current_type_registry().component_dirs
     if base_idl_type in INCLUDES_FOR_TYPE:
         return INCLUDES_FOR_TYPE[base_idl_type]
     if base_idl_type in TYPED_ARRAY_TYPES:
         return INCLUDES_FOR_TYPE['ArrayBufferView'].union(
-            set(['bindings/%s/v8/V8%s.h' % (component_dir[base_idl_type], base_idl_type)])
+            set(['bindings/%s/v8/V8%s.h' % (component_dirs[base_idl_type], base_idl_type)])
         )
     if idl_type.is_basic_type:
         return set(['bindings/core/v8/IDLTypes.h',
@@ -425,11 +527,11 @@ def includes_for_type(idl_type, extended_attributes=None):
     if idl_type.is_custom_callback_function:
         return set()
     if idl_type.is_callback_function:
-        component = IdlType.callback_functions[base_idl_type]['component_dir']
+        component = current_type_registry().callback_functions[base_idl_type]['component_dir']
         return set(['bindings/%s/v8/%s.h' % (component, to_snake_case('V8%s' % base_idl_type))])
-    if base_idl_type not in component_dir:
+    if base_idl_type not in component_dirs:
         return set()
-    return set(['bindings/%s/v8/V8%s.h' % (component_dir[base_idl_type],
+    return set(['bindings/%s/v8/V8%s.h' % (component_dirs[base_idl_type],
                                            base_idl_type)])
 
 IdlType.includes_for_type = includes_for_type
@@ -518,11 +620,10 @@ IdlTypeBase.impl_forward_declaration_name = property(
     impl_forward_declaration_name)
 
 
-component_dir = {}
-
-
 def set_component_dirs(new_component_dirs):
-    component_dir.update(new_component_dirs)
+    registry = current_type_registry()
+    registry.component_dirs.update(new_component_dirs)
+    registry.changed()
 
 
 ################################################################################
@@ -597,7 +698,22 @@ def native_value_traits_type_name(idl_type):
     return name
 
 
+# Extended attributes v8_value_to_cpp_value() depends on.
+V8_VALUE_TO_CPP_VALUE_EXTENDED_ATTRIBUTES = CPP_TYPE_EXTENDED_ATTRIBUTES + ('Clamp', 'EnforceRange')
+
+
 def v8_value_to_cpp_value(idl_type, extended_attributes, v8_value, variable_name, isolate):
+    # The expression is memoized as a format string, with the values left as
+    # replacement fields.
+    key = (relevant_extended_attributes(extended_attributes, V8_VALUE_TO_CPP_VALUE_EXTENDED_ATTRIBUTES),)
+    cpp_expression_format = conversion_cache.get(
+        'v8_value_to_cpp_value', idl_type, key,
+        lambda: uncached_v8_value_to_cpp_value(idl_type, extended_attributes, '{v8_value}',
+                                               '{variable_name}', '{isolate}'))
+    return cpp_expression_format.format(v8_value=v8_value, variable_name=variable_name, isolate=isolate)
+
+
+def uncached_v8_value_to_cpp_value(idl_type, extended_attributes, v8_value, variable_name, isolate):
     if idl_type.name == 'void':
         return ''
 
@@ -766,7 +882,12 @@ def preprocess_idl_type(idl_type):
         return idl_type
     return idl_type
 
-IdlTypeBase.preprocessed_type = property(preprocess_idl_type)
+
+def preprocessed_type(idl_type):
+    return conversion_cache.get('preprocessed_type', idl_type, (),
+                                lambda: preprocess_idl_type(idl_type))
+
+IdlTypeBase.preprocessed_type = property(preprocessed_type)
 
 
 def preprocess_idl_type_and_value(idl_type, cpp_value, extended_attributes):
@@ -794,7 +915,14 @@ def preprocess_idl_type_and_value(idl_type, cpp_value, extended_attributes):
     return idl_type, cpp_value
 
 
-def v8_conversion_type(idl_type, extended_attributes):
+def v8_conversion_type(idl_type, extended_attributes=None):
+    """Returns V8 conversion type; see uncached_v8_conversion_type()."""
+    # |extended_attributes| does not affect the conversion type.
+    return conversion_cache.get('v8_conversion_type', idl_type, (),
+                                lambda: uncached_v8_conversion_type(idl_type, extended_attributes))
+
+
+def uncached_v8_conversion_type(idl_type, extended_attributes):
     """Returns V8 conversion type, adding any additional includes.
 
     The V8 conversion type is used to select the C++ -> V8 conversion function
@@ -1003,6 +1131,21 @@ CPP_VALUE_TO_V8_VALUE = {
 
 def cpp_value_to_v8_value(idl_type, cpp_value, isolate='info.GetIsolate()', creation_context='info.Holder()', extended_attributes=None):
     """Returns an expression that converts a C++ value to a V8 value."""
+    if extended_attributes and 'Reflect' in extended_attributes:
+        # [Reflect] rewrites |cpp_value| itself; see
+        # preprocess_idl_type_and_value().
+        return uncached_cpp_value_to_v8_value(idl_type, cpp_value, isolate, creation_context,
+                                              extended_attributes)
+    # The expression is memoized as a format string, with the values left as
+    # replacement fields.
+    statement_format = conversion_cache.get(
+        'cpp_value_to_v8_value', idl_type, (),
+        lambda: uncached_cpp_value_to_v8_value(idl_type, '{cpp_value}', '{isolate}',
+                                               '{creation_context}', extended_attributes))
+    return statement_format.format(cpp_value=cpp_value, isolate=isolate, creation_context=creation_context)
+
+
+def uncached_cpp_value_to_v8_value(idl_type, cpp_value, isolate, creation_context, extended_attributes):
     # the isolate parameter is needed for callback interfaces
     idl_type, cpp_value = preprocess_idl_type_and_value(idl_type, cpp_value, extended_attributes)
     this_v8_conversion_type = idl_type.v8_conversion_type(extended_attributes)
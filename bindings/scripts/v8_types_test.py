@@ -0,0 +1,61 @@
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# pylint: disable=import-error,print-statement,relative-import
+
+"""Unit tests for the memoized conversions of v8_types.py."""
+
+import unittest
+
+from idl_types import IdlNullableType
+from idl_types import IdlType
+from idl_types import TypeRegistry
+from idl_types import use_type_registry
+from v8_types import cpp_type
+from v8_types import conversion_cache
+from v8_types import set_garbage_collected_types
+from v8_types import uncached_cpp_type
+from v8_types import v8_value_to_cpp_value
+
+
+class ConversionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        conversion_cache.reset_statistics()
+
+    def test_hits_and_misses(self):
+        idl_type = IdlType('DOMString')
+        self.assertEqual(cpp_type(idl_type), uncached_cpp_type(idl_type))
+        cpp_type(IdlType('DOMString'))
+        cpp_type(idl_type, raw_type=True)
+        cpp_type(idl_type, {'TreatNullAs': 'NullString'})
+        cpp_type(idl_type, {'TreatNullAs': 'NullString', 'Unrelated': None})
+        self.assertEqual(conversion_cache.statistics()['cpp_type'], (2, 3))
+
+    def test_conversion_template(self):
+        idl_type = IdlNullableType(IdlType('long'))
+        self.assertEqual(
+            v8_value_to_cpp_value(idl_type, {}, 'info[0]', 'x', 'isolate'),
+            'NativeValueTraits<IDLLong>::NativeValue(isolate, info[0], '
+            'exceptionState, kNormalConversion)')
+        self.assertEqual(
+            v8_value_to_cpp_value(idl_type, {}, 'v8Value', 'y', 'info.GetIsolate()'),
+            'NativeValueTraits<IDLLong>::NativeValue(info.GetIsolate(), v8Value, '
+            'exceptionState, kNormalConversion)')
+        self.assertEqual(
+            conversion_cache.statistics()['v8_value_to_cpp_value'], (1, 1))
+
+    def test_type_info_change_invalidates(self):
+        idl_type = IdlType('Node')
+        with use_type_registry(TypeRegistry()):
+            self.assertEqual(cpp_type(idl_type, used_in_cpp_sequence=True),
+                             'Member<Node>')
+            set_garbage_collected_types(['Node'])
+            self.assertEqual(cpp_type(idl_type, used_in_cpp_sequence=True),
+                             'Member<Node>')
+        self.assertEqual(conversion_cache.statistics()['cpp_type'], (0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 # found in the LICENSE file.
 
 from utilities import to_snake_case
+from v8_globals import ContextLocalSet
 import v8_types
 import v8_utilities
 
@@ -20,9 +21,9 @@ UNION_H_INCLUDES = frozenset([
 ])
 
 
-cpp_includes = set()
-header_forward_decls = set()
-header_includes = set()
+cpp_includes = ContextLocalSet('union_cpp_includes')
+header_forward_decls = ContextLocalSet('union_header_forward_decls')
+header_includes = ContextLocalSet('union_header_includes')
 
 
 def container_context(union_type, info_provider):
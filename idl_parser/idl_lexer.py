@@ -15,6 +15,7 @@ PLY can be found at:
 """
 
 import os.path
+import re
 import sys
 
 SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
@@ -22,6 +23,166 @@ sys.path.insert(0, os.path.join(SRC_DIR, 'third_party'))
 from ply import lex
 
 
+#
+# Fast Lexer
+#
+# FastLexer is an alternative to the lexer object built by PLY's lex.  PLY
+# calls a Python function per token rule and counts lines token by token,
+# which is slow across thousands of files.  FastLexer scans with a single
+# compiled pattern made of the same rules, in the same order, and handles the
+# rules of IDLLexer inline, looking keywords up in the IDLLexer's keyword
+# table.  It produces the same token stream, line numbers and line index
+# (IDLLexer.index) as PLY, and reports errors through IDLLexer.t_ANY_error.
+#
+# Only the rules of IDLLexer are supported; a lexer which defines other token
+# rules must use PLY.
+#
+FAST_LEXER_RULES = frozenset([
+    't_ELLIPSIS', 't_float', 't_integer', 't_LINE_END', 't_string',
+    't_SPECIAL_COMMENT', 't_COMMENT', 't_KEYWORD_OR_SYMBOL',
+])
+
+# Compiled scanner patterns, by lexer class.
+_fast_lexer_patterns = {}
+
+
+def _FastLexerPattern(lexer_class):
+  if lexer_class in _fast_lexer_patterns:
+    return _fast_lexer_patterns[lexer_class]
+
+  function_rules = []
+  for name in dir(lexer_class):
+    if not name.startswith('t_') or name in ('t_ignore', 't_ANY_error'):
+      continue
+    rule = getattr(lexer_class, name)
+    if name not in FAST_LEXER_RULES or not callable(rule):
+      raise ValueError('The fast lexer does not support the rule %s.' % name)
+    function_rules.append(rule)
+  # Like PLY, try function rules in the order they are defined.
+  function_rules.sort(key=lambda rule: rule.__code__.co_firstlineno)
+
+  # Ignored characters never start a token, so skipping them first (as PLY
+  # does) is the same as trying them first.
+  patterns = ['(?P<t_ignore>[%s]+)' % re.escape(lexer_class.t_ignore)]
+  for rule in function_rules:
+    # '(.|\n)' matches any character, as does '[\s\S]', which does not
+    # backtrack through a group for every character of long comments.
+    regex = rule.__doc__.replace('(.|\\n)', '[\\s\\S]')
+    patterns.append('(?P<%s>%s)' % (rule.__name__, regex))
+  # PLY compiles token rules in verbose mode.
+  pattern = re.compile('|'.join(patterns), re.VERBOSE)
+  _fast_lexer_patterns[lexer_class] = pattern
+  return pattern
+
+
+class FastLexer(object):
+  def __init__(self, idl_lexer):
+    self._idl_lexer = idl_lexer
+    self._pattern = _FastLexerPattern(type(idl_lexer))
+    self._tokens = iter(())
+    self.lexdata = ''
+    self.lexpos = 0
+    self.lineno = 1
+    self.filename = None
+
+  def input(self, data):
+    self.lexdata = data
+    self.lexpos = 0
+    self._tokens = self._Scan()
+
+  def token(self):
+    return next(self._tokens, None)
+
+  def _Scan(self):
+    # Hot loop: keep everything in locals.
+    data = self.lexdata
+    end = len(data)
+    match = self._pattern.match
+    idl_lexer = self._idl_lexer
+    keywords = idl_lexer.keywords
+    literals = idl_lexer.literals
+    line_index = idl_lexer.index
+    LexToken = lex.LexToken
+    pos = self.lexpos
+    lineno = self.lineno
+
+    while pos < end:
+      m = match(data, pos)
+      if m is None:
+        if data[pos] in literals:
+          tok = LexToken()
+          tok.type = tok.value = data[pos]
+          tok.lineno = lineno
+          tok.lexpos = pos
+          pos += 1
+          self.lexpos = pos
+          yield tok
+          continue
+        # As PLY, report the error and give up.
+        self.lexpos = pos
+        self.lineno = lineno
+        tok = LexToken()
+        tok.type = 'error'
+        tok.value = data[pos:]
+        tok.lineno = lineno
+        tok.lexpos = pos
+        tok.lexer = self
+        idl_lexer.t_ANY_error(tok)
+        raise lex.LexError("Scanning error. Illegal character '%s'" %
+                           data[pos], data[pos:])
+
+      rule = m.lastgroup
+      value = m.group()
+      start = pos
+      pos = m.end()
+      if rule == 't_ignore':
+        continue
+      if rule == 't_LINE_END':
+        lineno += len(value)
+        line_index.extend([pos] * len(value))
+        continue
+      if rule == 't_COMMENT':
+        newlines = value.count('\n')
+        if newlines:
+          lineno += newlines
+          line_index.extend([pos] * newlines)
+        continue
+
+      tok = LexToken()
+      tok.lineno = lineno
+      tok.lexpos = start
+      if rule == 't_KEYWORD_OR_SYMBOL':
+        tok.type = keywords.get(value, 'identifier')
+        if value[0] == '_':
+          value = value[1:]
+      elif rule == 't_string':
+        tok.type = 'string'
+        value = value[1:-1]
+        newlines = value.count('\n')
+        if newlines:
+          lineno += newlines
+          line_index.extend([pos] * newlines)
+      elif rule == 't_SPECIAL_COMMENT':
+        tok.type = 'SPECIAL_COMMENT'
+        newlines = value.count('\n')
+        if newlines:
+          lineno += newlines
+          line_index.extend([pos] * newlines)
+      else:
+        # t_ELLIPSIS, t_float and t_integer.
+        tok.type = rule[2:]
+      tok.value = value
+      self.lexpos = pos
+      self.lineno = lineno
+      yield tok
+
+    self.lexpos = pos
+    self.lineno = lineno
+
+
+LEXER_ENGINES = ('ply', 'fast')
+
+
 #
 # IDL Lexer
 #
@@ -174,18 +335,7 @@ class IDLLexer(object):
   def t_ANY_error(self, t):
     msg = 'Unrecognized input'
     line = self.Lexer().lineno
-
-    # If that line has not been accounted for, then we must have hit
-    # EoF, so compute the beginning of the line that caused the problem.
-    if line >= len(self.index):
-      # Find the offset in the line of the first word causing the issue
-      word = t.value.split()[0]
-      offs = self.lines[line - 1].find(word)
-      # Add the computed line's starting position
-      self.index.append(self.Lexer().lexpos - offs)
-      msg = 'Unexpected EoF reached after'
-
-    pos = self.Lexer().lexpos - self.index[line]
+    pos = self.Lexer().lexpos - self.LineOffsets()[line - 1]
     out = self.ErrorMessage(line, pos, msg)
     sys.stderr.write(out + '\n')
     self._lex_errors += 1
@@ -207,12 +357,26 @@ class IDLLexer(object):
       return "%s(%d) : %s" % (filename, line + 1, msg)
     return "<BuiltIn> : %s" % msg
 
+  def LineOffsets(self):
+    # The offsets at which the lines of the current data start.  Only error
+    # paths need them, so they are computed on first use, once per file.
+    if self._line_offsets is None:
+      self._line_offsets = [0]
+      self._line_offsets.extend(
+          match.end() for match in re.finditer('\n', self._data))
+    return self._line_offsets
+
+  def LineText(self, line):
+    # The text of a (1 based) line of the current data, without its newline.
+    offsets = self.LineOffsets()
+    if line >= len(offsets):
+      return self._data[offsets[line - 1]:]
+    return self._data[offsets[line - 1]:offsets[line] - 1]
+
   def SourceLine(self, line, pos):
     # Create a source line marker
     caret = ' ' * pos + '^'
-    # We decrement the line number since the array is 0 based while the
-    # line numbers are 1 based.
-    return "%s\n%s" % (self.lines[line - 1], caret)
+    return "%s\n%s" % (self.LineText(line), caret)
 
   def ErrorMessage(self, line, pos, msg):
     return "\n%s\n%s" % (
@@ -246,14 +410,18 @@ class IDLLexer(object):
     lexer.lineno = 1
     lexer.filename = filename
     lexer.input(data)
-    self.lines = data.split('\n')
+    self._data = data
+    self._line_offsets = None
 
   def KnownTokens(self):
     return self.tokens
 
   def Lexer(self):
     if not self._lexobj:
-      self._lexobj = lex.lex(object=self, lextab=None, optimize=0)
+      if self._engine == 'fast':
+        self._lexobj = FastLexer(self)
+      else:
+        self._lexobj = lex.lex(object=self, lextab=None, optimize=0)
     return self._lexobj
 
   def _AddToken(self, token):
@@ -276,7 +444,12 @@ class IDLLexer(object):
       self.tokens.remove(key.upper())
       del self.keywords[key]
 
-  def __init__(self):
+  # |engine| selects how the input is scanned: 'ply' uses PLY's lex, 'fast'
+  # uses FastLexer, which produces the same tokens faster.
+  def __init__(self, engine='ply'):
+    if engine not in LEXER_ENGINES:
+      raise ValueError('Unknown lexer engine: %s' % engine)
+    self._engine = engine
     self.index = [0]
     self._lex_errors = 0
     self.linex = []
@@ -287,7 +460,8 @@ class IDLLexer(object):
     self._AddKeywords(IDLLexer.keywords)
     self._lexobj = None
     self.last = None
-    self.lines = None
+    self._data = ''
+    self._line_offsets = None
 
 # If run by itself, attempt to build the lexer
 if __name__ == '__main__':
@@ -75,23 +75,30 @@ class IDLAttribute(object):
 # allow for look-ups.  IDLNode is derived from IDLRelease, so it is
 # version aware.
 #
+# Parsing a large tree creates many nodes, so nodes are kept compact: they use
+# __slots__, the default properties live in slots and the property dictionary
+# and ERRORS/WARNINGS lists are only created when needed, and children are
+# indexed by class the first time GetListOf or GetOneOf is called.
+#
 class IDLNode(object):
   VERBOSE_PROPS = [
       'PROD', 'NAME', 'VALUE', 'TYPE',
       'ERRORS', 'WARNINGS', 'FILENAME', 'LINENO', 'POSITION', 'DATETIME',
   ]
 
+  __slots__ = ('_cls', '_filename', '_lineno', '_pos', '_properties',
+               '_children', '_children_by_class', '_parent')
+
   def __init__(self, cls, filename, lineno, pos, children=None):
     self._cls = cls
-    self._properties = {
-      'ERRORS' : [],
-      'WARNINGS': [],
-      'FILENAME': filename,
-      'LINENO' : lineno,
-      'POSITION' : pos,
-    }
+    self._filename = filename
+    self._lineno = lineno
+    self._pos = pos
+    # Properties other than FILENAME, LINENO and POSITION, unless set.
+    self._properties = None
 
     self._children = []
+    self._children_by_class = None
     self._parent = None
     self.AddChildren(children)
 
@@ -157,7 +164,7 @@ class IDLNode(object):
         self.out.append(tab + str(node))
 
         proplist = []
-        for key, value in node.GetProperties().iteritems():
+        for key, value in node.GetProperties().items():
           if key not in self.props:
             proplist.append(tab + '  %s: %s' % (key, str(value)))
         if proplist:
@@ -183,14 +190,31 @@ class IDLNode(object):
   def GetChildren(self):
     return self._children
 
+  def _GetChildrenByClass(self):
+    if self._children_by_class is None:
+      children_by_class = {}
+      for child in self._children:
+        children_by_class.setdefault(child._cls, []).append(child)
+      self._children_by_class = children_by_class
+    return self._children_by_class
+
   def GetListOf(self, *keys):
+    if len(keys) == 1:
+      return list(self._GetChildrenByClass().get(keys[0], ()))
+    # Keep the children of several classes in document order.
     out = []
-    for child in self.GetChildren():
-      if child.GetClass() in keys:
+    for child in self._children:
+      if child._cls in keys:
         out.append(child)
     return out
 
   def GetOneOf(self, *keys):
+    children_by_class = self._GetChildrenByClass()
+    if len(keys) == 1:
+      out = children_by_class.get(keys[0])
+      if out:
+        return out[0]
+      return None
     out = self.GetListOf(*keys)
     if out:
       return out[0]
@@ -207,6 +231,7 @@ class IDLNode(object):
       if type(child) == IDLNode:
         child._parent = self
         self._children.append(child)
+        self._children_by_class = None
         continue
       raise RuntimeError('Adding child of type %s.\n' % type(child).__name__)
 
@@ -215,10 +240,36 @@ class IDLNode(object):
 # Property Functions
 #
   def SetProperty(self, name, val):
+    if self._properties is None:
+      self._properties = {}
     self._properties[name] = val
 
   def GetProperty(self, name, default=None):
-    return self._properties.get(name, default)
+    properties = self._properties
+    if properties is not None and name in properties:
+      return properties[name]
+    if name == 'FILENAME':
+      return self._filename
+    if name == 'LINENO':
+      return self._lineno
+    if name == 'POSITION':
+      return self._pos
+    if name == 'ERRORS' or name == 'WARNINGS':
+      # Created on first use, as most nodes have neither.
+      messages = []
+      self.SetProperty(name, messages)
+      return messages
+    return default
 
   def GetProperties(self):
-    return self._properties
+    properties = {
+      'ERRORS' : self.GetProperty('ERRORS'),
+      'WARNINGS': self.GetProperty('WARNINGS'),
+      'FILENAME': self._filename,
+      'LINENO' : self._lineno,
+      'POSITION' : self._pos,
+    }
+    properties.update(self._properties)
+    # Changes to the returned dictionary apply to the node, as before.
+    self._properties = properties
+    return properties
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# Copyright 2017 The Chromium Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pickle
+import unittest
+
+from idl_node import IDLAttribute, IDLNode
+
+
+def MakeNode(cls, name=None, children=None):
+  node = IDLNode(cls, 'test.idl', 3, 7, children)
+  if name is not None:
+    node.SetProperty('NAME', name)
+  return node
+
+
+class IDLNodePropertiesTest(unittest.TestCase):
+
+  def testDefaults(self):
+    node = IDLNode('Interface', 'test.idl', 3, 7)
+    self.assertEqual(node.GetProperty('FILENAME'), 'test.idl')
+    self.assertEqual(node.GetProperty('LINENO'), 3)
+    self.assertEqual(node.GetProperty('POSITION'), 7)
+    self.assertEqual(node.GetProperty('NAME'), None)
+    self.assertEqual(node.GetProperty('NAME', 'default'), 'default')
+    self.assertEqual(node.GetName(), None)
+
+  def testSetProperty(self):
+    node = IDLNode('Interface', 'test.idl', 3, 7,
+                   [IDLAttribute('NAME', 'Node')])
+    self.assertEqual(node.GetName(), 'Node')
+    node.SetProperty('NAME', 'Element')
+    node.SetProperty('LINENO', 4)
+    self.assertEqual(node.GetName(), 'Element')
+    self.assertEqual(node.GetFileAndLine(), ('test.idl', 4))
+
+  def testErrorsAndWarnings(self):
+    node = MakeNode('Interface')
+    # Each node gets its own lists, and messages appended are kept.
+    node.GetProperty('ERRORS').append('error')
+    self.assertEqual(node.GetProperty('ERRORS'), ['error'])
+    self.assertEqual(node.GetProperty('WARNINGS'), [])
+    self.assertEqual(MakeNode('Interface').GetProperty('ERRORS'), [])
+
+  def testGetProperties(self):
+    node = MakeNode('Interface', 'Node')
+    properties = node.GetProperties()
+    self.assertEqual(properties, {
+        'ERRORS': [], 'WARNINGS': [], 'FILENAME': 'test.idl', 'LINENO': 3,
+        'POSITION': 7, 'NAME': 'Node'})
+    # Changes to the returned dictionary apply to the node.
+    properties['NAME'] = 'Element'
+    self.assertEqual(node.GetName(), 'Element')
+
+
+class IDLNodeChildrenTest(unittest.TestCase):
+
+  def setUp(self):
+    self.attribute = MakeNode('Attribute', 'a')
+    self.operation = MakeNode('Operation', 'f')
+    self.constant = MakeNode('Const', 'c')
+    self.node = MakeNode('Interface', 'Node',
+                         [self.attribute, None, self.operation])
+
+  def testGetOneOfAndGetListOf(self):
+    self.assertEqual(self.node.GetOneOf('Operation'), self.operation)
+    self.assertEqual(self.node.GetOneOf('Const'), None)
+    self.assertEqual(self.node.GetOneOf('Const', 'Operation', 'Attribute'),
+                     self.attribute)
+    self.assertEqual(self.node.GetListOf('Attribute'), [self.attribute])
+    self.assertEqual(self.attribute.GetParent(), self.node)
+
+  def testAddChildren(self):
+    # Lookups before AddChildren do not hide the children added later.
+    self.assertEqual(self.node.GetListOf('Const'), [])
+    second_attribute = MakeNode('Attribute', 'b')
+    self.node.AddChildren([self.constant, second_attribute])
+    self.assertEqual(self.node.GetOneOf('Const'), self.constant)
+    self.assertEqual(self.node.GetListOf('Attribute'),
+                     [self.attribute, second_attribute])
+    self.assertEqual(self.node.GetListOf('Attribute', 'Const'),
+                     [self.attribute, self.constant, second_attribute])
+    # The returned lists are copies.
+    self.node.GetListOf('Attribute').append(self.operation)
+    self.assertEqual(len(self.node.GetListOf('Attribute')), 2)
+
+  def testAddInvalidChild(self):
+    self.assertRaises(RuntimeError, self.node.AddChildren, ['text'])
+
+  def testPickle(self):
+    self.node.GetListOf('Attribute')
+    self.node.GetProperty('WARNINGS').append('warning')
+    node = pickle.loads(pickle.dumps(self.node, pickle.HIGHEST_PROTOCOL))
+    self.assertEqual(node.Tree(suppress_props=[]),
+                     self.node.Tree(suppress_props=[]))
+    self.assertEqual(node.GetProperty('WARNINGS'), ['warning'])
+    attribute = node.GetOneOf('Attribute')
+    self.assertEqual(attribute.GetName(), 'a')
+    self.assertEqual(attribute.GetParent(), node)
+    node.AddChildren(MakeNode('Const', 'c'))
+    self.assertEqual(node.GetOneOf('Const').GetName(), 'c')
+
+
+if __name__ == '__main__':
+  unittest.main()